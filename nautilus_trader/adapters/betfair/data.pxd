@@ -27,6 +27,7 @@ cpdef enum SubscriptionStatus:
 cdef class BetfairDataClient(LiveMarketDataClient):
     cdef object _client
     cdef object _stream
+    cdef object _parser
     cdef set _subscribed_instruments
     cdef set _subscribed_market_ids
     cdef SubscriptionStatus subscription_status
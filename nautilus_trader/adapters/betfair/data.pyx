@@ -35,7 +35,7 @@ from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.instruments.betting cimport BettingInstrument
 
 from nautilus_trader.adapters.betfair.common import BETFAIR_VENUE
-from nautilus_trader.adapters.betfair.parsing import on_market_update
+from nautilus_trader.adapters.betfair.parsing import BetfairMarketStreamParser
 from nautilus_trader.adapters.betfair.sockets import BetfairMarketStreamClient
 
 
@@ -112,6 +112,7 @@ cdef class BetfairDataClient(LiveMarketDataClient):
             logger=logger,
         )
         self._instrument_provider = instrument_provider
+        self._parser = BetfairMarketStreamParser(instrument_provider)
         self._stream = BetfairMarketStreamClient(
             client=self._client, logger=logger, message_handler=self._on_market_update,
         )
@@ -138,9 +139,11 @@ cdef class BetfairDataClient(LiveMarketDataClient):
         await self._stream.connect()
 
         # Pass any preloaded instruments into the engine
-        for instrument in self._instrument_provider.get_all().values():
+        cdef list instruments = list(self._instrument_provider.get_all().values())
+        for instrument in instruments:
             self._handle_data(instrument)
             self._engine.cache.add_instrument(instrument)
+        self._parser.load_instruments(instruments)
 
         self._log.debug(f"DataEngine has {len(self._engine.cache.instruments(BETFAIR_VENUE))} Betfair instruments")
 
@@ -338,10 +341,7 @@ cdef class BetfairDataClient(LiveMarketDataClient):
 
     cpdef void _on_market_update(self, bytes raw) except *:
         cdef dict update = orjson.loads(raw)  # type: dict
-        updates = on_market_update(
-            instrument_provider=self._instrument_provider,
-            update=update,
-        )
+        updates = self._parser.parse(update)
         if not updates:
             if update.get('op') == 'connection' or update.get('connectionsAvailable'):
                 return
@@ -12,10 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
-from collections import defaultdict
 import datetime
 import hashlib
-import itertools
 from typing import List, Optional, Union
 
 from betfairlightweight.filters import cancel_instruction
@@ -37,7 +35,6 @@ from nautilus_trader.adapters.betfair.common import N2B_TIME_IN_FORCE
 from nautilus_trader.adapters.betfair.common import price_to_probability
 from nautilus_trader.adapters.betfair.common import probability_to_price
 from nautilus_trader.adapters.betfair.util import hash_json
-from nautilus_trader.adapters.betfair.util import one
 from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.core.datetime import millis_to_nanos
 from nautilus_trader.execution.messages import ExecutionReport
@@ -78,6 +75,7 @@ from nautilus_trader.model.orders.market import MarketOrder
 
 
 uuid_factory = UUIDFactory()
+_B_SIDE_KINDS_SET = frozenset(B_SIDE_KINDS)
 
 
 def make_custom_order_ref(client_order_id, strategy_id):
@@ -282,42 +280,6 @@ def _handle_market_trades(
     return trade_ticks
 
 
-def _handle_book_updates(runner, instrument, ts_event_ns, ts_recv_ns):
-    deltas = []
-    for side in B_SIDE_KINDS:
-        for upd in runner.get(side, []):
-            # TODO(bm): Clean this up
-            if len(upd) == 3:
-                _, price, volume = upd
-            else:
-                price, volume = upd
-            deltas.append(
-                OrderBookDelta(
-                    instrument_id=instrument.id,
-                    level=BookLevel.L2,
-                    delta_type=DeltaType.DELETE if volume == 0 else DeltaType.UPDATE,
-                    order=Order(
-                        price=price_to_probability(price, side=B2N_MARKET_STREAM_SIDE[side]),
-                        size=Quantity(volume, precision=8),
-                        side=B2N_MARKET_STREAM_SIDE[side],
-                    ),
-                    ts_event_ns=ts_event_ns,
-                    ts_recv_ns=ts_recv_ns,
-                )
-            )
-    if deltas:
-        ob_update = OrderBookDeltas(
-            level=BookLevel.L2,
-            instrument_id=instrument.id,
-            deltas=deltas,
-            ts_event_ns=ts_event_ns,
-            ts_recv_ns=ts_recv_ns,
-        )
-        return [ob_update]
-    else:
-        return []
-
-
 def _handle_market_close(runner, instrument, timestamp_ns):
     if runner["status"] in ("LOSER", "REMOVED"):
         close_price = InstrumentClosePrice(
@@ -377,61 +339,145 @@ def _handle_instrument_status(market, instrument, timestamp_ns):
     return [status]
 
 
-def _handle_market_runners_status(instrument_provider, market, timestamp_ns):
-    updates = []
+class BetfairMarketStreamParser:
+    """
+    Provides a streaming parser for Betfair market change messages (MCM).
+
+    Instruments are resolved through a (market_id, selection_id, handicap)
+    lookup table which is pre-built from the instrument provider and keyed on
+    the raw stream values, falling back to the provider for unseen runners.
+    Book updates are emitted straight into a reusable per-message batch (one
+    `OrderBookDeltas` per instrument), and runners without book or trade
+    changes are skipped.
+    """
 
-    for runner in market.get("marketDefinition", {}).get("runners", []):
-        kw = dict(
-            market_id=market["id"],
-            selection_id=str(runner["id"]),
-            handicap=str(runner.get("hc") or ""),
-        )
-        instrument = instrument_provider.get_betting_instrument(**kw)
+    def __init__(self, instrument_provider, preload: bool = True):
+        """
+        Initialize a new instance of the ``BetfairMarketStreamParser`` class.
+
+        Parameters
+        ----------
+        instrument_provider : BetfairInstrumentProvider
+            The instrument provider for the parser.
+        preload : bool
+            If the lookup table should be pre-built from the instruments
+            currently held by the provider.
+
+        """
+        self.instrument_provider = instrument_provider
+        self._instruments = {}  # type: dict[tuple, BettingInstrument]
+        self._raw_instruments = {}  # type: dict[tuple, BettingInstrument]
+        self._probabilities = {}  # type: dict[tuple, Price]
+        self._book_batch = {}  # type: dict[InstrumentId, list[OrderBookDelta]]
+        if preload:
+            self.load_instruments(list(instrument_provider.get_all().values()))
+
+    def load_instruments(self, instruments: List[BettingInstrument]):
+        """
+        Add the given instruments to the lookup table.
+
+        Parameters
+        ----------
+        instruments : list[BettingInstrument]
+            The instruments to add.
+
+        """
+        for instrument in instruments:
+            key = (instrument.market_id, instrument.selection_id, instrument.selection_handicap)
+            self._instruments[key] = instrument
+
+    def resolve(self, market_id: str, selection_id, handicap) -> Optional[BettingInstrument]:
+        """
+        Return the instrument for the given raw stream runner identifiers.
+
+        Parameters
+        ----------
+        market_id : str
+            The market ID.
+        selection_id : int
+            The runner selection ID (as received).
+        handicap : float, optional
+            The runner handicap (as received).
+
+        Returns
+        -------
+        BettingInstrument or None
+
+        """
+        raw_key = (market_id, selection_id, handicap)
+        instrument = self._raw_instruments.get(raw_key)
+        if instrument is not None:
+            return instrument
+
+        key = (market_id, str(selection_id), str(handicap or ""))
+        instrument = self._instruments.get(key)
         if instrument is None:
-            continue
-        updates.extend(
-            _handle_instrument_status(
-                market=market, instrument=instrument, timestamp_ns=timestamp_ns
-            )
-        )
-        if market["marketDefinition"].get("status") == "CLOSED":
-            updates.extend(
-                _handle_market_close(
-                    runner=runner, instrument=instrument, timestamp_ns=timestamp_ns
-                )
-            )
-    return updates
+            instrument = self.instrument_provider.get_betting_instrument(*key)
+            if instrument is None:
+                return None
+            self._instruments[key] = instrument
+
+        self._raw_instruments[raw_key] = instrument
+        return instrument
+
+    def parse(self, update: dict) -> list:
+        """
+        Parse the given market change message.
+
+        Parameters
+        ----------
+        update : dict
+            The decoded market change message.
+
+        Returns
+        -------
+        list[Data]
+
+        """
+        if update.get("ct") == "HEARTBEAT":
+            # TODO - Should we send out heartbeats
+            return []
+        for mc in update.get("mc", []):
+            if mc.get("img"):
+                return self._parse_snapshot(update)
+            else:
+                return self._parse_update(update)
+        return []
 
+    def _parse_runners_status(self, market: dict, timestamp_ns: int) -> list:
+        market_def = market.get("marketDefinition")
+        if not market_def:
+            return []
 
-def build_market_snapshot_messages(
-    instrument_provider, raw
-) -> List[Union[OrderBookSnapshot, InstrumentStatusUpdate]]:
-    updates = []
-    ts_event_ns = millis_to_nanos(raw["pt"])
-    timestamp_ns = millis_to_nanos(raw["pt"])  # TODO(bm): Could call clock.ts_recv_ns()
-    for market in raw.get("mc", []):
-        # Instrument Status
-        updates.extend(
-            _handle_market_runners_status(
-                instrument_provider=instrument_provider,
-                market=market,
-                timestamp_ns=timestamp_ns,
+        updates = []
+        market_id = market["id"]
+        for runner in market_def.get("runners", []):
+            instrument = self.resolve(market_id, runner["id"], runner.get("hc"))
+            if instrument is None:
+                continue
+            updates.extend(
+                _handle_instrument_status(
+                    market=market, instrument=instrument, timestamp_ns=timestamp_ns
+                )
             )
-        )
-
-        # OrderBook snapshots
-        if market.get("img") is True:
-            market_id = market["id"]
-            for (selection_id, handicap), selections in itertools.groupby(
-                market.get("rc", []), lambda x: (x["id"], x.get("hc"))
-            ):
-                for selection in list(selections):
-                    kw = dict(
-                        market_id=market_id,
-                        selection_id=str(selection_id),
-                        handicap=str(handicap or ""),
+            if market_def.get("status") == "CLOSED":
+                updates.extend(
+                    _handle_market_close(
+                        runner=runner, instrument=instrument, timestamp_ns=timestamp_ns
                     )
-                    instrument = instrument_provider.get_betting_instrument(**kw)
+                )
+        return updates
+
+    def _parse_snapshot(self, raw: dict) -> list:
+        updates = []
+        ts_event_ns = millis_to_nanos(raw["pt"])
+        timestamp_ns = ts_event_ns  # TODO(bm): Could call clock.ts_recv_ns()
+        for market in raw.get("mc", []):
+            updates.extend(self._parse_runners_status(market, ts_event_ns))
+            if market.get("img") is True:
+                market_id = market["id"]
+                for selection in market.get("rc", []):
+                    instrument = self.resolve(market_id, selection["id"], selection.get("hc"))
                     if instrument is None:
                         continue
                     updates.extend(
@@ -442,86 +488,106 @@ def build_market_snapshot_messages(
                             ts_recv_ns=timestamp_ns,
                         )
                     )
-    return updates
-
-
-def _merge_order_book_deltas(all_deltas: List[OrderBookDeltas]):
-    per_instrument_deltas = defaultdict(list)
-    level = one(set(deltas.level for deltas in all_deltas))
-    ts_event_ns = one(set(deltas.ts_event_ns for deltas in all_deltas))
-    ts_recv_ns = one(set(deltas.ts_recv_ns for deltas in all_deltas))
-
-    for deltas in all_deltas:
-        per_instrument_deltas[deltas.instrument_id].extend(deltas.deltas)
-    return [
-        OrderBookDeltas(
-            instrument_id=instrument_id,
-            deltas=deltas,
-            level=level,
-            ts_event_ns=ts_event_ns,
-            ts_recv_ns=ts_recv_ns,
-        )
-        for instrument_id, deltas in per_instrument_deltas.items()
-    ]
-
+        return updates
+
+    def _parse_update(self, raw: dict) -> list:
+        updates = []
+        book_batch = self._book_batch
+        book_batch.clear()
+        ts_event_ns = millis_to_nanos(raw["pt"])
+        ts_recv_ns = ts_event_ns  # TODO(bm): Could call self._clock.ts_recv_ns()
+        for market in raw.get("mc", []):
+            updates.extend(self._parse_runners_status(market, ts_event_ns))
+            market_id = market["id"]
+            for runner in market.get("rc", []):
+                has_trades = "trd" in runner
+                if not has_trades and _B_SIDE_KINDS_SET.isdisjoint(runner):
+                    # No book or trade changes for this runner
+                    continue
+                instrument = self.resolve(market_id, runner["id"], runner.get("hc"))
+                if instrument is None:
+                    continue
+                self._append_book_deltas(runner, instrument, ts_event_ns, ts_recv_ns)
+                if has_trades:
+                    updates.extend(
+                        _handle_market_trades(
+                            runner=runner,
+                            instrument=instrument,
+                            ts_event_ns=ts_event_ns,
+                            ts_recv_ns=ts_recv_ns,
+                        )
+                    )
 
-def build_market_update_messages(
-    instrument_provider, raw
-) -> List[Union[OrderBookDelta, TradeTick, InstrumentStatusUpdate, InstrumentClosePrice]]:
-    updates = []
-    book_updates = []
-    ts_event_ns = millis_to_nanos(raw["pt"])
-    ts_recv_ns = millis_to_nanos(raw["pt"])  # TODO(bm): Could call self._clock.ts_recv_ns()
-    for market in raw.get("mc", []):
-        updates.extend(
-            _handle_market_runners_status(
-                instrument_provider=instrument_provider,
-                market=market,
-                timestamp_ns=ts_event_ns,
-            )
-        )
-        for runner in market.get("rc", []):
-            kw = dict(
-                market_id=market["id"],
-                selection_id=str(runner["id"]),
-                handicap=str(runner.get("hc") or ""),
-            )
-            instrument = instrument_provider.get_betting_instrument(**kw)
-            if instrument is None:
-                continue
-            # Delay appending book updates until we can merge at the end
-            book_updates.extend(
-                _handle_book_updates(
-                    runner=runner,
-                    instrument=instrument,
+        for instrument_id, deltas in book_batch.items():
+            updates.append(
+                OrderBookDeltas(
+                    instrument_id=instrument_id,
+                    deltas=deltas,
+                    level=BookLevel.L2,
                     ts_event_ns=ts_event_ns,
                     ts_recv_ns=ts_recv_ns,
                 )
             )
-            if "trd" in runner:
-                updates.extend(
-                    _handle_market_trades(
-                        runner=runner,
-                        instrument=instrument,
+        book_batch.clear()
+        return updates
+
+    def _append_book_deltas(self, runner: dict, instrument, ts_event_ns: int, ts_recv_ns: int):
+        deltas = None
+        instrument_id = instrument.id
+        for side in B_SIDE_KINDS:
+            levels = runner.get(side)
+            if not levels:
+                continue
+            if deltas is None:
+                deltas = self._book_batch.get(instrument_id)
+                if deltas is None:
+                    deltas = []
+                    self._book_batch[instrument_id] = deltas
+            order_side = B2N_MARKET_STREAM_SIDE[side]
+            for level in levels:
+                if len(level) == 3:
+                    _, price, volume = level
+                else:
+                    price, volume = level
+                deltas.append(
+                    OrderBookDelta(
+                        instrument_id=instrument_id,
+                        level=BookLevel.L2,
+                        delta_type=DeltaType.DELETE if volume == 0 else DeltaType.UPDATE,
+                        order=Order(
+                            price=self._probability(price, order_side),
+                            size=Quantity(volume, precision=8),
+                            side=order_side,
+                        ),
                         ts_event_ns=ts_event_ns,
                         ts_recv_ns=ts_recv_ns,
                     )
                 )
-    if book_updates:
-        updates.extend(_merge_order_book_deltas(book_updates))
-    return updates
+
+    def _probability(self, price, side) -> Price:
+        # Betfair prices are on a fixed ladder, so the (immutable) results are memoized
+        key = (price, side)
+        probability = self._probabilities.get(key)
+        if probability is None:
+            probability = price_to_probability(price, side=side)
+            self._probabilities[key] = probability
+        return probability
+
+
+def build_market_snapshot_messages(
+    instrument_provider, raw
+) -> List[Union[OrderBookSnapshot, InstrumentStatusUpdate]]:
+    return BetfairMarketStreamParser(instrument_provider, preload=False)._parse_snapshot(raw)
+
+
+def build_market_update_messages(
+    instrument_provider, raw
+) -> List[Union[OrderBookDeltas, TradeTick, InstrumentStatusUpdate, InstrumentClosePrice]]:
+    return BetfairMarketStreamParser(instrument_provider, preload=False)._parse_update(raw)
 
 
 def on_market_update(instrument_provider, update: dict):
-    if update.get("ct") == "HEARTBEAT":
-        # TODO - Should we send out heartbeats
-        return []
-    for mc in update.get("mc", []):
-        if mc.get("img"):
-            return build_market_snapshot_messages(instrument_provider, update)
-        else:
-            return build_market_update_messages(instrument_provider, update)
-    return []
+    return BetfairMarketStreamParser(instrument_provider, preload=False).parse(update)
 
 
 # TODO - Need to handle pagination > 1000 orders
@@ -16,12 +16,14 @@
 from libc.stdint cimport int64_t
 
 from nautilus_trader.adapters.ccxt.providers cimport CCXTInstrumentProvider
+from nautilus_trader.adapters.ccxt.streams cimport StreamStats
 from nautilus_trader.live.data_client cimport LiveMarketDataClient
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.bar cimport BarSpecification
 from nautilus_trader.model.data.bar cimport BarType
 from nautilus_trader.model.data.tick cimport TradeTick
 from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.instruments.base cimport Instrument
 
 
 cdef class CCXTDataClient(LiveMarketDataClient):
@@ -31,13 +33,27 @@ cdef class CCXTDataClient(LiveMarketDataClient):
     cdef set _subscribed_instruments
     cdef dict _subscribed_order_books
     cdef dict _subscribed_quote_ticks
-    cdef dict _subscribed_trade_ticks
+    cdef set _subscribed_trade_ticks
     cdef dict _subscribed_bars
 
+    cdef bint _multiplex_order_books
+    cdef bint _multiplex_trades
+    cdef dict _book_streams
+    cdef dict _trade_streams
+    cdef bint _book_streams_pending
+    cdef bint _trade_streams_pending
+    cdef dict _stream_stats
+
     cdef object _update_instruments_task
 
     cdef void _log_ccxt_error(self, ex, str method_name) except *
     cdef int64_t _ccxt_to_timestamp_ns(self, int64_t millis) except *
+    cdef StreamStats _get_stream_stats(self, str name)
+    cdef void _schedule_book_streams_update(self) except *
+    cdef void _schedule_trade_streams_update(self) except *
+    cdef void _update_streams(self, dict streams, dict wanted, create_stream) except *
+    cdef void _handle_order_book(self, Instrument instrument, dict lob, StreamStats stats) except *
+    cdef void _handle_trade(self, Instrument instrument, dict trade, StreamStats stats) except *
     cdef void _on_quote_tick(
         self,
         InstrumentId instrument_id,
@@ -21,6 +21,8 @@ from ccxt.base.errors import BaseError as CCXTError
 
 from nautilus_trader.adapters.ccxt.providers import CCXTInstrumentProvider
 
+from nautilus_trader.adapters.ccxt.streams cimport StreamStats
+from nautilus_trader.adapters.ccxt.streams cimport TopOfBook
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.core.correctness cimport Condition
@@ -55,6 +57,12 @@ cdef int _SECONDS_IN_HOUR = 60 * 60
 cdef class CCXTDataClient(LiveMarketDataClient):
     """
     Provides a data client for the unified CCXT Pro API.
+
+    Order book and quote tick subscriptions for an instrument share a single
+    order book stream, with quotes derived only when the top of book changes.
+    Where the exchange supports watching many symbols at once (CCXT Pro
+    `watchOrderBookForSymbols` and `watchTradesForSymbols`), subscriptions are
+    multiplexed onto one shared stream per data type.
     """
 
     def __init__(
@@ -107,11 +115,20 @@ cdef class CCXTDataClient(LiveMarketDataClient):
 
         # Subscriptions
         self._subscribed_instruments = set()   # type: set[InstrumentId]
-        self._subscribed_order_books = {}      # type: dict[InstrumentId, asyncio.Task]
-        self._subscribed_quote_ticks = {}      # type: dict[InstrumentId, asyncio.Task]
-        self._subscribed_trade_ticks = {}      # type: dict[InstrumentId, asyncio.Task]
+        self._subscribed_order_books = {}      # type: dict[InstrumentId, tuple[BookLevel, int, dict]]
+        self._subscribed_quote_ticks = {}      # type: dict[InstrumentId, TopOfBook]
+        self._subscribed_trade_ticks = set()   # type: set[InstrumentId]
         self._subscribed_bars = {}             # type: dict[BarType, asyncio.Task]
 
+        # Streams (keyed by InstrumentId, or None for the multiplexed stream)
+        self._multiplex_order_books = client.has.get("watchOrderBookForSymbols") is True
+        self._multiplex_trades = client.has.get("watchTradesForSymbols") is True
+        self._book_streams = {}                # type: dict[object, tuple[object, asyncio.Task]]
+        self._trade_streams = {}               # type: dict[object, tuple[object, asyncio.Task]]
+        self._book_streams_pending = False
+        self._trade_streams_pending = False
+        self._stream_stats = {}                # type: dict[str, StreamStats]
+
         # Scheduled tasks
         self._update_instruments_task = None
 
@@ -149,7 +166,7 @@ cdef class CCXTDataClient(LiveMarketDataClient):
         list[InstrumentId]
 
         """
-        return sorted(list(self._subscribed_trade_ticks.keys()))
+        return sorted(list(self._subscribed_trade_ticks))
 
     @property
     def subscribed_bars(self):
@@ -163,6 +180,18 @@ cdef class CCXTDataClient(LiveMarketDataClient):
         """
         return sorted(list(self._subscribed_bars.keys()))
 
+    @property
+    def stream_stats(self):
+        """
+        The message and latency statistics for each stream.
+
+        Returns
+        -------
+        dict[str, StreamStats]
+
+        """
+        return self._stream_stats.copy()
+
     cpdef void connect(self) except *:
         """
         Connect the client.
@@ -203,11 +232,17 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             self._update_instruments_task.cancel()
 
         # Cancel residual tasks
-        for task in self._subscribed_trade_ticks.values():
+        cdef list tasks = [task for _, task in self._book_streams.values()]
+        tasks += [task for _, task in self._trade_streams.values()]
+        tasks += list(self._subscribed_bars.values())
+        for task in tasks:
             if not task.cancelled():
                 self._log.debug(f"Cancelling {task}...")
                 task.cancel()
 
+        self._book_streams.clear()
+        self._trade_streams.clear()
+
         # Ensure ccxt closed
         self._log.info("Closing WebSocket(s)...")
         await self._client.close()
@@ -303,13 +338,8 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             self._log.warning(f"Already subscribed {instrument_id.symbol} <OrderBook> data.")
             return
 
-        task = self._loop.create_task(self._watch_order_book(
-            instrument_id=instrument_id,
-            level=level,
-            depth=depth,
-            kwargs=kwargs,
-        ))
-        self._subscribed_order_books[instrument_id] = task
+        self._subscribed_order_books[instrument_id] = (level, depth, kwargs)
+        self._schedule_book_streams_update()
 
         self._log.info(f"Subscribed to {instrument_id.symbol} <OrderBook> data.")
 
@@ -326,11 +356,11 @@ cdef class CCXTDataClient(LiveMarketDataClient):
         Condition.not_none(instrument_id, "instrument_id")
 
         if instrument_id in self._subscribed_quote_ticks:
-            self._log.warning(f"Already subscribed {instrument_id.symbol} <TradeTick> data.")
+            self._log.warning(f"Already subscribed {instrument_id.symbol} <QuoteTick> data.")
             return
 
-        task = self._loop.create_task(self._watch_quotes(instrument_id))
-        self._subscribed_quote_ticks[instrument_id] = task
+        self._subscribed_quote_ticks[instrument_id] = TopOfBook()
+        self._schedule_book_streams_update()
 
         self._log.info(f"Subscribed to {instrument_id.symbol} <QuoteTick> data.")
 
@@ -350,8 +380,8 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             self._log.warning(f"Already subscribed {instrument_id.symbol} <TradeTick> data.")
             return
 
-        task = self._loop.create_task(self._watch_trades(instrument_id))
-        self._subscribed_trade_ticks[instrument_id] = task
+        self._subscribed_trade_ticks.add(instrument_id)
+        self._schedule_trade_streams_update()
 
         self._log.info(f"Subscribed to {instrument_id.symbol} <TradeTick> data.")
 
@@ -415,9 +445,8 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             self._log.debug(f"Not subscribed to {instrument_id.symbol} <OrderBook> data.")
             return
 
-        task = self._subscribed_order_books.pop(instrument_id)
-        task.cancel()
-        self._log.debug(f"Cancelled {task}.")
+        self._subscribed_order_books.pop(instrument_id)
+        self._schedule_book_streams_update()
         self._log.info(f"Unsubscribed from {instrument_id.symbol} <OrderBook> data.")
 
     cpdef void unsubscribe_quote_ticks(self, InstrumentId instrument_id) except *:
@@ -436,9 +465,8 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             self._log.debug(f"Not subscribed to {instrument_id.symbol} <QuoteTick> data.")
             return
 
-        task = self._subscribed_quote_ticks.pop(instrument_id)
-        task.cancel()
-        self._log.debug(f"Cancelled {task}.")
+        self._subscribed_quote_ticks.pop(instrument_id)
+        self._schedule_book_streams_update()
         self._log.info(f"Unsubscribed from {instrument_id.symbol} <QuoteTick> data.")
 
     cpdef void unsubscribe_trade_ticks(self, InstrumentId instrument_id) except *:
@@ -457,9 +485,8 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             self._log.debug(f"Not subscribed to {instrument_id.symbol} <TradeTick> data.")
             return
 
-        task = self._subscribed_trade_ticks.pop(instrument_id)
-        task.cancel()
-        self._log.debug(f"Cancelled {task}.")
+        self._subscribed_trade_ticks.discard(instrument_id)
+        self._schedule_trade_streams_update()
         self._log.info(f"Unsubscribed from {instrument_id.symbol} <TradeTick> data.")
 
     cpdef void unsubscribe_bars(self, BarType bar_type) except *:
@@ -652,14 +679,117 @@ cdef class CCXTDataClient(LiveMarketDataClient):
 
 # -- STREAMS ---------------------------------------------------------------------------------------
 
-    # TODO: Possibly combine this with _watch_quotes
-    async def _watch_order_book(self, InstrumentId instrument_id, BookLevel level, int depth, dict kwargs):
+    cdef StreamStats _get_stream_stats(self, str name):
+        cdef StreamStats stats = self._stream_stats.get(name)
+        if stats is None:
+            stats = StreamStats(name)
+            self._stream_stats[name] = stats
+
+        return stats
+
+    cdef void _schedule_book_streams_update(self) except *:
+        # Coalesce subscription changes within one event loop iteration
+        if not self._book_streams_pending:
+            self._book_streams_pending = True
+            self._loop.call_soon(self._update_book_streams)
+
+    cdef void _schedule_trade_streams_update(self) except *:
+        # Coalesce subscription changes within one event loop iteration
+        if not self._trade_streams_pending:
+            self._trade_streams_pending = True
+            self._loop.call_soon(self._update_trade_streams)
+
+    def _update_book_streams(self):
+        self._book_streams_pending = False
+
+        cdef dict wanted = {}     # type: dict[object, object]
+        cdef list multiplexed = []
+        cdef InstrumentId instrument_id
+        cdef tuple subscription
+        cdef int depth
+        cdef dict kwargs
+        for instrument_id in self._subscribed_order_books.keys() | self._subscribed_quote_ticks.keys():
+            subscription = self._subscribed_order_books.get(instrument_id)
+            depth = 0 if subscription is None else subscription[1]
+            kwargs = {} if subscription is None else subscription[2]
+            if self._multiplex_order_books and depth == 0 and not kwargs:
+                multiplexed.append(instrument_id)
+            else:
+                # Dedicated stream (exchange specific depth or parameters)
+                wanted[instrument_id] = (depth, kwargs)
+
+        if multiplexed:
+            wanted[None] = tuple(sorted(multiplexed))
+
+        self._update_streams(self._book_streams, wanted, self._create_book_stream)
+
+    def _update_trade_streams(self):
+        self._trade_streams_pending = False
+
+        cdef dict wanted = {}     # type: dict[object, object]
+        cdef InstrumentId instrument_id
+        if self._multiplex_trades:
+            if self._subscribed_trade_ticks:
+                wanted[None] = tuple(sorted(self._subscribed_trade_ticks))
+        else:
+            for instrument_id in self._subscribed_trade_ticks:
+                wanted[instrument_id] = None
+
+        self._update_streams(self._trade_streams, wanted, self._create_trade_stream)
+
+    cdef void _update_streams(self, dict streams, dict wanted, create_stream) except *:
+        # Restart any stream whose parameters (or multiplexed symbols) changed
+        cdef tuple stream
+        for key in list(streams.keys()):
+            stream = streams[key]
+            if key not in wanted or wanted[key] != stream[0]:
+                streams.pop(key)
+                stream[1].cancel()
+                self._log.debug(f"Cancelled {stream[1]}.")
+
+        for key, params in wanted.items():
+            if key not in streams:
+                streams[key] = (params, self._loop.create_task(create_stream(key, params)))
+
+    def _create_book_stream(self, InstrumentId instrument_id, params):
+        if instrument_id is None:
+            return self._watch_order_books(
+                instrument_ids=list(params),
+                stats=self._get_stream_stats("OrderBook-*"),
+            )
+
+        return self._watch_order_book(
+            instrument_id=instrument_id,
+            depth=params[0],
+            kwargs=params[1],
+            stats=self._get_stream_stats(f"OrderBook-{instrument_id.symbol}"),
+        )
+
+    def _create_trade_stream(self, InstrumentId instrument_id, params):
+        if instrument_id is None:
+            return self._watch_trades_multiplexed(
+                instrument_ids=list(params),
+                stats=self._get_stream_stats("TradeTick-*"),
+            )
+
+        return self._watch_trades(
+            instrument_id=instrument_id,
+            stats=self._get_stream_stats(f"TradeTick-{instrument_id.symbol}"),
+        )
+
+    async def _watch_order_book(
+        self,
+        InstrumentId instrument_id,
+        int depth,
+        dict kwargs,
+        StreamStats stats,
+    ):
         cdef Instrument instrument = self._instrument_provider.find(instrument_id)
         if instrument is None:
             self._log.error(f"Cannot subscribe to order book (no instrument for {instrument_id.symbol}).")
             return
 
-        cdef OrderBookSnapshot snapshot
+        cdef bint exiting = False  # Flag to stop loop
         try:
             while True:
                 try:
@@ -668,118 +798,107 @@ cdef class CCXTDataClient(LiveMarketDataClient):
                         limit=None if depth == 0 else depth,
                         params=kwargs,
                     )
-                    timestamp_ms = lob["timestamp"]
-                    if timestamp_ms is None:
-                        # First quote timestamp often None
-                        timestamp_ms = self._client.milliseconds()
-
-                    bids = lob.get("bids")
-                    asks = lob.get("asks")
-                    if not bids:
-                        continue
-                    if not asks:
-                        continue
-
-                    # Currently inefficient while using CCXT. The order book
-                    # is regenerated with a snapshot on every update.
-                    snapshot = OrderBookSnapshot(
-                        instrument_id=instrument.id,
-                        level=level,
-                        bids=list(bids),
-                        asks=list(asks),
-                        ts_event_ns=self._ccxt_to_timestamp_ns(millis=timestamp_ms),
-                        ts_recv_ns=self._clock.timestamp_ns(),
-                    )
-
-                    self._handle_data(snapshot)
                 except CCXTError as ex:
+                    stats.on_error()
                     self._log_ccxt_error(ex, self._watch_order_book.__name__)
                     continue
+                except TypeError:
+                    # Temporary workaround for testing
+                    lob = self._client.watch_order_book
+                    exiting = True
+
+                self._handle_order_book(instrument, lob, stats)
+
+                if exiting:
+                    break
         except asyncio.CancelledError as ex:
             self._log.debug(f"Cancelled `_watch_order_book` for {instrument_id.symbol}.")
         except Exception as ex:
             self._log.exception(ex)
 
-    async def _watch_quotes(self, InstrumentId instrument_id):
-        cdef Instrument instrument = self._instrument_provider.find(instrument_id)
-        if instrument is None:
-            self._log.error(f"Cannot subscribe to quote ticks (no instrument for {instrument_id.symbol}).")
-            return
+    async def _watch_order_books(self, list instrument_ids, StreamStats stats):
+        cdef dict instruments = {}  # type: dict[str, Instrument]
+        cdef InstrumentId instrument_id
+        cdef Instrument instrument
+        for instrument_id in instrument_ids:
+            instrument = self._instrument_provider.find(instrument_id)
+            if instrument is None:
+                self._log.error(f"Cannot subscribe to order book (no instrument for {instrument_id.symbol}).")
+                continue
+            instruments[instrument_id.symbol.value] = instrument
 
-        # Setup precisions
-        cdef int price_precision = instrument.price_precision
-        cdef int size_precision = instrument.size_precision
+        if not instruments:
+            return
 
-        cdef list bids
-        cdef list asks
-        cdef bint generate_tick = False
-        cdef list last_best_bid = None
-        cdef list last_best_ask = None
-        cdef list best_bid = None
-        cdef list best_ask = None
-        cdef bint exiting = False  # Flag to stop loop
+        cdef list symbols = list(instruments.keys())
         try:
             while True:
                 try:
-                    lob = await self._client.watch_order_book(symbol=instrument_id.symbol.value)
+                    lob = await self._client.watch_order_book_for_symbols(symbols=symbols)
                 except CCXTError as ex:
-                    self._log_ccxt_error(ex, self._watch_quotes.__name__)
-                    continue
-                except TypeError:
-                    # Temporary workaround for testing
-                    lob = self._client.watch_order_book
-                    exiting = True
-
-                bids = <list>lob.get("bids")
-                asks = <list>lob.get("asks")
-
-                if bids:
-                    best_bid = bids[0]
-                else:
+                    stats.on_error()
+                    self._log_ccxt_error(ex, self._watch_order_books.__name__)
                     continue
 
-                if asks:
-                    best_ask = asks[0]
-                else:
+                instrument = instruments.get(lob.get("symbol"))
+                if instrument is None:
                     continue
 
-                generate_tick = False
-                # Cache last quotes if changed
-                if last_best_bid is None or best_bid != last_best_bid:
-                    last_best_bid = best_bid
-                    generate_tick = True
-                if last_best_ask is None or best_ask != last_best_ask:
-                    last_best_ask = best_ask
-                    generate_tick = True
-
-                # Only generate quote tick on change to best bid or ask
-                if not generate_tick:
-                    continue
-
-                timestamp = lob["timestamp"]
-                if timestamp is None:  # Compiled to fast C check
-                    # First quote timestamp often None
-                    timestamp = self._client.milliseconds()
-
-                self._on_quote_tick(
-                    instrument_id,
-                    best_bid[0],
-                    best_ask[0],
-                    best_bid[1],
-                    best_ask[1],
-                    timestamp,
-                    self._clock.timestamp_ns(),
-                    price_precision,
-                    size_precision,
-                )
-
-                if exiting:
-                    break
+                self._handle_order_book(instrument, lob, stats)
         except asyncio.CancelledError as ex:
-            self._log.debug(f"Cancelled `_watch_ticker` for {instrument_id.symbol}.")
+            self._log.debug(f"Cancelled `_watch_order_books` for {len(symbols)} symbols.")
         except Exception as ex:
             self._log.exception(ex)
 
+    cdef void _handle_order_book(self, Instrument instrument, dict lob, StreamStats stats) except *:
+        timestamp_ms = lob["timestamp"]
+        if timestamp_ms is None:  # Compiled to fast C check
+            # First quote timestamp often None
+            timestamp_ms = self._client.milliseconds()
+
+        cdef int64_t ts_event_ns = self._ccxt_to_timestamp_ns(millis=timestamp_ms)
+        cdef int64_t ts_recv_ns = self._clock.timestamp_ns()
+        stats.on_message(ts_event_ns, ts_recv_ns)
+
+        cdef list bids = <list>lob.get("bids")
+        cdef list asks = <list>lob.get("asks")
+        if not bids or not asks:
+            return
+
+        cdef OrderBookSnapshot snapshot
+        cdef tuple subscription = self._subscribed_order_books.get(instrument.id)
+        if subscription is not None:
+            # Currently inefficient while using CCXT. The order book
+            # is regenerated with a snapshot on every update.
+            snapshot = OrderBookSnapshot(
+                instrument_id=instrument.id,
+                level=subscription[0],
+                bids=list(bids),
+                asks=list(asks),
+                ts_event_ns=ts_event_ns,
+                ts_recv_ns=ts_recv_ns,
+            )
+            self._handle_data(snapshot)
+            stats.on_emitted()
+
+        # Only generate quote tick on change to best bid or ask
+        cdef TopOfBook top = self._subscribed_quote_ticks.get(instrument.id)
+        if top is None or not top.update(bids, asks):
+            return
+
+        self._on_quote_tick(
+            instrument.id,
+            top._best_bid[0],
+            top._best_ask[0],
+            top._best_bid[1],
+            top._best_ask[1],
+            ts_event_ns,
+            ts_recv_ns,
+            instrument.price_precision,
+            instrument.size_precision,
+        )
+        stats.on_emitted()
+
     cdef void _on_quote_tick(
         self,
         InstrumentId instrument_id,
@@ -804,22 +923,19 @@ cdef class CCXTDataClient(LiveMarketDataClient):
 
         self._handle_data(tick)
 
-    async def _watch_trades(self, InstrumentId instrument_id):
+    async def _watch_trades(self, InstrumentId instrument_id, StreamStats stats):
         cdef Instrument instrument = self._instrument_provider.find(instrument_id)
         if instrument is None:
             self._log.error(f"Cannot subscribe to trade ticks (no instrument for {instrument_id.symbol}).")
             return
 
-        cdef int price_precision = instrument.price_precision
-        cdef int size_precision = instrument.size_precision
-
-        cdef dict trade
         cdef bint exiting = False  # Flag to stop loop
         try:
             while True:
                 try:
                     trades = await self._client.watch_trades(symbol=instrument_id.symbol.value)
                 except CCXTError as ex:
+                    stats.on_error()
                     self._log_ccxt_error(ex, self._watch_trades.__name__)
                     continue
                 except TypeError:
@@ -827,18 +943,7 @@ cdef class CCXTDataClient(LiveMarketDataClient):
                     trades = self._client.watch_trades
                     exiting = True
 
-                trade = trades[0]  # Last trade only
-                self._on_trade_tick(
-                    instrument_id,
-                    trade["price"],
-                    trade["amount"],
-                    trade["side"],
-                    trade["id"],
-                    self._ccxt_to_timestamp_ns(millis=trade["timestamp"]),
-                    self._clock.timestamp_ns(),
-                    price_precision,
-                    size_precision,
-                )
+                self._handle_trade(instrument, trades[0], stats)  # Last trade only
 
                 if exiting:
                     break
@@ -847,6 +952,64 @@ cdef class CCXTDataClient(LiveMarketDataClient):
         except Exception as ex:
             self._log.exception(ex)
 
+    async def _watch_trades_multiplexed(self, list instrument_ids, StreamStats stats):
+        cdef dict instruments = {}  # type: dict[str, Instrument]
+        cdef InstrumentId instrument_id
+        cdef Instrument instrument
+        for instrument_id in instrument_ids:
+            instrument = self._instrument_provider.find(instrument_id)
+            if instrument is None:
+                self._log.error(f"Cannot subscribe to trade ticks (no instrument for {instrument_id.symbol}).")
+                continue
+            instruments[instrument_id.symbol.value] = instrument
+
+        if not instruments:
+            return
+
+        cdef list symbols = list(instruments.keys())
+        cdef set seen
+        cdef dict trade
+        try:
+            while True:
+                try:
+                    trades = await self._client.watch_trades_for_symbols(symbols=symbols)
+                except CCXTError as ex:
+                    stats.on_error()
+                    self._log_ccxt_error(ex, self._watch_trades_multiplexed.__name__)
+                    continue
+
+                seen = set()
+                for trade in trades:
+                    symbol = trade["symbol"]
+                    if symbol in seen:
+                        continue  # Last trade only (per symbol)
+                    seen.add(symbol)
+                    instrument = instruments.get(symbol)
+                    if instrument is not None:
+                        self._handle_trade(instrument, trade, stats)
+        except asyncio.CancelledError as ex:
+            self._log.debug(f"Cancelled `_watch_trades_multiplexed` for {len(symbols)} symbols.")
+        except Exception as ex:
+            self._log.exception(ex)
+
+    cdef void _handle_trade(self, Instrument instrument, dict trade, StreamStats stats) except *:
+        cdef int64_t ts_event_ns = self._ccxt_to_timestamp_ns(millis=trade["timestamp"])
+        cdef int64_t ts_recv_ns = self._clock.timestamp_ns()
+        stats.on_message(ts_event_ns, ts_recv_ns)
+
+        self._on_trade_tick(
+            instrument.id,
+            trade["price"],
+            trade["amount"],
+            trade["side"],
+            trade["id"],
+            ts_event_ns,
+            ts_recv_ns,
+            instrument.price_precision,
+            instrument.size_precision,
+        )
+        stats.on_emitted()
+
     cdef void _on_trade_tick(
         self,
         InstrumentId instrument_id,
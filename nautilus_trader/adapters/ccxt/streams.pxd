@@ -0,0 +1,45 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+
+
+cdef class StreamStats:
+    cdef readonly str name
+    """The name of the stream.\n\n:returns: `str`"""
+    cdef readonly int64_t message_count
+    """The count of messages received on the stream.\n\n:returns: `int64`"""
+    cdef readonly int64_t emitted_count
+    """The count of data objects emitted from the stream.\n\n:returns: `int64`"""
+    cdef readonly int64_t error_count
+    """The count of errors raised while watching the stream.\n\n:returns: `int64`"""
+    cdef readonly int64_t last_latency_ns
+    """The latency of the last message (receive time less event time).\n\n:returns: `int64`"""
+    cdef readonly int64_t max_latency_ns
+    """The maximum message latency seen on the stream.\n\n:returns: `int64`"""
+    cdef int64_t _total_latency_ns
+
+    cdef void on_message(self, int64_t ts_event_ns, int64_t ts_recv_ns) except *
+    cdef void on_emitted(self) except *
+    cdef void on_error(self) except *
+    cpdef double avg_latency_ns(self) except *
+    cpdef dict to_dict(self)
+
+
+cdef class TopOfBook:
+    cdef list _best_bid
+    cdef list _best_ask
+
+    cpdef bint update(self, list bids, list asks) except *
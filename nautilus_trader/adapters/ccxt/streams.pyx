@@ -0,0 +1,172 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+cdef class StreamStats:
+    """
+    Provides message and latency counters for a single market data stream.
+    """
+
+    def __init__(self, str name not None):
+        """
+        Initialize a new instance of the ``StreamStats`` class.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stream.
+
+        Raises
+        ------
+        ValueError
+            If name is not a valid string.
+
+        """
+        Condition.valid_string(name, "name")
+
+        self.name = name
+        self.message_count = 0
+        self.emitted_count = 0
+        self.error_count = 0
+        self.last_latency_ns = 0
+        self.max_latency_ns = 0
+        self._total_latency_ns = 0
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}("
+                f"name={self.name}, "
+                f"messages={self.message_count}, "
+                f"emitted={self.emitted_count}, "
+                f"errors={self.error_count}, "
+                f"avg_latency_ns={self.avg_latency_ns():.0f})")
+
+    cdef void on_message(self, int64_t ts_event_ns, int64_t ts_recv_ns) except *:
+        cdef int64_t latency_ns = ts_recv_ns - ts_event_ns
+        self.message_count += 1
+        self.last_latency_ns = latency_ns
+        self._total_latency_ns += latency_ns
+        if latency_ns > self.max_latency_ns:
+            self.max_latency_ns = latency_ns
+
+    cdef void on_emitted(self) except *:
+        self.emitted_count += 1
+
+    cdef void on_error(self) except *:
+        self.error_count += 1
+
+    cpdef double avg_latency_ns(self) except *:
+        """
+        Return the average message latency for the stream.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.message_count == 0:
+            return 0.0
+
+        return self._total_latency_ns / <double>self.message_count
+
+    cpdef dict to_dict(self):
+        """
+        Return a dictionary representation of the stream statistics.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        return {
+            "name": self.name,
+            "message_count": self.message_count,
+            "emitted_count": self.emitted_count,
+            "error_count": self.error_count,
+            "last_latency_ns": self.last_latency_ns,
+            "max_latency_ns": self.max_latency_ns,
+            "avg_latency_ns": self.avg_latency_ns(),
+        }
+
+
+cdef class TopOfBook:
+    """
+    Provides the last seen best bid and ask levels for an order book stream,
+    so that quotes are only derived when the top of book changes.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new instance of the ``TopOfBook`` class.
+        """
+        self._best_bid = None
+        self._best_ask = None
+
+    @property
+    def best_bid(self):
+        """
+        The last best bid level [price, size].
+
+        Returns
+        -------
+        list or None
+
+        """
+        return self._best_bid
+
+    @property
+    def best_ask(self):
+        """
+        The last best ask level [price, size].
+
+        Returns
+        -------
+        list or None
+
+        """
+        return self._best_ask
+
+    cpdef bint update(self, list bids, list asks) except *:
+        """
+        Update with the given order book levels.
+
+        Parameters
+        ----------
+        bids : list[list]
+            The order book bid levels (best first).
+        asks : list[list]
+            The order book ask levels (best first).
+
+        Returns
+        -------
+        bool
+            True if the best bid or best ask level changed, else False.
+
+        """
+        if not bids or not asks:
+            return False
+
+        cdef list best_bid = bids[0]
+        cdef list best_ask = asks[0]
+        if best_bid == self._best_bid and best_ask == self._best_ask:
+            return False
+
+        # Copy levels as the CCXT order book may be mutated in place
+        self._best_bid = list(best_bid)
+        self._best_ask = list(best_ask)
+        return True
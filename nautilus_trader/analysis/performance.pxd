@@ -21,12 +21,32 @@ from nautilus_trader.model.objects cimport Money
 from nautilus_trader.trading.account cimport Account
 
 
+cdef class RealizedPnLBuffer:
+    cdef dict _index
+    cdef list _position_ids
+    cdef object _values
+    cdef int _count
+    cdef object _series
+    cdef dict _stats
+
+    cdef void append(self, str position_id, double value) except *
+    cdef void extend(self, list position_ids, list values) except *
+    cdef void _reserve(self, int capacity) except *
+    cdef object values(self)
+    cdef object to_series(self)
+    cdef dict stats(self)
+
+
 cdef class PerformanceAnalyzer:
     cdef dict _account_balances_starting
     cdef dict _account_balances
     cdef dict _realized_pnls
+    cdef dict _returns_buckets
     cdef object _daily_returns
 
+    cdef RealizedPnLBuffer _get_pnl_buffer(self, Currency currency)
+    cdef dict _pnl_stats(self, Currency currency)
+
     cpdef void calculate_statistics(self, Account account, list positions) except *
     cpdef void add_positions(self, list positions) except *
     cpdef void add_trade(self, PositionId position_id, Money realized_pnl) except *
@@ -15,6 +15,7 @@
 
 from cpython.datetime cimport date
 from cpython.datetime cimport datetime
+from libc.stdint cimport int64_t
 
 from empyrical import alpha
 from empyrical import annual_return
@@ -36,13 +37,125 @@ from scipy.stats import kurtosis
 from scipy.stats import skew
 
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.datetime cimport nanos_to_unix_dt
 from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.trading.account cimport Account
 
 
+cdef int _INITIAL_CAPACITY = 64
+cdef int64_t _NANOSECONDS_IN_DAY = 86_400_000_000_000
+cdef int _UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+cdef class RealizedPnLBuffer:
+    """
+    Provides an append-only columnar buffer of realized PnL values for a
+    single currency, keyed by position ID.
+
+    Values are held in a growable ``float64`` array, so appending is amortized
+    constant time. The ``pd.Series`` view and summary statistics are computed
+    lazily in a single vectorized pass and cached until the next write.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new instance of the ``RealizedPnLBuffer`` class.
+        """
+        self._index = {}         # type: dict[str, int]
+        self._position_ids = []  # type: list[str]
+        self._values = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._count = 0
+        self._series = None
+        self._stats = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    cdef void append(self, str position_id, double value) except *:
+        self._series = None
+        self._stats = None
+
+        cdef int row = self._index.get(position_id, -1)
+        if row >= 0:
+            # Position already recorded, overwrite (as per `Series.loc`)
+            self._values[row] = value
+            return
+
+        self._reserve(self._count + 1)
+        self._index[position_id] = self._count
+        self._position_ids.append(position_id)
+        self._values[self._count] = value
+        self._count += 1
+
+    cdef void extend(self, list position_ids, list values) except *:
+        cdef int i
+        cdef int count = len(position_ids)
+        if count == 0:
+            return
+
+        if self._index.keys().isdisjoint(position_ids) and len(set(position_ids)) == count:
+            # Fast path: all new and unique position IDs, bulk copy
+            self._series = None
+            self._stats = None
+            self._reserve(self._count + count)
+            self._values[self._count:self._count + count] = np.asarray(values, dtype=np.float64)
+            for i in range(count):
+                self._index[position_ids[i]] = self._count + i
+            self._position_ids.extend(position_ids)
+            self._count += count
+            return
+
+        for i in range(count):
+            self.append(position_ids[i], values[i])
+
+    cdef void _reserve(self, int capacity) except *:
+        cdef int new_capacity = len(self._values)
+        if capacity <= new_capacity:
+            return
+
+        while new_capacity < capacity:
+            new_capacity *= 2
+
+        cdef np.ndarray values = np.empty(new_capacity, dtype=np.float64)
+        values[:self._count] = self._values[:self._count]
+        self._values = values
+
+    cdef object values(self):
+        return self._values[:self._count]
+
+    cdef object to_series(self):
+        if self._series is None:
+            self._series = pd.Series(
+                self.values().copy(),
+                index=self._position_ids.copy(),
+                dtype=float64,
+            )
+
+        return self._series
+
+    cdef dict stats(self):
+        if self._stats is not None:
+            return self._stats
+
+        cdef np.ndarray pnls = self.values()
+        cdef np.ndarray winners = pnls[pnls > 0.0]
+        cdef np.ndarray losers = pnls[pnls <= 0.0]
+        cdef int count = len(pnls)
+
+        self._stats = {
+            "max_winner": pnls.max() if count else 0.0,
+            "max_loser": pnls.min() if count else 0.0,
+            "min_winner": winners.min() if len(winners) else 0.0,
+            "min_loser": losers.max() if len(losers) else 0.0,  # max is least loser
+            "avg_winner": winners.mean() if len(winners) else 0.0,
+            "avg_loser": losers.mean() if len(losers) else 0.0,
+            "win_rate": len(winners) / float(max(1, count)),
+        }
+
+        return self._stats
+
+
 cdef class PerformanceAnalyzer:
     """
     Provides a performance analyzer for tracking and generating performance
@@ -55,8 +168,9 @@ cdef class PerformanceAnalyzer:
         """
         self._account_balances_starting = {}  # type: dict[Currency, Money]
         self._account_balances = {}           # type: dict[Currency, Money]
-        self._realized_pnls = {}              # type: dict[Currency, list[float]]
-        self._daily_returns = pd.Series(dtype=float64)
+        self._realized_pnls = {}              # type: dict[Currency, RealizedPnLBuffer]
+        self._returns_buckets = {}            # type: dict[date, float]
+        self._daily_returns = None
 
     cpdef void calculate_statistics(self, Account account, list positions) except *:
         """
@@ -76,7 +190,8 @@ cdef class PerformanceAnalyzer:
         self._account_balances_starting = account.starting_balances()
         self._account_balances = account.balances_total()
         self._realized_pnls = {}
-        self._daily_returns = pd.Series(dtype=float64)
+        self._returns_buckets = {}
+        self._daily_returns = None
 
         self.add_positions(positions)
 
@@ -92,10 +207,51 @@ cdef class PerformanceAnalyzer:
         """
         Condition.not_none(positions, "positions")
 
+        if not positions:
+            return
+
+        cdef int count = len(positions)
+        cdef dict pnls = {}  # type: dict[Currency, tuple[list[str], list[float]]]
+        cdef np.ndarray ts_closed = np.empty(count, dtype=np.int64)
+        cdef np.ndarray returns = np.empty(count, dtype=np.float64)
+
+        cdef int i
         cdef Position position
-        for position in positions:
-            self.add_trade(position.id, position.realized_pnl)
-            self.add_return(nanos_to_unix_dt(position.ts_closed_ns), position.realized_return)
+        cdef Money realized_pnl
+        cdef tuple columns
+        for i in range(count):
+            position = positions[i]
+            realized_pnl = position.realized_pnl
+            columns = pnls.get(realized_pnl.currency)
+            if columns is None:
+                columns = ([], [])
+                pnls[realized_pnl.currency] = columns
+            columns[0].append(position.id.value)
+            columns[1].append(realized_pnl.as_double())
+            ts_closed[i] = position.ts_closed_ns
+            returns[i] = position.realized_return
+
+        cdef Currency currency
+        for currency, columns in pnls.items():
+            self._get_pnl_buffer(currency).extend(columns[0], columns[1])
+
+        # Bucket returns by UTC date, preserving first-seen order of the dates
+        cdef np.ndarray days = ts_closed // _NANOSECONDS_IN_DAY
+        unique_days, first_index, inverse = np.unique(
+            days,
+            return_index=True,
+            return_inverse=True,
+        )
+        cdef np.ndarray sums = np.bincount(inverse, weights=returns, minlength=len(unique_days))
+
+        cdef dict buckets = self._returns_buckets
+        cdef date index_date
+        cdef int j
+        for j in np.argsort(first_index, kind="stable"):
+            index_date = date.fromordinal(_UNIX_EPOCH_ORDINAL + int(unique_days[j]))
+            buckets[index_date] = buckets.get(index_date, 0.0) + sums[j]
+
+        self._daily_returns = None
 
     cpdef void add_trade(self, PositionId position_id, Money realized_pnl) except *:
         """
@@ -112,10 +268,10 @@ cdef class PerformanceAnalyzer:
         Condition.not_none(position_id, "position_id")
         Condition.not_none(realized_pnl, "realized_pnl")
 
-        cdef Currency currency = realized_pnl.currency
-        realized_pnls = self._realized_pnls.get(currency, pd.Series(dtype=float64))
-        realized_pnls.loc[position_id.value] = realized_pnl.as_double()
-        self._realized_pnls[currency] = realized_pnls
+        self._get_pnl_buffer(realized_pnl.currency).append(
+            position_id.value,
+            realized_pnl.as_double(),
+        )
 
     cpdef void add_return(self, datetime timestamp, double value) except *:
         """
@@ -132,10 +288,8 @@ cdef class PerformanceAnalyzer:
         Condition.not_none(timestamp, "time")
 
         cdef date index_date = timestamp.date()
-        if index_date not in self._daily_returns:
-            self._daily_returns.loc[index_date] = 0
-
-        self._daily_returns.loc[index_date] += value
+        self._returns_buckets[index_date] = self._returns_buckets.get(index_date, 0.0) + value
+        self._daily_returns = None
 
     cpdef void reset(self) except *:
         """
@@ -146,7 +300,31 @@ cdef class PerformanceAnalyzer:
         self._account_balances_starting = {}
         self._account_balances = {}
         self._realized_pnls = {}
-        self._daily_returns = pd.Series(dtype=float64)
+        self._returns_buckets = {}
+        self._daily_returns = None
+
+    cdef RealizedPnLBuffer _get_pnl_buffer(self, Currency currency):
+        cdef RealizedPnLBuffer buffer = self._realized_pnls.get(currency)
+        if buffer is None:
+            buffer = RealizedPnLBuffer()
+            self._realized_pnls[currency] = buffer
+
+        return buffer
+
+    cdef dict _pnl_stats(self, Currency currency):
+        if currency is None:
+            Condition.true(len(self._account_balances) <= 1, "currency was None for multi-currency portfolio")
+            if not self._account_balances:
+                return None
+            currency = next(iter(self._account_balances.keys()))
+        if not self._realized_pnls:
+            return None
+
+        cdef RealizedPnLBuffer buffer = self._realized_pnls.get(currency)
+        if buffer is None or buffer._count == 0:
+            return None
+
+        return buffer.stats()
 
     cpdef object realized_pnls(self, Currency currency=None):
         """
@@ -169,13 +347,19 @@ cdef class PerformanceAnalyzer:
             If currency is None when analyzing multi-currency portfolios.
 
         """
-        if not self._realized_pnls:
-            return None
         if currency is None:
-            Condition.true(len(self._account_balances) == 1, "currency was None for multi-currency portfolio")
+            Condition.true(len(self._account_balances) <= 1, "currency was None for multi-currency portfolio")
+            if not self._account_balances:
+                return None
             currency = next(iter(self._account_balances.keys()))
+        if not self._realized_pnls:
+            return None
+
+        cdef RealizedPnLBuffer buffer = self._realized_pnls.get(currency)
+        if buffer is None:
+            return None
 
-        return self._realized_pnls.get(currency)
+        return buffer.to_series()
 
     cpdef double total_pnl(self, Currency currency=None) except *:
         """
@@ -275,11 +459,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
+        cdef dict stats = self._pnl_stats(currency)
+        if stats is None:
             return 0.0
 
-        return max(realized_pnls)
+        return stats["max_winner"]
 
     cpdef double max_loser(self, Currency currency=None) except *:
         """
@@ -295,11 +479,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
+        cdef dict stats = self._pnl_stats(currency)
+        if stats is None:
             return 0.0
 
-        return min(realized_pnls)
+        return stats["max_loser"]
 
     cpdef double min_winner(self, Currency currency=None) except *:
         """
@@ -315,15 +499,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
-            return 0.0
-
-        cdef list winners = [x for x in realized_pnls if x > 0.0]
-        if realized_pnls is None or not winners:
+        cdef dict stats = self._pnl_stats(currency)
+        if stats is None:
             return 0.0
 
-        return min(np.asarray(winners, dtype=np.float64))
+        return stats["min_winner"]
 
     cpdef double min_loser(self, Currency currency=None) except *:
         """
@@ -339,15 +519,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
+        cdef dict stats = self._pnl_stats(currency)
+        if stats is None:
             return 0.0
 
-        cdef list losers = [x for x in realized_pnls if x <= 0.0]
-        if not losers:
-            return 0.0
-
-        return max(np.asarray(losers, dtype=np.float64))  # max is least loser
+        return stats["min_loser"]
 
     cpdef double avg_winner(self, Currency currency=None) except *:
         """
@@ -363,16 +539,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
+        cdef dict stats = self._pnl_stats(currency)
+        if stats is None:
             return 0.0
 
-        cdef np.ndarray pnls = realized_pnls.to_numpy()
-        cdef np.ndarray winners = pnls[pnls > 0.0]
-        if len(winners) == 0:
-            return 0.0
-        else:
-            return winners.mean()
+        return stats["avg_winner"]
 
     cpdef double avg_loser(self, Currency currency=None) except *:
         """
@@ -388,16 +559,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
+        cdef dict stats = self._pnl_stats(currency)
+        if stats is None:
             return 0.0
 
-        cdef np.ndarray pnls = realized_pnls.to_numpy()
-        cdef np.ndarray losers = pnls[pnls <= 0.0]
-        if len(losers) == 0:
-            return 0.0
-        else:
-            return losers.mean()
+        return stats["avg_loser"]
 
     cpdef double win_rate(self, Currency currency=None) except *:
         """
@@ -413,14 +579,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
+        cdef dict stats = self._pnl_stats(currency)
+        if stats is None:
             return 0.0
 
-        cdef list winners = [x for x in realized_pnls if x > 0.0]
-        cdef list losers = [x for x in realized_pnls if x <= 0.0]
-
-        return len(winners) / float(max(1, (len(winners) + len(losers))))
+        return stats["win_rate"]
 
     cpdef double expectancy(self, Currency currency=None) except *:
         """
@@ -436,14 +599,14 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
+        cdef dict stats = self._pnl_stats(currency)
+        if stats is None:
             return 0.0
 
-        cdef double win_rate = self.win_rate(currency)
+        cdef double win_rate = stats["win_rate"]
         cdef double loss_rate = 1.0 - win_rate
 
-        return (self.avg_winner(currency) * win_rate) + (self.avg_loser(currency) * loss_rate)
+        return (stats["avg_winner"] * win_rate) + (stats["avg_loser"] * loss_rate)
 
     cpdef object daily_returns(self):
         """
@@ -454,6 +617,13 @@ cdef class PerformanceAnalyzer:
         pd.Series
 
         """
+        if self._daily_returns is None:
+            self._daily_returns = pd.Series(
+                list(self._returns_buckets.values()),
+                index=list(self._returns_buckets.keys()),
+                dtype=float64,
+            )
+
         return self._daily_returns
 
     cpdef double annual_return(self) except *:
@@ -469,7 +639,7 @@ cdef class PerformanceAnalyzer:
         This is equivalent to the compound annual growth rate.
 
         """
-        return annual_return(returns=self._daily_returns)
+        return annual_return(returns=self.daily_returns())
 
     cpdef double cum_return(self) except *:
         """
@@ -480,7 +650,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return cum_returns_final(returns=self._daily_returns)
+        return cum_returns_final(returns=self.daily_returns())
 
     cpdef double max_drawdown_return(self) except *:
         """
@@ -491,7 +661,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return max_drawdown(returns=self._daily_returns)
+        return max_drawdown(returns=self.daily_returns())
 
     cpdef double annual_volatility(self) except *:
         """
@@ -502,7 +672,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return annual_volatility(returns=self._daily_returns)
+        return annual_volatility(returns=self.daily_returns())
 
     cpdef double sharpe_ratio(self) except *:
         """
@@ -513,7 +683,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return sharpe_ratio(returns=self._daily_returns)
+        return sharpe_ratio(returns=self.daily_returns())
 
     cpdef double calmar_ratio(self) except *:
         """
@@ -524,7 +694,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return calmar_ratio(returns=self._daily_returns)
+        return calmar_ratio(returns=self.daily_returns())
 
     cpdef double sortino_ratio(self) except *:
         """
@@ -535,7 +705,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return sortino_ratio(returns=self._daily_returns)
+        return sortino_ratio(returns=self.daily_returns())
 
     cpdef double omega_ratio(self) except *:
         """
@@ -546,7 +716,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return omega_ratio(returns=self._daily_returns)
+        return omega_ratio(returns=self.daily_returns())
 
     cpdef double stability_of_timeseries(self) except *:
         """
@@ -557,7 +727,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return stability_of_timeseries(returns=self._daily_returns)
+        return stability_of_timeseries(returns=self.daily_returns())
 
     cpdef double returns_mean(self) except *:
         """
@@ -568,7 +738,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return np.mean(self._daily_returns)
+        return np.mean(self.daily_returns())
 
     cpdef double returns_variance(self) except *:
         """
@@ -579,7 +749,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return np.var(self._daily_returns)
+        return np.var(self.daily_returns())
 
     cpdef double returns_skew(self) except *:
         """
@@ -590,7 +760,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return skew(self._daily_returns)
+        return skew(self.daily_returns())
 
     cpdef double returns_kurtosis(self) except *:
         """
@@ -601,7 +771,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return kurtosis(self._daily_returns)
+        return kurtosis(self.daily_returns())
 
     cpdef double returns_tail_ratio(self) except *:
         """
@@ -612,7 +782,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return tail_ratio(self._daily_returns)
+        return tail_ratio(self.daily_returns())
 
     cpdef double alpha(self) except *:
         """
@@ -623,7 +793,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return alpha(returns=self._daily_returns, factor_returns=self._daily_returns)
+        return alpha(returns=self.daily_returns(), factor_returns=self.daily_returns())
 
     cpdef double beta(self) except *:
         """
@@ -634,7 +804,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return beta(returns=self._daily_returns, factor_returns=self._daily_returns)
+        return beta(returns=self.daily_returns(), factor_returns=self.daily_returns())
 
     cpdef dict get_performance_stats_pnls(self, Currency currency=None):
         """
@@ -15,18 +15,29 @@
 
 from collections import defaultdict
 from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+import hashlib
+import heapq
 from io import BytesIO
+import itertools
 from itertools import takewhile
+import multiprocessing
 import os
 import pathlib
 import re
+import threading
+import time
 from typing import Callable, Generator
+import uuid
 import warnings
 
 import fsspec
 import orjson
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 from tqdm import tqdm
@@ -40,6 +51,8 @@ from nautilus_trader.model.instruments.base import Instrument
 from nautilus_trader.model.orderbook.data import OrderBookDelta
 from nautilus_trader.model.orderbook.data import OrderBookDeltas
 from nautilus_trader.model.orderbook.data import OrderBookSnapshot
+from nautilus_trader.serialization.arrow.core import _chunk
+from nautilus_trader.serialization.arrow.core import _decode
 from nautilus_trader.serialization.arrow.core import _deserialize
 from nautilus_trader.serialization.arrow.core import _partition_keys
 from nautilus_trader.serialization.arrow.core import _schemas
@@ -48,12 +61,24 @@ from nautilus_trader.serialization.arrow.core import _serialize
 
 NewFile = namedtuple("NewFile", "name")
 EOStream = namedtuple("EOStream", "")
+RowGroup = namedtuple("RowGroup", "key ts_min ts_max fragment cls filter schema is_last")
+IngestStats = namedtuple("IngestStats", "name bytes rows seconds bytes_per_second rows_per_second")
+DEFAULT_MAX_INFLIGHT_BYTES = 256 * 1024 * 1024
+DEFAULT_FRAGMENT_TARGET_BYTES = 64 * 1024 * 1024
+MANIFEST_FILENAME = "_manifest.json"
+HASH_BLOCK_SIZE = 1024 * 1024
 GENERIC_DATA_PREFIX = "genericdata_"
 category_attributes = {
     "TradeTick": ["instrument_id", "type", "aggressor_side"],
     "OrderBookDelta": ["instrument_id", "type", "level", "delta_type", "order_size"],
 }
 NAUTILUS_TS_COLUMNS = ("ts_event_ns", "ts_recv_ns", "timestamp_ns")
+BACKTEST_DATA_TYPES = {
+    "order_book_deltas": ("order_book_delta", OrderBookDelta),
+    "trade_ticks": ("trade_tick", TradeTick),
+    "instrument_status_events": ("instrument_status_update", InstrumentStatusUpdate),
+    "quote_ticks": ("quote_tick", QuoteTick),
+}
 
 
 class ByteParser:
@@ -327,8 +352,52 @@ class DataLoader:
         else:
             raise ValueError("path argument must be str and a valid directory or file")
 
-    def stream_bytes(self, progress=False):
-        path = self.path if not progress else tqdm(self.path)
+    def file_hash(self, fn: str) -> str:
+        """
+        Return the hash of the (raw) contents of the given file.
+
+        Parameters
+        ----------
+        fn : str
+            The file path.
+
+        Returns
+        -------
+        str
+
+        """
+        hasher = hashlib.sha256()
+        with self.fs.open(fn, "rb") as f:
+            data = f.read(HASH_BLOCK_SIZE)
+            while data:
+                hasher.update(data)
+                data = f.read(HASH_BLOCK_SIZE)
+        return hasher.hexdigest()
+
+    def file_stat(self, fn: str):
+        """
+        Return the size and modification time of the given file.
+
+        Parameters
+        ----------
+        fn : str
+            The file path.
+
+        Returns
+        -------
+        tuple[int, float or None]
+            The modification time is None if not supported by the filesystem.
+
+        """
+        try:
+            mtime = self.fs.modified(fn).timestamp()
+        except NotImplementedError:
+            mtime = None
+        return self.fs.size(fn), mtime
+
+    def stream_bytes(self, progress=False, files=None):
+        path = self.path if files is None else files
+        path = path if not progress else tqdm(path)
         for fn in path:
             with fsspec.open(f"{self.fs_protocol}://{fn}", compression=self.compression) as f:
                 yield NewFile(fn)
@@ -339,9 +408,9 @@ class DataLoader:
                     yield None  # this is a chunk
         yield EOStream()
 
-    def run(self, progress=False):
+    def run(self, progress=False, files=None):
         stream = self.parser.read(
-            stream=self.stream_bytes(progress=progress),
+            stream=self.stream_bytes(progress=progress, files=files),
             instrument_provider=self.instrument_provider,
         )
         while 1:
@@ -384,11 +453,18 @@ class DataCatalog:
         )
         self.root = pathlib.Path(path or os.environ["NAUTILUS_BACKTEST_DIR"])
         self._processed_files_fn = f"{self.root}/.processed_raw_files.json"
+        self._manifest_lock = threading.RLock()
 
     # ---- Loading data ---------------------------------------------------------------------------------------- #
 
     def import_from_data_loader(
-        self, loader: DataLoader, append_only=False, progress=False, **kwargs
+        self,
+        loader: DataLoader,
+        append_only=False,
+        progress=False,
+        workers=None,
+        max_inflight_bytes=DEFAULT_MAX_INFLIGHT_BYTES,
+        **kwargs,
     ):
         """
         Load data from a DataLoader instance into the backtest catalogue.
@@ -398,29 +474,173 @@ class DataCatalog:
         loader : DataLoader
             The data loader to use.
         append_only : bool
-            If read existing data to dedupe + sort.
-            Use this if the data is strictly ordered.
+            Retained for compatibility; data is always written as new fragments,
+            which are de-duplicated and sorted by `compact`.
+        progress : bool
+            If progress should be shown.
+        workers : int, optional
+            The number of worker processes to parse files with. If None or 1
+            the files are parsed and written serially in this process.
+        max_inflight_bytes : int
+            The approximate memory budget (in bytes) for files being parsed plus
+            parsed tables waiting to be written (parallel mode only). Files being
+            parsed are estimated from their size and the parsed to raw size ratio
+            of the files parsed so far.
         kwargs : dict
             The kwargs passed through to `ParquetWriter`.
 
+        Returns
+        -------
+        list[IngestStats] or None
+            The per-file throughput statistics (parallel mode only).
+
+        Notes
+        -----
+        Raw files are skipped when their contents hash matches that of a
+        previous import of the same file. Files are only hashed again when
+        their size or modification time have changed.
+
+        In parallel mode each file is parsed in a worker process into Arrow
+        tables, which are concatenated and written by this (single writer)
+        process without converting them to pandas.
+        Parsers are inherited by forked workers, so need only be picklable
+        where the platform does not support `fork`.
+
         """
-        for chunk in loader.run(progress=progress):
-            self._write_chunks(chunk=chunk, append_only=append_only, **kwargs)
+        if workers is not None and workers > 1:
+            return self._import_parallel(
+                loader=loader,
+                workers=workers,
+                max_inflight_bytes=max_inflight_bytes,
+                append_only=append_only,
+                progress=progress,
+                **kwargs,
+            )
+
+        files, file_hashes = self._unprocessed_files(loader)
+        for chunk in loader.run(progress=progress, files=files):
+            self._write_chunks(
+                chunk=chunk,
+                append_only=append_only,
+                file_hashes=file_hashes,
+                **kwargs,
+            )
+
+    def _import_parallel(
+        self,
+        loader: DataLoader,
+        workers: int,
+        max_inflight_bytes: int,
+        append_only=False,
+        progress=False,
+        **kwargs,
+    ):
+        assert max_inflight_bytes > 0, "max_inflight_bytes must be positive"
+        kwargs.pop("log_filenames", None)
+
+        files, file_hashes = self._unprocessed_files(loader)
+        budget = _InflightBudget(
+            sizes={fn: loader.fs.size(fn) or 0 for fn in files},
+            max_bytes=max_inflight_bytes,
+        )
+        buffer = _TableBuffer(catalog=self, file_hashes=file_hashes, **kwargs)
+
+        stats = []
+        pending = {}  # type: dict[Future, str]
+        queue = iter(files)
+        next_file = next(queue, None)
+        progress_bar = tqdm(total=len(files)) if progress else None
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_ingest_mp_context(),
+            initializer=_init_ingest_worker,
+            initargs=(loader,),
+        ) as executor:
+            while next_file is not None or pending:
+                # Submit files while within the in-flight memory budget
+                while next_file is not None and len(pending) < workers * 2:
+                    if pending and not budget.fits(next_file, buffer.nbytes):
+                        break
+                    pending[executor.submit(_ingest_file, next_file)] = next_file
+                    budget.charge(next_file)
+                    next_file = next(queue, None)
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    fn = pending.pop(future)
+                    tables, file_stats = future.result()
+                    budget.release(fn, parsed_bytes=sum(t.nbytes for t in tables.values()))
+                    buffer.add(fn, tables)
+                    stats.append(file_stats)
+                    if progress_bar is not None:
+                        progress_bar.update(1)
+
+                if buffer.nbytes >= max_inflight_bytes // 2:
+                    buffer.flush()
+
+        buffer.flush()
+        if progress_bar is not None:
+            progress_bar.close()
+
+        return stats
 
     def _save_processed_raw_files(self, files):
-        # TODO(bm): We should save a hash of the contents alongside the filename to check for changes
-        # load existing
-        existing = self._load_processed_raw_files()
-        new = set(files + existing)
+        # Merge with existing {filename: {"hash", "size", "mtime"}}
+        processed = self._load_processed_raw_files()
+        processed.update(files)
         with self.fs.open(self._processed_files_fn, "wb") as f:
-            return f.write(orjson.dumps(sorted(new)))
+            return f.write(orjson.dumps(processed, option=orjson.OPT_SORT_KEYS))
 
     def _load_processed_raw_files(self):
         if self.fs.exists(self._processed_files_fn):
             with self.fs.open(self._processed_files_fn, "rb") as f:
-                return orjson.loads(f.read())
+                processed = orjson.loads(f.read())
+            if isinstance(processed, list):
+                # Filename only (no hash) format
+                return {fn: None for fn in processed}
+            return processed
         else:
-            return []
+            return {}
+
+    @staticmethod
+    def _is_processed(processed_raw_files, fn, file_hash):
+        # A file is only reprocessed if both hashes are known and differ
+        if fn not in processed_raw_files:
+            return False
+        processed_hash = _record_hash(processed_raw_files[fn])
+        file_hash = _record_hash(file_hash)
+        return processed_hash is None or file_hash is None or processed_hash == file_hash
+
+    def _unprocessed_files(self, loader):
+        # Returns the files to import, and the {filename: record} of all files
+        processed_raw_files = self._load_processed_raw_files()
+        file_hashes = {}
+        touched = {}
+        for fn in loader.path:
+            size, mtime = loader.file_stat(fn)
+            record = processed_raw_files.get(fn)
+            if (
+                isinstance(record, dict)
+                and mtime is not None
+                and record.get("size") == size
+                and record.get("mtime") == mtime
+            ):
+                file_hashes[fn] = record  # Unchanged since it was hashed
+                continue
+            file_hashes[fn] = {"hash": loader.file_hash(fn), "size": size, "mtime": mtime}
+            if record is not None and self._is_processed(processed_raw_files, fn, file_hashes[fn]):
+                touched[fn] = file_hashes[fn]  # Same contents, so store the new size and mtime
+
+        if touched:
+            self._save_processed_raw_files(files=touched)
+
+        files = [
+            fn
+            for fn in loader.path
+            if not self._is_processed(processed_raw_files, fn, file_hashes[fn])
+        ]
+        return files, file_hashes
 
     @staticmethod
     def _determine_partition_cols(cls, instrument_id):
@@ -430,25 +650,24 @@ class DataCatalog:
             return ["instrument_id"]
         return
 
-    def _write_chunks(self, chunk, append_only=False, **kwargs):  # noqa: C901
-        processed_raw_files = self._load_processed_raw_files()
-        log_filenames = kwargs.pop("log_filenames", False)
-
+    @staticmethod
+    def _split_chunk(chunk, processed_raw_files, file_hashes=None, log_filenames=False):
         # Split objects into their respective tables
         type_conv = {OrderBookDeltas: OrderBookDelta, OrderBookSnapshot: OrderBookDelta}
         tables = defaultdict(dict)
         skip_file = False
         for obj in chunk:
-            if skip_file:
-                continue
             if isinstance(obj, NewFile):
                 if log_filenames:
                     print(obj.name)
-                if obj.name in processed_raw_files:
+                file_hash = file_hashes.get(obj.name) if file_hashes else None
+                if DataCatalog._is_processed(processed_raw_files, obj.name, file_hash):
                     skip_file = True
                 else:
                     skip_file = False
-                    processed_raw_files.append(obj.name)
+                    processed_raw_files[obj.name] = file_hash
+                continue
+            if skip_file:
                 continue
 
             # TODO (bm) - better handling of instruments -> currency we're writing a file per instrument
@@ -459,76 +678,269 @@ class DataCatalog:
                     tables[cls][instrument_id] = []
                 tables[cls][instrument_id].append(data)
 
+        return tables
+
+    def _write_chunks(self, chunk, append_only=False, file_hashes=None, **kwargs):
+        processed_raw_files = self._load_processed_raw_files()
+        log_filenames = kwargs.pop("log_filenames", False)
+
+        tables = self._split_chunk(
+            chunk,
+            processed_raw_files,
+            file_hashes=file_hashes,
+            log_filenames=log_filenames,
+        )
+
         for cls in tables:
             for ins_id in tables[cls]:
-                name = f"{camel_to_snake_case(cls.__name__)}.parquet"
-                if is_custom_data(cls):
-                    name = f"{GENERIC_DATA_PREFIX}{camel_to_snake_case(cls.__name__)}.parquet"
-                fn = self.root.joinpath(name)
-
                 df = pd.DataFrame(tables[cls][ins_id])
 
                 if df.empty:
                     continue
 
-                ts_col = None
-                for c in NAUTILUS_TS_COLUMNS:
-                    if c in df.columns:
-                        ts_col = c
-                assert ts_col is not None, f"Could not find timestamp column for type: {cls}"
-
-                partition_cols = self._determine_partition_cols(cls=cls, instrument_id=ins_id)
-
-                # Load any existing data, drop dupes
-                if not append_only:
-                    if self.fs.exists(fn) or self.fs.isdir(str(fn)):
-                        existing = self._query(
-                            filename=camel_to_snake_case(cls.__name__),
-                            instrument_ids=ins_id,
-                            ts_column=ts_col,
-                        )
-                        if not existing.empty:
-                            df = df.append(existing).drop_duplicates()
-                            # Remove this file/partition, will be written again
-                            if partition_cols:
-                                assert partition_cols == [
-                                    "instrument_id"
-                                ], "Only support appending to instrument_id partitions"
-                                # We only want to remove this partition
-                                partition_path = f"/instrument_id={clean_key(ins_id)}"
-                                self.fs.rm(str(fn) + partition_path, recursive=True)
-                            else:
-                                self.fs.rm(str(fn), recursive=True)
-
-                df = df.sort_values(ts_col)
-                df = df.astype({k: "category" for k in category_attributes.get(cls.__name__, [])})
-                for col in NAUTILUS_TS_COLUMNS:
-                    if col in df.columns:
-                        df = df.sort_values(col)
-                        break
+                self._write_frame(cls, ins_id, df, **kwargs)
 
-                clean_partition_cols(df, partition_cols)
-
-                table = pa.Table.from_pandas(df, schema=_schemas.get(cls.__name__))
-                metadata_collector = []
-                pq.write_to_dataset(
-                    table=table,
-                    root_path=str(fn),
-                    filesystem=self.fs,
-                    partition_cols=partition_cols,
-                    # use_legacy_dataset=True,
-                    version="2.0",
-                    metadata_collector=metadata_collector,
-                    **kwargs,
+        # Save any new processed files
+        self._save_processed_raw_files(files=processed_raw_files)
+
+    def _write_frame(self, cls, ins_id, df, **kwargs):
+        df = df.astype({k: "category" for k in category_attributes.get(cls.__name__, [])})
+        self._write_table(cls, ins_id, pa.Table.from_pandas(df, preserve_index=False), **kwargs)
+
+    def _write_table(self, cls, ins_id, table, **kwargs):
+        # Write the data as new immutable fragment(s), existing data is never
+        # read or rewritten here (de-duplication is deferred to `compact`).
+        name = f"{camel_to_snake_case(cls.__name__)}.parquet"
+        if is_custom_data(cls):
+            name = f"{GENERIC_DATA_PREFIX}{camel_to_snake_case(cls.__name__)}.parquet"
+        fn = self.root.joinpath(name)
+
+        ts_col = None
+        for c in NAUTILUS_TS_COLUMNS:
+            if c in table.column_names:
+                ts_col = c
+        assert ts_col is not None, f"Could not find timestamp column for type: {cls}"
+
+        table = _encode_categories(table, category_attributes.get(cls.__name__, []))
+        sort_col = next(c for c in NAUTILUS_TS_COLUMNS if c in table.column_names)
+        table = table.take(pc.sort_indices(table, sort_keys=[(sort_col, "ascending")]))
+
+        partition_cols = self._determine_partition_cols(cls=cls, instrument_id=ins_id)
+        schema = _schemas.get(cls.__name__)
+        metadata_schema = schema if schema is not None else table.schema
+        if schema is not None:
+            for col in partition_cols or []:
+                if col in schema.names:
+                    schema = schema.remove(schema.get_field_index(col))
+
+        fragments = [
+            self._write_fragment(
+                fn=fn,
+                partition=partition,
+                table=partition_table,
+                schema=schema,
+                ts_col=ts_col,
+                **kwargs,
+            )
+            for partition, partition_table in _partition_table(table, partition_cols)
+        ]
+
+        with self._manifest_lock:
+            manifest = self._load_manifest(fn)
+            manifest["ts_column"] = ts_col
+            # Without a manifest the fragments just written are discovered on disk
+            written = {f["path"] for f in fragments}
+            manifest["fragments"] = [
+                f for f in manifest["fragments"] if f["path"] not in written
+            ] + fragments
+            self._save_manifest(fn, manifest)
+
+        # Write the ``_common_metadata`` parquet file without row groups statistics
+        pq.write_metadata(metadata_schema, fn / "_common_metadata", version="2.0")
+
+        # Write the ``_metadata`` parquet file with row groups statistics of all files
+        pq.write_metadata(metadata_schema, fn / "_metadata", version="2.0")
+
+    def _write_fragment(self, fn, partition, table, schema, ts_col, **kwargs):
+        directory = fn.joinpath(partition) if partition else fn
+        self.fs.makedirs(str(directory), exist_ok=True)
+        path = directory.joinpath(f"{uuid.uuid4().hex}.parquet")
+
+        if schema is not None:
+            table = table.select(schema.names).cast(schema)
+        with self.fs.open(str(path), "wb") as f:
+            pq.write_table(table, f, version="2.0", **kwargs)
+
+        ts_range = pc.min_max(table.column(ts_col)).as_py() if table.num_rows else {}
+        return {
+            "path": str(path.relative_to(fn)),
+            "partition": partition,
+            "rows": table.num_rows,
+            "bytes": self.fs.size(str(path)),
+            "ts_min": ts_range.get("min"),
+            "ts_max": ts_range.get("max"),
+        }
+
+    # ---- Fragments -------------------------------------------------------------------------------------- #
+
+    def _load_manifest(self, fn):
+        path = str(fn / MANIFEST_FILENAME)
+        if self.fs.exists(path):
+            with self.fs.open(path, "rb") as f:
+                return orjson.loads(f.read())
+        manifest = {"ts_column": None, "fragments": []}
+        if self.fs.isdir(str(fn)):
+            # Fragments written before the manifest existed (no known timestamps)
+            for file in sorted(self.fs.find(str(fn))):
+                relative = pathlib.PurePosixPath(file).relative_to(self.fs._strip_protocol(str(fn)))
+                if not file.endswith(".parquet") or any(
+                    part.startswith(("_", ".")) for part in relative.parts
+                ):
+                    continue
+                manifest["fragments"].append(
+                    {
+                        "path": str(relative),
+                        "partition": str(relative.parent) if relative.parent.parts else "",
+                        "rows": None,
+                        "bytes": self.fs.size(file),
+                        "ts_min": None,
+                        "ts_max": None,
+                    }
                 )
-                # Write the ``_common_metadata`` parquet file without row groups statistics
-                pq.write_metadata(table.schema, fn / "_common_metadata", version="2.0")
+        return manifest
 
-                # Write the ``_metadata`` parquet file with row groups statistics of all files
-                pq.write_metadata(table.schema, fn / "_metadata", version="2.0")
+    def _save_manifest(self, fn, manifest):
+        with self.fs.open(str(fn / MANIFEST_FILENAME), "wb") as f:
+            f.write(orjson.dumps(manifest))
 
-            # Save any new processed files
-        self._save_processed_raw_files(files=processed_raw_files)
+    def fragments(self, cls):
+        """
+        Return the fragments manifest for the given data type.
+
+        Parameters
+        ----------
+        cls : type
+            The data type.
+
+        Returns
+        -------
+        list[dict]
+            The fragments with their `path`, `partition`, `rows`, `bytes`,
+            `ts_min` and `ts_max`.
+
+        """
+        with self._manifest_lock:
+            return self._load_manifest(self._dataset_path(cls))["fragments"]
+
+    def _dataset_path(self, cls):
+        name = f"{camel_to_snake_case(cls.__name__)}.parquet"
+        if is_custom_data(cls):
+            name = f"{GENERIC_DATA_PREFIX}{name}"
+        return self.root.joinpath(name)
+
+    def compact(self, cls=None, target_bytes=DEFAULT_FRAGMENT_TARGET_BYTES, background=False):
+        """
+        Compact the fragments of the catalog datasets.
+
+        Within each partition, fragments smaller than the target size (along
+        with any fragments overlapping them in time) are merged, de-duplicated,
+        sorted and rewritten as files of approximately the target size.
+
+        Parameters
+        ----------
+        cls : type, optional
+            The data type to compact, if None then all datasets are compacted.
+        target_bytes : int
+            The target size (in bytes) of compacted files.
+        background : bool
+            If the compaction should run on a background thread.
+
+        Returns
+        -------
+        threading.Thread or None
+            The background thread (if `background`).
+
+        """
+        assert target_bytes > 0, "target_bytes must be positive"
+        if background:
+            thread = threading.Thread(
+                target=self.compact,
+                kwargs={"cls": cls, "target_bytes": target_bytes},
+                daemon=True,
+            )
+            thread.start()
+            return thread
+
+        if cls is not None:
+            paths = [self._dataset_path(cls)]
+        else:
+            paths = [
+                self.root.joinpath(pathlib.Path(path).name)
+                for path in self.fs.ls(str(self.root), detail=False)
+                if path.endswith(".parquet") and self.fs.isdir(path)
+            ]
+
+        for fn in paths:
+            if self.fs.isdir(str(fn)):
+                self._compact_dataset(fn, target_bytes)
+
+    def _compact_dataset(self, fn, target_bytes):
+        with self._manifest_lock:
+            manifest = self._load_manifest(fn)
+
+        partitions = defaultdict(list)
+        for fragment in manifest["fragments"]:
+            partitions[fragment["partition"]].append(fragment)
+
+        for partition, fragments in partitions.items():
+            selected = _select_compaction_fragments(fragments, target_bytes)
+            if len(selected) < 2:
+                continue  # Nothing to merge
+            self._compact_fragments(fn, partition, selected, manifest["ts_column"], target_bytes)
+
+    def _compact_fragments(self, fn, partition, fragments, ts_col, target_bytes):
+        tables = []
+        for fragment in fragments:
+            with self.fs.open(str(fn / fragment["path"]), "rb") as f:
+                tables.append(pq.read_table(f))
+        table = pa.concat_tables(tables)
+
+        df = table.to_pandas().drop_duplicates()
+        if ts_col is None:
+            ts_col = next((c for c in NAUTILUS_TS_COLUMNS if c in df.columns), None)
+        if ts_col is not None:
+            df = df.sort_values(ts_col, kind="mergesort")
+
+        # Size output files by the on-disk bytes per row of the inputs
+        total_bytes = sum(fragment["bytes"] for fragment in fragments)
+        rows_per_file = max(1, int(target_bytes * table.num_rows / max(total_bytes, 1)))
+
+        compacted = []
+        for start in range(0, len(df), rows_per_file):
+            compacted.append(
+                self._write_fragment(
+                    fn=fn,
+                    partition=partition,
+                    table=pa.Table.from_pandas(
+                        df.iloc[start : start + rows_per_file],
+                        schema=table.schema,
+                        preserve_index=False,
+                    ),
+                    schema=None,
+                    ts_col=ts_col,
+                )
+            )
+
+        removed = {fragment["path"] for fragment in fragments}
+        with self._manifest_lock:
+            manifest = self._load_manifest(fn)
+            manifest["fragments"] = [
+                fragment for fragment in manifest["fragments"] if fragment["path"] not in removed
+            ] + compacted
+            self._save_manifest(fn, manifest)
+
+        for path in removed:
+            self.fs.rm(str(fn / path))
 
     def clear_cache(self, **kwargs):
         force = kwargs.get("FORCE", False)
@@ -564,15 +976,23 @@ class DataCatalog:
             The kwargs passed to `self.load_backtest_data`.
 
         """
-        data = self.load_backtest_data(
-            instrument_ids=[ins.id.value for ins in instruments],
-            chunk_size=chunk_size,
-            **kwargs,
-        )
+        instrument_ids = [ins.id.value for ins in instruments]
 
-        # TODO(bm): Handle chunk size
         if chunk_size is not None:
-            pass
+            # Stream the data into the engine during the run
+            for instrument in instruments:
+                engine.add_instrument(instrument)
+            engine.add_data_stream(
+                CatalogDataStream(
+                    catalog=self,
+                    instrument_ids=instrument_ids,
+                    chunk_size=chunk_size,
+                    **kwargs,
+                )
+            )
+            return engine
+
+        data = self.load_backtest_data(instrument_ids=instrument_ids, **kwargs)
 
         # Add instruments & data to engine
         for instrument in instruments:
@@ -592,26 +1012,143 @@ class DataCatalog:
 
     # ---- QUERIES ---------------------------------------------------------------------------------------- #
 
-    # def _load_chunked_backtest_data(self, name, query, instrument_ids, filters, chunk_size):
-    #     """
-    #     Stream chunked data from parquet dataset
-    #
-    #     :param name:
-    #     :param query:
-    #     :param instrument_ids:
-    #     :param filters:
-    #     :return:
-    #     """
-    #     # TODO - look at dask.dataframe.aggregate_row_groups for chunking solution
-    #     dataset = query(instrument_ids=instrument_ids, filters=filters, return_dataset=True)
-    #     ts_column_idx = ds.schema.names.index('ts_recv_ns')
-    #     for piece in ds.pieces:
-    #         meta = piece.get_metadata()
-    #         for i in range(meta.num_row_groups):
-    #             rg = meta.row_group(i)
-    #             rg_size = rg.total_byte_size
-    #             ts_stats = rg.column(ts_column_idx).statistics
-    #     return
+    def _row_groups(self, names, instrument_ids=None, start=None, end=None, ts_column="ts_event_ns"):
+        # Collect the row groups for the given data type names, pruned by the
+        # filters (using row group statistics) and ordered by timestamp.
+        row_groups = []
+        for name in names:
+            filename, cls = BACKTEST_DATA_TYPES[name]
+            path = f"{self.root}/{filename}.parquet/"
+            if not self.fs.exists(path):
+                continue
+
+            dataset = ds.dataset(path, partitioning="hive", filesystem=self.fs)
+            filter_expr = self._build_filter(
+                instrument_ids=instrument_ids,
+                start=start,
+                end=end,
+                ts_column=ts_column,
+            )
+            for fragment in dataset.get_fragments(filter=filter_expr):
+                pieces = fragment.split_by_row_group(filter=filter_expr, schema=dataset.schema)
+                prev_max = None
+                carry_min = None
+                fragment_groups = []
+                for piece in pieces:
+                    statistics = piece.row_groups[0].statistics or {}
+                    stats = statistics.get(ts_column)
+                    ts_min = stats["min"] if stats else None
+                    ts_max = stats["max"] if stats else None
+                    # The trailing rows of the previous row group may be carried
+                    # into this one, so it must be loaded no later than that.
+                    lower = ts_min if ts_min is not None else -(2 ** 63)  # No statistics, so load first
+                    if ts_column == "ts_event_ns":
+                        # Carried rows share the previous row group's maximum
+                        key = prev_max if prev_max is not None else lower
+                    else:
+                        # Carried rows are grouped by `ts_event_ns`, so are only
+                        # bounded by the minimum of the row groups they span.
+                        key = lower if carry_min is None else min(lower, carry_min)
+                        event_stats = statistics.get("ts_event_ns")
+                        if event_stats and event_stats["min"] == event_stats["max"]:
+                            carry_min = key  # The whole row group may be carried
+                        else:
+                            carry_min = lower
+                    fragment_groups.append(
+                        RowGroup(key, ts_min, ts_max, piece, cls, filter_expr, dataset.schema, False)
+                    )
+                    prev_max = ts_max if ts_max is not None else prev_max
+                if fragment_groups:
+                    fragment_groups[-1] = fragment_groups[-1]._replace(is_last=True)
+                row_groups.extend(fragment_groups)
+
+        return sorted(row_groups, key=lambda rg: rg.key)
+
+    def _load_row_group(self, row_group, carried):
+        table = row_group.fragment.to_table(
+            filter=row_group.filter,
+            schema=row_group.schema,
+        )
+
+        path = row_group.fragment.path
+        if path in carried:
+            table = pa.concat_tables([carried.pop(path), table])
+
+        # Objects built from groups of rows (i.e. order book snapshots) must not
+        # be split across row groups, so hold back the rows for the trailing
+        # event timestamp until the next row group of this file is loaded.
+        if _chunk.get(row_group.cls.__name__) and not row_group.is_last and table.num_rows:
+            ts = table.column("ts_event_ns")
+            trailing = pc.equal(ts, ts[-1].as_py())
+            carried[path] = table.filter(trailing)
+            table = table.filter(pc.invert(trailing))
+
+        return _decode(row_group.cls, table)
+
+    def _load_chunked_backtest_data(
+        self,
+        names,
+        instrument_ids=None,
+        start=None,
+        end=None,
+        chunk_size=10_000,
+        ts_column="ts_event_ns",
+    ):
+        """
+        Stream time ordered batches of Nautilus objects from the parquet datasets.
+
+        Row groups are loaded lazily in order of their minimum timestamp, and
+        objects are only emitted once no unloaded row group can contain an
+        earlier object, so the memory used is bounded by the number of
+        overlapping row groups rather than by the size of the datasets.
+        """
+        row_groups = self._row_groups(
+            names=names,
+            instrument_ids=instrument_ids,
+            start=start,
+            end=end,
+            ts_column=ts_column,
+        )
+
+        pending = []  # Heap of (timestamp, sequence, object)
+        sequence = itertools.count()  # Tie breaker to preserve load order
+        carried = {}
+        batch = []
+        last_ts = None
+        first = None  # The first object emitted at `last_ts`
+        seen = None  # The keys of the objects emitted at `last_ts`
+        i = 0
+        while i < len(row_groups) or pending:
+            next_key = row_groups[i].key if i < len(row_groups) else None
+            if next_key is not None and (not pending or next_key <= pending[0][0]):
+                for obj in self._load_row_group(row_groups[i], carried):
+                    heapq.heappush(pending, (getattr(obj, ts_column), next(sequence), obj))
+                i += 1
+                continue
+
+            # Emit everything earlier than the next row group to be loaded
+            while pending and (next_key is None or pending[0][0] < next_key):
+                ts, _, obj = heapq.heappop(pending)
+                # Overlapping fragments may hold the same rows, which are only
+                # removed by `compact`, so drop objects equal to an earlier
+                # object with the same timestamp (keys are only built once a
+                # timestamp repeats).
+                if ts != last_ts:
+                    last_ts, first, seen = ts, obj, None
+                else:
+                    if seen is None:
+                        seen = {_duplicate_key(first)}
+                    key = _duplicate_key(obj)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                batch.append(obj)
+                if len(batch) >= chunk_size:
+                    yield batch
+                    batch = []
+
+        if batch:
+            yield batch
 
     def load_backtest_data(
         self,
@@ -623,6 +1160,7 @@ class DataCatalog:
         quote_ticks=False,
         instrument_status_events=True,
         chunk_size=None,
+        ts_column="ts_event_ns",
     ):
         """
         Load backtest data objects from the catalogue.
@@ -646,6 +1184,16 @@ class DataCatalog:
         chunk_size : int
             The chunk size to return (used for streaming backtest).
             Use None for a loading all the data.
+        ts_column : str
+            The timestamp column to filter on and, when chunk_size is given,
+            to order the batches by (`ts_event_ns` or `ts_recv_ns`).
+
+        Returns
+        -------
+        dict[str, list[Data]] or Generator[list[Data]]
+            The data by name, or when chunk_size is given a generator of
+            batches of up to chunk_size objects across all the data types,
+            ordered by `ts_column`.
 
         """
         assert instrument_ids is None or isinstance(
@@ -665,10 +1213,14 @@ class DataCatalog:
         data = {}
 
         if chunk_size:
-            raise KeyError
-            # data[name] = self._load_chunked_backtest_data(
-            #     chunk_size=chunk_size, name=name, query=query, instrument_ids=instrument_ids, filters=filters,
-            # )
+            return self._load_chunked_backtest_data(
+                names=[name for name, to_load, _, _ in queries if to_load],
+                instrument_ids=instrument_ids,
+                start=start_timestamp,
+                end=end_timestamp,
+                chunk_size=chunk_size,
+                ts_column=ts_column,
+            )
 
         for name, to_load, query, kw in queries:
             if to_load:
@@ -677,12 +1229,13 @@ class DataCatalog:
                     as_nautilus=True,
                     start=start_timestamp,
                     end=end_timestamp,
+                    ts_column=ts_column,
                     **kw,
                 )
 
         return data
 
-    def _query(
+    def _query_table(
         self,
         filename,
         filter_expr=None,
@@ -690,6 +1243,53 @@ class DataCatalog:
         start=None,
         end=None,
         ts_column="ts_event_ns",
+    ):
+        path = f"{self.root}/{filename}.parquet/"
+        if not self.fs.exists(path):
+            return
+
+        filter_expr = self._build_filter(
+            filter_expr=filter_expr,
+            instrument_ids=instrument_ids,
+            start=start,
+            end=end,
+            ts_column=ts_column,
+        )
+        dataset = ds.dataset(path, partitioning="hive", filesystem=self.fs)
+        table = dataset.to_table(filter=filter_expr)
+        if ts_column in table.column_names:
+            # Fragments are not rewritten on import, so restore time order (stable sort).
+            # Duplicate rows are dropped within runs of `ts_event_ns`, so also sort
+            # by it to keep duplicates adjacent when ordering by another column.
+            sort_keys = [(ts_column, "ascending")]
+            if ts_column != "ts_event_ns" and "ts_event_ns" in table.column_names:
+                sort_keys.append(("ts_event_ns", "ascending"))
+            table = table.take(pc.sort_indices(table, sort_keys=sort_keys))
+        return table
+
+    def _query(self, filename, **kwargs):
+        table = self._query_table(filename, **kwargs)
+        if table is None:
+            return
+        df = table.to_pandas().drop_duplicates()
+        if "instrument_id" in df.columns:
+            df = df.astype({"instrument_id": "category"})
+        return df
+
+    def _query_objects(self, filename, cls, **kwargs):
+        # Decode the Arrow columns directly (see `register_parquet(decoder=...)`)
+        table = self._query_table(filename, **kwargs)
+        if table is None:
+            return []
+        return _decode(cls, table)
+
+    @staticmethod
+    def _build_filter(
+        filter_expr=None,
+        instrument_ids=None,
+        start=None,
+        end=None,
+        ts_column="ts_event_ns",
     ):
         filters = [filter_expr] if filter_expr is not None else []
         if instrument_ids is not None:
@@ -702,16 +1302,7 @@ class DataCatalog:
             filters.append(ds.field(ts_column) >= int(pd.Timestamp(start).to_datetime64()))
         if end is not None:
             filters.append(ds.field(ts_column) <= int(pd.Timestamp(end).to_datetime64()))
-
-        path = f"{self.root}/{filename}.parquet/"
-        if not self.fs.exists(path):
-            return
-
-        dataset = ds.dataset(path, partitioning="hive", filesystem=self.fs)
-        df = dataset.to_table(filter=combine_filters(*filters)).to_pandas().drop_duplicates()
-        if "instrument_id" in df.columns:
-            df = df.astype({"instrument_id": "category"})
-        return df
+        return combine_filters(*filters)
 
     @staticmethod
     def _make_objects(df, cls):
@@ -749,48 +1340,69 @@ class DataCatalog:
     def instrument_status_events(
         self, instrument_ids=None, filter_expr=None, as_nautilus=False, **kwargs
     ):
-        df = self._query(
+        if as_nautilus:
+            return self._query_objects(
+                "instrument_status_update",
+                cls=InstrumentStatusUpdate,
+                instrument_ids=instrument_ids,
+                filter_expr=filter_expr,
+                **kwargs,
+            )
+        return self._query(
             "instrument_status_update",
             instrument_ids=instrument_ids,
             filter_expr=filter_expr,
             **kwargs,
         )
-        if not as_nautilus:
-            return df
-        return self._make_objects(df=df, cls=InstrumentStatusUpdate)
 
     def trade_ticks(self, instrument_ids=None, filter_expr=None, as_nautilus=False, **kwargs):
+        if as_nautilus:
+            return self._query_objects(
+                "trade_tick",
+                cls=TradeTick,
+                instrument_ids=instrument_ids,
+                filter_expr=filter_expr,
+                **kwargs,
+            )
         df = self._query(
             "trade_tick",
             instrument_ids=instrument_ids,
             filter_expr=filter_expr,
             **kwargs,
         )
-        if not as_nautilus:
-            return df.astype({"price": float, "size": float})
-        return self._make_objects(df=df, cls=TradeTick)
+        return df.astype({"price": float, "size": float})
 
     def quote_ticks(self, instrument_ids=None, filter_expr=None, as_nautilus=False, **kwargs):
-        df = self._query(
+        if as_nautilus:
+            return self._query_objects(
+                "quote_tick",
+                cls=QuoteTick,
+                instrument_ids=instrument_ids,
+                filter_expr=filter_expr,
+                **kwargs,
+            )
+        return self._query(
             "quote_tick",
             instrument_ids=instrument_ids,
             filter_expr=filter_expr,
             **kwargs,
         )
-        if not as_nautilus:
-            return df
-        return self._make_objects(df=df, cls=QuoteTick)
 
     def order_book_deltas(self, instrument_ids=None, filter_expr=None, as_nautilus=False, **kwargs):
-        df = self._query(
+        if as_nautilus:
+            return self._query_objects(
+                "order_book_delta",
+                cls=OrderBookDelta,
+                instrument_ids=instrument_ids,
+                filter_expr=filter_expr,
+                **kwargs,
+            )
+        return self._query(
             "order_book_delta",
             instrument_ids=instrument_ids,
             filter_expr=filter_expr,
             **kwargs,
         )
-        if not as_nautilus:
-            return df
-        return self._make_objects(df=df, cls=OrderBookDelta)
 
     def generic_data(self, name, filter_expr=None, as_nautilus=False, **kwargs):
         df = self._query(
@@ -824,6 +1436,292 @@ class DataCatalog:
         return partitions
 
 
+class CatalogDataStream:
+    """
+    Provides a re-iterable, time ordered stream of backtest data from a data
+    catalog, loaded lazily in chunks.
+
+    The bounds of the stream are determined from the parquet row group
+    statistics, so no data is read until the stream is iterated.
+    """
+
+    def __init__(
+        self,
+        catalog: DataCatalog,
+        instrument_ids=None,
+        start_timestamp=None,
+        end_timestamp=None,
+        order_book_deltas=True,
+        trade_ticks=True,
+        quote_ticks=False,
+        instrument_status_events=True,
+        chunk_size=10_000,
+        ts_column="ts_recv_ns",
+    ):
+        """
+        Initialize a new instance of the ``CatalogDataStream`` class.
+
+        Parameters
+        ----------
+        catalog : DataCatalog
+            The data catalog to stream from.
+        instrument_ids : list[InstrumentId]
+            The instruments to stream data for.
+        start_timestamp : datetime
+            The starting timestamp of the data to stream.
+        end_timestamp : datetime
+            The ending timestamp of the data to stream.
+        order_book_deltas : bool
+            If order book deltas should be streamed.
+        trade_ticks : bool
+            If trade ticks should be streamed.
+        quote_ticks : bool
+            If quote ticks should be streamed.
+        instrument_status_events : bool
+            If instrument status events should be streamed.
+        chunk_size : int
+            The number of objects to load per chunk.
+        ts_column : str
+            The timestamp column to bound and order the stream by. Defaults to
+            `ts_recv_ns`, the order in which backtest data is processed.
+
+        """
+        assert chunk_size > 0, "chunk_size must be positive"
+        self.catalog = catalog
+        self.chunk_size = chunk_size
+        self.ts_column = ts_column
+        self._kwargs = dict(
+            instrument_ids=instrument_ids,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            order_book_deltas=order_book_deltas,
+            trade_ticks=trade_ticks,
+            quote_ticks=quote_ticks,
+            instrument_status_events=instrument_status_events,
+        )
+
+        # Determine bounds from the row group statistics
+        row_groups = catalog._row_groups(
+            names=[name for name in BACKTEST_DATA_TYPES if self._kwargs[name]],
+            instrument_ids=instrument_ids,
+            start=start_timestamp,
+            end=end_timestamp,
+            ts_column=ts_column,
+        )
+        ts_mins = [rg.ts_min for rg in row_groups]
+        ts_maxs = [rg.ts_max for rg in row_groups]
+        self.min_timestamp_ns = min(ts_mins) if ts_mins and None not in ts_mins else None
+        self.max_timestamp_ns = max(ts_maxs) if ts_maxs and None not in ts_maxs else None
+
+    def __iter__(self):
+        for chunk in self.catalog.load_backtest_data(
+            chunk_size=self.chunk_size,
+            ts_column=self.ts_column,
+            **self._kwargs,
+        ):
+            yield from chunk
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(root={self.catalog.root}, chunk_size={self.chunk_size})"
+
+
+def _record_hash(record):
+    # The contents hash of a processed raw file record (or legacy hash)
+    if isinstance(record, dict):
+        return record.get("hash")
+    return record
+
+
+def _duplicate_key(obj):
+    # The stored rows of the object, as compared by `compact`
+    return type(obj), orjson.dumps(maybe_list(_serialize(obj)), default=str)
+
+
+def _select_compaction_fragments(fragments, target_bytes):
+    # Small fragments plus (transitively) any fragments overlapping them in
+    # time, as duplicate rows can only occur between overlapping fragments.
+    selected = [f for f in fragments if f["bytes"] < target_bytes]
+    if not selected:
+        return []
+
+    def overlaps(a, b):
+        if None in (a["ts_min"], a["ts_max"], b["ts_min"], b["ts_max"]):
+            return True  # Unknown range
+        return a["ts_min"] <= b["ts_max"] and b["ts_min"] <= a["ts_max"]
+
+    remaining = [f for f in fragments if f["bytes"] >= target_bytes]
+    changed = True
+    while changed and remaining:
+        changed = False
+        for fragment in list(remaining):
+            if any(overlaps(fragment, other) for other in selected):
+                selected.append(fragment)
+                remaining.remove(fragment)
+                changed = True
+
+    return selected
+
+
+_INGEST_LOADER = None
+
+
+def _ingest_mp_context():
+    # Forked workers inherit the loader (and its parser) without pickling
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _init_ingest_worker(loader):
+    global _INGEST_LOADER
+    _INGEST_LOADER = loader
+
+
+def _ingest_file(fn):
+    # Parse a single file in a worker process into Arrow tables
+    ts_start = time.perf_counter()
+    loader = _INGEST_LOADER
+
+    chunk = itertools.chain.from_iterable(loader.run(files=[fn]))
+    split = DataCatalog._split_chunk(chunk, processed_raw_files={})
+
+    tables = {}
+    rows = 0
+    for cls in split:
+        for ins_id, values in split[cls].items():
+            table = pa.Table.from_pandas(pd.DataFrame(values), preserve_index=False)
+            tables[(cls, ins_id)] = table
+            rows += table.num_rows
+
+    size = loader.fs.size(fn) or 0
+    seconds = time.perf_counter() - ts_start
+    stats = IngestStats(
+        name=fn,
+        bytes=size,
+        rows=rows,
+        seconds=seconds,
+        bytes_per_second=size / seconds if seconds else 0.0,
+        rows_per_second=rows / seconds if seconds else 0.0,
+    )
+    return tables, stats
+
+
+class _InflightBudget:
+    """
+    Tracks the estimated memory of files being parsed for a parallel import.
+
+    The parsed size of a (possibly compressed) file is only known once it has
+    been parsed, so files being parsed are charged by their size scaled by the
+    ratio of parsed (Arrow) bytes to raw bytes of the files parsed so far.
+    """
+
+    def __init__(self, sizes, max_bytes):
+        self.sizes = sizes
+        self.max_bytes = max_bytes
+        self.inflight_bytes = 0
+        self._charges = {}  # type: dict[str, int]
+        self._raw_bytes = 0
+        self._parsed_bytes = 0
+
+    def estimate(self, fn):
+        size = self.sizes[fn]
+        if not self._raw_bytes:
+            return size
+        return int(size * self._parsed_bytes / self._raw_bytes)
+
+    def fits(self, fn, buffered_bytes):
+        return self.inflight_bytes + buffered_bytes + self.estimate(fn) <= self.max_bytes
+
+    def charge(self, fn):
+        self._charges[fn] = self.estimate(fn)
+        self.inflight_bytes += self._charges[fn]
+
+    def release(self, fn, parsed_bytes):
+        self.inflight_bytes -= self._charges.pop(fn)
+        self._raw_bytes += self.sizes[fn]
+        self._parsed_bytes += parsed_bytes
+
+
+class _TableBuffer:
+    """
+    Buffers the parsed Arrow tables of files until they are written to a catalog.
+    """
+
+    def __init__(self, catalog, file_hashes, **kwargs):
+        self.catalog = catalog
+        self.file_hashes = file_hashes
+        self.kwargs = kwargs
+        self.nbytes = 0
+        self._tables = defaultdict(list)  # type: dict[tuple, list[pa.Table]]
+        self._files = {}  # type: dict[str, dict]
+
+    def add(self, fn, tables):
+        for key, table in tables.items():
+            self._tables[key].append(table)
+            self.nbytes += table.nbytes
+        self._files[fn] = self.file_hashes[fn]
+
+    def flush(self):
+        for (cls, ins_id), tables in self._tables.items():
+            table = _concat_tables(tables)
+            if table.num_rows:
+                self.catalog._write_table(cls, ins_id, table, **self.kwargs)
+        if self._files:
+            self.catalog._save_processed_raw_files(files=self._files)
+        self._tables.clear()
+        self._files = {}
+        self.nbytes = 0
+
+
+def _concat_tables(tables):
+    # Tables parsed from different files may infer different types for the
+    # same column (i.e. all nulls), so align them to the unified schema.
+    if len(tables) == 1:
+        return tables[0]
+    schema = pa.unify_schemas([table.schema.remove_metadata() for table in tables])
+    aligned = []
+    for table in tables:
+        columns = [
+            table.column(field.name).cast(field.type)
+            if field.name in table.column_names
+            else pa.nulls(table.num_rows, field.type)
+            for field in schema
+        ]
+        aligned.append(pa.Table.from_arrays(columns, schema=schema))
+    return pa.concat_tables(aligned)
+
+
+def _encode_categories(table, names):
+    # Dictionary encode the given columns as pandas categoricals are written,
+    # with the smallest index type which fits the categories.
+    table = table.combine_chunks()
+    for name in names:
+        if name not in table.column_names or pa.types.is_dictionary(table.column(name).type):
+            continue
+        column = table.column(name).dictionary_encode()
+        size = len(column.chunk(0).dictionary) if column.num_chunks else 0
+        for index_type in (pa.int8(), pa.int16(), pa.int32()):
+            if size < 2 ** (index_type.bit_width - 1):
+                break
+        column = column.cast(pa.dictionary(index_type, column.type.value_type))
+        table = table.set_column(table.column_names.index(name), name, column)
+    return table
+
+
+def _partition_table(table, partition_cols):
+    # Split the table by the (cleaned) values of its partition columns
+    if not partition_cols:
+        yield "", table
+        return
+    keys = clean_partition_cols(table.select(partition_cols).to_pandas(), partition_cols)
+    columns = [col for col in table.column_names if col not in partition_cols]
+    for values, indices in keys.groupby(partition_cols, observed=True, sort=False).indices.items():
+        if not isinstance(values, tuple):
+            values = (values,)
+        partition = "/".join(f"{col}={val}" for col, val in zip(partition_cols, values))
+        yield partition, table.select(columns).take(indices)
+
+
 def camel_to_snake_case(s):
     return re.sub(r"(?<!^)(?=[A-Z])", "_", s).lower()
 
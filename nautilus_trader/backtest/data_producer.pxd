@@ -15,6 +15,7 @@
 
 from cpython.datetime cimport datetime
 from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
 
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.model.data.base cimport Data
@@ -42,6 +43,8 @@ cdef class BacktestDataProducer(DataProducerFacade):
     cdef object _quote_tick_data
     cdef object _trade_tick_data
     cdef dict _instrument_index
+    cdef uint8_t[:] _price_precisions
+    cdef uint8_t[:] _size_precisions
     cdef bint _is_connected
 
     cdef list _stream
@@ -50,20 +53,20 @@ cdef class BacktestDataProducer(DataProducerFacade):
     cdef Data _next_data
 
     cdef unsigned short[:] _quote_instruments
-    cdef str[:] _quote_bids
-    cdef str[:] _quote_asks
-    cdef str[:] _quote_bid_sizes
-    cdef str[:] _quote_ask_sizes
+    cdef int64_t[:] _quote_bids
+    cdef int64_t[:] _quote_asks
+    cdef int64_t[:] _quote_bid_sizes
+    cdef int64_t[:] _quote_ask_sizes
     cdef int64_t[:] _quote_timestamps
     cdef int _quote_index
     cdef int _quote_index_last
     cdef QuoteTick _next_quote_tick
 
     cdef unsigned short[:] _trade_instruments
-    cdef str[:] _trade_prices
-    cdef str[:] _trade_sizes
-    cdef str[:] _trade_match_ids
-    cdef str[:] _trade_sides
+    cdef int64_t[:] _trade_prices
+    cdef int64_t[:] _trade_sizes
+    cdef object[:] _trade_match_ids
+    cdef uint8_t[:] _trade_sides
     cdef int64_t[:] _trade_timestamps
     cdef int _trade_index
     cdef int _trade_index_last
@@ -94,3 +97,22 @@ cdef class CachedProducer(DataProducerFacade):
     cpdef void reset(self) except *
     cpdef Data next(self)
     cdef void _create_data_cache(self) except *
+
+
+cdef class StreamingProducer(DataProducerFacade):
+    cdef LoggerAdapter _log
+    cdef list _instruments
+    cdef list _sources
+    cdef list _iterators
+    cdef list _heap
+    cdef list _buffer
+    cdef int _buffer_size
+    cdef int _buffer_index
+    cdef int64_t _stop_ns
+    cdef bint _open_max
+
+    cpdef LoggerAdapter get_logger(self)
+    cpdef void reset(self) except *
+    cpdef Data next(self)
+    cdef void _push_next(self, int source_index) except *
+    cdef void _fill_buffer(self) except *
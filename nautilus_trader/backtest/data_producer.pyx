@@ -19,6 +19,9 @@ This module provides a data producer for backtesting.
 
 from bisect import bisect_left
 import gc
+from heapq import heappop
+from heapq import heappush
+from itertools import dropwhile
 
 import numpy as np
 import pandas as pd
@@ -26,8 +29,10 @@ import pandas as pd
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
 from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
 
 from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport as_utc_timestamp
 from nautilus_trader.core.datetime cimport dt_to_unix_nanos
 from nautilus_trader.core.datetime cimport nanos_to_unix_dt
@@ -35,7 +40,7 @@ from nautilus_trader.core.functions cimport slice_dataframe
 from nautilus_trader.core.time cimport unix_timestamp
 from nautilus_trader.data.wrangling cimport QuoteTickDataWrangler
 from nautilus_trader.data.wrangling cimport TradeTickDataWrangler
-from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSideParser
+from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSide
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregation
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregationParser
 from nautilus_trader.model.data.base cimport Data
@@ -47,6 +52,28 @@ from nautilus_trader.model.objects cimport Quantity
 INT64_MAX = 9223372036854775807
 
 
+def _as_raw(values, uint8_t[:] precisions, instrument_codes):
+    # Scale the given column of decimal values to raw int64 integers, using
+    # the precision of the instrument each row belongs to.
+    scalars = np.power(10.0, np.asarray(precisions, dtype=np.float64))
+    raw = np.asarray(values, dtype=np.float64) * scalars[instrument_codes]
+    return np.rint(raw).astype(np.int64)
+
+
+def _as_aggressor_sides(values):
+    # Map the given column of aggressor side strings to enum values
+    values = np.asarray(values, dtype=object)
+    sides = np.full(len(values), AggressorSide.UNKNOWN, dtype=np.uint8)
+    sides[values == "BUY"] = AggressorSide.BUY
+    sides[values == "SELL"] = AggressorSide.SELL
+    return sides
+
+
+def _as_unix_nanos(index):
+    # Convert the given UTC datetime index to UNIX timestamps (nanoseconds)
+    return np.asarray(index.values.astype("datetime64[ns]"), dtype=np.int64)
+
+
 cdef class DataProducerFacade:
     """
     Provides a read-only facade for data producers.
@@ -234,6 +261,16 @@ cdef class BacktestDataProducer(DataProducerFacade):
 
             self.execution_resolutions.append(f"{instrument_id}={execution_resolution}")
 
+        # Decimal precisions for converting raw values, indexed by instrument
+        self._price_precisions = np.asarray(
+            [instrument.price_precision for instrument in self._instruments],
+            dtype=np.uint8,
+        )
+        self._size_precisions = np.asarray(
+            [instrument.size_precision for instrument in self._instruments],
+            dtype=np.uint8,
+        )
+
         # Merge and sort all ticks
         if quote_tick_frames:
             self._log.info(f"Merging QuoteTick data streams...")
@@ -378,15 +415,15 @@ cdef class BacktestDataProducer(DataProducerFacade):
             # See slice_dataframe function comments on why [:] isn't used
             quote_ticks_slice = slice_dataframe(self._quote_tick_data, start + time_buffer, stop)
 
-            self._quote_instruments = quote_ticks_slice["instrument_id"].to_numpy(dtype=np.ushort)
-            self._quote_bids = quote_ticks_slice["bid"].values
-            self._quote_asks = quote_ticks_slice["ask"].values
-            self._quote_bid_sizes = quote_ticks_slice["bid_size"].values
-            self._quote_ask_sizes = quote_ticks_slice["ask_size"].values
-            self._quote_timestamps = np.asarray(
-                [dt_to_unix_nanos(dt) for dt in quote_ticks_slice.index],
-                dtype=np.int64,
-            )
+            # Decode all columns once up front, so ticks can be built
+            # directly from raw integers without any string parsing.
+            instrument_codes = quote_ticks_slice["instrument_id"].to_numpy(dtype=np.ushort)
+            self._quote_instruments = instrument_codes
+            self._quote_bids = _as_raw(quote_ticks_slice["bid"], self._price_precisions, instrument_codes)
+            self._quote_asks = _as_raw(quote_ticks_slice["ask"], self._price_precisions, instrument_codes)
+            self._quote_bid_sizes = _as_raw(quote_ticks_slice["bid_size"], self._size_precisions, instrument_codes)
+            self._quote_ask_sizes = _as_raw(quote_ticks_slice["ask_size"], self._size_precisions, instrument_codes)
+            self._quote_timestamps = _as_unix_nanos(quote_ticks_slice.index)
 
             # Set indexing
             self._quote_index = 0
@@ -400,15 +437,15 @@ cdef class BacktestDataProducer(DataProducerFacade):
             # See slice_dataframe function comments on why [:] isn't used
             trade_ticks_slice = slice_dataframe(self._trade_tick_data, start, stop)
 
-            self._trade_instruments = trade_ticks_slice["instrument_id"].to_numpy(dtype=np.ushort)
-            self._trade_prices = trade_ticks_slice["price"].values
-            self._trade_sizes = trade_ticks_slice["quantity"].values
-            self._trade_match_ids = trade_ticks_slice["match_id"].values
-            self._trade_sides = trade_ticks_slice["aggressor_side"].values
-            self._trade_timestamps = np.asarray(
-                [dt_to_unix_nanos(dt) for dt in trade_ticks_slice.index],
-                dtype=np.int64,
-            )
+            # Decode all columns once up front, so ticks can be built
+            # directly from raw integers without any string parsing.
+            instrument_codes = trade_ticks_slice["instrument_id"].to_numpy(dtype=np.ushort)
+            self._trade_instruments = instrument_codes
+            self._trade_prices = _as_raw(trade_ticks_slice["price"], self._price_precisions, instrument_codes)
+            self._trade_sizes = _as_raw(trade_ticks_slice["quantity"], self._size_precisions, instrument_codes)
+            self._trade_match_ids = trade_ticks_slice["match_id"].to_numpy(dtype=object)
+            self._trade_sides = _as_aggressor_sides(trade_ticks_slice["aggressor_side"])
+            self._trade_timestamps = _as_unix_nanos(trade_ticks_slice.index)
 
             # Set indexing
             self._trade_index = 0
@@ -535,22 +572,26 @@ cdef class BacktestDataProducer(DataProducerFacade):
                 self.has_data = False
 
     cdef QuoteTick _generate_quote_tick(self, int index):
+        cdef unsigned short instrument = self._quote_instruments[index]
+        cdef uint8_t price_prec = self._price_precisions[instrument]
+        cdef uint8_t size_prec = self._size_precisions[instrument]
         return QuoteTick(
-            instrument_id=self._instrument_index[self._quote_instruments[index]],
-            bid=Price.from_str_c(self._quote_bids[index]),
-            ask=Price.from_str_c(self._quote_asks[index]),
-            bid_size=Quantity.from_str_c(self._quote_bid_sizes[index]),
-            ask_size=Quantity.from_str_c(self._quote_ask_sizes[index]),
+            instrument_id=self._instrument_index[instrument],
+            bid=Price.from_raw_c(self._quote_bids[index], price_prec),
+            ask=Price.from_raw_c(self._quote_asks[index], price_prec),
+            bid_size=Quantity.from_raw_c(self._quote_bid_sizes[index], size_prec),
+            ask_size=Quantity.from_raw_c(self._quote_ask_sizes[index], size_prec),
             ts_event_ns=self._quote_timestamps[index],
             ts_recv_ns=self._quote_timestamps[index],
         )
 
     cdef TradeTick _generate_trade_tick(self, int index):
+        cdef unsigned short instrument = self._trade_instruments[index]
         return TradeTick(
-            instrument_id=self._instrument_index[self._trade_instruments[index]],
-            price=Price.from_str_c(self._trade_prices[index]),
-            size=Quantity.from_str_c(self._trade_sizes[index]),
-            aggressor_side=AggressorSideParser.from_str(self._trade_sides[index]),
+            instrument_id=self._instrument_index[instrument],
+            price=Price.from_raw_c(self._trade_prices[index], self._price_precisions[instrument]),
+            size=Quantity.from_raw_c(self._trade_sizes[index], self._size_precisions[instrument]),
+            aggressor_side=<AggressorSide>self._trade_sides[index],
             match_id=self._trade_match_ids[index],
             ts_event_ns=self._trade_timestamps[index],  # TODO(cs): Hardcoded identical for now
             ts_recv_ns=self._trade_timestamps[index],
@@ -674,3 +715,267 @@ cdef class CachedProducer(DataProducerFacade):
         self._producer.reset()
         self._producer.clear()
         gc.collect()  # Removes redundant processing artifacts
+
+
+def _iterate_producer(DataProducerFacade producer):
+    # Yield all data from the given (already setup) producer
+    cdef Data data
+    while producer.has_data:
+        data = producer.next()
+        if data is None:
+            break
+        yield data
+
+
+cdef class StreamingProducer(DataProducerFacade):
+    """
+    Provides a data producer which lazily merges multiple time ordered data
+    sources into a single stream, ordered by `ts_recv_ns`.
+
+    Data is pulled from the sources with a k-way heap merge into a look-ahead
+    buffer of bounded size, so peak memory is proportional to the buffer size
+    rather than to the size of the dataset.
+    """
+
+    def __init__(
+        self,
+        Logger logger not None,
+        list sources not None,
+        list instruments=None,
+        int buffer_size=100_000,
+        min_timestamp_ns=None,
+        max_timestamp_ns=None,
+    ):
+        """
+        Initialize a new instance of the ``StreamingProducer`` class.
+
+        Parameters
+        ----------
+        logger : Logger
+            The logger for the component.
+        sources : list[object]
+            The data sources to merge. Each source is either a data producer,
+            a callable returning an iterator of `Data`, or a re-iterable
+            collection of `Data` (such as a list). Each source must yield its
+            data in non-decreasing `ts_recv_ns` order. Sources should expose
+            `min_timestamp_ns` and `max_timestamp_ns` attributes, otherwise
+            only their first data item is read to determine the bounds.
+        instruments : list[Instrument], optional
+            The instruments for backtesting.
+        buffer_size : int, optional
+            The maximum number of data items to hold in the look-ahead buffer.
+        min_timestamp_ns : int64, optional
+            The UNIX timestamp (nanoseconds) of the first data item. If None
+            then will be determined from the sources.
+        max_timestamp_ns : int64, optional
+            The UNIX timestamp (nanoseconds) of the last data item. If None
+            then will be determined from the sources. If any source does not
+            expose its bounds then the maximum is open until the merged stream
+            is first exhausted, after which it is the timestamp of the last
+            data item.
+
+        Raises
+        ------
+        ValueError
+            If buffer_size is not positive (> 0).
+        ValueError
+            If any source is a single-use iterator.
+
+        """
+        if instruments is None:
+            instruments = []
+        Condition.positive_int(buffer_size, "buffer_size")
+        for source in sources:
+            Condition.true(
+                isinstance(source, DataProducerFacade)
+                or callable(source)
+                or iter(source) is not source,
+                "source was a single-use iterator (use a callable returning an iterator)",
+            )
+
+        self._log = LoggerAdapter(
+            component=type(self).__name__,
+            logger=logger,
+        )
+
+        self._instruments = instruments
+        self._sources = sources
+        self._iterators = []
+        self._heap = []  # type: list[tuple[int, int, Data]]
+        self._buffer = []
+        self._buffer_size = buffer_size
+        self._buffer_index = 0
+        self._stop_ns = 0
+        self._open_max = False
+
+        self.execution_resolutions = []
+        for source in sources:
+            if isinstance(source, DataProducerFacade):
+                self.execution_resolutions += source.execution_resolutions
+
+        if min_timestamp_ns is None or max_timestamp_ns is None:
+            bounds = self._source_bounds()
+            if min_timestamp_ns is None:
+                min_timestamp_ns = bounds[0]
+            if max_timestamp_ns is None:
+                max_timestamp_ns = bounds[1]
+                self._open_max = bounds[2]
+
+        self.min_timestamp_ns = min_timestamp_ns
+        self.max_timestamp_ns = max_timestamp_ns
+        self.min_timestamp = as_utc_timestamp(nanos_to_unix_dt(self.min_timestamp_ns))
+        self.max_timestamp = as_utc_timestamp(nanos_to_unix_dt(self.max_timestamp_ns))
+        self.has_data = False
+
+    cpdef LoggerAdapter get_logger(self):
+        """
+        Return the logger for the component.
+
+        Returns
+        -------
+        LoggerAdapter
+
+        """
+        return self._log
+
+    cpdef list instruments(self):
+        """
+        Return the instruments held by the data producer.
+
+        Returns
+        -------
+        list[Instrument]
+
+        """
+        return self._instruments.copy()
+
+    def setup(self, int64_t start_ns, int64_t stop_ns):
+        """
+        Setup the data streams for a backtest run.
+
+        Parameters
+        ----------
+        start_ns : int64
+            The UNIX timestamp (nanoseconds) for the run start.
+        stop_ns : int64
+            The UNIX timestamp (nanoseconds) for the run stop.
+
+        """
+        self._log.info(f"Opening {len(self._sources)} data sources...")
+
+        self._stop_ns = stop_ns
+        self._heap = []
+        self._iterators = []
+
+        cdef int i
+        for i, source in enumerate(self._sources):
+            iterator = dropwhile(
+                lambda data: data.ts_recv_ns < start_ns,
+                self._open_source(source, start_ns, stop_ns),
+            )
+            self._iterators.append(iterator)
+            self._push_next(i)
+
+        self._fill_buffer()
+        self.has_data = len(self._buffer) > 0
+
+    cpdef void reset(self) except *:
+        """
+        Reset the data producer.
+
+        All stateful fields are reset to their initial value.
+        """
+        self._iterators = []
+        self._heap = []
+        self._buffer = []
+        self._buffer_index = 0
+        self.has_data = False
+
+    cpdef Data next(self):
+        """
+        Return the next data item in the stream (if one exists).
+
+        Checking `has_data` is `True` will ensure there is data.
+
+        Returns
+        -------
+        Data or None
+
+        """
+        if not self.has_data:
+            return None
+
+        cdef Data data = self._buffer[self._buffer_index]
+        self._buffer_index += 1
+
+        # Refill buffer from the sources when exhausted
+        if self._buffer_index >= len(self._buffer):
+            self._fill_buffer()
+            self.has_data = len(self._buffer) > 0
+
+        if not self.has_data and self._open_max and self._stop_ns >= self.max_timestamp_ns:
+            # All sources were streamed to the end, so the maximum is now known
+            self.max_timestamp_ns = data.ts_recv_ns
+            self.max_timestamp = as_utc_timestamp(nanos_to_unix_dt(self.max_timestamp_ns))
+            self._open_max = False
+
+        return data
+
+    cdef void _push_next(self, int source_index) except *:
+        cdef Data data = next(self._iterators[source_index], None)
+        if data is None or data.ts_recv_ns > self._stop_ns:
+            return  # Source exhausted for this run
+
+        # The source index breaks timestamp ties, so data is never compared
+        heappush(self._heap, (data.ts_recv_ns, source_index, data))
+
+    cdef void _fill_buffer(self) except *:
+        self._buffer = []
+        self._buffer_index = 0
+
+        cdef tuple entry
+        while self._heap and len(self._buffer) < self._buffer_size:
+            entry = heappop(self._heap)
+            self._buffer.append(entry[2])
+            self._push_next(entry[1])
+
+    def _open_source(self, source, int64_t start_ns, int64_t stop_ns):
+        if isinstance(source, DataProducerFacade):
+            source.reset()
+            source.setup(start_ns, stop_ns)
+            return _iterate_producer(source)
+        elif callable(source):
+            return iter(source())
+        else:
+            return iter(source)
+
+    def _source_bounds(self):
+        cdef int64_t min_ns = INT64_MAX
+        cdef int64_t max_ns = -INT64_MAX
+        cdef bint open_max = False
+        cdef Data first
+        for source in self._sources:
+            # Data producers (and any source exposing its bounds) are not read
+            source_min_ns = getattr(source, "min_timestamp_ns", None)
+            source_max_ns = getattr(source, "max_timestamp_ns", None)
+            if source_min_ns is not None and source_max_ns is not None:
+                if source_min_ns <= source_max_ns:
+                    min_ns = min(min_ns, source_min_ns)
+                    max_ns = max(max_ns, source_max_ns)
+                continue
+
+            # Read only the first data item, the maximum remains open
+            first = next(self._open_source(source, 0, INT64_MAX), None)
+            if first is not None:
+                min_ns = min(min_ns, first.ts_recv_ns)
+                open_max = True
+
+        # Same bounds as an empty data producer where unknown
+        if min_ns == INT64_MAX:
+            min_ns = dt_to_unix_nanos(as_utc_timestamp(pd.Timestamp.max - timedelta(days=1)))
+        if open_max:
+            max_ns = dt_to_unix_nanos(as_utc_timestamp(pd.Timestamp.max - timedelta(days=1)))
+        elif max_ns == -INT64_MAX:
+            max_ns = dt_to_unix_nanos(as_utc_timestamp(pd.Timestamp.min + timedelta(days=1)))
+
+        return min_ns, max_ns, open_max
@@ -22,6 +22,7 @@ from nautilus_trader.backtest.data_producer cimport DataProducerFacade
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.clock cimport TestClockScheduler
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.uuid cimport UUIDFactory
@@ -38,6 +39,7 @@ from nautilus_trader.trading.trader cimport Trader
 cdef class BacktestEngine:
     cdef Clock _clock
     cdef Clock _test_clock
+    cdef TestClockScheduler _scheduler
     cdef UUIDFactory _uuid_factory
     cdef MessageBus _msgbus
     cdef Cache _cache
@@ -53,6 +55,7 @@ cdef class BacktestEngine:
     cdef bint _cache_db_flush
     cdef bint _use_data_cache
     cdef bint _run_analysis
+    cdef int _stream_buffer_size
 
     cdef dict _exchanges
     cdef list _generic_data
@@ -62,6 +65,7 @@ cdef class BacktestEngine:
     cdef dict _trade_ticks
     cdef dict _bars_bid
     cdef dict _bars_ask
+    cdef list _data_streams
 
     cdef readonly Trader trader
     """The trader for the backtest.\n\n:returns: `Trader`"""
@@ -24,6 +24,7 @@ from nautilus_trader.backtest.data_client cimport BacktestDataClient
 from nautilus_trader.backtest.data_client cimport BacktestMarketDataClient
 from nautilus_trader.backtest.data_producer cimport BacktestDataProducer
 from nautilus_trader.backtest.data_producer cimport CachedProducer
+from nautilus_trader.backtest.data_producer cimport StreamingProducer
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.backtest.execution cimport BacktestExecClient
 from nautilus_trader.backtest.models cimport FillModel
@@ -32,12 +33,12 @@ from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.c_enums.component_state cimport ComponentState
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.clock cimport TestClock
+from nautilus_trader.common.clock cimport TestClockScheduler
 from nautilus_trader.common.logging cimport LogLevel
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.logging cimport log_memory
 from nautilus_trader.common.logging cimport nautilus_header
-from nautilus_trader.common.timer cimport TimeEventHandler
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport as_utc_timestamp
@@ -94,6 +95,7 @@ cdef class BacktestEngine:
         bint bypass_logging=False,
         bint run_analysis=True,
         int level_stdout=LogLevel.INFO,
+        int stream_buffer_size=100_000,
     ):
         """
         Initialize a new instance of the ``BacktestEngine`` class.
@@ -122,16 +124,26 @@ cdef class BacktestEngine:
             If post backtest performance analysis should be run.
         level_stdout : int, optional
             The minimum log level for logging messages to stdout.
+        stream_buffer_size : int, optional
+            The maximum number of data items buffered ahead when streaming
+            data sources added with `add_data_stream()`.
+
+        Raises
+        ------
+        ValueError
+            If stream_buffer_size is not positive (> 0).
 
         """
         if trader_id is None:
             trader_id = TraderId("BACKTESTER-000")
         Condition.valid_string(cache_db_type, "cache_db_type")
+        Condition.positive_int(stream_buffer_size, "stream_buffer_size")
 
         # Options
         self._cache_db_flush = cache_db_flush
         self._use_data_cache = use_data_cache
         self._run_analysis = run_analysis
+        self._stream_buffer_size = stream_buffer_size
 
         # Data
         self._generic_data = []     # type: list[GenericData]
@@ -141,12 +153,14 @@ cdef class BacktestEngine:
         self._trade_ticks = {}      # type: dict[InstrumentId, pd.DataFrame]
         self._bars_bid = {}         # type: dict[InstrumentId, dict[BarAggregation, pd.DataFrame]]
         self._bars_ask = {}         # type: dict[InstrumentId, dict[BarAggregation, pd.DataFrame]]
+        self._data_streams = []     # type: list[object]
 
         # Setup components
         self._clock = LiveClock()
         self.created_time = self._clock.utc_now()
 
         self._test_clock = TestClock()
+        self._scheduler = TestClockScheduler(self._test_clock)
         self._uuid_factory = UUIDFactory()
         self.system_id = self._uuid_factory.generate()
 
@@ -354,6 +368,46 @@ cdef class BacktestEngine:
 
         self._log.info(f"Added {len(data)} Data.")
 
+    def add_data_stream(self, source, ClientId client_id=None) -> None:
+        """
+        Add the data source to be streamed lazily during backtest runs.
+
+        Streamed data is merged with all other data in `ts_recv_ns` order
+        without being loaded into memory up front.
+
+        Parameters
+        ----------
+        source : callable or iterable
+            The data source, either a callable returning an iterator of `Data`
+            or a re-iterable collection of `Data`. The data must be in
+            non-decreasing `ts_recv_ns` order.
+        client_id : ClientId, optional
+            The data client ID to associate with generic data in the stream.
+            Market data is associated with the client for its venue, which is
+            registered when adding the instrument.
+
+        Raises
+        ------
+        ValueError
+            If source is not callable or iterable.
+
+        """
+        Condition.not_none(source, "source")
+        Condition.true(
+            callable(source) or hasattr(source, "__iter__"),
+            "source was not callable or iterable",
+        )
+
+        # Check client has been registered
+        if client_id is not None:
+            self._add_data_client_if_not_exists(client_id)
+
+        # Add data stream
+        self._data_streams.append(source)
+        self._data_producer = None  # Rebuild producer on next run
+
+        self._log.info(f"Added data stream {source}.")
+
     def add_instrument(self, Instrument instrument) -> None:
         """
         Add the instrument to the backtest engine.
@@ -848,7 +902,15 @@ cdef class BacktestEngine:
                 data=self._data,
             )
 
-            if self._use_data_cache:
+            if self._data_streams:
+                # Merge in-memory data with the streams lazily
+                self._data_producer = StreamingProducer(
+                    logger=self._test_logger,
+                    sources=[self._data_producer] + self._data_streams,
+                    instruments=self._data_producer.instruments(),
+                    buffer_size=self._stream_buffer_size,
+                )
+            elif self._use_data_cache:
                 self._data_producer = CachedProducer(self._data_producer)
 
         log_memory(self._log)
@@ -909,8 +971,10 @@ cdef class BacktestEngine:
                 warn_no_strategies=False,
             )
 
+        self._scheduler.clear()
         for strategy in self.trader.strategies_c():
             strategy.clock.set_time(start_ns)
+            self._scheduler.register(strategy.clock)
 
         # Start main components
         self._data_engine.start()
@@ -936,19 +1000,13 @@ cdef class BacktestEngine:
             run_started=run_started,
             run_finished=self._clock.utc_now(),
             start=start,
-            stop=stop,
+            stop=min(stop, self._data_producer.max_timestamp),  # Streamed maximum known at the end
         )
 
     cdef void _advance_time(self, int64_t now_ns) except *:
-        cdef TradingStrategy strategy
-        cdef TimeEventHandler event_handler
-        cdef list time_events = []  # type: list[TimeEventHandler]
-        for strategy in self.trader.strategies_c():
-            time_events += strategy.clock.advance_time(now_ns)
-        for event_handler in sorted(time_events):
-            self._test_clock.set_time(event_handler.event.event_timestamp_ns)
-            event_handler.handle()
-        self._test_clock.set_time(now_ns)
+        # Handles any due time events across all strategy clocks in
+        # timestamp order, then sets every clock to now.
+        self._scheduler.advance_time(now_ns)
 
     cdef void _process_modules(self, int64_t now_ns) except *:
         cdef SimulatedExchange exchange
@@ -17,6 +17,7 @@ from libc.stdint cimport int64_t
 
 from nautilus_trader.backtest.execution cimport BacktestExecClient
 from nautilus_trader.backtest.models cimport FillModel
+from nautilus_trader.backtest.triggers cimport OrderTriggerBook
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport LoggerAdapter
@@ -90,6 +91,7 @@ cdef class SimulatedExchange:
 
     cdef dict _books
     cdef dict _instrument_orders
+    cdef dict _trigger_books
     cdef dict _working_orders
     cdef dict _position_index
     cdef dict _child_orders
@@ -179,6 +181,7 @@ cdef class SimulatedExchange:
 
     cdef void _add_order(self, PassiveOrder order) except *
     cdef void _delete_order(self, Order order) except *
+    cdef void _reindex_order(self, PassiveOrder order) except *
     cdef void _iterate_matching_engine(self, InstrumentId instrument_id, int64_t timestamp_ns) except *
     cdef void _match_order(self, PassiveOrder order) except *
     cdef void _match_limit_order(self, LimitOrder order) except *
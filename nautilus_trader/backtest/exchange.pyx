@@ -22,6 +22,7 @@ from libc.stdint cimport int64_t
 from nautilus_trader.backtest.execution cimport BacktestExecClient
 from nautilus_trader.backtest.models cimport FillModel
 from nautilus_trader.backtest.modules cimport SimulationModule
+from nautilus_trader.backtest.triggers cimport OrderTriggerBook
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.clock cimport TestClock
 from nautilus_trader.common.logging cimport Logger
@@ -184,6 +185,7 @@ cdef class SimulatedExchange:
 
         self._books = {}                # type: dict[InstrumentId, OrderBook]
         self._instrument_orders = {}    # type: dict[InstrumentId, dict[ClientOrderId, PassiveOrder]]
+        self._trigger_books = {}        # type: dict[InstrumentId, OrderTriggerBook]
         self._working_orders = {}       # type: dict[ClientOrderId, PassiveOrder]
         self._position_index = {}       # type: dict[ClientOrderId, PositionId]
         self._child_orders = {}         # type: dict[ClientOrderId, list[Order]]
@@ -472,6 +474,7 @@ cdef class SimulatedExchange:
 
         self._books.clear()
         self._instrument_orders.clear()
+        self._trigger_books.clear()
         self._working_orders.clear()
         self._position_index.clear()
         self._child_orders.clear()
@@ -601,6 +604,8 @@ cdef class SimulatedExchange:
             # Design-time error
             raise RuntimeError("invalid order type")
 
+        self._reindex_order(order)
+
     cdef void _cancel_order(self, PassiveOrder order) except *:
         cdef dict instrument_orders = self._instrument_orders.get(order.instrument_id)
         if instrument_orders:
@@ -608,6 +613,10 @@ cdef class SimulatedExchange:
             # Will raise KeyError if not found by `pop`.
             instrument_orders.pop(order.client_order_id)
 
+        cdef OrderTriggerBook trigger_book = self._trigger_books.get(order.instrument_id)
+        if trigger_book is not None:
+            trigger_book.remove(order)
+
         self._generate_order_pending_cancel(order)
         self._generate_order_canceled(order)
         self._check_oco_order(order.client_order_id)
@@ -957,32 +966,65 @@ cdef class SimulatedExchange:
             self._instrument_orders[order.instrument_id] = instrument_orders
         instrument_orders[order.client_order_id] = order
 
+        cdef OrderTriggerBook trigger_book = self._trigger_books.get(order.instrument_id)
+        if trigger_book is None:
+            trigger_book = OrderTriggerBook()
+            self._trigger_books[order.instrument_id] = trigger_book
+        trigger_book.add(order)
+
     cdef void _delete_order(self, Order order) except *:
         self._working_orders.pop(order.client_order_id, None)
         cdef dict instrument_orders = self._instrument_orders.get(order.instrument_id)
         if instrument_orders:
             instrument_orders.pop(order.client_order_id, None)
 
+        cdef OrderTriggerBook trigger_book = self._trigger_books.get(order.instrument_id)
+        if trigger_book is not None and isinstance(order, PassiveOrder):
+            trigger_book.remove(order)
+
+    cdef void _reindex_order(self, PassiveOrder order) except *:
+        # Re-index the order following a change to its prices or trigger state
+        if order.client_order_id not in self._working_orders:
+            return  # Order no longer working
+
+        cdef OrderTriggerBook trigger_book = self._trigger_books.get(order.instrument_id)
+        if trigger_book is not None:
+            trigger_book.update(order)
+
     cdef void _iterate_matching_engine(
         self, InstrumentId instrument_id,
         int64_t timestamp_ns,
     ) except *:
-        cdef dict working_orders = self._instrument_orders.get(instrument_id)
-        if working_orders is None:
+        cdef OrderTriggerBook trigger_book = self._trigger_books.get(instrument_id)
+        if trigger_book is None or len(trigger_book) == 0:
             return  # No orders to iterate
 
+        cdef Price bid = self.best_bid_price(instrument_id)
+        cdef Price ask = self.best_ask_price(instrument_id)
+
+        # Only visit orders whose price has been crossed by the market
+        cdef list triggered = trigger_book.triggered(
+            bid is not None,
+            bid.as_double() if bid is not None else 0.0,
+            ask is not None,
+            ask.as_double() if ask is not None else 0.0,
+        )
+
         cdef PassiveOrder order
-        for order in working_orders.copy().values():  # Copy dict for safe loop
+        for order in triggered:
             if not order.is_working_c():
                 continue  # Orders state has changed since the loop started
 
             # Check for order match
             self._match_order(order)
 
-            # Check for order expiry (if expire time then compare nanoseconds)
-            if order.expire_time and timestamp_ns >= order.expire_time_ns:
-                self._delete_order(order)
-                self._expire_order(order)
+        # Check for order expiry
+        for order in trigger_book.expired(timestamp_ns):
+            if not order.is_working_c():
+                continue  # Orders state has changed since the loop started
+
+            self._delete_order(order)
+            self._expire_order(order)
 
     cdef void _match_order(self, PassiveOrder order) except *:
         if order.type == OrderType.LIMIT:
@@ -1010,6 +1052,7 @@ cdef class SimulatedExchange:
         else:  # Order not triggered
             if self._is_stop_triggered(order.instrument_id, order.side, order.trigger):
                 self._generate_order_triggered(order)
+                self._reindex_order(order)
 
             # Check for immediate fill
             if not self._is_limit_marketable(order.instrument_id, order.side, order.price):
@@ -0,0 +1,48 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+
+from nautilus_trader.model.orders.base cimport PassiveOrder
+
+
+cdef class TriggerIndex:
+    cdef list _keys
+    cdef list _entries
+    cdef dict _order_keys
+
+    cpdef void add(self, double key, int64_t sequence, PassiveOrder order) except *
+    cpdef void remove(self, PassiveOrder order) except *
+    cdef void at_or_above(self, double price, dict found) except *
+    cdef void at_or_below(self, double price, dict found) except *
+
+
+cdef class OrderTriggerBook:
+    cdef TriggerIndex _buy_limits
+    cdef TriggerIndex _sell_limits
+    cdef TriggerIndex _buy_stops
+    cdef TriggerIndex _sell_stops
+    cdef list _expiries
+    cdef dict _sequences
+    cdef int64_t _sequence
+
+    cpdef void add(self, PassiveOrder order) except *
+    cpdef void update(self, PassiveOrder order) except *
+    cpdef void remove(self, PassiveOrder order) except *
+    cpdef list triggered(self, bint has_bid, double bid, bint has_ask, double ask)
+    cpdef list expired(self, int64_t timestamp_ns)
+
+    cdef void _index(self, PassiveOrder order, int64_t sequence) except *
+    cdef void _unindex(self, PassiveOrder order) except *
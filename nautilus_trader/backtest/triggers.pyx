@@ -0,0 +1,258 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from heapq import heappop
+from heapq import heappush
+
+from libc.stdint cimport int64_t
+
+from nautilus_trader.core.functions cimport bisect_double_left
+from nautilus_trader.core.functions cimport bisect_double_right
+from nautilus_trader.model.c_enums.order_side cimport OrderSide
+from nautilus_trader.model.c_enums.order_type cimport OrderType
+from nautilus_trader.model.orders.base cimport PassiveOrder
+from nautilus_trader.model.orders.stop_limit cimport StopLimitOrder
+
+
+cdef class TriggerIndex:
+    """
+    Provides an index of passive orders sorted by a trigger price key.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new instance of the ``TriggerIndex`` class.
+        """
+        self._keys = []         # type: list[float] (ascending)
+        self._entries = []      # type: list[tuple[int, PassiveOrder]] (parallel to keys)
+        self._order_keys = {}   # type: dict[ClientOrderId, float]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    cpdef void add(self, double key, int64_t sequence, PassiveOrder order) except *:
+        """
+        Add the given order to the index at the given price key.
+
+        Parameters
+        ----------
+        key : double
+            The price key for the order.
+        sequence : int64
+            The orders sequence number (determines visiting order).
+        order : PassiveOrder
+            The order to add.
+
+        """
+        cdef int index = bisect_double_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._entries.insert(index, (sequence, order))
+        self._order_keys[order.client_order_id] = key
+
+    cpdef void remove(self, PassiveOrder order) except *:
+        """
+        Remove the given order from the index (if found).
+
+        Parameters
+        ----------
+        order : PassiveOrder
+            The order to remove.
+
+        """
+        key = self._order_keys.pop(order.client_order_id, None)
+        if key is None:
+            return  # Not indexed
+
+        cdef int index = bisect_double_left(self._keys, key)
+        cdef int length = len(self._keys)
+        while index < length and self._entries[index][1] is not order:
+            index += 1
+
+        del self._keys[index]
+        del self._entries[index]
+
+    cdef void at_or_above(self, double price, dict found) except *:
+        # Add all orders with a key at or above the given price to found
+        cdef int index
+        for index in range(bisect_double_left(self._keys, price), len(self._keys)):
+            sequence, order = self._entries[index]
+            found[sequence] = order
+
+    cdef void at_or_below(self, double price, dict found) except *:
+        # Add all orders with a key at or below the given price to found
+        cdef int index
+        for index in range(bisect_double_right(self._keys, price)):
+            sequence, order = self._entries[index]
+            found[sequence] = order
+
+
+cdef class OrderTriggerBook:
+    """
+    Provides price and expiry indexes for the working orders of an instrument.
+
+    Limit prices and stop triggers are indexed per side so that only orders
+    whose price has been crossed by the best bid/ask are visited. Expire times
+    are held in a heap, with removed orders discarded lazily.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new instance of the ``OrderTriggerBook`` class.
+        """
+        self._buy_limits = TriggerIndex()
+        self._sell_limits = TriggerIndex()
+        self._buy_stops = TriggerIndex()
+        self._sell_stops = TriggerIndex()
+        self._expiries = []   # type: list[tuple[int, int, PassiveOrder]]
+        self._sequences = {}  # type: dict[ClientOrderId, int]
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._sequences)
+
+    cpdef void add(self, PassiveOrder order) except *:
+        """
+        Add the given order to the book.
+
+        Parameters
+        ----------
+        order : PassiveOrder
+            The order to add.
+
+        """
+        cdef int64_t sequence = self._sequence
+        self._sequence += 1
+        self._sequences[order.client_order_id] = sequence
+        self._index(order, sequence)
+
+        if order.expire_time is not None:
+            heappush(self._expiries, (order.expire_time_ns, sequence, order))
+
+    cpdef void update(self, PassiveOrder order) except *:
+        """
+        Re-index the given order following a change to its prices or state.
+
+        Parameters
+        ----------
+        order : PassiveOrder
+            The order to update.
+
+        """
+        sequence = self._sequences.get(order.client_order_id)
+        if sequence is None:
+            return  # Not in book
+
+        self._unindex(order)
+        self._index(order, sequence)
+
+    cpdef void remove(self, PassiveOrder order) except *:
+        """
+        Remove the given order from the book (if found).
+
+        Parameters
+        ----------
+        order : PassiveOrder
+            The order to remove.
+
+        """
+        if self._sequences.pop(order.client_order_id, None) is None:
+            return  # Not in book
+
+        self._unindex(order)
+
+        if not self._sequences:
+            self._expiries.clear()  # Discard any stale expiry entries
+
+    cpdef list triggered(self, bint has_bid, double bid, bint has_ask, double ask):
+        """
+        Return the orders which may be matched or triggered at the given market.
+
+        Parameters
+        ----------
+        has_bid : bool
+            If there is a best bid price.
+        bid : double
+            The best bid price.
+        has_ask : bool
+            If there is a best ask price.
+        ask : double
+            The best ask price.
+
+        Returns
+        -------
+        list[PassiveOrder]
+            In the order they were added to the book.
+
+        """
+        cdef dict found = {}
+        if has_ask:
+            self._buy_limits.at_or_above(ask, found)
+            self._buy_stops.at_or_below(ask, found)
+        if has_bid:
+            self._sell_limits.at_or_below(bid, found)
+            self._sell_stops.at_or_above(bid, found)
+
+        return [found[sequence] for sequence in sorted(found)]
+
+    cpdef list expired(self, int64_t timestamp_ns):
+        """
+        Return the orders in the book which have expired at the given timestamp.
+
+        Parameters
+        ----------
+        timestamp_ns : int64
+            The UNIX timestamp (nanoseconds) now.
+
+        Returns
+        -------
+        list[PassiveOrder]
+            In expire time order.
+
+        """
+        cdef list expired = []
+        cdef PassiveOrder order
+        while self._expiries and self._expiries[0][0] <= timestamp_ns:
+            _, sequence, order = heappop(self._expiries)
+            if self._sequences.get(order.client_order_id) == sequence:
+                expired.append(order)
+
+        return expired
+
+    cdef void _index(self, PassiveOrder order, int64_t sequence) except *:
+        cdef bint is_buy = order.side == OrderSide.BUY
+        if order.type == OrderType.LIMIT:
+            (self._buy_limits if is_buy else self._sell_limits).add(order.price.as_double(), sequence, order)
+        elif order.type == OrderType.STOP_MARKET:
+            (self._buy_stops if is_buy else self._sell_stops).add(order.price.as_double(), sequence, order)
+        elif order.type == OrderType.STOP_LIMIT:
+            # An untriggered stop limit can be triggered or immediately marketable
+            if not (<StopLimitOrder>order).is_triggered:
+                (self._buy_stops if is_buy else self._sell_stops).add(
+                    (<StopLimitOrder>order).trigger.as_double(),
+                    sequence,
+                    order,
+                )
+            (self._buy_limits if is_buy else self._sell_limits).add(order.price.as_double(), sequence, order)
+        else:
+            # Design-time error
+            raise RuntimeError("invalid order type")
+
+    cdef void _unindex(self, PassiveOrder order) except *:
+        if order.side == OrderSide.BUY:
+            self._buy_limits.remove(order)
+            self._buy_stops.remove(order)
+        else:  # => OrderSide.SELL
+            self._sell_limits.remove(order)
+            self._sell_stops.remove(order)
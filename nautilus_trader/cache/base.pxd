@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.cache.history cimport BarHistory
+from nautilus_trader.cache.history cimport QuoteTickHistory
+from nautilus_trader.cache.history cimport TradeTickHistory
 from nautilus_trader.model.c_enums.price_type cimport PriceType
 from nautilus_trader.model.currency cimport Currency
 from nautilus_trader.model.data.bar cimport Bar
@@ -46,6 +49,9 @@ cdef class CacheFacade:
     cpdef QuoteTick quote_tick(self, InstrumentId instrument_id, int index=*)
     cpdef TradeTick trade_tick(self, InstrumentId instrument_id, int index=*)
     cpdef Bar bar(self, BarType bar_type, int index=*)
+    cpdef QuoteTickHistory quote_tick_history(self, InstrumentId instrument_id)
+    cpdef TradeTickHistory trade_tick_history(self, InstrumentId instrument_id)
+    cpdef BarHistory bar_history(self, BarType bar_type)
     cpdef int quote_tick_count(self, InstrumentId instrument_id) except *
     cpdef int trade_tick_count(self, InstrumentId instrument_id) except *
     cpdef int bar_count(self, BarType bar_type) except *
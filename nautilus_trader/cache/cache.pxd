@@ -18,6 +18,7 @@ from nautilus_trader.cache.database cimport CacheDatabase
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.model.currency cimport Currency
 from nautilus_trader.model.data.bar cimport Bar
+from nautilus_trader.model.data.bar cimport BarType
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.data.tick cimport TradeTick
 from nautilus_trader.model.identifiers cimport AccountId
@@ -71,11 +72,17 @@ cdef class Cache(CacheFacade):
     cdef set _index_positions_open
     cdef set _index_positions_closed
     cdef set _index_strategies
+    cdef dict _index_orders_query
+    cdef dict _index_positions_query
+    cdef dict _cached_orders_query
+    cdef dict _cached_positions_query
 
     cdef readonly int tick_capacity
     """The caches tick capacity.\n\n:returns: `int`"""
     cdef readonly int bar_capacity
     """The caches bar capacity.\n\n:returns: `int`"""
+    cdef readonly bint columnar_history
+    """If the caches tick and bar histories are columnar.\n\n:returns: `bool`"""
 
     cpdef void cache_currencies(self) except *
     cpdef void cache_instruments(self) except *
@@ -91,12 +98,19 @@ cdef class Cache(CacheFacade):
     cpdef void flush_db(self) except *
 
     cdef tuple _build_quote_table(self, Venue venue)
+    cdef object _new_quote_ticks(self, InstrumentId instrument_id)
+    cdef object _new_trade_ticks(self, InstrumentId instrument_id)
+    cdef object _new_bars(self, BarType bar_type)
     cdef void _build_index_venue_account(self) except *
     cdef void _cache_venue_account_id(self, AccountId account_id) except *
     cdef void _build_indexes_from_orders(self) except *
     cdef void _build_indexes_from_positions(self) except *
-    cdef set _build_ord_query_filter_set(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
-    cdef set _build_pos_query_filter_set(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
+    cdef void _update_order_state(self, set index, int state, Order order, bint member) except *
+    cdef void _update_position_state(self, set index, int state, Position position, bint member) except *
+    cdef set _query_order_ids(self, set index, int state, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
+    cdef set _query_position_ids(self, set index, int state, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
+    cdef list _query_orders(self, set index, int state, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
+    cdef list _query_positions(self, set index, int state, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
 
     cpdef Instrument load_instrument(self, InstrumentId instrument_id)
     cpdef Account load_account(self, AccountId account_id)
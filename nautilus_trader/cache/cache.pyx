@@ -19,6 +19,9 @@ from decimal import Decimal
 from libc.stdint cimport int64_t
 
 from nautilus_trader.cache.base cimport CacheFacade
+from nautilus_trader.cache.history cimport BarHistory
+from nautilus_trader.cache.history cimport QuoteTickHistory
+from nautilus_trader.cache.history cimport TradeTickHistory
 from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
@@ -46,6 +49,58 @@ from nautilus_trader.trading.calculators cimport ExchangeRateCalculator
 from nautilus_trader.trading.strategy cimport TradingStrategy
 
 
+# Query index states (first element of every composite index key)
+cdef int _ORDERS_ALL = 0
+cdef int _ORDERS_INFLIGHT = 1
+cdef int _ORDERS_WORKING = 2
+cdef int _ORDERS_COMPLETED = 3
+cdef int _POSITIONS_ALL = 0
+cdef int _POSITIONS_OPEN = 1
+cdef int _POSITIONS_CLOSED = 2
+
+
+cdef inline tuple _query_keys(
+    int state,
+    Venue venue,
+    InstrumentId instrument_id,
+    StrategyId strategy_id,
+):
+    # Every (state, venue, instrument, strategy) filter combination which
+    # matches an item, the unfiltered key is always first.
+    return (
+        (state, None, None, None),
+        (state, venue, None, None),
+        (state, None, instrument_id, None),
+        (state, None, None, strategy_id),
+        (state, venue, instrument_id, None),
+        (state, venue, None, strategy_id),
+        (state, None, instrument_id, strategy_id),
+        (state, venue, instrument_id, strategy_id),
+    )
+
+
+cdef inline void _update_query_index(
+    dict index,
+    dict results,
+    tuple keys,
+    object item,
+    bint member,
+) except *:
+    cdef tuple key
+    cdef set items
+    for key in keys:
+        results.pop(key, None)  # Invalidate any cached query result
+    for key in keys[1:]:  # The unfiltered sets are maintained by the cache
+        items = index.get(key)
+        if items is None:
+            if member:
+                index[key] = {item}
+        elif member:
+            items.add(item)
+        else:
+            items.discard(item)
+
+
 cdef class Cache(CacheFacade):
     """
     Provides a common object cache for market and execution related data.
@@ -76,6 +131,12 @@ cdef class Cache(CacheFacade):
         ValueError
             If config and 'config[bar_capacity]' is not positive.
 
+        Notes
+        -----
+        If 'config[columnar_history]' is True then tick and bar histories are
+        held in columnar ring buffers, see `quote_tick_history`,
+        `trade_tick_history` and `bar_history`.
+
         """
         if config is None:
             config = {}
@@ -89,13 +150,14 @@ cdef class Cache(CacheFacade):
         self.bar_capacity = config.get("bar_capacity", 1000)
         Condition.positive_int(self.tick_capacity, "tick_capacity")
         Condition.positive_int(self.bar_capacity, "bar_capacity")
+        self.columnar_history = config.get("columnar_history", False)
 
         # Caches
         self._xrate_symbols = {}               # type: dict[InstrumentId, str]
-        self._quote_ticks = {}                 # type: dict[InstrumentId, deque[QuoteTick]]
-        self._trade_ticks = {}                 # type: dict[InstrumentId, deque[TradeTick]]
+        self._quote_ticks = {}                 # type: dict[InstrumentId, deque[QuoteTick] or QuoteTickHistory]
+        self._trade_ticks = {}                 # type: dict[InstrumentId, deque[TradeTick] or TradeTickHistory]
         self._order_books = {}                 # type: dict[InstrumentId, OrderBook]
-        self._bars = {}                        # type: dict[BarType, deque[Bar]]
+        self._bars = {}                        # type: dict[BarType, deque[Bar] or BarHistory]
         self._currencies = {}                  # type: dict[str, Currency]
         self._instruments = {}                 # type: dict[InstrumentId, Instrument]
         self._accounts = {}                    # type: dict[AccountId, Account]
@@ -124,6 +186,12 @@ cdef class Cache(CacheFacade):
         self._index_positions_closed = set()   # type: set[PositionId]
         self._index_strategies = set()         # type: set[StrategyId]
 
+        # Composite query index (state, venue, instrument_id, strategy_id)
+        self._index_orders_query = {}          # type: dict[tuple, set[ClientOrderId]]
+        self._index_positions_query = {}       # type: dict[tuple, set[PositionId]]
+        self._cached_orders_query = {}         # type: dict[tuple, tuple[Order]]
+        self._cached_positions_query = {}      # type: dict[tuple, tuple[Position]]
+
         self._log.info("Initialized.")
 
 # -- COMMANDS --------------------------------------------------------------------------------------
@@ -575,6 +643,10 @@ cdef class Cache(CacheFacade):
         self._index_positions_open.clear()
         self._index_positions_closed.clear()
         self._index_strategies.clear()
+        self._index_orders_query.clear()
+        self._index_positions_query.clear()
+        self._cached_orders_query.clear()
+        self._cached_positions_query.clear()
 
         self._log.debug(f"Cleared index.")
 
@@ -653,19 +725,19 @@ cdef class Cache(CacheFacade):
             self._index_strategy_orders[order.strategy_id].add(client_order_id)
 
             # 7: Build _index_orders -> {ClientOrderId}
-            self._index_orders.add(client_order_id)
+            self._update_order_state(self._index_orders, _ORDERS_ALL, order, True)
 
             # 8: Build _index_orders_inflight -> {ClientOrderId}
             if order.is_inflight_c():
-                self._index_orders_inflight.add(client_order_id)
+                self._update_order_state(self._index_orders_inflight, _ORDERS_INFLIGHT, order, True)
 
             # 9: Build _index_orders_working -> {ClientOrderId}
             if order.is_working_c():
-                self._index_orders_working.add(client_order_id)
+                self._update_order_state(self._index_orders_working, _ORDERS_WORKING, order, True)
 
             # 10: Build _index_orders_completed -> {ClientOrderId}
             if order.is_completed_c():
-                self._index_orders_completed.add(client_order_id)
+                self._update_order_state(self._index_orders_completed, _ORDERS_COMPLETED, order, True)
 
             # 11: Build _index_strategies -> {StrategyId}
             self._index_strategies.add(order.strategy_id)
@@ -702,18 +774,66 @@ cdef class Cache(CacheFacade):
             self._index_strategy_positions[position.strategy_id].add(position.id)
 
             # 6: Build _index_positions -> {PositionId}
-            self._index_positions.add(position_id)
+            self._update_position_state(self._index_positions, _POSITIONS_ALL, position, True)
 
             # 7: Build _index_positions_open -> {PositionId}
             if position.is_open_c():
-                self._index_positions_open.add(position_id)
+                self._update_position_state(self._index_positions_open, _POSITIONS_OPEN, position, True)
             # 8: Build _index_positions_closed -> {PositionId}
             elif position.is_closed_c():
-                self._index_positions_closed.add(position_id)
+                self._update_position_state(self._index_positions_closed, _POSITIONS_CLOSED, position, True)
 
             # 9: Build _index_strategies -> {StrategyId}
             self._index_strategies.add(position.strategy_id)
 
+    cdef void _update_order_state(
+        self,
+        set index,
+        int state,
+        Order order,
+        bint member,
+    ) except *:
+        cdef ClientOrderId client_order_id = order.client_order_id
+        if (client_order_id in index) == member:
+            return  # No change
+
+        if member:
+            index.add(client_order_id)
+        else:
+            index.discard(client_order_id)
+
+        _update_query_index(
+            self._index_orders_query,
+            self._cached_orders_query,
+            _query_keys(state, order.instrument_id.venue, order.instrument_id, order.strategy_id),
+            client_order_id,
+            member,
+        )
+
+    cdef void _update_position_state(
+        self,
+        set index,
+        int state,
+        Position position,
+        bint member,
+    ) except *:
+        cdef PositionId position_id = position.id
+        if (position_id in index) == member:
+            return  # No change
+
+        if member:
+            index.add(position_id)
+        else:
+            index.discard(position_id)
+
+        _update_query_index(
+            self._index_positions_query,
+            self._cached_positions_query,
+            _query_keys(state, position.instrument_id.venue, position.instrument_id, position.strategy_id),
+            position_id,
+            member,
+        )
+
     cpdef void load_strategy(self, TradingStrategy strategy) except *:
         """
         Load the state dictionary for the given strategy.
@@ -847,7 +967,7 @@ cdef class Cache(CacheFacade):
 
         if not ticks:
             # The instrument_id was not registered
-            ticks = deque(maxlen=self.tick_capacity)
+            ticks = self._new_quote_ticks(instrument_id)
             self._quote_ticks[instrument_id] = ticks
 
         ticks.appendleft(tick)
@@ -869,7 +989,7 @@ cdef class Cache(CacheFacade):
 
         if not ticks:
             # The instrument_id was not registered
-            ticks = deque(maxlen=self.tick_capacity)
+            ticks = self._new_trade_ticks(instrument_id)
             self._trade_ticks[instrument_id] = ticks
 
         ticks.appendleft(tick)
@@ -890,7 +1010,7 @@ cdef class Cache(CacheFacade):
 
         if not bars:
             # The bar type was not registered
-            bars = deque(maxlen=self.bar_capacity)
+            bars = self._new_bars(bar.type)
             self._bars[bar.type] = bars
 
         bars.appendleft(bar)
@@ -920,7 +1040,7 @@ cdef class Cache(CacheFacade):
 
         if not cached_ticks:
             # The instrument_id was not registered
-            cached_ticks = deque(maxlen=self.tick_capacity)
+            cached_ticks = self._new_quote_ticks(instrument_id)
             self._quote_ticks[instrument_id] = cached_ticks
         elif len(cached_ticks) > 0:
             # Currently the simple solution for multiple consumers requesting
@@ -957,7 +1077,7 @@ cdef class Cache(CacheFacade):
 
         if not cached_ticks:
             # The instrument_id was not registered
-            cached_ticks = deque(maxlen=self.tick_capacity)
+            cached_ticks = self._new_trade_ticks(instrument_id)
             self._trade_ticks[instrument_id] = cached_ticks
         elif len(cached_ticks) > 0:
             # Currently the simple solution for multiple consumers requesting
@@ -994,7 +1114,7 @@ cdef class Cache(CacheFacade):
 
         if not cached_bars:
             # The instrument_id was not registered
-            cached_bars = deque(maxlen=self.bar_capacity)
+            cached_bars = self._new_bars(bar_type)
             self._bars[bar_type] = cached_bars
         elif len(cached_bars) > 0:
             # Currently the simple solution for multiple consumers requesting
@@ -1006,6 +1126,21 @@ cdef class Cache(CacheFacade):
         for bar in bars:
             cached_bars.appendleft(bar)
 
+    cdef object _new_quote_ticks(self, InstrumentId instrument_id):
+        if self.columnar_history:
+            return QuoteTickHistory(instrument_id, self.tick_capacity)
+        return deque(maxlen=self.tick_capacity)
+
+    cdef object _new_trade_ticks(self, InstrumentId instrument_id):
+        if self.columnar_history:
+            return TradeTickHistory(instrument_id, self.tick_capacity)
+        return deque(maxlen=self.tick_capacity)
+
+    cdef object _new_bars(self, BarType bar_type):
+        if self.columnar_history:
+            return BarHistory(bar_type, self.bar_capacity)
+        return deque(maxlen=self.bar_capacity)
+
     cpdef void add_currency(self, Currency currency) except *:
         """
         Add the given currency to the cache.
@@ -1110,7 +1245,7 @@ cdef class Cache(CacheFacade):
         Condition.not_in(order.client_order_id, self._index_order_strategy, "order.client_order_id", "index_order_strategy")
 
         self._orders[order.client_order_id] = order
-        self._index_orders.add(order.client_order_id)
+        self._update_order_state(self._index_orders, _ORDERS_ALL, order, True)
         self._index_order_strategy[order.client_order_id] = order.strategy_id
 
         # Index: Venue -> Set[ClientOrderId]
@@ -1227,8 +1362,8 @@ cdef class Cache(CacheFacade):
         Condition.not_in(position.id, self._index_positions_open, "position.id", "index_positions_open")
 
         self._positions[position.id] = position
-        self._index_positions.add(position.id)
-        self._index_positions_open.add(position.id)
+        self._update_position_state(self._index_positions, _POSITIONS_ALL, position, True)
+        self._update_position_state(self._index_positions_open, _POSITIONS_OPEN, position, True)
 
         self.add_position_id(
             position.id,
@@ -1291,16 +1426,16 @@ cdef class Cache(CacheFacade):
             self._index_order_ids[order.venue_order_id] = order.client_order_id
 
         if order.is_inflight_c():
-            self._index_orders_inflight.add(order.client_order_id)
+            self._update_order_state(self._index_orders_inflight, _ORDERS_INFLIGHT, order, True)
         elif order.is_completed_c():
-            self._index_orders_inflight.discard(order.client_order_id)
-            self._index_orders_working.discard(order.client_order_id)
-            self._index_orders_completed.add(order.client_order_id)
+            self._update_order_state(self._index_orders_inflight, _ORDERS_INFLIGHT, order, False)
+            self._update_order_state(self._index_orders_working, _ORDERS_WORKING, order, False)
+            self._update_order_state(self._index_orders_completed, _ORDERS_COMPLETED, order, True)
         else:
             if order.is_working_c():
-                self._index_orders_working.add(order.client_order_id)
-            self._index_orders_inflight.discard(order.client_order_id)
-            self._index_orders_completed.discard(order.client_order_id)
+                self._update_order_state(self._index_orders_working, _ORDERS_WORKING, order, True)
+            self._update_order_state(self._index_orders_inflight, _ORDERS_INFLIGHT, order, False)
+            self._update_order_state(self._index_orders_completed, _ORDERS_COMPLETED, order, False)
 
         # Update database
         if self._database is not None:
@@ -1319,8 +1454,8 @@ cdef class Cache(CacheFacade):
         Condition.not_none(position, "position")
 
         if position.is_closed_c():
-            self._index_positions_closed.add(position.id)
-            self._index_positions_open.discard(position.id)
+            self._update_position_state(self._index_positions_closed, _POSITIONS_CLOSED, position, True)
+            self._update_position_state(self._index_positions_open, _POSITIONS_OPEN, position, False)
 
         # Update database
         if self._database is not None:
@@ -1575,6 +1710,69 @@ cdef class Cache(CacheFacade):
         except IndexError:
             return None
 
+    cpdef QuoteTickHistory quote_tick_history(self, InstrumentId instrument_id):
+        """
+        Return the columnar quote tick history for the given instrument ID.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the ticks.
+
+        Returns
+        -------
+        QuoteTickHistory or None
+            If columnar history is not enabled or no ticks then returns None.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        if not self.columnar_history:
+            return None
+        return self._quote_ticks.get(instrument_id)
+
+    cpdef TradeTickHistory trade_tick_history(self, InstrumentId instrument_id):
+        """
+        Return the columnar trade tick history for the given instrument ID.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the ticks.
+
+        Returns
+        -------
+        TradeTickHistory or None
+            If columnar history is not enabled or no ticks then returns None.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        if not self.columnar_history:
+            return None
+        return self._trade_ticks.get(instrument_id)
+
+    cpdef BarHistory bar_history(self, BarType bar_type):
+        """
+        Return the columnar bar history for the given bar type.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type for the bars.
+
+        Returns
+        -------
+        BarHistory or None
+            If columnar history is not enabled or no bars then returns None.
+
+        """
+        Condition.not_none(bar_type, "bar_type")
+
+        if not self.columnar_history:
+            return None
+        return self._bars.get(bar_type)
+
     cpdef int quote_tick_count(self, InstrumentId instrument_id) except *:
         """
         The count of quote ticks for the given instrument ID.
@@ -1894,53 +2092,77 @@ cdef class Cache(CacheFacade):
 
 # -- IDENTIFIER QUERIES ----------------------------------------------------------------------------
 
-    cdef set _build_ord_query_filter_set(
+    cdef set _query_order_ids(
+        self,
+        set index,
+        int state,
+        Venue venue,
+        InstrumentId instrument_id,
+        StrategyId strategy_id,
+    ):
+        if venue is None and instrument_id is None and strategy_id is None:
+            return index
+        return self._index_orders_query.get((state, venue, instrument_id, strategy_id), set())
+
+    cdef set _query_position_ids(
+        self,
+        set index,
+        int state,
+        Venue venue,
+        InstrumentId instrument_id,
+        StrategyId strategy_id,
+    ):
+        if venue is None and instrument_id is None and strategy_id is None:
+            return index
+        return self._index_positions_query.get((state, venue, instrument_id, strategy_id), set())
+
+    cdef list _query_orders(
         self,
+        set index,
+        int state,
         Venue venue,
         InstrumentId instrument_id,
         StrategyId strategy_id,
     ):
-        cdef set query = None
-
-        # Build potential query set
-        if venue is not None:
-            query = self._index_venue_orders.get(venue, set())
-        if instrument_id is not None:
-            if query is None:
-                query = self._index_instrument_orders.get(instrument_id, set())
-            else:
-                query = query.intersection(self._index_instrument_orders.get(instrument_id, set()))
-        if strategy_id is not None:
-            if query is None:
-                query = self._index_strategy_orders.get(strategy_id, set())
-            else:
-                query = query.intersection(self._index_strategy_orders.get(strategy_id, set()))
-
-        return query
-
-    cdef set _build_pos_query_filter_set(
+        cdef tuple key = (state, venue, instrument_id, strategy_id)
+        cdef tuple orders = self._cached_orders_query.get(key)
+        if orders is not None:
+            return list(orders)
+
+        cdef set client_order_ids = self._query_order_ids(index, state, venue, instrument_id, strategy_id)
+        try:
+            orders = tuple([self._orders[client_order_id] for client_order_id in client_order_ids])
+        except KeyError as ex:
+            self._log.error("Cannot find Order object in cache " + str(ex))
+            return None
+
+        # Cached until the index for the key is next changed
+        self._cached_orders_query[key] = orders
+        return list(orders)
+
+    cdef list _query_positions(
         self,
+        set index,
+        int state,
         Venue venue,
         InstrumentId instrument_id,
         StrategyId strategy_id,
     ):
-        cdef set query = None
-
-        # Build potential query set
-        if venue is not None:
-            query = self._index_venue_positions.get(venue, set())
-        if instrument_id is not None:
-            if query is None:
-                query = self._index_instrument_positions.get(instrument_id, set())
-            else:
-                query = query.intersection(self._index_instrument_positions.get(instrument_id, set()))
-        if strategy_id is not None:
-            if query is None:
-                query = self._index_strategy_positions.get(strategy_id, set())
-            else:
-                query = query.intersection(self._index_strategy_positions.get(strategy_id, set()))
-
-        return query
+        cdef tuple key = (state, venue, instrument_id, strategy_id)
+        cdef tuple positions = self._cached_positions_query.get(key)
+        if positions is not None:
+            return list(positions)
+
+        cdef set position_ids = self._query_position_ids(index, state, venue, instrument_id, strategy_id)
+        try:
+            positions = tuple([self._positions[position_id] for position_id in position_ids])
+        except KeyError as ex:
+            self._log.error("Cannot find Position object in cache " + str(ex))
+            return None
+
+        # Cached until the index for the key is next changed
+        self._cached_positions_query[key] = positions
+        return list(positions)
 
     cpdef set client_order_ids(
         self,
@@ -1965,12 +2187,12 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(venue, instrument_id, strategy_id)
+        cdef set query = self._query_order_ids(self._index_orders, _ORDERS_ALL, venue, instrument_id, strategy_id)
 
-        if query is None:
-            return self._index_orders
+        if query is self._index_orders:
+            return query
         else:
-            return self._index_orders.intersection(query)
+            return set(query)  # Copy so the index cannot be mutated
 
     cpdef set client_order_ids_inflight(
         self,
@@ -1995,12 +2217,12 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(venue, instrument_id, strategy_id)
+        cdef set query = self._query_order_ids(self._index_orders_inflight, _ORDERS_INFLIGHT, venue, instrument_id, strategy_id)
 
-        if query is None:
-            return self._index_orders_inflight
+        if query is self._index_orders_inflight:
+            return query
         else:
-            return self._index_orders_inflight.intersection(query)
+            return set(query)  # Copy so the index cannot be mutated
 
     cpdef set client_order_ids_working(
         self,
@@ -2025,12 +2247,12 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(venue, instrument_id, strategy_id)
+        cdef set query = self._query_order_ids(self._index_orders_working, _ORDERS_WORKING, venue, instrument_id, strategy_id)
 
-        if query is None:
-            return self._index_orders_working
+        if query is self._index_orders_working:
+            return query
         else:
-            return self._index_orders_working.intersection(query)
+            return set(query)  # Copy so the index cannot be mutated
 
     cpdef set client_order_ids_completed(
         self,
@@ -2055,12 +2277,12 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(venue, instrument_id, strategy_id)
+        cdef set query = self._query_order_ids(self._index_orders_completed, _ORDERS_COMPLETED, venue, instrument_id, strategy_id)
 
-        if query is None:
-            return self._index_orders_completed
+        if query is self._index_orders_completed:
+            return query
         else:
-            return self._index_orders_completed.intersection(query)
+            return set(query)  # Copy so the index cannot be mutated
 
     cpdef set position_ids(
         self,
@@ -2085,12 +2307,12 @@ cdef class Cache(CacheFacade):
         Set[PositionId]
 
         """
-        cdef set query = self._build_pos_query_filter_set(venue, instrument_id, strategy_id)
+        cdef set query = self._query_position_ids(self._index_positions, _POSITIONS_ALL, venue, instrument_id, strategy_id)
 
-        if query is None:
-            return self._index_positions
+        if query is self._index_positions:
+            return query
         else:
-            return self._index_positions.intersection(query)
+            return set(query)  # Copy so the index cannot be mutated
 
     cpdef set position_open_ids(
         self,
@@ -2115,12 +2337,12 @@ cdef class Cache(CacheFacade):
         Set[PositionId]
 
         """
-        cdef set query = self._build_pos_query_filter_set(venue, instrument_id, strategy_id)
+        cdef set query = self._query_position_ids(self._index_positions_open, _POSITIONS_OPEN, venue, instrument_id, strategy_id)
 
-        if query is None:
-            return self._index_positions_open
+        if query is self._index_positions_open:
+            return query
         else:
-            return self._index_positions_open.intersection(query)
+            return set(query)  # Copy so the index cannot be mutated
 
     cpdef set position_closed_ids(
         self,
@@ -2145,12 +2367,12 @@ cdef class Cache(CacheFacade):
         Set[PositionId]
 
         """
-        cdef set query = self._build_pos_query_filter_set(venue, instrument_id, strategy_id)
+        cdef set query = self._query_position_ids(self._index_positions_closed, _POSITIONS_CLOSED, venue, instrument_id, strategy_id)
 
-        if query is None:
-            return self._index_positions_closed
+        if query is self._index_positions_closed:
+            return query
         else:
-            return self._index_positions_closed.intersection(query)
+            return set(query)  # Copy so the index cannot be mutated
 
     cpdef set strategy_ids(self):
         """
@@ -2237,12 +2459,7 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids(venue, instrument_id, strategy_id)
-
-        try:
-            return [self._orders[client_order_id] for client_order_id in client_order_ids]
-        except KeyError as ex:
-            self._log.error("Cannot find order object in cached orders " + str(ex))
+        return self._query_orders(self._index_orders, _ORDERS_ALL, venue, instrument_id, strategy_id)
 
     cpdef list orders_inflight(
         self,
@@ -2267,12 +2484,7 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_inflight(venue, instrument_id, strategy_id)
-
-        try:
-            return [self._orders[client_order_id] for client_order_id in client_order_ids]
-        except KeyError as ex:
-            self._log.error("Cannot find Order object in cache " + str(ex))
+        return self._query_orders(self._index_orders_inflight, _ORDERS_INFLIGHT, venue, instrument_id, strategy_id)
 
     cpdef list orders_working(
         self,
@@ -2297,12 +2509,7 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_working(venue, instrument_id, strategy_id)
-
-        try:
-            return [self._orders[client_order_id] for client_order_id in client_order_ids]
-        except KeyError as ex:
-            self._log.error("Cannot find Order object in cache " + str(ex))
+        return self._query_orders(self._index_orders_working, _ORDERS_WORKING, venue, instrument_id, strategy_id)
 
     cpdef list orders_completed(
         self,
@@ -2327,12 +2534,7 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_completed(venue, instrument_id, strategy_id)
-
-        try:
-            return [self._orders[client_order_id] for client_order_id in client_order_ids]
-        except KeyError as ex:
-            self._log.error("Cannot find Order object in cache " + str(ex))
+        return self._query_orders(self._index_orders_completed, _ORDERS_COMPLETED, venue, instrument_id, strategy_id)
 
 # -- POSITION QUERIES ------------------------------------------------------------------------------
 
@@ -2396,12 +2598,7 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_ids(venue, instrument_id, strategy_id)
-
-        try:
-            return [self._positions[position_id] for position_id in position_ids]
-        except KeyError as ex:
-            self._log.error("Cannot find Position object in cache " + str(ex))
+        return self._query_positions(self._index_positions, _POSITIONS_ALL, venue, instrument_id, strategy_id)
 
     cpdef list positions_open(
         self,
@@ -2426,12 +2623,7 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_open_ids(venue, instrument_id, strategy_id)
-
-        try:
-            return [self._positions[position_id] for position_id in position_ids]
-        except KeyError as ex:
-            self._log.error("Cannot find Position object in cache " + str(ex))
+        return self._query_positions(self._index_positions_open, _POSITIONS_OPEN, venue, instrument_id, strategy_id)
 
     cpdef list positions_closed(
         self,
@@ -2456,12 +2648,7 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_closed_ids(venue, instrument_id, strategy_id)
-
-        try:
-            return [self._positions[position_id] for position_id in position_ids]
-        except KeyError as ex:
-            self._log.error("Cannot find Position object in cache " + str(ex))
+        return self._query_positions(self._index_positions_closed, _POSITIONS_CLOSED, venue, instrument_id, strategy_id)
 
     cpdef bint order_exists(self, ClientOrderId client_order_id) except *:
         """
@@ -2559,7 +2746,7 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.client_order_ids(venue, instrument_id, strategy_id))
+        return len(self._query_order_ids(self._index_orders, _ORDERS_ALL, venue, instrument_id, strategy_id))
 
     cpdef int orders_inflight_count(
         self,
@@ -2584,7 +2771,7 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.client_order_ids_inflight(venue, instrument_id, strategy_id))
+        return len(self._query_order_ids(self._index_orders_inflight, _ORDERS_INFLIGHT, venue, instrument_id, strategy_id))
 
     cpdef int orders_working_count(
         self,
@@ -2609,7 +2796,7 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.client_order_ids_working(venue, instrument_id, strategy_id))
+        return len(self._query_order_ids(self._index_orders_working, _ORDERS_WORKING, venue, instrument_id, strategy_id))
 
     cpdef int orders_completed_count(
         self,
@@ -2634,7 +2821,7 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.client_order_ids_completed(venue, instrument_id, strategy_id))
+        return len(self._query_order_ids(self._index_orders_completed, _ORDERS_COMPLETED, venue, instrument_id, strategy_id))
 
     cpdef bint position_exists(self, PositionId position_id) except *:
         """
@@ -2716,7 +2903,7 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.position_ids(venue, instrument_id, strategy_id))
+        return len(self._query_position_ids(self._index_positions, _POSITIONS_ALL, venue, instrument_id, strategy_id))
 
     cpdef int positions_open_count(
         self,
@@ -2741,7 +2928,7 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.position_open_ids(venue, instrument_id, strategy_id))
+        return len(self._query_position_ids(self._index_positions_open, _POSITIONS_OPEN, venue, instrument_id, strategy_id))
 
     cpdef int positions_closed_count(
         self,
@@ -2766,7 +2953,7 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.position_closed_ids(venue, instrument_id, strategy_id))
+        return len(self._query_position_ids(self._index_positions_closed, _POSITIONS_CLOSED, venue, instrument_id, strategy_id))
 
 # -- STRATEGY QUERIES ------------------------------------------------------------------------------
 
@@ -0,0 +1,80 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+
+from nautilus_trader.model.data.bar cimport Bar
+from nautilus_trader.model.data.bar cimport BarType
+from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+
+
+cdef class ColumnarHistory:
+    cdef readonly int capacity
+    """The maximum number of values held.\n\n:returns: `int`"""
+    cdef int _count
+    cdef int _head
+    cdef dict _columns
+    cdef int64_t[::1] _ts_event_ns
+    cdef int64_t[::1] _ts_recv_ns
+
+    cdef int _slot(self, int index)
+    cdef int _next_slot(self, int64_t ts_event_ns, int64_t ts_recv_ns) except -1
+    cdef void _write_raw(self, int64_t[::1] column, int slot, int64_t value) except *
+    cpdef object column(self, str name, int count=*, bint copy=*)
+    cpdef list columns(self)
+    cpdef list to_list(self, int count=*)
+    cpdef void clear(self) except *
+    cpdef void appendleft(self, object data) except *
+    cdef object _materialize(self, int slot)
+
+
+cdef class QuoteTickHistory(ColumnarHistory):
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID of the history.\n\n:returns: `InstrumentId`"""
+    cdef int64_t[::1] _bid
+    cdef int64_t[::1] _ask
+    cdef int64_t[::1] _bid_size
+    cdef int64_t[::1] _ask_size
+    cdef uint8_t[:, ::1] _precisions
+
+    cpdef void add(self, QuoteTick tick) except *
+
+
+cdef class TradeTickHistory(ColumnarHistory):
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID of the history.\n\n:returns: `InstrumentId`"""
+    cdef int64_t[::1] _price
+    cdef int64_t[::1] _size
+    cdef uint8_t[::1] _aggressor_side
+    cdef uint8_t[:, ::1] _precisions
+    cdef list _match_ids
+
+    cpdef void add(self, TradeTick tick) except *
+
+
+cdef class BarHistory(ColumnarHistory):
+    cdef readonly BarType bar_type
+    """The bar type of the history.\n\n:returns: `BarType`"""
+    cdef int64_t[::1] _open
+    cdef int64_t[::1] _high
+    cdef int64_t[::1] _low
+    cdef int64_t[::1] _close
+    cdef int64_t[::1] _volume
+    cdef uint8_t[:, ::1] _precisions
+
+    cpdef void add(self, Bar bar) except *
@@ -0,0 +1,493 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSide
+from nautilus_trader.model.data.bar cimport Bar
+from nautilus_trader.model.data.bar cimport BarType
+from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
+
+
+cdef class ColumnarHistory:
+    """
+    The abstract base class for all columnar data histories.
+
+    Provides a fixed capacity ring buffer of `int64`/`uint8` columns, from
+    which the most recent values are available as read-only NumPy views in
+    chronological order (oldest first), without copying. Objects are only
+    materialized from the columns on request, in which case the history is
+    reverse indexed (most recent value at index 0), as for a `deque` which is
+    appended to the left.
+
+    Each column is stored twice consecutively, so the most recent values are
+    always a contiguous slice regardless of the write position.
+
+    Prices and quantities are held as their raw fixed-point values (i.e.
+    `Price.raw`, scaled by 10 to the power of the precision), so materialized
+    objects are exact.
+
+    This class should not be used directly, but through a concrete subclass.
+    """
+
+    def __init__(self, int capacity, list columns not None):
+        """
+        Initialize a new instance of the ``ColumnarHistory`` class.
+
+        Parameters
+        ----------
+        capacity : int
+            The maximum number of values to hold.
+        columns : list[tuple[str, type]]
+            The names and NumPy dtypes of the columns (other than timestamps).
+
+        Raises
+        ------
+        ValueError
+            If capacity is not positive (> 0).
+
+        """
+        Condition.positive_int(capacity, "capacity")
+
+        self.capacity = capacity
+        self._count = 0
+        self._head = 0
+        self._columns = {
+            name: np.zeros(capacity * 2, dtype=dtype)
+            for name, dtype in columns + [("ts_event_ns", np.int64), ("ts_recv_ns", np.int64)]
+        }
+        self._ts_event_ns = self._columns["ts_event_ns"]
+        self._ts_recv_ns = self._columns["ts_recv_ns"]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, int index):
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError("history index out of range")
+        return self._materialize(self._slot(index))
+
+    def __iter__(self):
+        cdef int i
+        for i in range(self._count):
+            yield self._materialize(self._slot(i))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(capacity={self.capacity}, count={self._count})"
+
+    cdef int _slot(self, int index):
+        # The slot of the value at the given reverse index (always non-negative,
+        # as the index is less than the capacity).
+        return (self._head - 1 - index + self.capacity) % self.capacity
+
+    cdef int _next_slot(self, int64_t ts_event_ns, int64_t ts_recv_ns) except -1:
+        cdef int slot = self._head
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+        self._ts_event_ns[slot] = ts_event_ns
+        self._ts_event_ns[slot + self.capacity] = ts_event_ns
+        self._ts_recv_ns[slot] = ts_recv_ns
+        self._ts_recv_ns[slot + self.capacity] = ts_recv_ns
+        return slot
+
+    cdef void _write_raw(self, int64_t[::1] column, int slot, int64_t value) except *:
+        column[slot] = value
+        column[slot + self.capacity] = value
+
+    cpdef object column(self, str name, int count=0, bint copy=False):
+        """
+        Return a read-only view of the most recent values of the given column.
+
+        The view aliases the ring buffer of the history, so once the history is
+        at capacity later calls to `add` overwrite the values it holds (oldest
+        first). Pass `copy=True` to keep the values across updates.
+
+        Parameters
+        ----------
+        name : str
+            The column name.
+        count : int, optional
+            The number of values to return. If zero or greater than the number
+            of values held then all values held are returned.
+        copy : bool, optional
+            If a (writeable) copy of the values should be returned, rather than
+            a view.
+
+        Returns
+        -------
+        np.ndarray
+            In chronological order (most recent value last).
+
+        Raises
+        ------
+        KeyError
+            If name is not a column of the history.
+
+        """
+        Condition.is_in(name, self._columns, "name", "columns")
+
+        if count <= 0 or count > self._count:
+            count = self._count
+
+        cdef int stop = self._slot(0) + self.capacity + 1
+        view = self._columns[name][stop - count:stop]
+        if copy:
+            return view.copy()
+        view.flags.writeable = False
+        return view
+
+    cpdef list columns(self):
+        """
+        Return the column names of the history.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        return list(self._columns)
+
+    cpdef list to_list(self, int count=0):
+        """
+        Return the most recent values materialized as objects.
+
+        Parameters
+        ----------
+        count : int, optional
+            The number of values to return. If zero or greater than the number
+            of values held then all values held are returned.
+
+        Returns
+        -------
+        list[Data]
+            Reverse ordered (most recent value first).
+
+        """
+        if count <= 0 or count > self._count:
+            count = self._count
+
+        cdef int i
+        return [self._materialize(self._slot(i)) for i in range(count)]
+
+    cpdef void clear(self) except *:
+        """
+        Clear all values from the history.
+        """
+        self._count = 0
+        self._head = 0
+
+    cpdef void appendleft(self, object data) except *:
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method must be implemented in the subclass")
+
+    cdef object _materialize(self, int slot):
+        raise NotImplementedError("method must be implemented in the subclass")
+
+
+cdef class QuoteTickHistory(ColumnarHistory):
+    """
+    Provides a columnar history of quote ticks for an instrument.
+
+    Columns are `bid`, `ask`, `bid_size`, `ask_size` (raw fixed-point `int64`)
+    and `ts_event_ns`, `ts_recv_ns` (`int64`).
+    """
+
+    def __init__(self, InstrumentId instrument_id not None, int capacity):
+        """
+        Initialize a new instance of the ``QuoteTickHistory`` class.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the ticks.
+        capacity : int
+            The maximum number of ticks to hold.
+
+        Raises
+        ------
+        ValueError
+            If capacity is not positive (> 0).
+
+        """
+        super().__init__(
+            capacity,
+            [
+                ("bid", np.int64),
+                ("ask", np.int64),
+                ("bid_size", np.int64),
+                ("ask_size", np.int64),
+            ],
+        )
+
+        self.instrument_id = instrument_id
+        self._bid = self._columns["bid"]
+        self._ask = self._columns["ask"]
+        self._bid_size = self._columns["bid_size"]
+        self._ask_size = self._columns["ask_size"]
+        self._precisions = np.zeros((capacity, 4), dtype=np.uint8)
+
+    cpdef void add(self, QuoteTick tick) except *:
+        """
+        Add the given tick to the history.
+
+        Parameters
+        ----------
+        tick : QuoteTick
+            The tick to add.
+
+        Raises
+        ------
+        ValueError
+            If tick.instrument_id is not equal to the histories instrument ID.
+
+        """
+        Condition.not_none(tick, "tick")
+        Condition.equal(tick.instrument_id, self.instrument_id, "tick.instrument_id", "self.instrument_id")
+
+        cdef int slot = self._next_slot(tick.ts_event_ns, tick.ts_recv_ns)
+        self._write_raw(self._bid, slot, tick.bid.raw)
+        self._write_raw(self._ask, slot, tick.ask.raw)
+        self._write_raw(self._bid_size, slot, tick.bid_size.raw)
+        self._write_raw(self._ask_size, slot, tick.ask_size.raw)
+        self._precisions[slot, 0] = tick.bid.precision
+        self._precisions[slot, 1] = tick.ask.precision
+        self._precisions[slot, 2] = tick.bid_size.precision
+        self._precisions[slot, 3] = tick.ask_size.precision
+
+    cpdef void appendleft(self, object data) except *:
+        """
+        Add the given tick to the history.
+
+        Parameters
+        ----------
+        data : QuoteTick
+            The tick to add.
+
+        """
+        self.add(data)
+
+    cdef object _materialize(self, int slot):
+        return QuoteTick(
+            self.instrument_id,
+            Price.from_raw_c(self._bid[slot], self._precisions[slot, 0]),
+            Price.from_raw_c(self._ask[slot], self._precisions[slot, 1]),
+            Quantity.from_raw_c(self._bid_size[slot], self._precisions[slot, 2]),
+            Quantity.from_raw_c(self._ask_size[slot], self._precisions[slot, 3]),
+            self._ts_event_ns[slot],
+            self._ts_recv_ns[slot],
+        )
+
+
+cdef class TradeTickHistory(ColumnarHistory):
+    """
+    Provides a columnar history of trade ticks for an instrument.
+
+    Columns are `price`, `size` (raw fixed-point `int64`), `aggressor_side`
+    (`uint8`) and `ts_event_ns`, `ts_recv_ns` (`int64`).
+    """
+
+    def __init__(self, InstrumentId instrument_id not None, int capacity):
+        """
+        Initialize a new instance of the ``TradeTickHistory`` class.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the ticks.
+        capacity : int
+            The maximum number of ticks to hold.
+
+        Raises
+        ------
+        ValueError
+            If capacity is not positive (> 0).
+
+        """
+        super().__init__(
+            capacity,
+            [
+                ("price", np.int64),
+                ("size", np.int64),
+                ("aggressor_side", np.uint8),
+            ],
+        )
+
+        self.instrument_id = instrument_id
+        self._price = self._columns["price"]
+        self._size = self._columns["size"]
+        self._aggressor_side = self._columns["aggressor_side"]
+        self._precisions = np.zeros((capacity, 2), dtype=np.uint8)
+        self._match_ids = [None] * capacity
+
+    cpdef void add(self, TradeTick tick) except *:
+        """
+        Add the given tick to the history.
+
+        Parameters
+        ----------
+        tick : TradeTick
+            The tick to add.
+
+        Raises
+        ------
+        ValueError
+            If tick.instrument_id is not equal to the histories instrument ID.
+
+        """
+        Condition.not_none(tick, "tick")
+        Condition.equal(tick.instrument_id, self.instrument_id, "tick.instrument_id", "self.instrument_id")
+
+        cdef int slot = self._next_slot(tick.ts_event_ns, tick.ts_recv_ns)
+        self._write_raw(self._price, slot, tick.price.raw)
+        self._write_raw(self._size, slot, tick.size.raw)
+        self._aggressor_side[slot] = tick.aggressor_side
+        self._aggressor_side[slot + self.capacity] = tick.aggressor_side
+        self._precisions[slot, 0] = tick.price.precision
+        self._precisions[slot, 1] = tick.size.precision
+        self._match_ids[slot] = tick.match_id
+
+    cpdef void appendleft(self, object data) except *:
+        """
+        Add the given tick to the history.
+
+        Parameters
+        ----------
+        data : TradeTick
+            The tick to add.
+
+        """
+        self.add(data)
+
+    cdef object _materialize(self, int slot):
+        return TradeTick(
+            self.instrument_id,
+            Price.from_raw_c(self._price[slot], self._precisions[slot, 0]),
+            Quantity.from_raw_c(self._size[slot], self._precisions[slot, 1]),
+            <AggressorSide>self._aggressor_side[slot],
+            self._match_ids[slot],
+            self._ts_event_ns[slot],
+            self._ts_recv_ns[slot],
+        )
+
+
+cdef class BarHistory(ColumnarHistory):
+    """
+    Provides a columnar history of bars for a bar type.
+
+    Columns are `open`, `high`, `low`, `close`, `volume` (raw fixed-point
+    `int64`) and `ts_event_ns`, `ts_recv_ns` (`int64`).
+    """
+
+    def __init__(self, BarType bar_type not None, int capacity):
+        """
+        Initialize a new instance of the ``BarHistory`` class.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type for the bars.
+        capacity : int
+            The maximum number of bars to hold.
+
+        Raises
+        ------
+        ValueError
+            If capacity is not positive (> 0).
+
+        """
+        super().__init__(
+            capacity,
+            [
+                ("open", np.int64),
+                ("high", np.int64),
+                ("low", np.int64),
+                ("close", np.int64),
+                ("volume", np.int64),
+            ],
+        )
+
+        self.bar_type = bar_type
+        self._open = self._columns["open"]
+        self._high = self._columns["high"]
+        self._low = self._columns["low"]
+        self._close = self._columns["close"]
+        self._volume = self._columns["volume"]
+        self._precisions = np.zeros((capacity, 5), dtype=np.uint8)
+
+    cpdef void add(self, Bar bar) except *:
+        """
+        Add the given bar to the history.
+
+        Parameters
+        ----------
+        bar : Bar
+            The bar to add.
+
+        Raises
+        ------
+        ValueError
+            If bar.type is not equal to the histories bar type.
+
+        """
+        Condition.not_none(bar, "bar")
+        Condition.equal(bar.type, self.bar_type, "bar.type", "self.bar_type")
+
+        cdef int slot = self._next_slot(bar.ts_event_ns, bar.ts_recv_ns)
+        self._write_raw(self._open, slot, bar.open.raw)
+        self._write_raw(self._high, slot, bar.high.raw)
+        self._write_raw(self._low, slot, bar.low.raw)
+        self._write_raw(self._close, slot, bar.close.raw)
+        self._write_raw(self._volume, slot, bar.volume.raw)
+        self._precisions[slot, 0] = bar.open.precision
+        self._precisions[slot, 1] = bar.high.precision
+        self._precisions[slot, 2] = bar.low.precision
+        self._precisions[slot, 3] = bar.close.precision
+        self._precisions[slot, 4] = bar.volume.precision
+
+    cpdef void appendleft(self, object data) except *:
+        """
+        Add the given bar to the history.
+
+        Parameters
+        ----------
+        data : Bar
+            The bar to add.
+
+        """
+        self.add(data)
+
+    cdef object _materialize(self, int slot):
+        return Bar(
+            self.bar_type,
+            Price.from_raw_c(self._open[slot], self._precisions[slot, 0]),
+            Price.from_raw_c(self._high[slot], self._precisions[slot, 1]),
+            Price.from_raw_c(self._low[slot], self._precisions[slot, 2]),
+            Price.from_raw_c(self._close[slot], self._precisions[slot, 3]),
+            Quantity.from_raw_c(self._volume[slot], self._precisions[slot, 4]),
+            self._ts_event_ns[slot],
+            self._ts_recv_ns[slot],
+        )
@@ -20,6 +20,7 @@ from libc.stdint cimport int64_t
 
 from nautilus_trader.common.timer cimport LiveTimer
 from nautilus_trader.common.timer cimport TimeEvent
+from nautilus_trader.common.timer cimport TimeEventHandler
 from nautilus_trader.common.timer cimport Timer
 from nautilus_trader.common.uuid cimport UUIDFactory
 
@@ -28,7 +29,9 @@ cdef class Clock:
     cdef UUIDFactory _uuid_factory
     cdef dict _timers
     cdef dict _handlers
-    cdef Timer[:] _stack
+    cdef dict _entries
+    cdef list _heap
+    cdef int64_t _sequence
     cdef object _default_handler
 
     cdef readonly bint is_test_clock
@@ -74,17 +77,39 @@ cdef class Clock:
     )
     cdef void _add_timer(self, Timer timer, handler: callable) except *
     cdef void _remove_timer(self, Timer timer) except *
-    cdef void _update_stack(self) except *
+    cdef void _reschedule_timer(self, Timer timer) except *
     cdef void _update_timing(self) except *
 
 
+cdef class TestClockScheduler
+
+
 cdef class TestClock(Clock):
     cdef int64_t _time_ns
     cdef dict _pending_events
+    cdef TestClockScheduler _scheduler
 
     cpdef void set_time(self, int64_t to_time_ns) except *
     cpdef list advance_time(self, int64_t to_time_ns)
 
+    cdef TimeEventHandler _pop_next_handler(self, int64_t to_time_ns)
+    cdef void _add_timer(self, Timer timer, handler: callable) except *
+
+
+cdef class TestClockScheduler:
+    cdef TestClock _clock
+    cdef list _clocks
+
+    cdef readonly int64_t next_event_time_ns
+    """The earliest next time event (nanoseconds) across all registered clocks.\n\n:returns: `int64`"""
+
+    cpdef void register(self, TestClock clock) except *
+    cpdef void clear(self) except *
+    cpdef void advance_time(self, int64_t to_time_ns) except *
+
+    cdef void _drain(self, int64_t to_time_ns) except *
+    cdef void _update_timing(self) except *
+
 
 cdef class LiveClock(Clock):
     cdef object _loop
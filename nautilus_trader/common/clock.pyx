@@ -13,13 +13,16 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import cython
-import numpy as np
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+
 import pytz
 
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
 from cpython.datetime cimport tzinfo
+from libc.stdint cimport INT64_MAX
 from libc.stdint cimport int64_t
 
 from nautilus_trader.common.timer cimport LoopTimer
@@ -41,6 +44,10 @@ cdef class Clock:
     """
     The abstract base class for all clocks.
 
+    Timers are scheduled in a binary heap keyed by their next time. Cancelled
+    and rescheduled timers leave their previous heap entry in place, marked as
+    removed, to be discarded once it reaches the top of the heap.
+
     This class should not be used directly, but through a concrete subclass.
     """
 
@@ -51,7 +58,9 @@ cdef class Clock:
         self._uuid_factory = UUIDFactory()
         self._timers = {}    # type: dict[str, Timer]
         self._handlers = {}  # type: dict[str, callable]
-        self._stack = None
+        self._entries = {}   # type: dict[str, list]  # Live heap entry per timer
+        self._heap = []      # type: list[list]  # [next_time_ns, sequence, timer or None]
+        self._sequence = 0   # Orders timers with equal next times by insertion
         self._default_handler = None
         self.is_test_clock = False
         self.is_default_handler_registered = False
@@ -375,45 +384,50 @@ cdef class Clock:
     cdef void _add_timer(self, Timer timer, handler: callable) except *:
         self._timers[timer.name] = timer
         self._handlers[timer.name] = handler
-        self._update_stack()
+        self.timer_count = len(self._timers)
+
+        cdef list entry = [timer.next_time_ns, self._sequence, timer]
+        self._sequence += 1
+        self._entries[timer.name] = entry
+        heappush(self._heap, entry)
         self._update_timing()
 
     cdef void _remove_timer(self, Timer timer) except *:
         self._timers.pop(timer.name, None)
         self._handlers.pop(timer.name, None)
-        self._update_stack()
+        self.timer_count = len(self._timers)
+
+        cdef list entry = self._entries.pop(timer.name, None)
+        if entry is not None:
+            entry[2] = None  # Mark removed
         self._update_timing()
 
-    cdef void _update_stack(self) except *:
-        self.timer_count = len(self._timers)
+    cdef void _reschedule_timer(self, Timer timer) except *:
+        # Replace the timers heap entry following a change to its next time
+        cdef list entry = self._entries.get(timer.name)
+        if entry is None:
+            return  # Timer was removed
 
-        if self.timer_count > 0:
-            # The call to np.asarray here looks inefficient, however its only
-            # called when a timer is added or removed. This then allows the
-            # construction of an efficient Timer[:] memoryview.
-            self._stack = np.ascontiguousarray(list(self._timers.values()))
-        else:
-            self._stack = None
+        entry[2] = None  # Mark removed
+        entry = [timer.next_time_ns, entry[1], timer]
+        self._entries[timer.name] = entry
+        heappush(self._heap, entry)
 
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
     cdef void _update_timing(self) except *:
-        if self.timer_count == 0:
+        # Discard removed entries from the top of the heap
+        while self._heap and self._heap[0][2] is None:
+            heappop(self._heap)
+
+        if not self._heap:
             self.next_event_time_ns = 0
             return
-        elif self.timer_count == 1:
-            self.next_event_time_ns = self._stack[0].next_time_ns
-            return
 
-        cdef int64_t next_time_ns = self._stack[0].next_time_ns
-        cdef int64_t observed_ns
-        cdef int i
-        for i in range(self.timer_count - 1):
-            observed_ns = self._stack[i + 1].next_time_ns
-            if observed_ns < next_time_ns:
-                next_time_ns = observed_ns
+        # Rebuild the heap if removed entries dominate
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [entry for entry in self._heap if entry[2] is not None]
+            heapify(self._heap)
 
-        self.next_event_time_ns = next_time_ns
+        self.next_event_time_ns = self._heap[0][0]
 
 
 cdef class TestClock(Clock):
@@ -520,21 +534,53 @@ cdef class TestClock(Clock):
             self._time_ns = to_time_ns
             return event_handlers  # No timer events to iterate
 
-        # Iterate timer events
+        # Pop timer events in time order (then timer insertion order)
+        cdef TimeEventHandler event_handler = self._pop_next_handler(to_time_ns)
+        while event_handler is not None:
+            event_handlers.append(event_handler)
+            event_handler = self._pop_next_handler(to_time_ns)
+
+        self._time_ns = to_time_ns
+        return event_handlers
+
+    cdef TimeEventHandler _pop_next_handler(self, int64_t to_time_ns):
+        # Return the next handler due at or before the given time (or None)
+        cdef list entry
         cdef TestTimer timer
         cdef TimeEvent event
-        for timer in self._stack:
-            for event in timer.advance(to_time_ns=to_time_ns):
-                event_handlers.append(TimeEventHandler(event, timer.callback))
+        while self._heap:
+            entry = self._heap[0]
+            if entry[2] is None:
+                heappop(self._heap)  # Removed
+                continue
+            if entry[0] > to_time_ns:
+                return None  # Nothing due
+
+            heappop(self._heap)
+            timer = entry[2]
+            event = <TimeEvent>timer.pop_next_event()
 
-        # Remove expired timers
-        for timer in self._stack:
             if timer.is_expired:
-                self._remove_timer(timer)
+                self._timers.pop(timer.name, None)
+                self._handlers.pop(timer.name, None)
+                self._entries.pop(timer.name, None)
+                self.timer_count = len(self._timers)
+            else:
+                entry = [timer.next_time_ns, entry[1], timer]
+                self._entries[timer.name] = entry
+                heappush(self._heap, entry)
 
-        self._update_timing()
-        self._time_ns = to_time_ns
-        return sorted(event_handlers)
+            self._update_timing()
+            return TimeEventHandler(event, timer.callback)
+
+        return None
+
+    cdef void _add_timer(self, Timer timer, handler: callable) except *:
+        Clock._add_timer(self, timer, handler)
+
+        # Notify any scheduler of a possibly earlier next event
+        if self._scheduler is not None and self.next_event_time_ns < self._scheduler.next_event_time_ns:
+            self._scheduler.next_event_time_ns = self.next_event_time_ns
 
     cdef Timer _create_timer(
         self,
@@ -553,6 +599,123 @@ cdef class TestClock(Clock):
         )
 
 
+cdef class TestClockScheduler:
+    """
+    Provides a time event scheduler across many test clocks.
+
+    Tracks a lower bound on the earliest next time event of all registered
+    clocks, so advancing time when nothing is due costs a single comparison
+    before the clocks are set to the new time.
+    """
+    __test__ = False
+
+    def __init__(self, TestClock clock=None):
+        """
+        Initialize a new instance of the ``TestClockScheduler`` class.
+
+        Parameters
+        ----------
+        clock : TestClock, optional
+            The clock to set to each time event timestamp before the event is
+            handled (and to the final time once advanced).
+
+        """
+        self._clock = clock
+        self._clocks = []  # type: list[TestClock]
+
+        self.next_event_time_ns = INT64_MAX
+
+    cpdef void register(self, TestClock clock) except *:
+        """
+        Register the given clock with the scheduler.
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock to register.
+
+        """
+        Condition.not_none(clock, "clock")
+
+        clock._scheduler = self
+        self._clocks.append(clock)
+        if clock.timer_count > 0 and clock.next_event_time_ns < self.next_event_time_ns:
+            self.next_event_time_ns = clock.next_event_time_ns
+
+    cpdef void clear(self) except *:
+        """
+        Deregister all clocks from the scheduler.
+        """
+        cdef TestClock clock
+        for clock in self._clocks:
+            clock._scheduler = None
+        self._clocks.clear()
+        self.next_event_time_ns = INT64_MAX
+
+    cpdef void advance_time(self, int64_t to_time_ns) except *:
+        """
+        Advance all registered clocks to the given time.
+
+        Any time events due at or before the given time are handled in
+        timestamp order across all clocks, with ties handled in clock
+        registration order.
+
+        Parameters
+        ----------
+        to_time_ns : int64
+            The UNIX time (nanoseconds) to advance the clocks to.
+
+        """
+        if to_time_ns >= self.next_event_time_ns:
+            self._drain(to_time_ns)
+
+        cdef TestClock clock
+        for clock in self._clocks:
+            clock._time_ns = to_time_ns
+        if self._clock is not None:
+            self._clock._time_ns = to_time_ns
+
+    cdef void _drain(self, int64_t to_time_ns) except *:
+        # Merge the due events of all clocks through a heap of clock indexes
+        cdef list heap = []
+        cdef TestClock clock
+        cdef int index
+        for index, clock in enumerate(self._clocks):
+            if clock.timer_count > 0 and clock.next_event_time_ns <= to_time_ns:
+                heap.append((clock.next_event_time_ns, index))
+        heapify(heap)
+
+        cdef TimeEventHandler event_handler
+        cdef int64_t timestamp_ns
+        while heap:
+            _, index = heappop(heap)
+            clock = self._clocks[index]
+            event_handler = clock._pop_next_handler(to_time_ns)
+            if event_handler is None:
+                continue  # Timer removed since scheduled
+
+            timestamp_ns = event_handler.event.event_timestamp_ns
+            if timestamp_ns > clock._time_ns:
+                clock._time_ns = timestamp_ns
+            if self._clock is not None and timestamp_ns > self._clock._time_ns:
+                self._clock._time_ns = timestamp_ns
+
+            event_handler.handle()
+
+            if clock.timer_count > 0 and clock.next_event_time_ns <= to_time_ns:
+                heappush(heap, (clock.next_event_time_ns, index))
+
+        self._update_timing()
+
+    cdef void _update_timing(self) except *:
+        self.next_event_time_ns = INT64_MAX
+
+        cdef TestClock clock
+        for clock in self._clocks:
+            if clock.timer_count > 0 and clock.next_event_time_ns < self.next_event_time_ns:
+                self.next_event_time_ns = clock.next_event_time_ns
+
+
 cdef class LiveClock(Clock):
     """
     Provides a clock for live trading. All times are timezone aware UTC.
@@ -668,6 +831,7 @@ cdef class LiveClock(Clock):
             self._remove_timer(timer)
         else:  # Continue timing
             timer.repeat(now_ns=self.timestamp_ns())
+            self._reschedule_timer(timer)
             self._update_timing()
 
     cdef void _handle_time_event(self, TimeEvent event) except *:
@@ -15,6 +15,7 @@
 
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport Logger
@@ -56,10 +57,51 @@ cdef class LogLevelParser:
     cdef LogLevel from_str(str value)
 
 
+cdef class LogRecord:
+    cdef readonly int64_t timestamp_ns
+    """The UNIX timestamp (nanoseconds) when the record was created.\n\n:returns: `int64`"""
+    cdef readonly LogLevel level
+    """The records log level.\n\n:returns: `LogLevel`"""
+    cdef readonly LogColor color
+    """The records log color.\n\n:returns: `LogColor`"""
+    cdef readonly str component
+    """The records component name.\n\n:returns: `str`"""
+    cdef readonly str msg
+    """The records message.\n\n:returns: `str`"""
+    cdef readonly dict annotations
+    """The records annotations.\n\n:returns: `dict[str, object]` or None"""
+    cdef readonly TraderId trader_id
+    """The trader ID of the logger which created the record.\n\n:returns: `TraderId` or None"""
+    cdef readonly UUID system_id
+    """The system ID of the logger which created the record.\n\n:returns: `UUID` or None"""
+
+    cpdef dict to_dict(self)
+
+
+cdef class LogSink:
+    cpdef void write(self, list records) except *
+    cpdef void flush(self) except *
+    cpdef void close(self) except *
+
+
+cdef class JsonLinesLogSink(LogSink):
+    cdef object _file
+    cdef object _queue
+    cdef object _thread
+    cdef double _timeout_secs
+
+    cdef readonly str path
+    """The sinks file path.\n\n:returns: `str`"""
+    cdef readonly bint is_closed
+    """If the sink is closed.\n\n:returns: `bool`"""
+
+
 cdef class Logger:
     cdef Clock _clock
     cdef LogLevel _log_level_stdout
     cdef LogLevel _log_level_raw
+    cdef LogLevel _log_level_min
+    cdef LogSink _sink
 
     cdef readonly TraderId trader_id
     """The loggers trader ID.\n\n:returns: `TraderId`"""
@@ -68,12 +110,16 @@ cdef class Logger:
     cdef readonly bint is_bypassed
     """If the logger is in bypass mode.\n\n:returns: `bool`"""
 
+    cpdef bint is_enabled(self, LogLevel level) except *
+    cdef bint is_enabled_c(self, LogLevel level) except *
     cdef void change_clock_c(self, Clock clock) except *
-    cdef void log_c(self, dict record) except *
-    cdef dict create_record(self, LogLevel level, LogColor color, str component, str msg, dict annotations=*)
+    cdef void log_c(self, LogRecord record) except *
+    cdef LogRecord create_record(self, LogLevel level, LogColor color, str component, str msg, dict annotations=*)
 
-    cdef void _log(self, dict record) except *
-    cdef str _format_record(self, LogLevel level, LogColor color, dict record)
+    cdef void _log(self, LogRecord record) except *
+    cdef void _log_batch(self, list records) except *
+    cdef void _write_stdout(self, LogRecord record) except *
+    cdef str _format_record(self, LogRecord record)
 
 
 cdef class LoggerAdapter:
@@ -92,6 +138,8 @@ cdef class LoggerAdapter:
     cpdef void critical(self, str msg, LogColor color=*, dict annotations=*) except *
     cpdef void exception(self, ex, dict annotations=*) except *
 
+    cdef void _log(self, LogLevel level, LogColor color, str msg, dict annotations) except *
+
 
 cpdef void nautilus_header(LoggerAdapter logger) except *
 cpdef void log_memory(LoggerAdapter logger) except *
@@ -22,16 +22,21 @@ from asyncio import Task
 from collections import defaultdict
 import platform
 from platform import python_version
+import queue
 import sys
+import threading
 import traceback
 
 import numpy as np
+import orjson
 import pandas as pd
 import psutil
 import scipy
 
 from nautilus_trader import __version__
 
+from libc.stdint cimport int64_t
+
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport LogLevel
@@ -99,9 +104,237 @@ cdef class LogLevelParser:
         return LogLevelParser.from_str(value)
 
 
+cdef class LogRecord:
+    """
+    Represents a single log record.
+    """
+
+    def __init__(
+        self,
+        int64_t timestamp_ns,
+        LogLevel level,
+        LogColor color,
+        str component not None,
+        str msg not None,
+        dict annotations=None,
+        TraderId trader_id=None,
+        UUID system_id=None,
+    ):
+        """
+        Initialize a new instance of the ``LogRecord`` class.
+
+        Parameters
+        ----------
+        timestamp_ns : int64
+            The UNIX timestamp (nanoseconds) when the record was created.
+        level : LogLevel
+            The log level for the record.
+        color : LogColor
+            The log color for the record.
+        component : str
+            The component name for the record.
+        msg : str
+            The message for the record.
+        annotations : dict[str, object], optional
+            The annotations for the record.
+        trader_id : TraderId, optional
+            The trader ID of the logger which created the record.
+        system_id : UUID, optional
+            The system ID of the logger which created the record.
+
+        """
+        self.timestamp_ns = timestamp_ns
+        self.level = level
+        self.color = color
+        self.component = component
+        self.msg = msg
+        self.annotations = annotations
+        self.trader_id = trader_id
+        self.system_id = system_id
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}("
+                f"timestamp_ns={self.timestamp_ns}, "
+                f"level={LogLevelParser.to_str(self.level)}, "
+                f"component={self.component}, "
+                f"msg='{self.msg}')")
+
+    cpdef dict to_dict(self):
+        """
+        Return a dictionary representation of this record.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        cdef dict values = {
+            "timestamp": self.timestamp_ns,
+            "level": LogLevelParser.to_str(self.level),
+            "color": self.color,
+            "trader_id": self.trader_id.value if self.trader_id is not None else "",
+            "system_id": self.system_id.value if self.system_id is not None else "",
+            "component": self.component,
+            "msg": self.msg,
+        }
+
+        if self.annotations is not None:
+            values.update(self.annotations)
+
+        return values
+
+
+cdef class LogSink:
+    """
+    The abstract base class for all raw log record sinks.
+
+    This class should not be used directly, but through a concrete subclass.
+    """
+
+    cpdef void write(self, list records) except *:
+        """
+        Write the given log records to the sink.
+
+        Parameters
+        ----------
+        records : list[LogRecord]
+            The records to write.
+
+        """
+        raise NotImplementedError("method must be implemented in the subclass")
+
+    cpdef void flush(self) except *:
+        """
+        Flush any buffered records to the underlying sink.
+        """
+        raise NotImplementedError("method must be implemented in the subclass")
+
+    cpdef void close(self) except *:
+        """
+        Flush any buffered records and close the sink.
+        """
+        raise NotImplementedError("method must be implemented in the subclass")
+
+
+cdef class JsonLinesLogSink(LogSink):
+    """
+    Provides a log sink which writes records as JSON lines to a file.
+
+    Batches of records are handed to a background thread which serializes them
+    and writes to a buffered file, keeping I/O off the calling thread.
+    """
+
+    def __init__(
+        self,
+        str path not None,
+        int buffer_size=1_048_576,
+        double timeout_secs=5.0,
+    ):
+        """
+        Initialize a new instance of the ``JsonLinesLogSink`` class.
+
+        Parameters
+        ----------
+        path : str
+            The file path to append records to.
+        buffer_size : int, optional
+            The write buffer size (bytes) for the file.
+        timeout_secs : double, optional
+            The maximum time to wait for the background thread on flush or close.
+
+        Raises
+        ------
+        ValueError
+            If path is not a valid string.
+        ValueError
+            If buffer_size is not positive (> 0).
+        ValueError
+            If timeout_secs is not positive (> 0).
+
+        """
+        Condition.valid_string(path, "path")
+        Condition.positive_int(buffer_size, "buffer_size")
+        Condition.positive(timeout_secs, "timeout_secs")
+
+        self._file = open(path, mode="ab", buffering=buffer_size)
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"{type(self).__name__}-{path}",
+            daemon=True,
+        )
+
+        self._timeout_secs = timeout_secs
+
+        self.path = path
+        self.is_closed = False
+
+        self._thread.start()
+
+    cpdef void write(self, list records) except *:
+        """
+        Write the given log records to the sink.
+
+        The records are serialized and written on the sinks background thread.
+
+        Parameters
+        ----------
+        records : list[LogRecord]
+            The records to write.
+
+        """
+        if records and not self.is_closed:
+            self._queue.put(records)
+
+    cpdef void flush(self) except *:
+        """
+        Flush any buffered records to the file.
+
+        Blocks until all records written prior to the call have been flushed,
+        or the timeout elapses. Returns immediately if the background thread
+        is no longer running.
+
+        """
+        if self.is_closed or not self._thread.is_alive():
+            return
+
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        flushed.wait(self._timeout_secs)
+
+    cpdef void close(self) except *:
+        """
+        Flush any buffered records and close the file.
+        """
+        if self.is_closed:
+            return
+
+        self.is_closed = True
+        self._queue.put(None)  # Sentinel
+        self._thread.join(self._timeout_secs)
+
+    def _run(self):
+        cdef LogRecord record
+        while True:
+            item = self._queue.get()
+            if item is None:  # Sentinel
+                break
+            elif isinstance(item, list):
+                self._file.write(b"".join([
+                    orjson.dumps(record.to_dict(), default=str) + b"\n" for record in item
+                ]))
+            else:  # Flush request
+                self._file.flush()
+                item.set()
+
+        self._file.close()
+
+
 cdef class Logger:
     """
     Provides a high-performance logger.
+
+    Records below every configured threshold are filtered before being built.
     """
 
     def __init__(
@@ -112,6 +345,7 @@ cdef class Logger:
         LogLevel level_stdout=LogLevel.INFO,
         LogLevel level_raw=LogLevel.DEBUG,
         bint bypass=False,
+        LogSink sink=None,
     ):
         """
         Initialize a new instance of the ``Logger`` class.
@@ -130,6 +364,8 @@ cdef class Logger:
             The minimum log level for the raw log record sink.
         bypass : bool
             If the logger should be bypassed.
+        sink : LogSink, optional
+            The raw log record sink for the logger.
 
         """
         if system_id is None:
@@ -137,11 +373,35 @@ cdef class Logger:
         self._clock = clock
         self._log_level_stdout = level_stdout
         self._log_level_raw = level_raw
+        self._log_level_min = min(level_stdout, LogLevel.ERROR)  # Errors always go to stderr
+        if sink is not None:
+            self._log_level_min = min(self._log_level_min, level_raw)
+        self._sink = sink
 
         self.trader_id = trader_id
         self.system_id = system_id
         self.is_bypassed = bypass
 
+    cpdef bint is_enabled(self, LogLevel level) except *:
+        """
+        Return a value indicating whether a record at the given level would be
+        logged to any output.
+
+        Parameters
+        ----------
+        level : LogLevel
+            The log level to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.is_enabled_c(level)
+
+    cdef bint is_enabled_c(self, LogLevel level) except *:
+        return not self.is_bypassed and level >= self._log_level_min
+
     cdef void change_clock_c(self, Clock clock) except *:
         """
         Change the loggers internal clock to the given clock.
@@ -155,7 +415,7 @@ cdef class Logger:
 
         self._clock = clock
 
-    cdef void log_c(self, dict record) except *:
+    cdef void log_c(self, LogRecord record) except *:
         """
         Handle the given record by sending it to configured sinks.
 
@@ -163,12 +423,12 @@ cdef class Logger:
 
         Parameters
         ----------
-        record : dict[str, object]
+        record : LogRecord
 
         """
         self._log(record)
 
-    cdef dict create_record(
+    cdef LogRecord create_record(
         self,
         LogLevel level,
         LogColor color,
@@ -176,57 +436,60 @@ cdef class Logger:
         str msg,
         dict annotations=None,
     ):
-        cdef dict record = {
-            "timestamp": self._clock.timestamp_ns(),
-            "level": LogLevelParser.to_str(level),
-            "color": color,
-            "trader_id": self.trader_id.value if self.trader_id is not None else "",
-            "system_id": self.system_id.value,
-            "component": component,
-            "msg": msg,
-        }
-
-        if annotations is not None:
-            record = {**record, **annotations}
+        cdef LogRecord record = LogRecord.__new__(LogRecord)
+        record.timestamp_ns = self._clock.timestamp_ns()
+        record.level = level
+        record.color = color
+        record.component = component
+        record.msg = msg
+        record.annotations = annotations
+        record.trader_id = self.trader_id
+        record.system_id = self.system_id
 
         return record
 
-    cdef void _log(self, dict record) except *:
-        cdef LogLevel level = LogLevelParser.from_str(record["level"])
-        cdef LogColor color = record.get("color", 0)
+    cdef void _log(self, LogRecord record) except *:
+        self._write_stdout(record)
 
-        if level >= LogLevel.ERROR:
-            sys.stderr.write(f"{self._format_record(level, color, record)}\n")
-        elif level >= self._log_level_stdout:
-            sys.stdout.write(f"{self._format_record(level, color, record)}\n")
+        if self._sink is not None and record.level >= self._log_level_raw:
+            self._sink.write([record])
 
-        if level >= self._log_level_raw:
-            pass  # TODO: Raw sink out - str(record)
+    cdef void _log_batch(self, list records) except *:
+        cdef list raw = []
+        cdef LogRecord record
+        for record in records:
+            self._write_stdout(record)
+            if record.level >= self._log_level_raw:
+                raw.append(record)
 
-    cdef str _format_record(
-        self,
-        LogLevel level,
-        LogColor color,
-        dict record,
-    ):
-        # Return the formatted log message from the given arguments
-        cdef str time = format_iso8601_us(nanos_to_unix_dt(record["timestamp"]))
+        if self._sink is not None and raw:
+            self._sink.write(raw)
+
+    cdef void _write_stdout(self, LogRecord record) except *:
+        if record.level >= LogLevel.ERROR:
+            sys.stderr.write(f"{self._format_record(record)}\n")
+        elif record.level >= self._log_level_stdout:
+            sys.stdout.write(f"{self._format_record(record)}\n")
+
+    cdef str _format_record(self, LogRecord record):
+        # Return the formatted log message from the given record
+        cdef str time = format_iso8601_us(nanos_to_unix_dt(record.timestamp_ns))
 
         # Set log color
         cdef str color_cmd = ""
-        if color == LogColor.YELLOW:
+        if record.color == LogColor.YELLOW:
             color_cmd = _YELLOW
-        elif color == LogColor.GREEN:
+        elif record.color == LogColor.GREEN:
             color_cmd = _GREEN
-        elif color == LogColor.BLUE:
+        elif record.color == LogColor.BLUE:
             color_cmd = _BLUE
-        elif color == LogColor.RED:
+        elif record.color == LogColor.RED:
             color_cmd = _RED
 
         cdef str trader_id_str = f"{self.trader_id.value}." if self.trader_id is not None else ""
         return (f"{_BOLD}{time}{_ENDC} {color_cmd}"
-                f"[{LogLevelParser.to_str(level)}] "
-                f"{trader_id_str}{record['component']}: {record['msg']}{_ENDC}")
+                f"[{LogLevelParser.to_str(record.level)}] "
+                f"{trader_id_str}{record.component}: {record.msg}{_ENDC}")
 
 
 cdef class LoggerAdapter:
@@ -288,18 +551,7 @@ cdef class LoggerAdapter:
         """
         Condition.not_none(msg, "message")
 
-        if self.is_bypassed:
-            return
-
-        cdef dict record = self._logger.create_record(
-            level=LogLevel.DEBUG,
-            color=color,
-            component=self.component,
-            msg=msg,
-            annotations=annotations,
-        )
-
-        self._logger.log_c(record)
+        self._log(LogLevel.DEBUG, color, msg, annotations)
 
     cpdef void info(
         self, str msg,
@@ -321,18 +573,7 @@ cdef class LoggerAdapter:
         """
         Condition.not_none(msg, "msg")
 
-        if self.is_bypassed:
-            return
-
-        cdef dict record = self._logger.create_record(
-            level=LogLevel.INFO,
-            color=color,
-            component=self.component,
-            msg=msg,
-            annotations=annotations,
-        )
-
-        self._logger.log_c(record)
+        self._log(LogLevel.INFO, color, msg, annotations)
 
     cpdef void warning(
         self,
@@ -355,18 +596,7 @@ cdef class LoggerAdapter:
         """
         Condition.not_none(msg, "msg")
 
-        if self.is_bypassed:
-            return
-
-        cdef dict record = self._logger.create_record(
-            level=LogLevel.WARNING,
-            color=color,
-            component=self.component,
-            msg=msg,
-            annotations=annotations,
-        )
-
-        self._logger.log_c(record)
+        self._log(LogLevel.WARNING, color, msg, annotations)
 
     cpdef void error(
         self,
@@ -389,18 +619,7 @@ cdef class LoggerAdapter:
         """
         Condition.not_none(msg, "msg")
 
-        if self.is_bypassed:
-            return
-
-        cdef dict record = self._logger.create_record(
-            level=LogLevel.ERROR,
-            color=color,
-            component=self.component,
-            msg=msg,
-            annotations=annotations,
-        )
-
-        self._logger.log_c(record)
+        self._log(LogLevel.ERROR, color, msg, annotations)
 
     cpdef void critical(
         self,
@@ -423,18 +642,7 @@ cdef class LoggerAdapter:
         """
         Condition.not_none(msg, "msg")
 
-        if self.is_bypassed:
-            return
-
-        cdef dict record = self._logger.create_record(
-            level=LogLevel.CRITICAL,
-            color=color,
-            component=self.component,
-            msg=msg,
-            annotations=annotations,
-        )
-
-        self._logger.log_c(record)
+        self._log(LogLevel.CRITICAL, color, msg, annotations)
 
     cpdef void exception(self, ex, dict annotations=None) except *:
         """
@@ -461,6 +669,18 @@ cdef class LoggerAdapter:
 
         self.error(f"{ex_string} {stack_trace_lines}", annotations=annotations)
 
+    cdef void _log(self, LogLevel level, LogColor color, str msg, dict annotations) except *:
+        if self.is_bypassed or not self._logger.is_enabled_c(level):
+            return  # Filtered before building the record
+
+        self._logger.log_c(self._logger.create_record(
+            level=level,
+            color=color,
+            component=self.component,
+            msg=msg,
+            annotations=annotations,
+        ))
+
 
 cpdef void nautilus_header(LoggerAdapter logger) except *:
     Condition.not_none(logger, "logger")
@@ -546,6 +766,7 @@ cdef class LiveLogger(Logger):
         LogLevel level_raw=LogLevel.DEBUG,
         bint bypass=False,
         int maxsize=10000,
+        LogSink sink=None,
     ):
         """
         Initialize a new instance of the ``LiveLogger`` class.
@@ -568,6 +789,8 @@ cdef class LiveLogger(Logger):
             If the logger should be bypassed.
         maxsize : int, optional
             The maximum capacity for the log queue.
+        sink : LogSink, optional
+            The raw log record sink for the logger.
 
         """
         super().__init__(
@@ -577,6 +800,7 @@ cdef class LiveLogger(Logger):
             level_stdout=level_stdout,
             level_raw=level_raw,
             bypass=bypass,
+            sink=sink,
         )
 
         self._loop = loop
@@ -598,7 +822,7 @@ cdef class LiveLogger(Logger):
         """
         return self._run_task
 
-    cdef void log_c(self, dict record) except *:
+    cdef void log_c(self, LogRecord record) except *:
         """
         Log the given message.
 
@@ -610,7 +834,7 @@ cdef class LiveLogger(Logger):
 
         Parameters
         ----------
-        record : dict[str, object]
+        record : LogRecord
             The log record.
 
         """
@@ -621,7 +845,8 @@ cdef class LiveLogger(Logger):
                 self._queue.put_nowait(record)
             except asyncio.QueueFull:
                 now = self._clock.utc_now()
-                next_msg = self._queue.peek_front().get("msg")
+                next_record = self._queue.peek_front()
+                next_msg = next_record.msg if next_record is not None else None
 
                 # Log blocking message once a second
                 if (
@@ -630,7 +855,7 @@ cdef class LiveLogger(Logger):
                 ):
                     self.last_blocked = now
 
-                    messages = [r["msg"] for r in self._queue.to_list()]
+                    messages = [r.msg for r in self._queue.to_list() if r is not None]
                     message_types = defaultdict(lambda: 0)
                     for msg in messages:
                         message_types[msg] += 1
@@ -653,7 +878,7 @@ cdef class LiveLogger(Logger):
                     self._log(blocking_record)
 
                 # If not spamming then add record to event loop
-                if next_msg != record.get("msg"):
+                if next_msg != record.msg:
                     self._loop.create_task(self._queue.put(record))  # Blocking until qsize reduces
         else:
             # If event loop is not running then pass message directly to the
@@ -681,21 +906,33 @@ cdef class LiveLogger(Logger):
             self._enqueue_sentinel()
 
     async def _consume_messages(self):
-        cdef dict record
+        cdef LogRecord record
+        cdef list batch
         try:
             while self.is_running:
                 record = await self._queue.get()
                 if record is None:  # Sentinel message (fast C-level check)
                     continue        # Returns to the top to check `self.is_running`
-                self._log(record)
+
+                # Drain everything already queued into a single batch
+                batch = [record]
+                while not self._queue.empty():
+                    record = self._queue.get_nowait()
+                    if record is not None:
+                        batch.append(record)
+                self._log_batch(batch)
         except asyncio.CancelledError:
             pass
         finally:
             # Pass remaining messages directly to the base class
+            batch = []
             while not self._queue.empty():
                 record = self._queue.get_nowait()
-                if record:
-                    self._log(record)
+                if record is not None:
+                    batch.append(record)
+            self._log_batch(batch)
+            if self._sink is not None:
+                self._sink.flush()
 
     cdef void _enqueue_sentinel(self) except *:
         self._queue.put_nowait(self._sentinel)
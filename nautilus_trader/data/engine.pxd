@@ -56,6 +56,7 @@ cdef class DataEngine(Component):
     cdef dict _data_handlers
     cdef dict _status_update_handlers
     cdef dict _close_price_handlers
+    cdef list _all_data_handlers
     cdef dict _bar_aggregators
     cdef dict _order_book_intervals
 
@@ -79,6 +80,8 @@ cdef class DataEngine(Component):
 
     cpdef void register_client(self, DataClient client) except *
     cpdef void deregister_client(self, DataClient client) except *
+    cpdef void register_data_handler(self, handler: callable) except *
+    cpdef void deregister_data_handler(self, handler: callable) except *
 
 # -- ABSTRACT METHODS ------------------------------------------------------------------------------
 
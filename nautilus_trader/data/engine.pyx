@@ -133,6 +133,7 @@ cdef class DataEngine(Component):
         self._data_handlers = {}              # type: dict[DataType, list[callable]]
         self._status_update_handlers = {}     # type: dict[DataType, list[callable]]
         self._close_price_handlers = {}       # type: dict[DataType, list[callable]]
+        self._all_data_handlers = []          # type: list[callable]
 
         # Aggregators
         self._bar_aggregators = {}            # type: dict[BarType, BarAggregator]
@@ -321,6 +322,52 @@ cdef class DataEngine(Component):
         del self._clients[client.id]
         self._log.info(f"Deregistered {client}.")
 
+    cpdef void register_data_handler(self, handler: callable) except *:
+        """
+        Register the given handler to receive all data processed by the engine.
+
+        The handler receives every data object after it has been handled by
+        the engine (i.e. for recording the data stream). Exceptions raised by
+        the handler are logged, and do not interrupt data handling.
+
+        Parameters
+        ----------
+        handler : callable
+            The handler to register.
+
+        Raises
+        ------
+        KeyError
+            If handler is already registered.
+
+        """
+        Condition.callable(handler, "handler")
+        Condition.not_in(handler, self._all_data_handlers, "handler", "self._all_data_handlers")
+
+        self._all_data_handlers.append(handler)
+        self._log.info(f"Registered data handler {handler}.")
+
+    cpdef void deregister_data_handler(self, handler: callable) except *:
+        """
+        Deregister the given handler from receiving all data.
+
+        Parameters
+        ----------
+        handler : callable
+            The handler to deregister.
+
+        Raises
+        ------
+        KeyError
+            If handler is not registered.
+
+        """
+        Condition.callable(handler, "handler")
+        Condition.is_in(handler, self._all_data_handlers, "handler", "self._all_data_handlers")
+
+        self._all_data_handlers.remove(handler)
+        self._log.info(f"Deregistered data handler {handler}.")
+
 # -- ABSTRACT METHODS ------------------------------------------------------------------------------
 
     cpdef void _on_start(self) except *:
@@ -1118,6 +1165,12 @@ cdef class DataEngine(Component):
         else:
             self._log.error(f"Cannot handle data: unrecognized type {type(data)} {data}.")
 
+        for handler in self._all_data_handlers:
+            try:
+                handler(data)
+            except Exception as ex:
+                self._log.exception(ex)
+
     cdef void _handle_instrument(self, Instrument instrument) except *:
         self.cache.add_instrument(instrument)
 
@@ -1,13 +1,187 @@
 import asyncio
-from asyncio import IncompleteReadError
+import time
 from typing import Callable, Optional
 
 import orjson
 
+from nautilus_trader.common.logging import LogLevel
 from nautilus_trader.common.logging import LoggerAdapter
 
 
 DEFAULT_CRLF = b"\r\n"
+DEFAULT_BUFFER_SIZE = 65536
+MIN_READ_SIZE = 4096
+
+
+class SocketProtocol(asyncio.BufferedProtocol):
+    """
+    Provides a buffered framing protocol for delimited message streams.
+
+    Incoming bytes are read directly into a reusable ``bytearray`` (via a
+    ``memoryview``), all complete frames are then dispatched in one batch per
+    read, and any trailing partial frame is compacted to the front of the
+    buffer ready for the next read.
+    """
+
+    def __init__(
+        self,
+        message_handler: Callable,
+        crlf: bytes = DEFAULT_CRLF,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        on_frames: Optional[Callable] = None,
+        logger: Optional[LoggerAdapter] = None,
+    ):
+        """
+        Initialize a new instance of the ``SocketProtocol`` class.
+
+        Parameters
+        ----------
+        message_handler : Callable[[bytes], None]
+            The handler for each complete frame (delimiter stripped).
+        crlf : bytes
+            The frame delimiter.
+        buffer_size : int
+            The initial size of the read buffer (grows for larger frames).
+        on_frames : Callable[[list[bytes]], None], optional
+            The callback for each batch of frames received in a single read
+            (before dispatching to the message handler).
+        logger : LoggerAdapter, optional
+            The logger for message handler exceptions, which are logged so the
+            remaining frames are still dispatched. If None then exceptions
+            propagate to the transport (closing the connection).
+
+        """
+        self.message_handler = message_handler
+        self.crlf = crlf
+        self.on_frames = on_frames
+        self.logger = logger
+        self.transport: Optional[asyncio.Transport] = None
+        self.is_stopped = False
+        self.bytes_received = 0
+        self.messages_received = 0
+
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # Start of unconsumed data
+        self._end = 0  # End of received data
+        self._closed: Optional[asyncio.Future] = None
+        self._drain_waiter: Optional[asyncio.Future] = None
+        self._paused = False
+
+    @property
+    def closed(self) -> asyncio.Future:
+        """
+        The future which completes when the connection is lost.
+
+        Returns
+        -------
+        asyncio.Future
+
+        """
+        if self._closed is None:
+            self._closed = asyncio.get_event_loop().create_future()
+        return self._closed
+
+    def connection_made(self, transport):
+        self.transport = transport
+        _ = self.closed  # Create future on the running loop
+
+    def connection_lost(self, exc):
+        if not self.closed.done():
+            self.closed.set_result(exc)
+        if self._drain_waiter is not None and not self._drain_waiter.done():
+            self._drain_waiter.set_result(None)
+
+    def pause_writing(self):
+        self._paused = True
+
+    def resume_writing(self):
+        self._paused = False
+        if self._drain_waiter is not None and not self._drain_waiter.done():
+            self._drain_waiter.set_result(None)
+
+    async def drain(self):
+        """
+        Wait until the transport write buffer is below the high watermark.
+        """
+        if not self._paused:
+            return
+        self._drain_waiter = asyncio.get_event_loop().create_future()
+        await self._drain_waiter
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        needed = max(sizehint, MIN_READ_SIZE)
+        if len(self._buffer) - self._end < needed:
+            self._make_room(needed)
+        return self._view[self._end :]
+
+    def buffer_updated(self, nbytes: int):
+        self.bytes_received += nbytes
+        self._end += nbytes
+
+        frames = self._split_frames()
+        if not frames:
+            return
+
+        if self.on_frames is not None:
+            self.on_frames(frames)
+
+        for frame in frames:
+            if self.is_stopped:
+                return
+            self.messages_received += 1
+            if self.logger is None:
+                self.message_handler(frame)
+                continue
+            try:
+                self.message_handler(frame)
+            except Exception as ex:
+                # Only a lost connection should close the transport
+                self.logger.exception(ex)
+
+    def eof_received(self):
+        return False  # Close the transport
+
+    def _split_frames(self) -> list:
+        frames = []
+        buffer = self._buffer
+        view = self._view
+        crlf = self.crlf
+        crlf_len = len(crlf)
+        start = self._start
+        end = self._end
+        while True:
+            index = buffer.find(crlf, start, end)
+            if index == -1:
+                break
+            frames.append(bytes(view[start:index]))
+            start = index + crlf_len
+
+        if start == end:
+            # All data consumed, reset to the front of the buffer
+            self._start = 0
+            self._end = 0
+        else:
+            self._start = start
+
+        return frames
+
+    def _make_room(self, needed: int):
+        # Compact any partial frame to the front, growing the buffer if required
+        pending = self._end - self._start
+        if len(self._buffer) - pending < needed:
+            size = len(self._buffer)
+            while size - pending < needed:
+                size *= 2
+            buffer = bytearray(size)
+            buffer[:pending] = self._view[self._start : self._end]
+            self._view.release()
+            self._buffer = buffer
+            self._view = memoryview(buffer)
+        elif self._start > 0:
+            self._view[:pending] = self._view[self._start : self._end]
+        self._start = 0
+        self._end = pending
 
 
 # TODO - Need to add DataClient subclass back
@@ -42,17 +216,35 @@ class SocketClient:
         self.crlf = crlf or DEFAULT_CRLF
         self.encoding = encoding
         self.ssl = ssl
-        self.reader: Optional[asyncio.StreamReader] = None
-        self.writer: Optional[asyncio.StreamWriter] = None
+        self.transport: Optional[asyncio.Transport] = None
+        self.protocol: Optional[SocketProtocol] = None
         self.connected = False
         self._stop = False
         self._stopped = False
+        self._stop_event: Optional[asyncio.Event] = None
+        self._log_debug = logger_adapter.get_logger().is_enabled(LogLevel.DEBUG)
+        self._ts_started: Optional[float] = None
+        self._bytes_received = 0  # From previous connections
+        self._messages_received = 0  # From previous connections
 
     async def connect(self):
         if not self.connected:
-            self.reader, self.writer = await asyncio.open_connection(
-                host=self.host, port=self.port, loop=self.loop, ssl=self.ssl
+            if self.protocol is not None:
+                self._bytes_received += self.protocol.bytes_received
+                self._messages_received += self.protocol.messages_received
+            self.transport, self.protocol = await self.loop.create_connection(
+                lambda: SocketProtocol(
+                    message_handler=self.message_handler,
+                    crlf=self.crlf,
+                    on_frames=self._on_frames if self._log_debug else None,
+                    logger=self.logger,
+                ),
+                host=self.host,
+                port=self.port,
+                ssl=self.ssl,
             )
+            if self._ts_started is None:
+                self._ts_started = time.monotonic()
             await self.post_connection()
             self.connected = True
 
@@ -60,14 +252,20 @@ class SocketClient:
         self.stop()
         while not self._stopped:
             await asyncio.sleep(0.01)
-        self.writer.close()
-        await self.writer.wait_closed()
-        self.reader = None
-        self.writer = None
+        self.transport.close()
+        await self.protocol.closed
+        self._bytes_received += self.protocol.bytes_received
+        self._messages_received += self.protocol.messages_received
+        self.transport = None
+        self.protocol = None
         self.connected = False
 
     def stop(self):
         self._stop = True
+        if self.protocol is not None:
+            self.protocol.is_stopped = True
+        if self._stop_event is not None:
+            self._stop_event.set()
 
     async def reconnect(self):
         await self.disconnect()
@@ -84,27 +282,55 @@ class SocketClient:
             raw = orjson.dumps(raw)
         if not isinstance(raw, bytes):
             raw = raw.encode(self.encoding)
-        self.logger.debug(f"SEND: {raw.decode()}")
-        self.writer.write(raw + self.crlf)
-        await self.writer.drain()
+        if self._log_debug:
+            self.logger.debug(f"SEND: {raw.decode()}")
+        self.transport.write(raw + self.crlf)
+        await self.protocol.drain()
 
     async def start(self):
-        partial = b""
         if not self.connected:
             await self.connect()
-        while not self._stop:
-            try:
-                raw = await self.reader.readuntil(separator=self.crlf)
-                if partial:
-                    raw = partial + raw
-                    partial = b""
-                self.logger.debug(f"RECV: {raw.decode()}")
-                self.message_handler(raw.rstrip(self.crlf))
-                await asyncio.sleep(0)
-            except IncompleteReadError as e:
-                partial = e.partial
-                self.logger.warning(str(e))
-                continue
-            except ConnectionResetError:
-                await self.connect()
-        self._stopped = True
+        self._stop_event = asyncio.Event()
+        if self._stop:
+            self._stop_event.set()
+        stop_waiter = self.loop.create_task(self._stop_event.wait())
+        try:
+            while not self._stop:
+                # Frames are dispatched by the protocol, wait for stop or connection loss
+                await asyncio.wait(
+                    {stop_waiter, self.protocol.closed},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not self._stop and self.protocol.closed.done():
+                    self.logger.warning(f"Connection lost ({self.protocol.closed.result()}), reconnecting...")
+                    self.connected = False
+                    await self.connect()
+        finally:
+            stop_waiter.cancel()
+            self._stopped = True
+
+    def stats(self) -> dict:
+        """
+        Return the receive throughput statistics for the client.
+
+        Returns
+        -------
+        dict[str, float]
+
+        """
+        bytes_received = self._bytes_received
+        messages_received = self._messages_received
+        if self.protocol is not None:
+            bytes_received += self.protocol.bytes_received
+            messages_received += self.protocol.messages_received
+        elapsed = time.monotonic() - self._ts_started if self._ts_started else 0.0
+        return {
+            "bytes_received": bytes_received,
+            "messages_received": messages_received,
+            "bytes_per_second": bytes_received / elapsed if elapsed else 0.0,
+            "messages_per_second": messages_received / elapsed if elapsed else 0.0,
+        }
+
+    def _on_frames(self, frames: list):
+        for frame in frames:
+            self.logger.debug(f"RECV: {frame.decode()}")
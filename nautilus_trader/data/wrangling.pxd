@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport int64_t
+
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregation
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.bar cimport BarType
@@ -30,8 +32,6 @@ cdef class QuoteTickDataWrangler:
     cdef readonly processed_data
     cdef readonly BarAggregation resolution
 
-    cpdef QuoteTick _build_tick_from_values(self, str[:] values, double timestamp)
-
 
 cdef class TradeTickDataWrangler:
     cdef object _data_trades
@@ -47,5 +47,16 @@ cdef class BarDataWrangler:
     cdef int _price_precision
     cdef int _size_precision
     cdef object _data
-
-    cpdef Bar _build_bar(self, double[:] values, double timestamp)
+    cdef int64_t[:] _opens
+    cdef int64_t[:] _highs
+    cdef int64_t[:] _lows
+    cdef int64_t[:] _closes
+    cdef int64_t[:] _volumes
+    cdef int64_t[:] _timestamps
+    cdef bint _cache_bars
+    cdef tuple _cache_key
+
+    cdef list _build_bars_slice(self, slice bars_slice)
+    cdef list _build_bars(self, int start, int stop)
+    cdef Bar _build_bar(self, int index)
+    cdef tuple _get_cache_key(self)
@@ -14,10 +14,14 @@
 # -------------------------------------------------------------------------------------------------
 
 from decimal import Decimal
-import random
+import hashlib
 
+import numpy as np
 import pandas as pd
 
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport as_utc_index
 from nautilus_trader.core.datetime cimport secs_to_nanos
@@ -26,11 +30,55 @@ from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregation
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.bar cimport BarType
 from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 
 
+cdef int64_t _OPEN_OFFSET_NS = 300_000_000   # Open tick 300ms before the bar close
+cdef int64_t _HIGH_OFFSET_NS = 200_000_000   # High tick 200ms before the bar close
+cdef int64_t _LOW_OFFSET_NS = 100_000_000    # Low tick 100ms before the bar close
+
+cdef int _BARS_CACHE_MAX_SIZE = 32
+cdef dict _BARS_CACHE = {}  # type: dict[tuple[BarType, str], list[Bar]]
+
+
+def _as_raw(values, int precision):
+    # Scale the given values to raw int64 integers at the given precision.
+    # Rounds as the built-in `format` (and `Price`/`Quantity` from a float),
+    # falling back to formatted strings for values too near a half to tell.
+    values = np.asarray(values, dtype=np.float64)
+    scaled = values * 10.0 ** precision
+    fraction = np.abs(scaled - np.floor(scaled))
+    ambiguous = np.abs(scaled) >= 2.0 ** 52
+    ambiguous |= np.abs(fraction - 0.5) <= np.abs(scaled) * 1e-15 + 1e-12
+    raw = np.rint(scaled).astype(np.int64)
+    for index in np.flatnonzero(ambiguous):
+        raw[index] = int(Decimal(f"{values[index]:.{precision}f}").scaleb(precision))
+    return raw
+
+
+def _round_to_precision(values, int precision):
+    # Round the given values to the given decimal precision
+    return _as_raw(values, precision) / 10.0 ** precision
+
+
+def _as_unix_nanos(index):
+    # Convert the given UTC datetime index to UNIX timestamps (nanoseconds)
+    return np.asarray(index.values.astype("datetime64[ns]"), dtype=np.int64)
+
+
+def _interleave(opens, highs, lows, closes, dtype=np.float64):
+    # Interleave the given columns as [open, high, low, close] per bar
+    values = np.empty(len(opens) * 4, dtype=dtype)
+    values[0::4] = opens
+    values[1::4] = highs
+    values[2::4] = lows
+    values[3::4] = closes
+    return values
+
+
 cdef class QuoteTickDataWrangler:
     """
     Provides a means of building lists of ticks from the given Pandas DataFrames
@@ -96,6 +144,9 @@ cdef class QuoteTickDataWrangler:
         """
         Pre-process the tick data in preparation for building ticks.
 
+        Prices and sizes are kept numeric, rounded to the instruments
+        precisions.
+
         Parameters
         ----------
         instrument_indexer : int
@@ -110,25 +161,27 @@ cdef class QuoteTickDataWrangler:
         if random_seed is not None:
             Condition.type(random_seed, int, "random_seed")
 
+        cdef int price_prec = self.instrument.price_precision
+        cdef int size_prec = self.instrument.size_precision
+
         if self._data_quotes is not None and not self._data_quotes.empty:
             # Build ticks from data
-            self.processed_data = self._data_quotes
-
-            if "bid_size" not in self.processed_data.columns:
-                self.processed_data["bid_size"] = default_volume
-
-            if "ask_size" not in self.processed_data.columns:
-                self.processed_data["ask_size"] = default_volume
-
-            # Pre-process prices into formatted strings
-            price_cols = ["bid", "ask"]
-            self._data_quotes[price_cols] = self._data_quotes[price_cols].applymap(lambda x: f'{x:.{self.instrument.price_precision}f}')
-
-            # Pre-process sizes into formatted strings
-            size_cols = ["bid_size", "ask_size"]
-            self._data_quotes[size_cols] = self._data_quotes[size_cols].applymap(lambda x: f'{x:.{self.instrument.size_precision}f}')
-
-            self.processed_data["instrument_id"] = instrument_indexer
+            processed = self._data_quotes
+            processed["bid"] = _round_to_precision(self._data_quotes["bid"], price_prec)
+            processed["ask"] = _round_to_precision(self._data_quotes["ask"], price_prec)
+
+            if "bid_size" in self._data_quotes.columns:
+                processed["bid_size"] = _round_to_precision(self._data_quotes["bid_size"], size_prec)
+            else:
+                processed["bid_size"] = _round_to_precision([default_volume], size_prec)[0]
+
+            if "ask_size" in self._data_quotes.columns:
+                processed["ask_size"] = _round_to_precision(self._data_quotes["ask_size"], size_prec)
+            else:
+                processed["ask_size"] = _round_to_precision([default_volume], size_prec)[0]
+
+            processed["instrument_id"] = instrument_indexer
+            self.processed_data = processed
             self.resolution = BarAggregation.TICK
             return
 
@@ -163,80 +216,66 @@ cdef class QuoteTickDataWrangler:
         bars_bid = as_utc_index(bars_bid)
         bars_ask = as_utc_index(bars_ask)
 
-        if "volume" not in bars_bid:
-            bars_bid["volume"] = default_volume * 4
-
-        if "volume" not in bars_ask:
-            bars_ask["volume"] = default_volume * 4
-
-        cdef dict data_open = {
-            "bid": bars_bid["open"],
-            "ask": bars_ask["open"],
-            "bid_size": bars_bid["volume"] / 4,
-            "ask_size": bars_ask["volume"] / 4,
-        }
-
-        cdef dict data_high = {
-            "bid": bars_bid["high"],
-            "ask": bars_ask["high"],
-            "bid_size": bars_bid["volume"] / 4,
-            "ask_size": bars_ask["volume"] / 4,
-        }
-
-        cdef dict data_low = {
-            "bid": bars_bid["low"],
-            "ask": bars_ask["low"],
-            "bid_size": bars_bid["volume"] / 4,
-            "ask_size": bars_ask["volume"] / 4,
-        }
-
-        cdef dict data_close = {
-            "bid": bars_bid["close"],
-            "ask": bars_ask["close"],
-            "bid_size": bars_bid["volume"] / 4,
-            "ask_size": bars_ask["volume"] / 4,
-        }
-
-        df_ticks_o = pd.DataFrame(data=data_open)
-        df_ticks_h = pd.DataFrame(data=data_high)
-        df_ticks_l = pd.DataFrame(data=data_low)
-        df_ticks_c = pd.DataFrame(data=data_close)
-
-        # Pre-process prices into formatted strings
-        price_cols = ["bid", "ask"]
-        df_ticks_o[price_cols] = df_ticks_o[price_cols].applymap(lambda x: f'{x:.{self.instrument.price_precision}f}')
-        df_ticks_h[price_cols] = df_ticks_h[price_cols].applymap(lambda x: f'{x:.{self.instrument.price_precision}f}')
-        df_ticks_l[price_cols] = df_ticks_l[price_cols].applymap(lambda x: f'{x:.{self.instrument.price_precision}f}')
-        df_ticks_c[price_cols] = df_ticks_c[price_cols].applymap(lambda x: f'{x:.{self.instrument.price_precision}f}')
-
-        # Pre-process sizes into formatted strings
-        size_cols = ["bid_size", "ask_size"]
-        df_ticks_o[size_cols] = df_ticks_o[size_cols].applymap(lambda x: f'{x:.{self.instrument.size_precision}f}')
-        df_ticks_h[size_cols] = df_ticks_h[size_cols].applymap(lambda x: f'{x:.{self.instrument.size_precision}f}')
-        df_ticks_l[size_cols] = df_ticks_l[size_cols].applymap(lambda x: f'{x:.{self.instrument.size_precision}f}')
-        df_ticks_c[size_cols] = df_ticks_c[size_cols].applymap(lambda x: f'{x:.{self.instrument.size_precision}f}')
-
-        df_ticks_o.index = df_ticks_o.index.shift(periods=-300, freq="ms")
-        df_ticks_h.index = df_ticks_h.index.shift(periods=-200, freq="ms")
-        df_ticks_l.index = df_ticks_l.index.shift(periods=-100, freq="ms")
-
-        # Merge tick data
-        df_ticks_final = pd.concat([df_ticks_o, df_ticks_h, df_ticks_l, df_ticks_c])
-        df_ticks_final.sort_index(axis=0, kind="mergesort", inplace=True)
+        # Interleave bar prices into ticks as [open, high, low, close]
+        bids = _interleave(
+            _round_to_precision(bars_bid["open"], price_prec),
+            _round_to_precision(bars_bid["high"], price_prec),
+            _round_to_precision(bars_bid["low"], price_prec),
+            _round_to_precision(bars_bid["close"], price_prec),
+        )
+        asks = _interleave(
+            _round_to_precision(bars_ask["open"], price_prec),
+            _round_to_precision(bars_ask["high"], price_prec),
+            _round_to_precision(bars_ask["low"], price_prec),
+            _round_to_precision(bars_ask["close"], price_prec),
+        )
 
-        cdef int i
-        # Randomly shift high low prices
+        # Each tick takes a quarter of the bars volume
+        if "volume" in bars_bid:
+            bid_sizes = np.asarray(bars_bid["volume"], dtype=np.float64) / 4
+        else:
+            bid_sizes = np.full(len(bars_bid), float(default_volume))
+        if "volume" in bars_ask:
+            ask_sizes = np.asarray(bars_ask["volume"], dtype=np.float64) / 4
+        else:
+            ask_sizes = np.full(len(bars_ask), float(default_volume))
+
+        # Offset the open, high and low ticks before the bar close
+        timestamps = _as_unix_nanos(bars_bid.index)
+        timestamps = _interleave(
+            timestamps - _OPEN_OFFSET_NS,
+            timestamps - _HIGH_OFFSET_NS,
+            timestamps - _LOW_OFFSET_NS,
+            timestamps,
+            dtype=np.int64,
+        )
+
+        # Randomly swap the order of the high and low ticks per bar
         if random_seed is not None:
-            random.seed(random_seed)
-            for i in range(0, len(df_ticks_o), 4):
-                if random.getrandbits(1):
-                    high = df_ticks_h.iloc[i]
-                    low = df_ticks_l.iloc[i]
-                    df_ticks_final.iloc[i + 1] = low
-                    df_ticks_final.iloc[i + 2] = high
+            swap = np.random.RandomState(random_seed).randint(0, 2, len(bars_bid)).astype(bool)
+            for values in (bids, asks):
+                highs = values[1::4]  # View
+                lows = values[2::4]   # View
+                swapped_highs = highs[swap]
+                highs[swap] = lows[swap]
+                lows[swap] = swapped_highs
+
+        processed = pd.DataFrame(
+            data={
+                "bid": bids,
+                "ask": asks,
+                "bid_size": _round_to_precision(np.repeat(bid_sizes, 4), size_prec),
+                "ask_size": _round_to_precision(np.repeat(ask_sizes, 4), size_prec),
+                "instrument_id": instrument_indexer,
+            },
+            index=pd.to_datetime(timestamps, utc=True),
+        )
+
+        # Ensure ticks are in time order (stable for equal timestamps)
+        if not processed.index.is_monotonic_increasing:
+            processed.sort_index(axis=0, kind="mergesort", inplace=True)
 
-        self.processed_data = df_ticks_final
-        self.processed_data["instrument_id"] = instrument_indexer
+        self.processed_data = processed
 
     def build_ticks(self):
         """
@@ -247,22 +286,29 @@ cdef class QuoteTickDataWrangler:
         list[QuoteTick]
 
         """
-        return list(map(self._build_tick_from_values,
-                        self.processed_data.values,
-                        [dt.timestamp() for dt in self.processed_data.index]))
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
+        cdef int64_t[:] bids = _as_raw(self.processed_data["bid"], price_prec)
+        cdef int64_t[:] asks = _as_raw(self.processed_data["ask"], price_prec)
+        cdef int64_t[:] bid_sizes = _as_raw(self.processed_data["bid_size"], size_prec)
+        cdef int64_t[:] ask_sizes = _as_raw(self.processed_data["ask_size"], size_prec)
+        cdef int64_t[:] timestamps = _as_unix_nanos(self.processed_data.index)
+
+        cdef InstrumentId instrument_id = self.instrument.id
+        cdef list ticks = []
+        cdef int i
+        for i in range(len(timestamps)):
+            ticks.append(QuoteTick(
+                instrument_id=instrument_id,
+                bid=Price.from_raw_c(bids[i], price_prec),
+                ask=Price.from_raw_c(asks[i], price_prec),
+                bid_size=Quantity.from_raw_c(bid_sizes[i], size_prec),
+                ask_size=Quantity.from_raw_c(ask_sizes[i], size_prec),
+                ts_event_ns=timestamps[i],  # TODO(cs): Hardcoded identical for now
+                ts_recv_ns=timestamps[i],
+            ))
 
-    cpdef QuoteTick _build_tick_from_values(self, str[:] values, double timestamp):
-        # Build a quote tick from the given values. The function expects the values to
-        # be an ndarray with 4 elements [bid, ask, bid_size, ask_size] of type double.
-        return QuoteTick(
-            instrument_id=self.instrument.id,
-            bid=Price(values[0], self.instrument.price_precision),
-            ask=Price(values[1], self.instrument.price_precision),
-            bid_size=Quantity(values[2], self.instrument.size_precision),
-            ask_size=Quantity(values[3], self.instrument.size_precision),
-            ts_event_ns=secs_to_nanos(timestamp),  # TODO(cs): Hardcoded identical for now
-            ts_recv_ns=secs_to_nanos(timestamp),
-        )
+        return ticks
 
 
 cdef class TradeTickDataWrangler:
@@ -360,6 +406,7 @@ cdef class BarDataWrangler:
         int price_precision,
         int size_precision,
         data: pd.DataFrame=None,
+        bint cache_bars=False,
     ):
         """
         Initialize a new instance of the ``BarDataWrangler`` class.
@@ -374,6 +421,9 @@ cdef class BarDataWrangler:
             The decimal precision for bar volumes (>= 0).
         data : pd.DataFrame
             The the bars market data.
+        cache_bars : bool
+            If built bars should be cached by bar type and data fingerprint, so
+            wranglers for identical data share the bars built by `build_bars_all`.
 
         Raises
         ------
@@ -398,18 +448,47 @@ cdef class BarDataWrangler:
         if "volume" not in self._data:
             self._data["volume"] = 1_000_000
 
+        # Scale the OHLCV columns to contiguous raw integers once up front
+        self._opens = _as_raw(self._data["open"], price_precision)
+        self._highs = _as_raw(self._data["high"], price_precision)
+        self._lows = _as_raw(self._data["low"], price_precision)
+        self._closes = _as_raw(self._data["close"], price_precision)
+        self._volumes = _as_raw(self._data["volume"], size_precision)
+        self._timestamps = _as_unix_nanos(self._data.index)
+        self._cache_bars = cache_bars
+        self._cache_key = None
+
+    @staticmethod
+    def clear_cache():
+        """
+        Clear all cached bars built by bar data wranglers.
+        """
+        _BARS_CACHE.clear()
+
     def build_bars_all(self):
         """
         Build bars from all data.
 
+        If `cache_bars` then building bars again from identical data returns
+        the cached bars.
+
         Returns
         -------
         list[Bar]
 
         """
-        return list(map(self._build_bar,
-                        self._data.values,
-                        [dt.timestamp() for dt in self._data.index]))
+        if not self._cache_bars:
+            return self._build_bars(0, len(self._timestamps))
+
+        cdef tuple key = self._get_cache_key()
+        cdef list bars = _BARS_CACHE.get(key)
+        if bars is None:
+            bars = self._build_bars(0, len(self._timestamps))
+            if len(_BARS_CACHE) >= _BARS_CACHE_MAX_SIZE:
+                _BARS_CACHE.pop(next(iter(_BARS_CACHE)))  # Evict oldest
+            _BARS_CACHE[key] = bars
+
+        return bars.copy()
 
     def build_bars_from(self, int index=0):
         """
@@ -422,9 +501,7 @@ cdef class BarDataWrangler:
         """
         Condition.not_negative_int(index, "index")
 
-        return list(map(self._build_bar,
-                        self._data.iloc[index:].values,
-                        [dt.timestamp() for dt in self._data.iloc[index:].index]))
+        return self._build_bars_slice(slice(index, None))
 
     def build_bars_range(self, int start=0, int end=-1):
         """
@@ -437,20 +514,72 @@ cdef class BarDataWrangler:
         """
         Condition.not_negative_int(start, "start")
 
-        return list(map(self._build_bar,
-                        self._data.iloc[start:end].values,
-                        [dt.timestamp() for dt in self._data.iloc[start:end].index]))
+        return self._build_bars_slice(slice(start, end))
+
+    def iter_bars(self, int start=0, end=None):
+        """
+        Return an iterator which lazily builds bars within the given range.
+
+        Parameters
+        ----------
+        start : int
+            The start index (>= 0).
+        end : int, optional
+            The end index (exclusive). If None then iterates to the end.
+
+        Returns
+        -------
+        Iterator[Bar]
+
+        """
+        Condition.not_negative_int(start, "start")
+
+        start, stop, _ = slice(start, end).indices(len(self._timestamps))
+        return (self._build_bar(i) for i in range(start, stop))
 
-    cpdef Bar _build_bar(self, double[:] values, double timestamp):
-        # Build a bar from the given index and values. The function expects the
-        # values to be an ndarray with 5 elements [open, high, low, close, volume].
+    cdef list _build_bars_slice(self, slice bars_slice):
+        cdef list bars
+        if self._cache_bars:
+            bars = _BARS_CACHE.get(self._get_cache_key())
+            if bars is not None:
+                return bars[bars_slice]
+
+        start, stop, _ = bars_slice.indices(len(self._timestamps))
+        return self._build_bars(start, stop)
+
+    cdef list _build_bars(self, int start, int stop):
+        cdef list bars = []
+        cdef int i
+        for i in range(start, stop):
+            bars.append(self._build_bar(i))
+
+        return bars
+
+    cdef Bar _build_bar(self, int index):
         return Bar(
             bar_type=self._bar_type,
-            open_price=Price(values[0], self._price_precision),
-            high_price=Price(values[1], self._price_precision),
-            low_price=Price(values[2], self._price_precision),
-            close_price=Price(values[3], self._price_precision),
-            volume=Quantity(values[4], self._size_precision),
-            ts_event_ns=secs_to_nanos(timestamp),  # TODO(cs): Hardcoded identical for now
-            ts_recv_ns=secs_to_nanos(timestamp),
+            open_price=Price.from_raw_c(self._opens[index], self._price_precision),
+            high_price=Price.from_raw_c(self._highs[index], self._price_precision),
+            low_price=Price.from_raw_c(self._lows[index], self._price_precision),
+            close_price=Price.from_raw_c(self._closes[index], self._price_precision),
+            volume=Quantity.from_raw_c(self._volumes[index], self._size_precision),
+            ts_event_ns=self._timestamps[index],  # TODO(cs): Hardcoded identical for now
+            ts_recv_ns=self._timestamps[index],
         )
+
+    cdef tuple _get_cache_key(self):
+        if self._cache_key is None:
+            # Fingerprint the raw columns (which also reflect the precisions)
+            fingerprint = hashlib.blake2b(digest_size=16)
+            for column in (
+                self._timestamps,
+                self._opens,
+                self._highs,
+                self._lows,
+                self._closes,
+                self._volumes,
+            ):
+                fingerprint.update(np.asarray(column))
+            self._cache_key = (self._bar_type, fingerprint.hexdigest())
+
+        return self._cache_key
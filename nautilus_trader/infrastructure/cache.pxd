@@ -14,9 +14,14 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.cache.database cimport CacheDatabase
+from nautilus_trader.model.currency cimport Currency
+from nautilus_trader.model.instruments.base cimport Instrument
+from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.position cimport Position
 from nautilus_trader.serialization.base cimport CommandSerializer
 from nautilus_trader.serialization.base cimport EventSerializer
 from nautilus_trader.serialization.base cimport InstrumentSerializer
+from nautilus_trader.trading.account cimport Account
 
 
 cdef class RedisCacheDatabase(CacheDatabase):
@@ -27,8 +32,33 @@ cdef class RedisCacheDatabase(CacheDatabase):
     cdef str _key_orders
     cdef str _key_positions
     cdef str _key_strategies
+    cdef str _key_account_snapshots
+    cdef str _key_order_snapshots
+    cdef str _key_position_snapshots
 
     cdef InstrumentSerializer _instrument_serializer
     cdef CommandSerializer _command_serializer
     cdef EventSerializer _event_serializer
     cdef object _redis
+    cdef int _batch_size
+    cdef int _workers
+    cdef int _snapshot_interval
+
+    cdef list _bulk_read(self, str prefix, str command, serializer=*)
+    cdef dict _load_snapshots(self, str prefix)
+    cdef list _load_tail(self, str key, dict snapshot)
+    cdef list _snapshot_events(self, dict snapshot)
+    cdef Account _account_from_snapshot(self, dict snapshot, list tail)
+    cdef Order _order_from_snapshot(self, dict snapshot, list tail)
+    cdef Position _position_from_snapshot(self, dict snapshot, list tail, Instrument instrument)
+    cdef void _write_snapshot(self, str key, list events, dict state, int event_count) except *
+    cdef int _compact(self, str key_events, str key_snapshots) except *
+    cdef Currency _currency_from_hash(self, str code, dict c_hash)
+    cdef Account _account_from_events(self, list events)
+    cdef Order _order_from_events(self, list events)
+    cdef Position _position_from_events(self, list events, Instrument instrument)
+
+    cpdef void snapshot_account(self, Account account) except *
+    cpdef void snapshot_order(self, Order order) except *
+    cpdef void snapshot_position(self, Position position) except *
+    cpdef int compact(self) except *
@@ -13,23 +13,38 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import msgpack
 import redis
 
 from nautilus_trader.cache.database cimport CacheDatabase
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.model.c_enums.currency_type cimport CurrencyTypeParser
+from nautilus_trader.model.c_enums.liquidity_side cimport LiquiditySide
+from nautilus_trader.model.c_enums.order_state cimport OrderState
+from nautilus_trader.model.c_enums.position_side cimport PositionSide
 from nautilus_trader.model.currency cimport Currency
 from nautilus_trader.model.events.order cimport OrderFilled
 from nautilus_trader.model.events.order cimport OrderInitialized
 from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport ClientOrderId
+from nautilus_trader.model.identifiers cimport ExecutionId
 from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.identifiers cimport StrategyId
 from nautilus_trader.model.identifiers cimport TraderId
+from nautilus_trader.model.identifiers cimport VenueOrderId
 from nautilus_trader.model.instruments.base cimport Instrument
+from nautilus_trader.model.objects cimport AccountBalance
+from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.orders.base cimport PassiveOrder
+from nautilus_trader.model.orders.stop_limit cimport StopLimitOrder
 from nautilus_trader.model.orders.unpacker cimport OrderUnpacker
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.serialization.base cimport CommandSerializer
@@ -47,6 +62,198 @@ cdef str _TRADER = 'Trader'
 cdef str _ORDERS = 'Orders'
 cdef str _POSITIONS = 'Positions'
 cdef str _STRATEGIES = 'Strategies'
+cdef str _SNAPSHOTS = 'Snapshots'
+
+cdef bytes _STATE = b'state'
+cdef bytes _EVENTS = b'events'
+cdef bytes _EVENT_COUNT = b'event_count'
+cdef bytes _TRIMMED = b'trimmed'
+
+cdef int _DEFAULT_BATCH_SIZE = 1000
+cdef int _DEFAULT_WORKERS = 4
+cdef int _DEFAULT_SNAPSHOT_INTERVAL = 100
+
+
+def _read_batch(client, str command, list keys, serializer=None):
+    # Read the values for the given keys in a single pipelined round trip,
+    # deserializing each value (or each element of a list value) if a
+    # serializer is given.
+    pipe = client.pipeline(transaction=False)
+    cdef bytes key
+    for key in keys:
+        if command == "lrange":
+            pipe.lrange(key, 0, -1)
+        else:
+            getattr(pipe, command)(key)
+
+    cdef list values = pipe.execute()
+    if serializer is not None:
+        deserialize = serializer.deserialize
+        if command == "lrange":
+            values = [[deserialize(item) for item in value] for value in values]
+        else:
+            values = [deserialize(value) if value else None for value in values]
+
+    return list(zip(keys, values))
+
+
+cdef inline str _key_id(bytes key_bytes):
+    return key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
+
+
+cdef inline int _tail_index(dict snapshot):
+    # The index in the (possibly trimmed) event list of the first event
+    # after the snapshot.
+    return int(snapshot[_EVENT_COUNT]) - int(snapshot.get(_TRIMMED, 0))
+
+
+cdef inline str _str_or_none(value):
+    return None if value is None else str(value)
+
+
+cdef inline object _decimal_or_none(str value):
+    return None if value is None else Decimal(value)
+
+
+cdef dict _account_state(Account account):
+    # The account state not held by its initial event
+    return {
+        "balances": [balance.to_dict() for balance in account._balances.values()],
+        "commissions": [commission.to_str() for commission in account._commissions.values()],
+        "initial_margins": [margin.to_str() for margin in account._initial_margins.values()],
+        "maint_margins": [margin.to_str() for margin in account._maint_margins.values()],
+    }
+
+
+cdef inline dict _money_by_currency(list values):
+    cdef Money money
+    cdef dict by_currency = {}
+    for value in values:
+        money = Money.from_str_c(value)
+        by_currency[money.currency] = money
+
+    return by_currency
+
+
+cdef void _restore_account_state(Account account, dict state) except *:
+    cdef AccountBalance balance
+    account._balances = {}
+    for values in state["balances"]:
+        balance = AccountBalance.from_dict_c(values)
+        account._balances[balance.currency] = balance
+
+    account._commissions = _money_by_currency(state["commissions"])
+    account._initial_margins = _money_by_currency(state["initial_margins"])
+    account._maint_margins = _money_by_currency(state["maint_margins"])
+
+
+cdef dict _order_state(Order order):
+    # The order state not held by its initialization event
+    cdef dict state = {
+        "state": order._fsm.state,
+        "rollback_state": order._rollback_state,
+        "strategy_id": order.strategy_id.value,
+        "venue_order_id": order.venue_order_id.value,
+        "position_id": order.position_id.value,
+        "account_id": None if order.account_id is None else order.account_id.value,
+        "execution_id": None if order.execution_id is None else order.execution_id.value,
+        "execution_ids": [execution_id.value for execution_id in order._execution_ids],
+        "quantity": str(order.quantity),
+        "filled_qty": str(order.filled_qty),
+        "ts_filled_ns": order.ts_filled_ns,
+        "avg_px": _str_or_none(order.avg_px),
+        "slippage": str(order.slippage),
+    }
+
+    cdef PassiveOrder passive
+    if isinstance(order, PassiveOrder):
+        passive = <PassiveOrder>order
+        state["price"] = str(passive.price)
+        state["liquidity_side"] = passive.liquidity_side
+        state["venue_order_ids"] = [venue_order_id.value for venue_order_id in passive._venue_order_ids]
+
+    cdef StopLimitOrder stop_limit
+    if isinstance(order, StopLimitOrder):
+        stop_limit = <StopLimitOrder>order
+        state["trigger"] = str(stop_limit.trigger)
+        state["is_triggered"] = stop_limit.is_triggered
+
+    return state
+
+
+cdef void _restore_order_state(Order order, dict state) except *:
+    order._fsm.state = state["state"]
+    order._rollback_state = <OrderState>state["rollback_state"]
+    order.strategy_id = StrategyId(state["strategy_id"])
+    order.venue_order_id = VenueOrderId(state["venue_order_id"])
+    order.position_id = PositionId(state["position_id"])
+    order.account_id = None if state["account_id"] is None else AccountId.from_str(state["account_id"])
+    order.execution_id = None if state["execution_id"] is None else ExecutionId(state["execution_id"])
+    order._execution_ids = [ExecutionId(value) for value in state["execution_ids"]]
+    order.quantity = Quantity.from_str(state["quantity"])
+    order.filled_qty = Quantity.from_str(state["filled_qty"])
+    order.ts_filled_ns = state["ts_filled_ns"]
+    order.avg_px = _decimal_or_none(state["avg_px"])
+    order.slippage = Decimal(state["slippage"])
+
+    cdef PassiveOrder passive
+    if isinstance(order, PassiveOrder):
+        passive = <PassiveOrder>order
+        passive.price = Price.from_str(state["price"])
+        passive.liquidity_side = <LiquiditySide>state["liquidity_side"]
+        passive._venue_order_ids = [VenueOrderId(value) for value in state["venue_order_ids"]]
+
+    cdef StopLimitOrder stop_limit
+    if isinstance(order, StopLimitOrder):
+        stop_limit = <StopLimitOrder>order
+        stop_limit.trigger = Price.from_str(state["trigger"])
+        stop_limit.is_triggered = state["is_triggered"]
+
+
+cdef dict _position_state(Position position):
+    # The position state not held by its opening fill
+    return {
+        "side": position.side,
+        "net_qty": str(position.net_qty),
+        "quantity": str(position.quantity),
+        "peak_qty": str(position.peak_qty),
+        "buy_qty": str(position._buy_qty),
+        "sell_qty": str(position._sell_qty),
+        "timestamp_ns": position.timestamp_ns,
+        "ts_closed_ns": position.ts_closed_ns,
+        "duration_ns": position.duration_ns,
+        "avg_px_open": str(position.avg_px_open),
+        "avg_px_close": _str_or_none(position.avg_px_close),
+        "realized_points": str(position.realized_points),
+        "realized_return": str(position.realized_return),
+        "realized_pnl": str(position.realized_pnl),
+        "commissions": [commission.to_str() for commission in position._commissions.values()],
+        "execution_ids": [execution_id.value for execution_id in position._execution_ids],
+        "client_order_ids": [client_order_id.value for client_order_id in position._client_order_ids],
+        "venue_order_ids": [venue_order_id.value for venue_order_id in position._venue_order_ids],
+    }
+
+
+cdef void _restore_position_state(Position position, dict state) except *:
+    position.side = <PositionSide>state["side"]
+    position.net_qty = Decimal(state["net_qty"])
+    position.quantity = Quantity.from_str(state["quantity"])
+    position.peak_qty = Quantity.from_str(state["peak_qty"])
+    position._buy_qty = Decimal(state["buy_qty"])
+    position._sell_qty = Decimal(state["sell_qty"])
+    position.timestamp_ns = state["timestamp_ns"]
+    position.ts_closed_ns = state["ts_closed_ns"]
+    position.duration_ns = state["duration_ns"]
+    position.avg_px_open = Decimal(state["avg_px_open"])
+    position.avg_px_close = _decimal_or_none(state["avg_px_close"])
+    position.realized_points = Decimal(state["realized_points"])
+    position.realized_return = Decimal(state["realized_return"])
+    position.realized_pnl = Money(Decimal(state["realized_pnl"]), position.cost_currency)
+
+    position._commissions = _money_by_currency(state["commissions"])
+    position._execution_ids = [ExecutionId(value) for value in state["execution_ids"]]
+    position._client_order_ids = {ClientOrderId(value) for value in state["client_order_ids"]}
+    position._venue_order_ids = {VenueOrderId(value) for value in state["venue_order_ids"]}
 
 
 cdef class RedisCacheDatabase(CacheDatabase):
@@ -60,6 +267,17 @@ cdef class RedisCacheDatabase(CacheDatabase):
     precision when persisted. If precision to this level is important, then you
     could additionally persist events in another medium/database which can
     properly handle int64 types.
+
+    Orders, positions and accounts are persisted as lists of events. To bound
+    the cost of rebuilding them on restart, a snapshot of the object state is
+    periodically written alongside the event list, which is then restored by
+    applying only the events after the snapshot. Calling `compact` trims the
+    events already covered by a snapshot.
+
+    A snapshot holds the first and last events it covers along with the
+    objects mutable state, and the number of events it covers. A restored
+    object therefore only holds these two events plus the events after the
+    snapshot.
     """
 
     def __init__(
@@ -86,6 +304,14 @@ cdef class RedisCacheDatabase(CacheDatabase):
             The command serializer for caching operations.
         event_serializer : EventSerializer
             The event serializer for caching operations.
+        config : dict[str, object]
+            The configuration for the database, containing the 'host' and 'port'
+            of the Redis instance. Optionally a 'batch_size' for the number of
+            keys read per pipelined round trip when bulk loading (default 1000),
+            'workers' for the number of threads reading and deserializing
+            batches in parallel (default 4), and 'snapshot_interval' for the
+            number of events between state snapshots of an order, position or
+            account (default 100, 0 disables periodic snapshots).
 
         Raises
         ------
@@ -93,12 +319,24 @@ cdef class RedisCacheDatabase(CacheDatabase):
             If the host is not a valid string.
         ValueError
             If the port is not in range [0, 65535].
+        ValueError
+            If the batch_size is not positive (> 0).
+        ValueError
+            If the workers is not positive (> 0).
+        ValueError
+            If the snapshot_interval is negative (< 0).
 
         """
         cdef str host = config["host"]
         cdef int port = int(config["port"])
+        cdef int batch_size = int(config.get("batch_size", _DEFAULT_BATCH_SIZE))
+        cdef int workers = int(config.get("workers", _DEFAULT_WORKERS))
+        cdef int snapshot_interval = int(config.get("snapshot_interval", _DEFAULT_SNAPSHOT_INTERVAL))
         Condition.valid_string(host, "host")
         Condition.in_range_int(port, 0, 65535, "port")
+        Condition.positive_int(batch_size, "batch_size")
+        Condition.positive_int(workers, "workers")
+        Condition.not_negative_int(snapshot_interval, "snapshot_interval")
         super().__init__(trader_id, logger)
 
         # Database keys
@@ -110,6 +348,11 @@ cdef class RedisCacheDatabase(CacheDatabase):
         self._key_positions   = f"{self._key_trader}:{_POSITIONS}:"   # noqa
         self._key_strategies  = f"{self._key_trader}:{_STRATEGIES}:"  # noqa
 
+        # Snapshot keys
+        self._key_account_snapshots  = f"{self._key_trader}:{_SNAPSHOTS}:{_ACCOUNTS}:"   # noqa
+        self._key_order_snapshots    = f"{self._key_trader}:{_SNAPSHOTS}:{_ORDERS}:"     # noqa
+        self._key_position_snapshots = f"{self._key_trader}:{_SNAPSHOTS}:{_POSITIONS}:"  # noqa
+
         # Serializers
         self._instrument_serializer = instrument_serializer
         self._command_serializer = command_serializer
@@ -117,6 +360,9 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
         # Redis client
         self._redis = redis.Redis(host=host, port=port, db=0)
+        self._batch_size = batch_size
+        self._workers = workers
+        self._snapshot_interval = snapshot_interval
 
 # -- COMMANDS --------------------------------------------------------------------------------------
 
@@ -140,19 +386,14 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         cdef dict currencies = {}
 
-        cdef list currency_keys = self._redis.keys(f"{self._key_currencies}*")
-        if not currency_keys:
-            return currencies
-
         cdef bytes key_bytes
-        cdef str currency_code
+        cdef dict c_hash
         cdef Currency currency
-        for key_bytes in currency_keys:
-            currency_code = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            currency = self.load_currency(currency_code)
-
-            if currency is not None:
-                currencies[currency.code] = currency
+        for key_bytes, c_hash in self._bulk_read(self._key_currencies, "hgetall"):
+            if not c_hash:
+                continue
+            currency = self._currency_from_hash(_key_id(key_bytes), c_hash)
+            currencies[currency.code] = currency
 
         return currencies
 
@@ -167,19 +408,13 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         cdef dict instruments = {}
 
-        cdef list instrument_keys = self._redis.keys(f"{self._key_instruments}*")
-        if not instrument_keys:
-            return instruments
-
         cdef bytes key_bytes
-        cdef str key_str
-        cdef InstrumentId instrument_id
         cdef Instrument instrument
-        for key_bytes in instrument_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            instrument_id = InstrumentId.from_str_c(key_str)
-            instrument = self.load_instrument(instrument_id)
-
+        for key_bytes, instrument in self._bulk_read(
+            self._key_instruments,
+            "get",
+            self._instrument_serializer,
+        ):
             if instrument is not None:
                 instruments[instrument.id] = instrument
 
@@ -195,22 +430,25 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
         """
         cdef dict accounts = {}
-
-        cdef list account_keys = self._redis.keys(f"{self._key_accounts}*")
-        if not account_keys:
-            return accounts
+        cdef dict snapshots = self._load_snapshots(self._key_account_snapshots)
 
         cdef bytes key_bytes
-        cdef str account_str
-        cdef AccountId account_id
+        cdef list events
+        cdef dict snapshot
         cdef Account account
-        for key_bytes in account_keys:
-            account_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            account_id = AccountId.from_str_c(account_str)
-            account = self.load_account(account_id)
-
-            if account is not None:
-                accounts[account.id] = account
+        for key_bytes, events in self._bulk_read(
+            self._key_accounts,
+            "lrange",
+            self._event_serializer,
+        ):
+            if not events:
+                continue
+            snapshot = snapshots.get(_key_id(key_bytes))
+            if snapshot is None:
+                account = self._account_from_events(events)
+            else:
+                account = self._account_from_snapshot(snapshot, events[_tail_index(snapshot):])
+            accounts[account.id] = account
 
         return accounts
 
@@ -224,22 +462,25 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
         """
         cdef dict orders = {}
-
-        cdef list order_keys = self._redis.keys(f"{self._key_orders}*")
-        if not order_keys:
-            return orders
+        cdef dict snapshots = self._load_snapshots(self._key_order_snapshots)
 
         cdef bytes key_bytes
-        cdef str key_str
-        cdef ClientOrderId client_order_id
+        cdef list events
+        cdef dict snapshot
         cdef Order order
-        for key_bytes in order_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            client_order_id = ClientOrderId(key_str)
-            order = self.load_order(client_order_id)
-
-            if order is not None:
-                orders[order.client_order_id] = order
+        for key_bytes, events in self._bulk_read(
+            self._key_orders,
+            "lrange",
+            self._event_serializer,
+        ):
+            if not events:
+                continue
+            snapshot = snapshots.get(_key_id(key_bytes))
+            if snapshot is None:
+                order = self._order_from_events(events)
+            else:
+                order = self._order_from_snapshot(snapshot, events[_tail_index(snapshot):])
+            orders[order.client_order_id] = order
 
         return orders
 
@@ -253,22 +494,40 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
         """
         cdef dict positions = {}
-
-        cdef list position_keys = self._redis.keys(f"{self._key_positions}*")
-        if not position_keys:
-            return positions
+        cdef dict instruments = {}  # Instruments are only loaded once per ID
+        cdef dict snapshots = self._load_snapshots(self._key_position_snapshots)
 
         cdef bytes key_bytes
-        cdef str key_str
-        cdef PositionId position_id
+        cdef list events
+        cdef dict snapshot
+        cdef OrderFilled initial_fill
+        cdef Instrument instrument
         cdef Position position
-        for key_bytes in position_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            position_id = PositionId(key_str)
-            position = self.load_position(position_id)
+        for key_bytes, events in self._bulk_read(
+            self._key_positions,
+            "lrange",
+            self._event_serializer,
+        ):
+            if not events:
+                continue
+            initial_fill = events[0]
+            instrument = instruments.get(initial_fill.instrument_id)
+            if instrument is None:
+                instrument = self.load_instrument(initial_fill.instrument_id)
+                if instrument is None:
+                    self._log.error(
+                        f"Cannot load position: "
+                        f"no instrument found for {initial_fill.instrument_id}",
+                    )
+                    continue
+                instruments[instrument.id] = instrument
 
-            if position is not None:
-                positions[position.id] = position
+            snapshot = snapshots.get(_key_id(key_bytes))
+            if snapshot is None:
+                position = self._position_from_events(events, instrument)
+            else:
+                position = self._position_from_snapshot(snapshot, events[_tail_index(snapshot):], instrument)
+            positions[position.id] = position
 
         return positions
 
@@ -289,15 +548,10 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(code, "code")
 
         cdef dict c_hash = self._redis.hgetall(name=self._key_currencies + code)
-        cdef dict c_map = {k.decode('utf-8'): v for k, v in c_hash.items()}
+        if not c_hash:
+            return None
 
-        return Currency(
-            code=code,
-            precision=int(c_map["precision"]),
-            iso4217=int(c_map["iso4217"]),
-            name=c_map["name"].decode(_UTF8),
-            currency_type=CurrencyTypeParser.from_str(c_map["currency_type"].decode("utf-8")),
-        )
+        return self._currency_from_hash(code, c_hash)
 
     cpdef Instrument load_instrument(self, InstrumentId instrument_id):
         """
@@ -339,22 +593,18 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(account_id, "account_id")
 
-        cdef list events = self._redis.lrange(
-            name=self._key_accounts + account_id.value,
-            start=0,
-            end=-1,
-        )
+        cdef str key = self._key_accounts + account_id.value
+        cdef dict snapshot = self._redis.hgetall(name=self._key_account_snapshots + account_id.value)
+        if snapshot:
+            return self._account_from_snapshot(snapshot, self._load_tail(key, snapshot))
+
+        cdef list events = self._redis.lrange(name=key, start=0, end=-1)
 
         # Check there is at least one event to pop
         if not events:
             return None
 
-        cdef bytes event
-        cdef Account account = Account(self._event_serializer.deserialize(events[0]))
-        for event in events[1:]:
-            account.apply(event=self._event_serializer.deserialize(event))
-
-        return account
+        return self._account_from_events([self._event_serializer.deserialize(e) for e in events])
 
     cpdef Order load_order(self, ClientOrderId client_order_id):
         """
@@ -372,24 +622,18 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
-        cdef list events = self._redis.lrange(
-            name=self._key_orders + client_order_id.value,
-            start=0,
-            end=-1,
-        )
+        cdef str key = self._key_orders + client_order_id.value
+        cdef dict snapshot = self._redis.hgetall(name=self._key_order_snapshots + client_order_id.value)
+        if snapshot:
+            return self._order_from_snapshot(snapshot, self._load_tail(key, snapshot))
+
+        cdef list events = self._redis.lrange(name=key, start=0, end=-1)
 
         # Check there is at least one event to pop
         if not events:
             return None
 
-        cdef OrderInitialized init = self._event_serializer.deserialize(events.pop(0))
-        cdef Order order = OrderUnpacker.from_init_c(init)
-
-        cdef bytes event_bytes
-        for event_bytes in events:
-            order.apply(self._event_serializer.deserialize(event_bytes))
-
-        return order
+        return self._order_from_events([self._event_serializer.deserialize(e) for e in events])
 
     cpdef Position load_position(self, PositionId position_id):
         """
@@ -407,17 +651,21 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(position_id, "position_id")
 
-        cdef list events = self._redis.lrange(
-            name=self._key_positions + position_id.value,
-            start=0,
-            end=-1,
-        )
+        cdef str key = self._key_positions + position_id.value
+        cdef dict snapshot = self._redis.hgetall(name=self._key_position_snapshots + position_id.value)
+        cdef list events
+        if snapshot:
+            events = self._snapshot_events(snapshot)
+        else:
+            events = self._redis.lrange(name=key, start=0, end=-1)
 
-        # Check there is at least one event to pop
-        if not events:
-            return None
+            # Check there is at least one event to pop
+            if not events:
+                return None
+
+            events = [self._event_serializer.deserialize(e) for e in events]
 
-        cdef OrderFilled initial_fill = self._event_serializer.deserialize(events.pop(0))
+        cdef OrderFilled initial_fill = events[0]
         cdef Instrument instrument = self.load_instrument(initial_fill.instrument_id)
         if instrument is None:
             self._log.error(
@@ -426,11 +674,141 @@ cdef class RedisCacheDatabase(CacheDatabase):
             )
             return
 
-        cdef Position position = Position(instrument, initial_fill)
+        if snapshot:
+            return self._position_from_snapshot(snapshot, self._load_tail(key, snapshot), instrument)
+
+        return self._position_from_events(events, instrument)
+
+    cdef list _bulk_read(self, str prefix, str command, serializer=None):
+        # Incrementally SCAN for the keys with the given prefix (rather than a
+        # blocking KEYS), then read them in pipelined batches which are fetched
+        # and deserialized in parallel by the worker pool.
+        cdef list keys = list(self._redis.scan_iter(match=f"{prefix}*", count=self._batch_size))
+        if not keys:
+            return []
+
+        cdef list batches = [
+            keys[i:i + self._batch_size] for i in range(0, len(keys), self._batch_size)
+        ]
+
+        cdef list results = []
+        cdef list futures
+        if self._workers == 1 or len(batches) == 1:
+            for batch in batches:
+                results.extend(_read_batch(self._redis, command, batch, serializer))
+        else:
+            with ThreadPoolExecutor(max_workers=min(self._workers, len(batches))) as pool:
+                futures = [
+                    pool.submit(_read_batch, self._redis, command, batch, serializer)
+                    for batch in batches
+                ]
+                for future in futures:
+                    results.extend(future.result())
+
+        self._log.debug(f"Bulk loaded {len(keys)} keys for {prefix}*.")
+        return results
+
+    cdef dict _load_snapshots(self, str prefix):
+        cdef dict snapshots = {}
+
+        cdef bytes key_bytes
+        cdef dict snapshot
+        for key_bytes, snapshot in self._bulk_read(prefix, "hgetall"):
+            if snapshot:
+                snapshots[_key_id(key_bytes)] = snapshot
+
+        return snapshots
+
+    cdef list _load_tail(self, str key, dict snapshot):
+        cdef list events = self._redis.lrange(name=key, start=_tail_index(snapshot), end=-1)
+        return [self._event_serializer.deserialize(e) for e in events]
+
+    cdef list _snapshot_events(self, dict snapshot):
+        return [self._event_serializer.deserialize(e) for e in msgpack.unpackb(snapshot[_EVENTS])]
+
+    cdef Account _account_from_snapshot(self, dict snapshot, list tail):
+        cdef list events = self._snapshot_events(snapshot)
+        cdef Account account = Account(events[0])
+        account._events = events
+        _restore_account_state(account, msgpack.unpackb(snapshot[_STATE]))
+
+        for event in tail:
+            account.apply(event)
+
+        return account
+
+    cdef Order _order_from_snapshot(self, dict snapshot, list tail):
+        cdef list events = self._snapshot_events(snapshot)
+        cdef Order order = OrderUnpacker.from_init_c(events[0])
+        order._events = events
+        _restore_order_state(order, msgpack.unpackb(snapshot[_STATE]))
+
+        for event in tail:
+            order.apply(event)
+
+        return order
+
+    cdef Position _position_from_snapshot(self, dict snapshot, list tail, Instrument instrument):
+        cdef list events = self._snapshot_events(snapshot)
+        cdef Position position = Position(instrument, events[0])
+        position._events = events
+        _restore_position_state(position, msgpack.unpackb(snapshot[_STATE]))
+
+        for event in tail:
+            position.apply(event)
+
+        return position
+
+    cdef void _write_snapshot(self, str key, list events, dict state, int event_count) except *:
+        # Only the first and last covered events are written, the rest of the
+        # objects history is summarized by its state.
+        cdef list covered = [events[0]] if len(events) == 1 else [events[0], events[-1]]
+        self._redis.hset(
+            name=key,
+            mapping={
+                _EVENTS: msgpack.packb([self._event_serializer.serialize(e) for e in covered]),
+                _STATE: msgpack.packb(state),
+                _EVENT_COUNT: event_count,
+                _TRIMMED: 0,
+            },
+        )
+
+    cdef Currency _currency_from_hash(self, str code, dict c_hash):
+        cdef dict c_map = {k.decode(_UTF8): v for k, v in c_hash.items()}
+
+        return Currency(
+            code=code,
+            precision=int(c_map["precision"]),
+            iso4217=int(c_map["iso4217"]),
+            name=c_map["name"].decode(_UTF8),
+            currency_type=CurrencyTypeParser.from_str(c_map["currency_type"].decode(_UTF8)),
+        )
+
+    cdef Account _account_from_events(self, list events):
+        cdef Account account = Account(events[0])
+
+        cdef int i
+        for i in range(1, len(events)):
+            account.apply(event=events[i])
+
+        return account
+
+    cdef Order _order_from_events(self, list events):
+        cdef OrderInitialized init = events[0]
+        cdef Order order = OrderUnpacker.from_init_c(init)
+
+        cdef int i
+        for i in range(1, len(events)):
+            order.apply(events[i])
+
+        return order
+
+    cdef Position _position_from_events(self, list events, Instrument instrument):
+        cdef Position position = Position(instrument, events[0])
 
-        cdef bytes event_bytes
-        for event_bytes in events:
-            position.apply(self._event_serializer.deserialize(event_bytes))
+        cdef int i
+        for i in range(1, len(events)):
+            position.apply(events[i])
 
         return position
 
@@ -471,6 +849,114 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
         self._log.info(f"Deleted {repr(strategy_id)}.")
 
+    cpdef void snapshot_account(self, Account account) except *:
+        """
+        Write a snapshot of the given accounts state to the database.
+
+        Parameters
+        ----------
+        account : Account
+            The account to snapshot.
+
+        """
+        Condition.not_none(account, "account")
+
+        self._write_snapshot(
+            self._key_account_snapshots + account.id.value,
+            account._events,
+            _account_state(account),
+            self._redis.llen(self._key_accounts + account.id.value),
+        )
+
+        self._log.debug(f"Snapshot {account}.")
+
+    cpdef void snapshot_order(self, Order order) except *:
+        """
+        Write a snapshot of the given orders state to the database.
+
+        Parameters
+        ----------
+        order : Order
+            The order to snapshot.
+
+        """
+        Condition.not_none(order, "order")
+
+        self._write_snapshot(
+            self._key_order_snapshots + order.client_order_id.value,
+            order._events,
+            _order_state(order),
+            self._redis.llen(self._key_orders + order.client_order_id.value),
+        )
+
+        self._log.debug(f"Snapshot {order}.")
+
+    cpdef void snapshot_position(self, Position position) except *:
+        """
+        Write a snapshot of the given positions state to the database.
+
+        Parameters
+        ----------
+        position : Position
+            The position to snapshot.
+
+        """
+        Condition.not_none(position, "position")
+
+        self._write_snapshot(
+            self._key_position_snapshots + position.id.value,
+            position._events,
+            _position_state(position),
+            self._redis.llen(self._key_positions + position.id.value),
+        )
+
+        self._log.debug(f"Snapshot {position}.")
+
+    cpdef int compact(self) except *:
+        """
+        Trim the persisted events which are already covered by a snapshot.
+
+        The last event covered by each snapshot is retained, so every
+        snapshotted object still has a non-empty event list.
+
+        Returns
+        -------
+        int
+            The number of events trimmed.
+
+        """
+        self._log.debug("Compacting database...")
+
+        cdef int total = 0
+        cdef str key_events
+        cdef str key_snapshots
+        for key_events, key_snapshots in (
+            (self._key_accounts, self._key_account_snapshots),
+            (self._key_orders, self._key_order_snapshots),
+            (self._key_positions, self._key_position_snapshots),
+        ):
+            total += self._compact(key_events, key_snapshots)
+
+        self._log.info(f"Compacted database, trimmed {total} events.")
+        return total
+
+    cdef int _compact(self, str key_events, str key_snapshots) except *:
+        cdef int total = 0
+        cdef int covered
+        cdef str id_str
+        cdef dict snapshot
+        pipe = self._redis.pipeline()
+        for id_str, snapshot in self._load_snapshots(key_snapshots).items():
+            covered = _tail_index(snapshot) - 1  # Retain the last covered event
+            if covered <= 0:
+                continue
+            pipe.ltrim(key_events + id_str, covered, -1)
+            pipe.hincrby(key_snapshots + id_str, _TRIMMED, covered)
+            total += covered
+        pipe.execute()
+
+        return total
+
     cpdef void add_currency(self, Currency currency) except *:
         """
         Add the given currency to the database.
@@ -628,7 +1114,20 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(account, "account")
 
         cdef bytes serialized_event = self._event_serializer.serialize(account.last_event_c())
-        self._redis.rpush(self._key_accounts + account.id.value, serialized_event)
+        cdef int reply = self._redis.rpush(self._key_accounts + account.id.value, serialized_event)
+
+        if self._snapshot_interval and reply % self._snapshot_interval == 0:
+            try:
+                self._write_snapshot(
+                    self._key_account_snapshots + account.id.value,
+                    account._events,
+                    _account_state(account),
+                    reply,
+                )
+            except Exception as ex:
+                # The event is persisted, so the object is restored from the
+                # previous snapshot (if any) and its events
+                self._log.error(f"Cannot snapshot {account}, {ex}.")
 
         self._log.debug(f"Updated {account}.")
 
@@ -651,6 +1150,19 @@ cdef class RedisCacheDatabase(CacheDatabase):
         if reply == 1:  # Reply = The length of the list after the push operation
             self._log.error(f"The updated Order(id={order.client_order_id.value}) did not already exist.")
 
+        if self._snapshot_interval and reply % self._snapshot_interval == 0:
+            try:
+                self._write_snapshot(
+                    self._key_order_snapshots + order.client_order_id.value,
+                    order._events,
+                    _order_state(order),
+                    reply,
+                )
+            except Exception as ex:
+                # The event is persisted, so the object is restored from the
+                # previous snapshot (if any) and its events
+                self._log.error(f"Cannot snapshot {order}, {ex}.")
+
         self._log.debug(f"Updated {order}.")
 
     cpdef void update_position(self, Position position) except *:
@@ -672,4 +1184,17 @@ cdef class RedisCacheDatabase(CacheDatabase):
         if reply == 1:  # Reply = The length of the list after the push operation
             self._log.error(f"The updated Position(id={position.id.value}) did not already exist.")
 
+        if self._snapshot_interval and reply % self._snapshot_interval == 0:
+            try:
+                self._write_snapshot(
+                    self._key_position_snapshots + position.id.value,
+                    position._events,
+                    _position_state(position),
+                    reply,
+                )
+            except Exception as ex:
+                # The event is persisted, so the object is restored from the
+                # previous snapshot (if any) and its events
+                self._log.error(f"Cannot snapshot {position}, {ex}.")
+
         self._log.debug(f"Updated {position}.")
@@ -170,10 +170,7 @@ class TradingNode:
                 instrument_serializer=MsgPackInstrumentSerializer(),
                 command_serializer=MsgPackCommandSerializer(),
                 event_serializer=MsgPackEventSerializer(),
-                config={
-                    "host": config_db["host"],
-                    "port": config_db["port"],
-                },
+                config=config_db,
             )
         else:
             raise ValueError(
@@ -252,6 +249,8 @@ class TradingNode:
             log=self._log,
         )
 
+        self._data_recorders = []
+
         self._log.info("state=INITIALIZED.")
         self.time_to_initialize = self._clock.delta(self.created_time)
         self._log.info(f"Initialized in {self.time_to_initialize.total_seconds():.3f}s.")
@@ -348,6 +347,28 @@ class TradingNode:
         """
         self._builder.add_exec_client_factory(name, factory)
 
+    def add_data_recorder(self, recorder) -> None:
+        """
+        Add the given data recorder to the node.
+
+        The recorder is passed all data processed by the data engine, and is
+        closed when the node stops.
+
+        Parameters
+        ----------
+        recorder : ArrowStreamRecorder
+            The recorder to add (any object with `write(data)` and `close()`
+            methods).
+
+        Raises
+        ------
+        KeyError
+            If recorder has already been added.
+
+        """
+        self._data_engine.register_data_handler(recorder.write)
+        self._data_recorders.append(recorder)
+
     def build(self) -> None:
         """
         Build the nodes clients.
@@ -642,6 +663,10 @@ class TradingNode:
                 f"\nExecEngine.check_disconnected() == {self._exec_engine.check_disconnected()}"
             )
 
+        for recorder in self._data_recorders:
+            self._data_engine.deregister_data_handler(recorder.write)
+            recorder.close()
+
         # Clean up remaining timers
         timer_names = self._clock.timer_names()
         self._clock.cancel_timers()
@@ -15,6 +15,8 @@
 
 
 cdef class Identifier:
+    cdef Py_hash_t _hash
+
     cdef readonly str value
     """The ID value.\n\n:returns: `str`"""
 
@@ -38,6 +40,8 @@ cdef class InstrumentId(Identifier):
 
     @staticmethod
     cdef InstrumentId from_str_c(str value)
+    @staticmethod
+    cdef InstrumentId _parse_c(str value)
 
 
 cdef class TraderId(Identifier):
@@ -84,3 +88,14 @@ cdef class PositionId(Identifier):
 
 cdef class ExecutionId(Identifier):
     pass
+
+
+cdef class IdentifierCache:
+    cdef object _factory
+    cdef object _ids
+
+    cdef readonly int capacity
+    """The maximum number of identifiers held by the cache.\n\n:returns: `int`"""
+
+    cpdef Identifier get(self, str value)
+    cpdef void clear(self) except *
@@ -13,10 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from collections import OrderedDict
+
 from nautilus_trader.core.correctness cimport Condition
 
 
 cdef str _NULL_ID = "NULL"
+cdef int _INSTRUMENT_ID_CACHE_CAPACITY = 100_000
 
 cdef class Identifier:
     """
@@ -43,9 +46,19 @@ cdef class Identifier:
         Condition.valid_string(value, "value")
 
         self.value = value
+        self._hash = hash(value)  # Assign hash for improved time complexity
+
+    def __reduce__(self):
+        return type(self), (self.value,)
 
     def __eq__(self, Identifier other) -> bool:
-        return isinstance(other, type(self)) and self.value == other.value
+        if self is other:
+            return True  # Interned or same instance
+        return (
+            isinstance(other, type(self))
+            and self._hash == other._hash
+            and self.value == other.value
+        )
 
     def __lt__(self, Identifier other) -> bool:
         return self.value < other.value
@@ -60,7 +73,7 @@ cdef class Identifier:
         return self.value >= other.value
 
     def __hash__(self) -> int:
-        return hash(self.value)
+        return self._hash
 
     def __str__(self) -> str:
         return self.value
@@ -149,8 +162,16 @@ cdef class InstrumentId(Identifier):
         self.symbol = symbol
         self.venue = venue
 
+    def __reduce__(self):
+        return InstrumentId, (self.symbol, self.venue)
+
     @staticmethod
     cdef InstrumentId from_str_c(str value):
+        # Parsed instrument IDs are interned so equal IDs share one instance
+        return _INSTRUMENT_IDS.get(value)
+
+    @staticmethod
+    cdef InstrumentId _parse_c(str value):
         Condition.valid_string(value, "value")
 
         cdef list pieces = value.rsplit('.', maxsplit=1)
@@ -307,6 +328,9 @@ cdef class AccountId(Identifier):
         self.issuer = issuer
         self.number = number
 
+    def __reduce__(self):
+        return AccountId, (self.issuer, self.number)
+
     @staticmethod
     cdef AccountId from_str_c(str value):
         Condition.valid_string(value, "value")
@@ -536,3 +560,83 @@ cdef class ExecutionId(Identifier):
 
         """
         super().__init__(value)
+
+
+cdef class IdentifierCache:
+    """
+    Provides a bounded cache of interned identifiers.
+
+    Equal identifiers obtained from the cache share a single instance, so
+    dictionary lookups keyed by them resolve on identity. When the capacity is
+    reached the least recently used entries are evicted first, bounding memory
+    for transient IDs such as ``ExecutionId`` (evicted instances remain valid).
+    """
+
+    def __init__(self, factory not None, int capacity=10_000):
+        """
+        Initialize a new instance of the ``IdentifierCache`` class.
+
+        Parameters
+        ----------
+        factory : Callable[[str], Identifier]
+            The factory for identifiers not yet in the cache, typically the
+            identifier type (or its ``from_str`` method for composite IDs).
+        capacity : int
+            The maximum number of identifiers to hold.
+
+        Raises
+        ------
+        ValueError
+            If capacity is not positive (> 0).
+
+        """
+        Condition.callable(factory, "factory")
+        Condition.positive_int(capacity, "capacity")
+
+        self.capacity = capacity
+        self._factory = factory
+        self._ids = OrderedDict()  # type: OrderedDict[str, Identifier]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    cpdef Identifier get(self, str value):
+        """
+        Return the interned identifier for the given value.
+
+        Parameters
+        ----------
+        value : str
+            The identifier value.
+
+        Returns
+        -------
+        Identifier
+
+        """
+        cdef Identifier identifier = self._ids.get(value)
+        if identifier is not None:
+            self._ids.move_to_end(value)
+            return identifier
+
+        identifier = self._factory(value)
+        if len(self._ids) >= self.capacity:
+            self._ids.popitem(last=False)  # Evict least recently used
+        self._ids[value] = identifier
+        return identifier
+
+    cpdef void clear(self) except *:
+        """
+        Clear all identifiers from the cache.
+        """
+        self._ids.clear()
+
+
+def _parse_instrument_id(str value):
+    return InstrumentId._parse_c(value)
+
+
+cdef IdentifierCache _INSTRUMENT_IDS = IdentifierCache(
+    _parse_instrument_id,
+    capacity=_INSTRUMENT_ID_CACHE_CAPACITY,
+)
@@ -13,23 +13,42 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint8_t
 
 from nautilus_trader.model.currency cimport Currency
 
 
 cdef class BaseDecimal:
-    cdef object _value
-
+    cdef readonly int64_t raw
+    """The raw fixed-point value (scaled by 10 to the power of the precision).\n\n:returns: `int64`"""
     cdef readonly uint8_t precision
     """The decimal precision.\n\n:returns: `uint8`"""
 
     @staticmethod
     cdef object _extract_value(object obj)
 
+    @staticmethod
+    cdef bint _is_fixed(object obj) except *
+
+    @staticmethod
+    cdef tuple _raw_pair(a, b)
+
     @staticmethod
     cdef bint _compare(a, b, int op) except *
 
+    @staticmethod
+    cdef bint _compare_raw(int64_t a, int64_t b, int op) except *
+
+    @staticmethod
+    cdef object _add(a, b, bint subtract)
+
+    @staticmethod
+    cdef object _mul(a, b)
+
+    @staticmethod
+    cdef object _hash(BaseDecimal value)
+
     cpdef object as_decimal(self)
     cpdef double as_double(self) except *
 
@@ -46,6 +65,9 @@ cdef class Quantity(BaseDecimal):
     @staticmethod
     cdef Quantity from_int_c(int value)
 
+    @staticmethod
+    cdef Quantity from_raw_c(int64_t raw, uint8_t precision)
+
 
 cdef class Price(BaseDecimal):
     @staticmethod
@@ -54,6 +76,9 @@ cdef class Price(BaseDecimal):
     @staticmethod
     cdef Price from_int_c(int value)
 
+    @staticmethod
+    cdef Price from_raw_c(int64_t raw, uint8_t precision)
+
 
 cdef class Money(BaseDecimal):
     cdef readonly Currency currency
@@ -62,6 +87,9 @@ cdef class Money(BaseDecimal):
     @staticmethod
     cdef Money from_str_c(str value)
 
+    @staticmethod
+    cdef Money from_raw_c(int64_t raw, Currency currency)
+
     cpdef str to_str(self)
 
 
@@ -23,6 +23,10 @@ subclasses are also able to be used as operands for mathematical operations with
 `float` objects. Return values are floats if one of the operands is a float, else
 a decimal.Decimal.
 
+Values are stored in fixed-point as a raw int64 mantissa scaled by 10 to the
+power of the precision, so comparisons, hashing and addition/subtraction are
+integer operations. A decimal.Decimal is only built on demand.
+
 
 References
 ----------
@@ -31,6 +35,7 @@ https://docs.python.org/3.9/library/decimal.html
 """
 
 import decimal
+import sys
 
 from cpython.object cimport PyObject_RichCompareBool
 from cpython.object cimport Py_EQ
@@ -38,6 +43,12 @@ from cpython.object cimport Py_GE
 from cpython.object cimport Py_GT
 from cpython.object cimport Py_LE
 from cpython.object cimport Py_LT
+from cpython.object cimport Py_NE
+from libc.math cimport fabs
+from libc.math cimport floor
+from libc.math cimport pow as c_pow
+from libc.math cimport round as c_round
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint8_t
 
 from nautilus_trader.core.correctness cimport Condition
@@ -45,6 +56,37 @@ from nautilus_trader.core.functions cimport precision_from_str
 from nautilus_trader.model.currency cimport Currency
 
 
+# Scaled doubles at or above this magnitude cannot be rounded exactly
+cdef double _MAX_EXACT_DOUBLE = 4503599627370496.0  # 2^52
+
+# For hashing consistently with the equivalent numeric types (see `Decimal.__hash__`)
+cdef object _HASH_MODULUS = sys.hash_info.modulus
+cdef object _HASH_10INV = pow(10, _HASH_MODULUS - 2, _HASH_MODULUS)
+
+
+cdef inline int64_t _raw_from_double(double value, uint8_t precision) except? -1:
+    cdef double scaled = value * c_pow(10.0, precision)
+    cdef double fraction = fabs(scaled - floor(scaled))
+    # Values exactly (or too near to tell) half way between two representable
+    # values, and values beyond the exact range of a double, are rounded as the
+    # formatted decimal string to maintain the rounding of the built-in `format`.
+    if not fabs(scaled) < _MAX_EXACT_DOUBLE or fabs(fraction - 0.5) <= fabs(scaled) * 1e-15 + 1e-12:
+        return int(decimal.Decimal(f"{value:.{precision}f}").scaleb(precision))
+    return <int64_t>c_round(scaled)
+
+
+cdef inline object _decimal_from_raw(object raw, uint8_t precision):
+    return decimal.Decimal(raw).scaleb(-precision)
+
+
+def _restore(type cls, int64_t raw, uint8_t precision):
+    # Unpickle a decimal type from its fixed-point state
+    cdef BaseDecimal value = cls.__new__(cls)
+    value.raw = raw
+    value.precision = precision
+    return value
+
+
 cdef class BaseDecimal:
     """
     The abstract base class for all domain value objects.
@@ -71,18 +113,30 @@ cdef class BaseDecimal:
         ------
         OverflowError
             If precision is negative (< 0).
+        OverflowError
+            If the value scaled by the precision exceeds the int64 range.
 
         """
-        if isinstance(value, decimal.Decimal):
-            self._value = round(value, precision)
+        if isinstance(value, int):
+            self.raw = value * 10 ** precision
+        elif isinstance(value, float):
+            self.raw = _raw_from_double(value, precision)
+        elif isinstance(value, decimal.Decimal):
+            self.raw = int(round(value, precision).scaleb(precision))
         else:
-            self._value = decimal.Decimal(f'{float(value):.{precision}f}')
+            self.raw = _raw_from_double(float(value), precision)
 
         self.precision = precision
 
+    def __reduce__(self):
+        return _restore, (type(self), self.raw, self.precision)
+
     def __eq__(self, other) -> bool:
         return BaseDecimal._compare(self, other, Py_EQ)
 
+    def __ne__(self, other) -> bool:
+        return BaseDecimal._compare(self, other, Py_NE)
+
     def __lt__(self, other) -> bool:
         return BaseDecimal._compare(self, other, Py_LT)
 
@@ -98,36 +152,48 @@ cdef class BaseDecimal:
     def __add__(self, other) -> decimal.Decimal or float:
         if isinstance(other, float):
             return float(self) + other
+        elif BaseDecimal._is_fixed(other):
+            return BaseDecimal._add(self, other, False)
         else:
             return BaseDecimal._extract_value(self) + BaseDecimal._extract_value(other)
 
     def __radd__(self, other) -> decimal.Decimal or float:
         if isinstance(other, float):
             return other + float(self)
+        elif BaseDecimal._is_fixed(other):
+            return BaseDecimal._add(other, self, False)
         else:
             return BaseDecimal._extract_value(other) + BaseDecimal._extract_value(self)
 
     def __sub__(self, other) -> decimal.Decimal or float:
         if isinstance(other, float):
             return float(self) - other
+        elif BaseDecimal._is_fixed(other):
+            return BaseDecimal._add(self, other, True)
         else:
             return BaseDecimal._extract_value(self) - BaseDecimal._extract_value(other)
 
     def __rsub__(self, other) -> decimal.Decimal or float:
         if isinstance(other, float):
             return other - float(self)
+        elif BaseDecimal._is_fixed(other):
+            return BaseDecimal._add(other, self, True)
         else:
             return BaseDecimal._extract_value(other) - BaseDecimal._extract_value(self)
 
     def __mul__(self, other) -> decimal.Decimal or float:
         if isinstance(other, float):
             return float(self) * other
+        elif BaseDecimal._is_fixed(other):
+            return BaseDecimal._mul(self, other)
         else:
             return BaseDecimal._extract_value(self) * BaseDecimal._extract_value(other)
 
     def __rmul__(self, other) -> decimal.Decimal or float:
         if isinstance(other, float):
             return other * float(self)
+        elif BaseDecimal._is_fixed(other):
+            return BaseDecimal._mul(other, self)
         else:
             return BaseDecimal._extract_value(other) * BaseDecimal._extract_value(self)
 
@@ -168,28 +234,32 @@ cdef class BaseDecimal:
             return BaseDecimal._extract_value(other) % BaseDecimal._extract_value(self)
 
     def __neg__(self) -> decimal.Decimal:
-        return self._value.__neg__()
+        return _decimal_from_raw(-self.raw, self.precision)
 
     def __pos__(self) -> decimal.Decimal:
-        return self._value.__pos__()
+        return self.as_decimal()
 
     def __abs__(self) -> decimal.Decimal:
-        return abs(self._value)
+        return _decimal_from_raw(abs(self.raw), self.precision)
 
     def __round__(self, ndigits=None) -> decimal.Decimal:
-        return round(self._value, ndigits)
+        return round(self.as_decimal(), ndigits)
 
     def __float__(self) -> float:
-        return float(self._value)
+        return self.as_double()
 
     def __int__(self) -> int:
-        return int(self._value)
+        # Truncates toward zero, as for `Decimal`
+        cdef object scale = 10 ** self.precision
+        if self.raw < 0:
+            return -(-self.raw // scale)
+        return self.raw // scale
 
     def __hash__(self) -> int:
-        return hash(self._value)
+        return BaseDecimal._hash(self)
 
     def __str__(self) -> str:
-        return str(self._value)
+        return str(self.as_decimal())
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}('{self}')"
@@ -200,14 +270,95 @@ cdef class BaseDecimal:
             return obj.as_decimal()
         return obj
 
+    @staticmethod
+    cdef bint _is_fixed(object obj) except *:
+        # If the object can take part in fixed-point integer operations
+        return isinstance(obj, (BaseDecimal, int))
+
+    @staticmethod
+    cdef tuple _raw_pair(a, b):
+        # Return the raw values of the operands scaled to a common precision
+        cdef object raw_a
+        cdef object raw_b
+        cdef uint8_t prec_a = 0
+        cdef uint8_t prec_b = 0
+        if isinstance(a, BaseDecimal):
+            raw_a = (<BaseDecimal>a).raw
+            prec_a = (<BaseDecimal>a).precision
+        else:
+            raw_a = a
+        if isinstance(b, BaseDecimal):
+            raw_b = (<BaseDecimal>b).raw
+            prec_b = (<BaseDecimal>b).precision
+        else:
+            raw_b = b
+
+        if prec_a < prec_b:
+            return raw_a * 10 ** (prec_b - prec_a), raw_b, prec_b
+        elif prec_b < prec_a:
+            return raw_a, raw_b * 10 ** (prec_a - prec_b), prec_a
+        return raw_a, raw_b, prec_a
+
     @staticmethod
     cdef bint _compare(a, b, int op) except *:
+        if isinstance(a, BaseDecimal) and isinstance(b, BaseDecimal):
+            if (<BaseDecimal>a).precision == (<BaseDecimal>b).precision:
+                return BaseDecimal._compare_raw((<BaseDecimal>a).raw, (<BaseDecimal>b).raw, op)
+        elif not (BaseDecimal._is_fixed(a) and BaseDecimal._is_fixed(b)):
+            # Floats and decimals compare exactly against the decimal value
+            return PyObject_RichCompareBool(
+                BaseDecimal._extract_value(a),
+                BaseDecimal._extract_value(b),
+                op,
+            )
+
+        cdef tuple pair = BaseDecimal._raw_pair(a, b)
+        return PyObject_RichCompareBool(pair[0], pair[1], op)
+
+    @staticmethod
+    cdef bint _compare_raw(int64_t a, int64_t b, int op) except *:
+        if op == Py_EQ:
+            return a == b
+        elif op == Py_NE:
+            return a != b
+        elif op == Py_LT:
+            return a < b
+        elif op == Py_LE:
+            return a <= b
+        elif op == Py_GT:
+            return a > b
+        else:
+            return a >= b
+
+    @staticmethod
+    cdef object _add(a, b, bint subtract):
+        cdef tuple pair = BaseDecimal._raw_pair(a, b)
+        if subtract:
+            return _decimal_from_raw(pair[0] - pair[1], pair[2])
+        return _decimal_from_raw(pair[0] + pair[1], pair[2])
+
+    @staticmethod
+    cdef object _mul(a, b):
+        cdef object raw_a = a
+        cdef object raw_b = b
+        cdef uint8_t precision = 0
         if isinstance(a, BaseDecimal):
-            a = <BaseDecimal>a.as_decimal()
+            raw_a = (<BaseDecimal>a).raw
+            precision += (<BaseDecimal>a).precision
         if isinstance(b, BaseDecimal):
-            b = <BaseDecimal>b.as_decimal()
+            raw_b = (<BaseDecimal>b).raw
+            precision += (<BaseDecimal>b).precision
+        return _decimal_from_raw(raw_a * raw_b, precision)
 
-        return PyObject_RichCompareBool(a, b, op)
+    @staticmethod
+    cdef object _hash(BaseDecimal value):
+        # Equal to the hash of the equivalent `Decimal`, `int` or `float`
+        cdef object h = abs(value.raw) % _HASH_MODULUS
+        if value.precision:
+            h = h * pow(_HASH_10INV, value.precision, _HASH_MODULUS) % _HASH_MODULUS
+        if value.raw < 0:
+            h = -h
+        return -2 if h == -1 else h
 
     cpdef object as_decimal(self):
         """
@@ -218,7 +369,7 @@ cdef class BaseDecimal:
         Decimal
 
         """
-        return self._value
+        return _decimal_from_raw(self.raw, self.precision)
 
     cpdef double as_double(self) except *:
         """
@@ -229,7 +380,7 @@ cdef class BaseDecimal:
         double
 
         """
-        return float(self._value)
+        return self.raw / c_pow(10.0, self.precision)
 
 
 cdef class Quantity(BaseDecimal):
@@ -269,8 +420,9 @@ cdef class Quantity(BaseDecimal):
         """
         super().__init__(value, precision)
 
-        # Post-condition
-        Condition.true(self._value >= 0, f"quantity negative, was {self._value}")
+        # Post-condition (the message is only formatted on failure)
+        if self.raw < 0:
+            raise ValueError(f"quantity negative, was {self}")
 
     @staticmethod
     cdef Quantity zero_c(uint8_t precision):
@@ -284,6 +436,17 @@ cdef class Quantity(BaseDecimal):
     cdef Quantity from_int_c(int value):
         return Quantity(value, precision=0)
 
+    @staticmethod
+    cdef Quantity from_raw_c(int64_t raw, uint8_t precision):
+        if raw < 0:
+            raise ValueError(f"quantity negative, was {raw}")
+
+        # Bypass __init__ as the raw value is already fixed-point
+        cdef Quantity quantity = Quantity.__new__(Quantity)
+        quantity.raw = raw
+        quantity.precision = precision
+        return quantity
+
     @staticmethod
     def zero(uint8_t precision=0) -> Quantity:
         """
@@ -353,6 +516,33 @@ cdef class Quantity(BaseDecimal):
 
         return Quantity.from_int_c(value)
 
+    @staticmethod
+    def from_raw(int64_t raw, uint8_t precision) -> Quantity:
+        """
+        Return a quantity from the given raw scaled integer value.
+
+        The raw value is the quantity multiplied by 10 to the power of the
+        given precision, e.g. a raw value of 150 with precision 2 is 1.50.
+
+        Parameters
+        ----------
+        raw : int64
+            The raw scaled integer value.
+        precision : uint8
+            The precision for the quantity.
+
+        Returns
+        -------
+        Quantity
+
+        Raises
+        ------
+        ValueError
+            If raw is negative (< 0).
+
+        """
+        return Quantity.from_raw_c(raw, precision)
+
     cpdef str to_str(self):
         """
         Return the formatted string representation of the quantity.
@@ -407,6 +597,14 @@ cdef class Price(BaseDecimal):
     cdef Price from_int_c(int value):
         return Price(value, precision=0)
 
+    @staticmethod
+    cdef Price from_raw_c(int64_t raw, uint8_t precision):
+        # Bypass __init__ as the raw value is already fixed-point
+        cdef Price price = Price.__new__(Price)
+        price.raw = raw
+        price.precision = precision
+        return price
+
     @staticmethod
     def from_str(str value) -> Price:
         """
@@ -447,6 +645,28 @@ cdef class Price(BaseDecimal):
 
         return Price.from_int_c(value)
 
+    @staticmethod
+    def from_raw(int64_t raw, uint8_t precision) -> Price:
+        """
+        Return a price from the given raw scaled integer value.
+
+        The raw value is the price multiplied by 10 to the power of the given
+        precision, e.g. a raw value of 91715 with precision 3 is 91.715.
+
+        Parameters
+        ----------
+        raw : int64
+            The raw scaled integer value.
+        precision : uint8
+            The precision for the price.
+
+        Returns
+        -------
+        Price
+
+        """
+        return Price.from_raw_c(raw, precision)
+
 
 cdef class Money(BaseDecimal):
     """
@@ -471,26 +691,41 @@ cdef class Money(BaseDecimal):
 
         self.currency = currency
 
+    def __reduce__(self):
+        return Money.from_raw, (self.raw, self.currency)
+
     def __eq__(self, Money other) -> bool:
-        return self.currency == other.currency and self._value == other.as_decimal()
+        return self.currency == other.currency and self.raw == other.raw
+
+    def __ne__(self, Money other) -> bool:
+        return not (self.currency == other.currency and self.raw == other.raw)
 
     def __lt__(self, Money other) -> bool:
-        return self.currency == other.currency and self._value < other.as_decimal()
+        return self.currency == other.currency and self.raw < other.raw
 
     def __le__(self, Money other) -> bool:
-        return self.currency == other.currency and self._value <= other.as_decimal()
+        return self.currency == other.currency and self.raw <= other.raw
 
     def __gt__(self, Money other) -> bool:
-        return self.currency == other.currency and self._value > other.as_decimal()
+        return self.currency == other.currency and self.raw > other.raw
 
     def __ge__(self, Money other) -> bool:
-        return self.currency == other.currency and self._value >= other.as_decimal()
+        return self.currency == other.currency and self.raw >= other.raw
 
     def __hash__(self) -> int:
-        return hash((self.currency, self._value))
+        return hash((self.currency, BaseDecimal._hash(self)))
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}('{self._value}', {self.currency})"
+        return f"{type(self).__name__}('{self}', {self.currency})"
+
+    @staticmethod
+    cdef Money from_raw_c(int64_t raw, Currency currency):
+        # Bypass __init__ as the raw value is already fixed-point
+        cdef Money money = Money.__new__(Money)
+        money.raw = raw
+        money.precision = currency.precision
+        money.currency = currency
+        return money
 
     @staticmethod
     cdef Money from_str_c(str value):
@@ -535,6 +770,28 @@ cdef class Money(BaseDecimal):
 
         return Money.from_str_c(value)
 
+    @staticmethod
+    def from_raw(int64_t raw, Currency currency not None) -> Money:
+        """
+        Return money from the given raw scaled integer value.
+
+        The raw value is the amount multiplied by 10 to the power of the
+        currency precision, e.g. a raw value of 150 in USD is 1.50 USD.
+
+        Parameters
+        ----------
+        raw : int64
+            The raw scaled integer value.
+        currency : Currency
+            The currency of the money.
+
+        Returns
+        -------
+        Money
+
+        """
+        return Money.from_raw_c(raw, currency)
+
     cpdef str to_str(self):
         """
         Return the formatted string representation of the money.
@@ -544,7 +801,7 @@ cdef class Money(BaseDecimal):
         str
 
         """
-        return f"{self._value:,} {self.currency}".replace(",", "_")
+        return f"{self.as_decimal():,} {self.currency}".replace(",", "_")
 
 
 cdef class AccountBalance:
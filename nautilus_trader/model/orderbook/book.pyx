@@ -541,14 +541,14 @@ cdef class OrderBook:
                 "bids": [
                     getattr(order, show)
                     for order in level.orders
-                    if level.price in self.bids.prices()
+                    if self.bids.contains_price(level.price)
                 ]
                 or None,
                 "price": level.price,
                 "asks": [
                     getattr(order, show)
                     for order in level.orders
-                    if level.price in self.asks.prices()
+                    if self.asks.contains_price(level.price)
                 ]
                 or None,
             }
@@ -829,9 +829,9 @@ cdef class L2OrderBook(OrderBook):
     cdef void _remove_if_exists(self, Order order) except *:
         # For a L2OrderBook, an order update means a whole level update. If this
         # level exists, remove it so we can insert the new level.
-        if order.side == OrderSide.BUY and order.price in self.bids.prices():
+        if order.side == OrderSide.BUY and self.bids.contains_price(order.price):
             self._delete(order)
-        elif order.side == OrderSide.SELL and order.price in self.asks.prices():
+        elif order.side == OrderSide.SELL and self.asks.contains_price(order.price):
             self._delete(order)
 
 
@@ -948,7 +948,7 @@ cdef class L1OrderBook(OrderBook):
             self._top_bid = bid
             self._top_bid_level = self.bids.top()
         else:
-            self._top_bid_level.price = price
+            self.bids._reprice_level(self._top_bid_level, price)
             self._top_bid.update_price(price)
             self._top_bid.update_size(size)
 
@@ -959,7 +959,7 @@ cdef class L1OrderBook(OrderBook):
             self._top_ask = ask
             self._top_ask_level = self.asks.top()
         else:
-            self._top_ask_level.price = price
+            self.asks._reprice_level(self._top_ask_level, price)
             self._top_ask.update_price(price)
             self._top_ask.update_size(size)
 
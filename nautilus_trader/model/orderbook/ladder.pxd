@@ -20,6 +20,8 @@ from nautilus_trader.model.orderbook.level cimport Level
 
 cdef class Ladder:
     cdef dict _order_id_level_index
+    cdef dict _price_levels
+    cdef list _price_keys
 
     cdef readonly list levels
     """The ladders levels.\n\n:returns: `list[Level]`"""
@@ -30,10 +32,15 @@ cdef class Ladder:
     cdef readonly int size_precision
     """The ladders size precision.\n\n:returns: `int`"""
 
-    cpdef bint reverse(self) except *
     cpdef void add(self, Order order) except *
     cpdef void update(self, Order order) except *
     cpdef void delete(self, Order order) except *
+    cdef inline double _price_key(self, double price)
+    cdef void _insert_level(self, Level level) except *
+    cdef void _remove_level(self, Level level) except *
+    cdef void _reprice_level(self, Level level, double price) except *
+    cpdef bint contains_price(self, double price) except *
+    cpdef Level level_at(self, double price)
     cpdef list depth(self, int n=*)
     cpdef list prices(self)
     cpdef list volumes(self)
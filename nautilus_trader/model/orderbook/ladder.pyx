@@ -13,9 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import heapq
-
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.functions cimport bisect_double_left
 from nautilus_trader.core.functions cimport bisect_double_right
 from nautilus_trader.model.c_enums.depth_type cimport DepthType
 from nautilus_trader.model.objects cimport Price
@@ -27,6 +26,11 @@ from nautilus_trader.model.orderbook.level cimport Level
 cdef class Ladder:
     """
     Represents a ladder of orders in a book.
+
+    Levels are indexed by price in a dictionary and kept ordered from the top
+    of the ladder by a parallel sorted array of price keys (prices are negated
+    for a reversed ladder), giving O(log n) level insertion and removal and
+    O(1) access to the top level.
     """
     def __init__(
         self,
@@ -58,6 +62,8 @@ cdef class Ladder:
         Condition.not_negative_int(size_precision, "size_precision")
 
         self._order_id_level_index = {}  # type: dict[str, Level]
+        self._price_levels = {}          # type: dict[float, Level]
+        self._price_keys = []            # type: list[float]  # Sorted ascending
 
         self.levels = []  # type: list[Level]  # TODO: Make levels private??
         self.reverse = reverse
@@ -79,28 +85,13 @@ cdef class Ladder:
         """
         Condition.not_none(order, "order")
 
-        cdef list existing_prices = self.prices()
-
-        cdef int price_idx
-        cdef Level level
-        if order.price in existing_prices:
-            # Level exists, add new order
-            price_idx = existing_prices.index(order.price)
-            level = self.levels[price_idx]
-            level.add(order=order)
-        else:
+        cdef Level level = self._price_levels.get(order.price)
+        if level is None:
             # New price, create Level
             level = Level(price=order.price)
-            level.add(order)
-
-            if self.reverse:
-                self.levels.append(level)
-                # TODO: heapq._siftdown_max is temporary before custom data structure
-                heapq._siftdown_max(self.levels, 0, len(self.levels) - 1)
-            else:
-                price_idx = bisect_double_right(existing_prices, level.price)
-                self.levels.insert(price_idx, level)
+            self._insert_level(level)
 
+        level.add(order=order)
         self._order_id_level_index[order.id] = level
 
     cpdef void update(self, Order order) except *:
@@ -115,17 +106,17 @@ cdef class Ladder:
         """
         Condition.not_none(order, "order")
 
-        if order.id not in self._order_id_level_index:
+        cdef Level level = self._order_id_level_index.get(order.id)
+        if level is None:
             self.add(order=order)
             return
 
-        # Find the existing order
-        cdef Level level = self._order_id_level_index[order.id]
         if order.price == level.price:
             # This update contains a volume update
             level.update(order=order)
             if not level.orders:
-                self.levels.remove(level)
+                self._order_id_level_index.pop(order.id, None)
+                self._remove_level(level)
         else:
             # New price for this order, delete and insert
             self.delete(order=order)
@@ -151,11 +142,67 @@ cdef class Ladder:
         if level is None:
             return
             # TODO: raise KeyError("Cannot delete order: not found at level.")
-        cdef int price_idx = self.prices().index(level.price)
         level.delete(order=order)
         self._order_id_level_index.pop(order.id)
         if not level.orders:
-            del self.levels[price_idx]
+            self._remove_level(level)
+
+    cdef inline double _price_key(self, double price):
+        return -price if self.reverse else price
+
+    cdef void _insert_level(self, Level level) except *:
+        cdef double key = self._price_key(level.price)
+        cdef int idx = bisect_double_right(self._price_keys, key)
+        self._price_keys.insert(idx, key)
+        self.levels.insert(idx, level)
+        self._price_levels[level.price] = level
+
+    cdef void _remove_level(self, Level level) except *:
+        cdef int idx = bisect_double_left(self._price_keys, self._price_key(level.price))
+        if idx >= len(self.levels) or self.levels[idx] is not level:
+            raise KeyError(f"Cannot remove level: {level} not found in ladder")
+        del self._price_keys[idx]
+        del self.levels[idx]
+        self._price_levels.pop(level.price, None)
+
+    cdef void _reprice_level(self, Level level, double price) except *:
+        # Move the level to the given price, keeping the price index consistent
+        # (L1 books update their single level per side in place).
+        self._remove_level(level)
+        level.price = price
+        self._insert_level(level)
+
+    cpdef bint contains_price(self, double price) except *:
+        """
+        Return a value indicating whether the ladder has a level at the given price.
+
+        Parameters
+        ----------
+        price : double
+            The price to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        return price in self._price_levels
+
+    cpdef Level level_at(self, double price):
+        """
+        Return the level at the given price (if found).
+
+        Parameters
+        ----------
+        price : double
+            The price for the level.
+
+        Returns
+        -------
+        Level or None
+
+        """
+        return self._price_levels.get(price)
 
     cpdef list depth(self, int n=1):
         """
@@ -171,8 +218,6 @@ cdef class Ladder:
         list[Level]
 
         """
-        if not self.levels:
-            return []
         n = n or len(self.levels)
         return self.levels[:n]
 
@@ -218,9 +263,8 @@ cdef class Ladder:
         Level or None
 
         """
-        cdef list top = self.depth(1)
-        if top:
-            return top[0]
+        if self.levels:
+            return self.levels[0]
         else:
             return None
 
@@ -249,11 +293,11 @@ cdef class Ladder:
         cdef Level level
         cdef Order book_order
 
-        for level in self.levels:
-            if self.reverse and level.price < order.price:
-                break
-            elif not self.reverse and level.price > order.price:
-                break
+        # Only levels at or better than the order price can fill
+        cdef int stop = bisect_double_right(self._price_keys, self._price_key(order.price))
+        cdef int i
+        for i in range(stop):
+            level = self.levels[i]
             for book_order in level.orders:
                 current = book_order.size if depth_type == DepthType.VOLUME else book_order.exposure()
                 if (cumulative_denominator + current) >= target:
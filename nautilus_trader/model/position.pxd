@@ -37,6 +37,8 @@ from nautilus_trader.model.objects cimport Quantity
 cdef class Position:
     cdef list _events
     cdef list _execution_ids
+    cdef set _client_order_ids
+    cdef set _venue_order_ids
     cdef object _buy_qty
     cdef object _sell_qty
     cdef dict _commissions
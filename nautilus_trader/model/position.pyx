@@ -63,6 +63,8 @@ cdef class Position:
 
         self._events = []         # type: list[OrderFilled]
         self._execution_ids = []  # type: list[ExecutionId]
+        self._client_order_ids = set()  # type: set[ClientOrderId]
+        self._venue_order_ids = set()   # type: set[VenueOrderId]
         self._buy_qty = Decimal()
         self._sell_qty = Decimal()
         self._commissions = {}
@@ -145,16 +147,14 @@ cdef class Position:
         }
 
     cdef list client_order_ids_c(self):
-        # Note the inner set {}
-        return sorted(list({fill.client_order_id for fill in self._events}))
+        return sorted(self._client_order_ids)
 
     cdef list venue_order_ids_c(self):
-        # Note the inner set {}
-        return sorted(list({fill.venue_order_id for fill in self._events}))
+        return sorted(self._venue_order_ids)
 
     cdef list execution_ids_c(self):
-        # Checked for duplicate before appending to events
-        return [fill.execution_id for fill in self._events]
+        # Checked for duplicate before appending
+        return self._execution_ids.copy()
 
     cdef list events_c(self):
         return self._events.copy()
@@ -415,6 +415,8 @@ cdef class Position:
 
         self._events.append(fill)
         self._execution_ids.append(fill.execution_id)
+        self._client_order_ids.add(fill.client_order_id)
+        self._venue_order_ids.add(fill.venue_order_id)
 
         # Calculate cumulative commission
         cdef Currency currency = fill.commission.currency
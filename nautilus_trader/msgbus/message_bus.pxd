@@ -17,9 +17,10 @@ from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport LoggerAdapter
 
 
-cdef class Subscription:
-    cdef str _topic_str
+cpdef bint is_matching(str topic, str pattern) except *
+
 
+cdef class Subscription:
     cdef readonly str topic
     """The topic for the subscription.\n\n:returns: `str`"""
     cdef readonly object handler
@@ -34,6 +35,7 @@ cdef class MessageBus:
     cdef dict _channels
     cdef Subscription[:] _patterns
     cdef int _patterns_len
+    cdef dict _resolved
 
     cdef readonly int processed_count
     """The count of messages process by the bus.\n\n:returns: `int32`"""
@@ -47,5 +49,7 @@ cdef class MessageBus:
     cpdef void unsubscribe(self, str topic, handler) except *
     cdef void _unsubscribe_pattern(self, Subscription sub) except *
     cdef void _unsubscribe_channel(self, Subscription sub) except *
+    cdef void _invalidate_pattern(self, str pattern) except *
+    cdef Subscription[:] _resolve(self, str topic)
     cpdef void publish(self, str topic, msg) except *
     cdef void publish_c(self, str topic, msg) except *
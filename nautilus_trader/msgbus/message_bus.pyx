@@ -24,6 +24,66 @@ from nautilus_trader.core.correctness cimport Condition
 
 
 cdef str WILDCARD = "*"
+cdef str SINGLE = "?"
+
+cdef int _RESOLVED_CACHE_MAX = 100_000
+
+
+cpdef bint is_matching(str topic, str pattern) except *:
+    """
+    Return a value indicating whether the topic matches the given pattern.
+
+    The pattern may contain wildcard characters, where '*' matches any
+    sequence of characters (including none), and '?' matches any single
+    character.
+
+    Parameters
+    ----------
+    topic : str
+        The topic to match.
+    pattern : str
+        The pattern to match against.
+
+    Returns
+    -------
+    bool
+
+    """
+    cdef int n = len(topic)
+    cdef int m = len(pattern)
+    cdef int i = 0  # Position in topic
+    cdef int j = 0  # Position in pattern
+    cdef int star_j = -1
+    cdef int star_i = 0
+    cdef Py_UCS4 c
+    while i < n:
+        if j < m:
+            c = pattern[j]
+            if c == "*":
+                # Record the star position, initially matching no characters
+                star_j = j
+                star_i = i
+                j += 1
+                continue
+            if c == "?" or c == topic[i]:
+                i += 1
+                j += 1
+                continue
+        if star_j == -1:
+            return False
+        # Backtrack, letting the last star consume one more character
+        star_i += 1
+        i = star_i
+        j = star_j + 1
+
+    # Any remaining pattern must be stars only
+    while j < m and pattern[j] == "*":
+        j += 1
+    return j == m
+
+
+cdef inline bint _is_pattern(str topic):
+    return WILDCARD in topic or SINGLE in topic
 
 
 cdef class Subscription:
@@ -52,7 +112,8 @@ cdef class Subscription:
         Parameters
         ----------
         topic : str
-            The topic for the subscription. May include wildcard glob patterns.
+            The topic for the subscription. May include wildcard glob patterns
+            ('*' for any sequence of characters, '?' for any single character).
         handler : Callable[[Message], None]
             The handler for the subscription.
         priority : int
@@ -69,8 +130,7 @@ cdef class Subscription:
         Condition.valid_string(topic, "topic")
         Condition.not_negative_int(priority, "priority")
 
-        self._topic_str = topic
-        self.topic = topic.replace(WILDCARD, "")
+        self.topic = topic
         self.handler = handler
         self.priority = priority
 
@@ -94,7 +154,7 @@ cdef class Subscription:
 
     def __repr__(self) -> str:
         return (f"{type(self).__name__}("
-                f"topic={self._topic_str}, "
+                f"topic={self.topic}, "
                 f"handler={self.handler}, "
                 f"priority={self.priority})")
 
@@ -105,6 +165,11 @@ cdef class MessageBus:
     publishing producers.
 
     The bus provides both a producer and consumer API.
+
+    Topics published to are resolved to the subscriptions of both the matching
+    channel and any matching patterns once, the result is then cached per topic
+    until a subscription change affects it. Publishing on a hot topic is
+    therefore a single lookup regardless of the number of patterns.
     """
 
     def __init__(
@@ -141,6 +206,7 @@ cdef class MessageBus:
         self._channels = {}    # type: dict[str, Subscription[:]]
         self._patterns = None  # type: Subscription[:]
         self._patterns_len = 0
+        self._resolved = {}    # type: dict[str, Subscription[:]]
 
         # Counters
         self.processed_count = 0
@@ -157,7 +223,7 @@ cdef class MessageBus:
         cdef list channels = []
         channels.extend(list(self._channels.keys()))
         if self._patterns is not None:
-            channels.extend([s.topic + WILDCARD for s in list(self._patterns)])
+            channels.extend([s.topic for s in list(self._patterns)])
         return channels
 
     cpdef list subscriptions(self, str topic):
@@ -167,8 +233,8 @@ cdef class MessageBus:
         Parameters
         ----------
         topic : str
-            The topic filter.
-            If None then will return subscriptions for ALL messages.
+            The topic filter, subscriptions for the channel of this topic and
+            for patterns which match it are returned.
 
         Returns
         -------
@@ -177,15 +243,12 @@ cdef class MessageBus:
         """
         Condition.valid_string(topic, "topic")
 
-        topic = topic.replace(WILDCARD, "")
-
-        cdef list output = []
-        for sub in self._channels.get(topic, []):
-            output.append(sub)
+        cdef list output = list(self._channels.get(topic, []))
 
+        cdef Subscription sub
         if self._patterns is not None:
             for sub in list(self._patterns):
-                if sub.topic.startswith(topic):
+                if sub.topic == topic or is_matching(topic, sub.topic):
                     output.append(sub)
 
         return output
@@ -201,8 +264,9 @@ cdef class MessageBus:
 
         Parameters
         ----------
-        topic : MessageType
-            The message type to subscribe to. If "*" then subscribes to ALL messages.
+        topic : str
+            The topic to subscribe to, which may be a pattern including the
+            wildcards '*' and '?'. If "*" then subscribes to ALL messages.
         handler : Callable[[Any], None]
             The handler for the subscription.
         priority : int
@@ -231,7 +295,7 @@ cdef class MessageBus:
         )
 
         # Get current subscriptions for topic
-        if WILDCARD in topic:
+        if _is_pattern(topic):
             self._subscribe_pattern(sub)
         else:
             self._subscribe_channel(sub)
@@ -251,6 +315,7 @@ cdef class MessageBus:
         subscriptions = sorted(subscriptions, reverse=True)
         self._patterns = np.ascontiguousarray(subscriptions)
         self._patterns_len = len(subscriptions)
+        self._invalidate_pattern(sub.topic)
         self._log.debug(f"Added {sub}.")
 
     cdef void _subscribe_channel(self, Subscription sub) except *:
@@ -263,6 +328,7 @@ cdef class MessageBus:
         subscriptions.append(sub)
         subscriptions = sorted(subscriptions, reverse=True)
         self._channels[sub.topic] = np.ascontiguousarray(subscriptions)
+        self._resolved.pop(sub.topic, None)
         self._log.info(f"Added {sub}.")
 
     cpdef void unsubscribe(self, str topic, handler: Callable[[Any], None]) except *:
@@ -283,7 +349,7 @@ cdef class MessageBus:
         cdef Subscription sub = Subscription(topic=topic, handler=handler)
 
         # Get current subscriptions for topic
-        if WILDCARD in topic:
+        if _is_pattern(topic):
             self._unsubscribe_pattern(sub)
         else:
             self._unsubscribe_channel(sub)
@@ -307,6 +373,7 @@ cdef class MessageBus:
         else:
             self._patterns = np.ascontiguousarray(subscriptions)
             self._patterns_len = len(subscriptions)
+        self._invalidate_pattern(sub.topic)
         self._log.debug(f"Removed {sub}.")
 
     cdef void _unsubscribe_channel(self, Subscription sub) except *:
@@ -318,6 +385,7 @@ cdef class MessageBus:
             return
 
         subscriptions.remove(sub)
+        self._resolved.pop(sub.topic, None)
         self._log.debug(f"Removed {sub}.")
 
         if not subscriptions:
@@ -327,6 +395,32 @@ cdef class MessageBus:
         subscriptions = sorted(subscriptions, reverse=True)
         self._channels[sub.topic] = np.ascontiguousarray(subscriptions)
 
+    cdef void _invalidate_pattern(self, str pattern) except *:
+        # Drop the resolved subscriptions for all topics the pattern matches
+        cdef str topic
+        for topic in [t for t in self._resolved if is_matching(t, pattern)]:
+            del self._resolved[topic]
+
+    cdef Subscription[:] _resolve(self, str topic):
+        cdef list subscriptions = list(self._channels.get(topic, []))
+
+        cdef int i
+        cdef Subscription sub
+        for i in range(self._patterns_len):
+            sub = self._patterns[i]
+            if is_matching(topic, sub.topic):
+                subscriptions.append(sub)
+
+        # Stable sort keeps channel subscriptions ahead of patterns for equal priority
+        subscriptions = sorted(subscriptions, reverse=True)
+
+        if len(self._resolved) >= _RESOLVED_CACHE_MAX:
+            self._resolved.clear()
+
+        cdef Subscription[:] resolved = np.ascontiguousarray(subscriptions, dtype=object)
+        self._resolved[topic] = resolved
+        return resolved
+
     cpdef void publish(self, str topic, msg: Any) except *:
         """
         Publish the given message.
@@ -350,18 +444,15 @@ cdef class MessageBus:
         Condition.not_none(topic, "topic")
         Condition.not_none(msg, "msg")
 
+        cdef Subscription[:] subscriptions = self._resolved.get(topic)
+        if subscriptions is None:
+            subscriptions = self._resolve(topic)
+
+        # Send to channel and matching pattern subscriptions
+        cdef int i
         cdef Subscription sub
-        cdef Subscription[:] subscriptions = self._channels.get(topic)
-        if subscriptions is not None:
-            # Send to channel subscriptions
-            for i in range(len(subscriptions)):
-                sub = subscriptions[i]
-                sub.handler(msg)
-
-        # Check all pattern subscriptions
-        for i in range(self._patterns_len):
-            sub = self._patterns[i]
-            if topic.__contains__(sub.topic):
-                sub.handler(msg)
+        for i in range(len(subscriptions)):
+            sub = subscriptions[i]
+            sub.handler(msg)
 
         self.processed_count += 1
@@ -23,18 +23,20 @@ from nautilus_trader.serialization.base import get_to_dict
 
 _PARQUET_OBJECT_TO_DICT_MAP: Dict[str, object] = {}
 _PARQUET_OBJECT_FROM_DICT_MAP: Dict[str, object] = {}
+_PARQUET_OBJECT_FROM_ARROW_MAP: Dict[str, object] = {}
 _chunk = {}
 _partition_keys = {}
 _schemas = {}
 
 
-def register_parquet(
+def register_parquet(  # noqa: C901
     cls_type,
     serializer: Optional[Callable] = None,
     deserializer: Optional[Callable] = None,
     schema: Optional[pa.Schema] = None,
     partition_keys=None,
     chunk=None,
+    decoder: Optional[Callable] = None,
     **kwargs,
 ):
     """
@@ -48,6 +50,9 @@ def register_parquet(
     :param chunk (bool): Whether to group objects by timestamp and operate together (Used for complex objects where
                          we write each object as multiple rows in parquet, ie OrderBook or AccountState)
     :param partition_key (optional): Optional partition key for data written to parquet (typically an id)
+    :param decoder (callable): Optional callable to decode a `pyarrow.Table` directly into a list of `cls_type`
+                               objects (bypassing pandas and the `deserializer`), called with the table and whether
+                               duplicate rows should be dropped
     """
     assert isinstance(
         cls_type, type
@@ -56,6 +61,7 @@ def register_parquet(
     assert deserializer is None or isinstance(
         deserializer, Callable  # type: ignore
     ), "Deserializer must be callable"
+    assert decoder is None or isinstance(decoder, Callable), "Decoder must be callable"  # type: ignore
     assert schema is None or isinstance(schema, pa.Schema), "partition_keys must be tuple"
     assert partition_keys is None or isinstance(
         partition_keys, tuple
@@ -73,11 +79,17 @@ def register_parquet(
             assert (
                 cls_name not in _PARQUET_OBJECT_FROM_DICT_MAP
             ), f"Deserializer already exists for {cls_name}: {_PARQUET_OBJECT_TO_DICT_MAP[cls_name]}"
+        if decoder is not None:
+            assert (
+                cls_name not in _PARQUET_OBJECT_FROM_ARROW_MAP
+            ), f"Decoder already exists for {cls_name}: {_PARQUET_OBJECT_FROM_ARROW_MAP[cls_name]}"
 
     if serializer is not None:
         _PARQUET_OBJECT_TO_DICT_MAP[cls_name] = serializer
     if deserializer is not None:
         _PARQUET_OBJECT_FROM_DICT_MAP[cls_name] = deserializer
+    if decoder is not None:
+        _PARQUET_OBJECT_FROM_ARROW_MAP[cls_name] = decoder
     if chunk is not None:
         _chunk[cls_name] = chunk
     if partition_keys is not None:
@@ -114,58 +126,84 @@ def _deserialize(cls, chunk):
             return [_PARQUET_OBJECT_FROM_DICT_MAP[name](c) for c in chunk]
     elif get_from_dict(name) is not None:
         return [get_from_dict(name)(c) for c in chunk]
+    elif hasattr(cls, "from_dict"):
+        return [cls.from_dict(c) for c in chunk]
     raise TypeError(
         f"class {name} cannot be deserialized by arrow._deserialize, register a method via `register()`"
     )
 
 
-# TODO (bm) - Implement for IPC / streaming. See https://arrow.apache.org/docs/python/ipc.html
-# @staticmethod
-# def to_arrow(message: bytes):
-#     """
-#     Serialize the given message to `MessagePack` specification bytes.
-#
-#     Parameters
-#     ----------
-#     message : dict
-#         The message to serialize.
-#
-#     Returns
-#     -------
-#     bytes
-#
-#     """
-#     Condition.not_none(message, "message")
-#
-#     batch = pa.record_batch(data, names=['f0', 'f1', 'f2'])
-#
-#     sink = pa.BufferOutputStream()
-#
-#     writer = pa.ipc.new_stream(sink, batch.schema)
-#     return msgpack.packb(message)
-#
-# @staticmethod
-# def from_arrow(message_bytes: bytes):
-#     """
-#     Deserialize the given `MessagePack` specification bytes to a dictionary.
-#
-#     Parameters
-#     ----------
-#     message_bytes : bytes
-#         The message bytes to deserialize.
-#
-#     Returns
-#     -------
-#     dict[str, object]
-#
-#     """
-#     Condition.not_none(message_bytes, "message_bytes")
-#
-#     return msgpack.unpackb(message_bytes)
+def _decode(cls, table: pa.Table, drop_duplicates=True):
+    name = cls.__name__
+    if name in _PARQUET_OBJECT_FROM_ARROW_MAP:
+        return _PARQUET_OBJECT_FROM_ARROW_MAP[name](table, drop_duplicates)
+    df = table.to_pandas()
+    if drop_duplicates:
+        df = df.drop_duplicates()
+    return _deserialize(cls=cls, chunk=df.to_dict("records"))
+
+
+def to_arrow(
+    objs,
+    schema: Optional[pa.Schema] = None,
+    group_column: Optional[str] = None,
+    group_start: int = 0,
+) -> pa.RecordBatch:
+    """
+    Serialize the given objects to a single `pyarrow.RecordBatch`.
+
+    Objects which serialize to multiple rows (i.e. `OrderBookSnapshot`) are
+    flattened, so all objects should share the same storage type.
+
+    :param objs: The objects to serialize
+    :param schema (pa.Schema): Optional schema for the batch, otherwise the registered schema for the type (if any)
+                               or a schema inferred from the data is used
+    :param group_column (str): Optional name of an int64 column holding the index of the object each row belongs to
+                               (offset by `group_start`), so the object boundaries are kept
+    :param group_start (int): The group index of the first object
+    """
+    rows = []
+    groups = []
+    for i, obj in enumerate(objs, start=group_start):
+        data = _serialize(obj)
+        if isinstance(data, list):
+            rows.extend(data)
+            groups.extend([i] * len(data))
+        else:
+            rows.append(data)
+            groups.append(i)
+    assert rows, "Cannot serialize an empty list of objects"
+
+    name = rows[0].get("type", type(objs[0]).__name__)
+    if schema is None:
+        schema = _schemas.get(name)
+    columns = {key: [row.get(key) for row in rows] for key in rows[0]}
+    if group_column is not None:
+        columns[group_column] = pa.array(groups, type=pa.int64())
+    table = pa.Table.from_pydict(columns, schema=schema)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"type": name.encode()})
+    return table.combine_chunks().to_batches()[0]
+
+
+def from_arrow(cls, data, drop_duplicates=False):
+    """
+    Deserialize the given `pyarrow.RecordBatch` or `pyarrow.Table` into a list of `cls` objects.
+
+    :param cls: The type to deserialize into
+    :param data (pa.RecordBatch or pa.Table): The arrow data to deserialize
+    :param drop_duplicates (bool): If duplicate rows should be dropped
+    """
+    if isinstance(data, pa.RecordBatch):
+        data = pa.Table.from_batches([data])
+    if data.num_rows == 0:
+        return []
+    return _decode(cls, data, drop_duplicates=drop_duplicates)
 
 
 # Default nautilus implementations
+from nautilus_trader.serialization.arrow.decoders import decoders_register
 from nautilus_trader.serialization.arrow.implementations.order_book import order_book_register
 
 
 order_book_register(func=register_parquet)
+decoders_register(func=register_parquet)
@@ -0,0 +1,439 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+"""
+Decoders which build Nautilus objects directly from the columns of Arrow record
+batches, without intermediate pandas frames or per row dictionaries.
+
+Repeated string values (i.e. instrument IDs, prices and enums) are dictionary
+encoded and parsed only once per batch.
+"""
+
+import numpy as np
+import pyarrow as pa
+
+from libc.stdint cimport int64_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSide
+from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSideParser
+from nautilus_trader.model.c_enums.book_level cimport BookLevel
+from nautilus_trader.model.c_enums.book_level cimport BookLevelParser
+from nautilus_trader.model.c_enums.delta_type cimport DeltaType
+from nautilus_trader.model.c_enums.delta_type cimport DeltaTypeParser
+from nautilus_trader.model.c_enums.instrument_status cimport InstrumentStatus
+from nautilus_trader.model.c_enums.instrument_status cimport InstrumentStatusParser
+from nautilus_trader.model.c_enums.order_side cimport OrderSide
+from nautilus_trader.model.c_enums.order_side cimport OrderSideParser
+from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport TradeTick
+from nautilus_trader.model.data.venue cimport InstrumentStatusUpdate
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
+from nautilus_trader.model.orderbook.data cimport Order
+from nautilus_trader.model.orderbook.data cimport OrderBookData
+from nautilus_trader.model.orderbook.data cimport OrderBookDelta
+from nautilus_trader.model.orderbook.data cimport OrderBookDeltas
+from nautilus_trader.model.orderbook.data cimport OrderBookSnapshot
+
+
+# Column holding the index of the recorded object each row belongs to
+cdef str _GROUP_COLUMN = "group_id"
+
+
+cdef class _DuplicateFilter:
+    """
+    Detects objects which are equal to an earlier object with the same timestamp.
+
+    Objects with equal timestamps must be adjacent (i.e. in timestamp order), so
+    only the current timestamp is held (across record batches). Keys are only
+    built once a timestamp repeats.
+    """
+
+    cdef object _key
+    cdef bint _started
+    cdef int64_t _ts
+    cdef object _first
+    cdef set _seen
+
+    def __init__(self, key not None):
+        self._key = key
+        self._started = False
+        self._ts = 0
+        self._first = None
+        self._seen = None
+
+    cdef bint is_duplicate(self, int64_t ts, obj) except *:
+        if not self._started or ts != self._ts:
+            self._started = True
+            self._ts = ts
+            self._first = obj
+            self._seen = None
+            return False
+        if self._seen is None:
+            self._seen = {self._key(self._first)}
+        key = self._key(obj)
+        if key in self._seen:
+            return True
+        self._seen.add(key)
+        return False
+
+
+def _trade_tick_key(TradeTick tick):
+    return (
+        tick.instrument_id,
+        tick.price,
+        tick.size,
+        tick.aggressor_side,
+        tick.match_id,
+        tick.ts_recv_ns,
+    )
+
+
+def _quote_tick_key(QuoteTick tick):
+    return (
+        tick.instrument_id,
+        tick.bid,
+        tick.ask,
+        tick.bid_size,
+        tick.ask_size,
+        tick.ts_recv_ns,
+    )
+
+
+def _instrument_status_update_key(InstrumentStatusUpdate update):
+    return update.instrument_id, update.status, update.ts_recv_ns
+
+
+def _order_book_delta_key(OrderBookDelta delta):
+    return (
+        delta.instrument_id,
+        delta.level,
+        delta.type,
+        None if delta.order is None else (
+            delta.order.price,
+            delta.order.size,
+            delta.order.side,
+            delta.order.id,
+        ),
+        delta.ts_recv_ns,
+    )
+
+
+cdef object _column(batch, str name):
+    return batch.column(batch.schema.get_field_index(name))
+
+
+cdef list _resolve(batch, str name, parser):
+    # Return the row values of the column, parsing each distinct value once
+    cdef object array = _column(batch, name)
+    if not pa.types.is_dictionary(array.type):
+        array = array.dictionary_encode()
+
+    cdef list dictionary = [parser(value) for value in array.dictionary.to_pylist()]
+    cdef object indices = array.indices
+    if indices.null_count > 0:
+        return [None if code is None else dictionary[code] for code in indices.to_pylist()]
+
+    cdef const int64_t[:] codes = np.asarray(indices.to_numpy(), dtype=np.int64)
+    cdef Py_ssize_t n = codes.shape[0]
+    cdef list values = [None] * n
+    cdef Py_ssize_t i
+    for i in range(n):
+        values[i] = dictionary[codes[i]]
+    return values
+
+
+cdef list _values(batch, str name):
+    return _column(batch, name).to_pylist()
+
+
+cdef const int64_t[:] _int64s(batch, str name):
+    return np.asarray(_column(batch, name).to_numpy(zero_copy_only=False), dtype=np.int64)
+
+
+cdef const double[:] _doubles(batch, str name):
+    return np.asarray(_column(batch, name).to_numpy(zero_copy_only=False), dtype=np.float64)
+
+
+cpdef list decode_trade_ticks(table, bint drop_duplicates=True):
+    """
+    Decode the given table into trade ticks.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        The table to decode (with the `TradeTick` parquet columns).
+    drop_duplicates : bool
+        If rows equal to an earlier row with the same `ts_event_ns` should be
+        dropped (rows with equal timestamps must be adjacent, i.e. sorted).
+
+    Returns
+    -------
+    list[TradeTick]
+
+    """
+    Condition.not_none(table, "table")
+
+    cdef _DuplicateFilter duplicates = _DuplicateFilter(_trade_tick_key)
+    cdef list ticks = []
+    cdef list instrument_ids, prices, sizes, sides, match_ids
+    cdef TradeTick tick
+    cdef const int64_t[:] ts_events
+    cdef const int64_t[:] ts_recvs
+    cdef Py_ssize_t i
+    for batch in table.to_batches():
+        instrument_ids = _resolve(batch, "instrument_id", InstrumentId.from_str)
+        prices = _resolve(batch, "price", Price.from_str)
+        sizes = _resolve(batch, "size", Quantity.from_str)
+        sides = _resolve(batch, "aggressor_side", AggressorSideParser.from_str_py)
+        match_ids = _values(batch, "match_id")
+        ts_events = _int64s(batch, "ts_event_ns")
+        ts_recvs = _int64s(batch, "ts_recv_ns")
+        for i in range(batch.num_rows):
+            tick = TradeTick(
+                instrument_ids[i],
+                prices[i],
+                sizes[i],
+                <AggressorSide>sides[i],
+                match_ids[i],
+                ts_events[i],
+                ts_recvs[i],
+            )
+            if drop_duplicates and duplicates.is_duplicate(tick.ts_event_ns, tick):
+                continue
+            ticks.append(tick)
+    return ticks
+
+
+cpdef list decode_quote_ticks(table, bint drop_duplicates=True):
+    """
+    Decode the given table into quote ticks.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        The table to decode (with the `QuoteTick` parquet columns).
+    drop_duplicates : bool
+        If rows equal to an earlier row with the same `ts_event_ns` should be
+        dropped (rows with equal timestamps must be adjacent, i.e. sorted).
+
+    Returns
+    -------
+    list[QuoteTick]
+
+    """
+    Condition.not_none(table, "table")
+
+    cdef _DuplicateFilter duplicates = _DuplicateFilter(_quote_tick_key)
+    cdef list ticks = []
+    cdef list instrument_ids, bids, asks, bid_sizes, ask_sizes
+    cdef QuoteTick tick
+    cdef const int64_t[:] ts_events
+    cdef const int64_t[:] ts_recvs
+    cdef Py_ssize_t i
+    for batch in table.to_batches():
+        instrument_ids = _resolve(batch, "instrument_id", InstrumentId.from_str)
+        bids = _resolve(batch, "bid", Price.from_str)
+        asks = _resolve(batch, "ask", Price.from_str)
+        bid_sizes = _resolve(batch, "bid_size", Quantity.from_str)
+        ask_sizes = _resolve(batch, "ask_size", Quantity.from_str)
+        ts_events = _int64s(batch, "ts_event_ns")
+        ts_recvs = _int64s(batch, "ts_recv_ns")
+        for i in range(batch.num_rows):
+            tick = QuoteTick(
+                instrument_ids[i],
+                bids[i],
+                asks[i],
+                bid_sizes[i],
+                ask_sizes[i],
+                ts_events[i],
+                ts_recvs[i],
+            )
+            if drop_duplicates and duplicates.is_duplicate(tick.ts_event_ns, tick):
+                continue
+            ticks.append(tick)
+    return ticks
+
+
+cpdef list decode_instrument_status_updates(table, bint drop_duplicates=True):
+    """
+    Decode the given table into instrument status updates.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        The table to decode (with the `InstrumentStatusUpdate` parquet columns).
+    drop_duplicates : bool
+        If rows equal to an earlier row with the same `ts_event_ns` should be
+        dropped (rows with equal timestamps must be adjacent, i.e. sorted).
+
+    Returns
+    -------
+    list[InstrumentStatusUpdate]
+
+    """
+    Condition.not_none(table, "table")
+
+    cdef _DuplicateFilter duplicates = _DuplicateFilter(_instrument_status_update_key)
+    cdef list updates = []
+    cdef list instrument_ids, statuses
+    cdef InstrumentStatusUpdate update
+    cdef const int64_t[:] ts_events
+    cdef const int64_t[:] ts_recvs
+    cdef Py_ssize_t i
+    for batch in table.to_batches():
+        instrument_ids = _resolve(batch, "instrument_id", InstrumentId.from_str)
+        statuses = _resolve(batch, "status", InstrumentStatusParser.from_str_py)
+        ts_events = _int64s(batch, "ts_event_ns")
+        ts_recvs = _int64s(batch, "ts_recv_ns")
+        for i in range(batch.num_rows):
+            update = InstrumentStatusUpdate(
+                instrument_ids[i],
+                <InstrumentStatus>statuses[i],
+                ts_events[i],
+                ts_recvs[i],
+            )
+            if drop_duplicates and duplicates.is_duplicate(update.ts_event_ns, update):
+                continue
+            updates.append(update)
+    return updates
+
+
+cpdef list decode_order_book_data(table, bint drop_duplicates=True):
+    """
+    Decode the given table into order book data.
+
+    Rows are grouped by the `group_id` column written by an
+    `ArrowStreamRecorder` (if present), otherwise by `instrument_id` and
+    `ts_event_ns`. A group starting with a `CLEAR` followed by an `ADD` is
+    decoded as an `OrderBookSnapshot`, any other group of several rows as
+    `OrderBookDeltas`, and a single row as an `OrderBookDelta`.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        The table to decode (with the `OrderBookData` parquet columns).
+    drop_duplicates : bool
+        If rows equal to an earlier row with the same `ts_event_ns` should be
+        dropped (rows with equal timestamps must be adjacent, i.e. sorted).
+
+    Returns
+    -------
+    list[OrderBookData]
+
+    """
+    Condition.not_none(table, "table")
+
+    cdef _DuplicateFilter duplicates = _DuplicateFilter(_order_book_delta_key)
+    cdef list results = []
+    cdef list group = []
+    cdef list instrument_ids, levels, delta_types, sides, order_ids
+    cdef const double[:] prices
+    cdef const double[:] sizes
+    cdef const int64_t[:] ts_events
+    cdef const int64_t[:] ts_recvs
+    cdef const int64_t[:] group_ids = None
+    cdef bint grouped = _GROUP_COLUMN in table.column_names
+    cdef object group_key = None
+    cdef object key
+    cdef DeltaType delta_type
+    cdef Order order
+    cdef OrderBookDelta delta
+    cdef Py_ssize_t i
+    for batch in table.to_batches():
+        instrument_ids = _resolve(batch, "instrument_id", InstrumentId.from_str)
+        levels = _resolve(batch, "level", BookLevelParser.from_str_py)
+        delta_types = _resolve(batch, "delta_type", DeltaTypeParser.from_str_py)
+        sides = _resolve(batch, "order_side", OrderSideParser.from_str_py)
+        order_ids = _values(batch, "order_id")
+        prices = _doubles(batch, "order_price")
+        sizes = _doubles(batch, "order_size")
+        ts_events = _int64s(batch, "ts_event_ns")
+        ts_recvs = _int64s(batch, "ts_recv_ns")
+        if grouped:
+            group_ids = _int64s(batch, _GROUP_COLUMN)
+        for i in range(batch.num_rows):
+            delta_type = <DeltaType>delta_types[i]
+            if delta_type == DeltaType.CLEAR:
+                order = None
+            else:
+                order = Order(prices[i], sizes[i], <OrderSide>sides[i], order_ids[i])
+            delta = OrderBookDelta(
+                instrument_ids[i],
+                <BookLevel>levels[i],
+                delta_type,
+                order,
+                ts_events[i],
+                ts_recvs[i],
+            )
+            if drop_duplicates and duplicates.is_duplicate(delta.ts_event_ns, delta):
+                continue
+            if grouped:
+                key = group_ids[i]
+            else:
+                key = (delta.instrument_id, delta.ts_event_ns)
+            if group and key != group_key:
+                results.append(_build_order_book_data(group))
+                group = []
+            group_key = key
+            group.append(delta)
+    if group:
+        results.append(_build_order_book_data(group))
+    return results
+
+
+cdef OrderBookData _build_order_book_data(list group):
+    cdef OrderBookDelta first = group[0]
+    if len(group) == 1:
+        return first
+
+    cdef OrderBookDelta second = group[1]
+    cdef OrderBookDelta delta
+    if first.type == DeltaType.CLEAR and second.type == DeltaType.ADD:
+        # First value is a CLEAR message, which we ignore
+        return OrderBookSnapshot(
+            instrument_id=second.instrument_id,
+            level=second.level,
+            bids=[
+                (delta.order.price, delta.order.size)
+                for delta in group[1:]
+                if delta.order is not None and delta.order.side == OrderSide.BUY
+            ],
+            asks=[
+                (delta.order.price, delta.order.size)
+                for delta in group[1:]
+                if delta.order is not None and delta.order.side == OrderSide.SELL
+            ],
+            ts_event_ns=second.ts_event_ns,
+            ts_recv_ns=second.ts_recv_ns,
+        )
+
+    return OrderBookDeltas(
+        instrument_id=first.instrument_id,
+        level=first.level,
+        deltas=group,
+        ts_event_ns=first.ts_event_ns,
+        ts_recv_ns=first.ts_recv_ns,
+    )
+
+
+def decoders_register(func):
+    func(TradeTick, decoder=decode_trade_ticks)
+    func(QuoteTick, decoder=decode_quote_ticks)
+    func(InstrumentStatusUpdate, decoder=decode_instrument_status_updates)
+    for cls in OrderBookData.__subclasses__():
+        func(cls, decoder=decode_order_book_data)
@@ -0,0 +1,509 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from collections import defaultdict
+import heapq
+import itertools
+import pathlib
+import queue
+import re
+import threading
+from typing import Dict, List
+import uuid
+import warnings
+
+import fsspec
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from nautilus_trader.model.data.bar import Bar
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.data.venue import InstrumentStatusUpdate
+from nautilus_trader.model.data.venue import VenueStatusUpdate
+from nautilus_trader.model.instruments.base import Instrument
+from nautilus_trader.model.orderbook.data import OrderBookDelta
+from nautilus_trader.model.orderbook.data import OrderBookDeltas
+from nautilus_trader.model.orderbook.data import OrderBookSnapshot
+from nautilus_trader.serialization.arrow.core import from_arrow
+from nautilus_trader.serialization.arrow.core import to_arrow
+
+
+STREAM_FILE_SUFFIX = ".arrow"
+
+# Objects stored as rows of another type
+_STORAGE_TYPES = {OrderBookDeltas: OrderBookDelta, OrderBookSnapshot: OrderBookDelta}
+
+# Column holding the index of the recorded object each row belongs to
+_GROUP_COLUMN = "group_id"
+
+_GROUPED_TYPES = {cls.__name__ for cls in _STORAGE_TYPES.values()}
+
+_DEFAULT_TYPES = (
+    QuoteTick,
+    TradeTick,
+    Bar,
+    OrderBookDelta,
+    InstrumentStatusUpdate,
+    VenueStatusUpdate,
+)
+
+
+def _snake_case(s):
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", s).lower()
+
+
+class _StreamFile:
+    def __init__(self, fs, path, schema, ts_start_ns):
+        self.path = path
+        self.schema = schema
+        self.ts_start_ns = ts_start_ns
+        self.sink = fs.open(path, "wb")
+        self.writer = pa.ipc.new_stream(self.sink, schema)
+
+    def write(self, batch: pa.RecordBatch):
+        self.writer.write_batch(batch)
+        self.sink.flush()
+
+    @property
+    def size(self):
+        return self.sink.tell()
+
+    def close(self):
+        self.writer.close()
+        self.sink.close()
+
+
+class ArrowStreamRecorder:
+    """
+    Provides a recorder which appends data to Arrow IPC stream files.
+
+    Data is buffered per type and written as record batches, to one directory
+    per type under `path`. Objects stored as several rows (i.e. order book
+    deltas and snapshots) are numbered in a `group_id` column, so each object
+    is decoded separately. Files are rotated once they reach `rotate_bytes`,
+    or span more than `rotate_interval_ns` of data (by `ts_recv_ns`). Every
+    written batch is flushed, so a crash loses at most the buffered data.
+
+    Batches are serialized and written on a background thread, keeping I/O off
+    the calling (i.e. data engine) thread. A batch which cannot be written is
+    dropped with a warning.
+
+    The recorder is typically added to a `TradingNode` with
+    `TradingNode.add_data_recorder`, and the files replayed into a
+    `BacktestEngine` with an `ArrowStreamReader`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fs_protocol: str = "file",
+        batch_size: int = 1000,
+        flush_interval_ns: int = 1_000_000_000,
+        rotate_bytes: int = 64 * 1024 ** 2,
+        rotate_interval_ns: int = 3600 * 1_000_000_000,
+        types=None,
+        timeout_secs: float = 5.0,
+    ):
+        """
+        Initialize a new instance of the ``ArrowStreamRecorder`` class.
+
+        Parameters
+        ----------
+        path : str
+            The root directory to write the stream files to.
+        fs_protocol : str
+            The fsspec filesystem protocol.
+        batch_size : int
+            The number of objects (per type) to buffer before writing a batch.
+        flush_interval_ns : int
+            The maximum span of buffered data (by `ts_recv_ns`) before writing a batch.
+        rotate_bytes : int
+            The file size after which a new file is started.
+        rotate_interval_ns : int
+            The maximum span of data in a file (by `ts_recv_ns`) before a new file is started.
+        types : tuple[type], optional
+            The data types to record, if None then all serializable data is recorded.
+        timeout_secs : float
+            The maximum time to wait for the background thread on flush or close.
+
+        """
+        assert batch_size > 0, "batch_size must be positive"
+        assert rotate_bytes > 0, "rotate_bytes must be positive"
+        assert timeout_secs > 0, "timeout_secs must be positive"
+        self.fs = fsspec.filesystem(fs_protocol)
+        self.path = pathlib.Path(path)
+        self.batch_size = batch_size
+        self.flush_interval_ns = flush_interval_ns
+        self.rotate_bytes = rotate_bytes
+        self.rotate_interval_ns = rotate_interval_ns
+        self.types = tuple(types) if types is not None else None
+        self.timeout_secs = timeout_secs
+
+        self._buffers: Dict[str, List] = defaultdict(list)
+        self._groups: Dict[str, int] = defaultdict(int)
+        self._files: Dict[str, _StreamFile] = {}
+        self._unsupported = set()
+        self._closed = False
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"{type(self).__name__}-{path}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def write(self, data) -> None:
+        """
+        Buffer the given data for writing.
+
+        Parameters
+        ----------
+        data : Data
+            The data to record.
+
+        """
+        if self._closed or (self.types is not None and not isinstance(data, self.types)):
+            return
+
+        cls = _STORAGE_TYPES.get(type(data), type(data))
+        name = cls.__name__
+        if name in self._unsupported:
+            return
+
+        buffer = self._buffers[name]
+        buffer.append(data)
+        if (
+            len(buffer) >= self.batch_size
+            or buffer[-1].ts_recv_ns - buffer[0].ts_recv_ns >= self.flush_interval_ns
+        ):
+            self._submit_buffer(name)
+
+    def flush(self) -> None:
+        """
+        Write all buffered data.
+
+        Blocks until the data has been written, or the timeout elapses.
+        """
+        if self._closed or not self._thread.is_alive():
+            return
+        for name in list(self._buffers):
+            self._submit_buffer(name)
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        flushed.wait(self.timeout_secs)
+
+    def close(self) -> None:
+        """
+        Write all buffered data and close the open files.
+
+        Blocks until the files are closed, or the timeout elapses.
+        """
+        if self._closed:
+            return
+        for name in list(self._buffers):
+            self._submit_buffer(name)
+        self._closed = True
+        self._queue.put(None)  # Sentinel
+        self._thread.join(self.timeout_secs)
+
+    def files(self) -> List[str]:
+        """
+        Return the paths of the files currently being written.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        return [file.path for file in list(self._files.values())]
+
+    def _submit_buffer(self, name):
+        objs = self._buffers.pop(name, None)
+        if objs:
+            self._queue.put((name, objs))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:  # Sentinel
+                break
+            elif isinstance(item, tuple):
+                name, objs = item
+                try:
+                    self._write_batch(name, objs)
+                except Exception as ex:
+                    warnings.warn(f"Cannot record {len(objs)} {name} objects, {ex!r}")
+            else:  # Flush request
+                item.set()
+
+        for name in list(self._files):
+            try:
+                self._close_file(name)
+            except Exception as ex:
+                warnings.warn(f"Cannot close {name} stream file, {ex!r}")
+
+    def _write_batch(self, name, objs):
+        file = self._files.get(name)
+        kw = {}
+        if name in _GROUPED_TYPES:
+            kw = {"group_column": _GROUP_COLUMN, "group_start": self._groups[name]}
+            self._groups[name] += len(objs)
+        try:
+            batch = to_arrow(objs, schema=file.schema if file is not None else None, **kw)
+        except (TypeError, pa.ArrowInvalid, pa.ArrowTypeError):
+            if file is None:
+                self._warn_unsupported(name, objs[0])
+                return
+            # Schema differs from the current file (i.e. columns first seen as null)
+            batch = to_arrow(objs, **kw)
+            self._close_file(name)
+            file = None
+
+        ts_start_ns = objs[0].ts_recv_ns
+        if file is not None and (
+            file.size >= self.rotate_bytes
+            or ts_start_ns - file.ts_start_ns >= self.rotate_interval_ns
+        ):
+            self._close_file(name)
+            file = None
+
+        if file is None:
+            file = self._open_file(name, batch.schema, ts_start_ns)
+        file.write(batch)
+
+    def _open_file(self, name, schema, ts_start_ns):
+        directory = self.path.joinpath(_snake_case(name))
+        self.fs.mkdirs(str(directory), exist_ok=True)
+        path = str(directory.joinpath(f"{ts_start_ns:020d}-{uuid.uuid4().hex[:8]}{STREAM_FILE_SUFFIX}"))
+        file = _StreamFile(fs=self.fs, path=path, schema=schema, ts_start_ns=ts_start_ns)
+        self._files[name] = file
+        return file
+
+    def _close_file(self, name):
+        file = self._files.pop(name, None)
+        if file is not None:
+            file.close()
+
+    def _warn_unsupported(self, name, obj):
+        self._unsupported.add(name)
+        warnings.warn(f"Cannot record data of type {type(obj)}, no arrow serialization registered")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={self.path})"
+
+
+class ArrowStreamReader:
+    """
+    Provides a reader for Arrow IPC stream files written by an
+    `ArrowStreamRecorder`.
+
+    Local files are memory-mapped, so record batches are read without copying.
+    A truncated final message (i.e. from a crashed process) is ignored.
+
+    The reader is a re-iterable, time ordered stream of the recorded data
+    (excluding instruments), which can be added to a `BacktestEngine` with
+    `setup_engine` or `BacktestEngine.add_data_stream`.
+    """
+
+    def __init__(self, path: str, fs_protocol: str = "file", types=None):
+        """
+        Initialize a new instance of the ``ArrowStreamReader`` class.
+
+        Parameters
+        ----------
+        path : str
+            The root directory of the stream files.
+        fs_protocol : str
+            The fsspec filesystem protocol.
+        types : tuple[type], optional
+            Additional data types which may have been recorded.
+
+        """
+        self.fs = fsspec.filesystem(fs_protocol)
+        self.fs_protocol = fs_protocol
+        self.path = pathlib.Path(path)
+        self._types = {
+            cls.__name__: cls
+            for cls in itertools.chain(_DEFAULT_TYPES, Instrument.__subclasses__(), types or ())
+        }
+        self._bounds = None
+
+    @property
+    def min_timestamp_ns(self):
+        return self._get_bounds()[0]
+
+    @property
+    def max_timestamp_ns(self):
+        return self._get_bounds()[1]
+
+    def types(self) -> List[type]:
+        """
+        Return the recorded data types.
+
+        Returns
+        -------
+        list[type]
+
+        """
+        names = {_snake_case(name): cls for name, cls in self._types.items()}
+        if not self.fs.exists(str(self.path)):
+            return []
+        result = []
+        for directory in sorted(self.fs.ls(str(self.path), detail=False)):
+            cls = names.get(pathlib.Path(directory).name)
+            if cls is not None:
+                result.append(cls)
+        return result
+
+    def files(self, cls) -> List[str]:
+        """
+        Return the stream files for the given type, in time order.
+
+        Parameters
+        ----------
+        cls : type
+            The data type.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        pattern = str(self.path.joinpath(_snake_case(cls.__name__), f"*{STREAM_FILE_SUFFIX}"))
+        return sorted(self.fs.glob(pattern))
+
+    def batches(self, cls):
+        """
+        Return a generator of the record batches for the given type.
+
+        Parameters
+        ----------
+        cls : type
+            The data type.
+
+        Returns
+        -------
+        Generator[pa.RecordBatch]
+
+        """
+        for fn in self.files(cls):
+            yield from self._read_file(fn)
+
+    def read(self, cls) -> List:
+        """
+        Read all recorded objects of the given type.
+
+        Parameters
+        ----------
+        cls : type
+            The data type.
+
+        Returns
+        -------
+        list[Data]
+
+        """
+        return list(self._iter_objects(cls))
+
+    def instruments(self) -> List[Instrument]:
+        """
+        Read the latest recorded version of each instrument.
+
+        Returns
+        -------
+        list[Instrument]
+
+        """
+        instruments = {}
+        for cls in self.types():
+            if not issubclass(cls, Instrument):
+                continue
+            for batch in self.batches(cls):
+                table = pa.Table.from_batches([batch])
+                if "type" in table.column_names:
+                    table = table.drop(["type"])
+                for instrument in from_arrow(cls, table):
+                    instruments[instrument.id] = instrument
+        return list(instruments.values())
+
+    def setup_engine(self, engine):
+        """
+        Add the recorded instruments and data stream to the given backtest engine.
+
+        Parameters
+        ----------
+        engine : BacktestEngine
+            The backtest engine to load data into.
+
+        Returns
+        -------
+        BacktestEngine
+
+        """
+        for instrument in self.instruments():
+            engine.add_instrument(instrument)
+        engine.add_data_stream(self)
+        return engine
+
+    def __iter__(self):
+        streams = [
+            self._iter_objects(cls) for cls in self.types() if not issubclass(cls, Instrument)
+        ]
+        yield from heapq.merge(*streams, key=lambda x: x.ts_recv_ns)
+
+    def _iter_objects(self, cls):
+        for batch in self.batches(cls):
+            yield from from_arrow(cls, batch)
+
+    def _read_file(self, fn):
+        if self.fs_protocol == "file":
+            source = pa.memory_map(fn, "r")
+        else:
+            source = self.fs.open(fn, "rb")
+        try:
+            try:
+                reader = pa.ipc.open_stream(source)
+            except (pa.ArrowInvalid, OSError):
+                return  # Empty or truncated schema message
+            while True:
+                try:
+                    batch = reader.read_next_batch()
+                except StopIteration:
+                    break
+                except (pa.ArrowInvalid, OSError):
+                    break  # Truncated final message
+                yield batch
+        finally:
+            source.close()
+
+    def _get_bounds(self):
+        if self._bounds is None:
+            ts_min, ts_max = None, None
+            for cls in self.types():
+                if issubclass(cls, Instrument):
+                    continue
+                for batch in self.batches(cls):
+                    if batch.num_rows == 0:
+                        continue
+                    result = pc.min_max(batch.column(batch.schema.get_field_index("ts_recv_ns")))
+                    batch_min, batch_max = result["min"].as_py(), result["max"].as_py()
+                    ts_min = batch_min if ts_min is None else min(ts_min, batch_min)
+                    ts_max = batch_max if ts_max is None else max(ts_max, batch_max)
+            self._bounds = (ts_min, ts_max)
+        return self._bounds
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={self.path})"
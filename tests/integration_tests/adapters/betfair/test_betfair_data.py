@@ -24,7 +24,7 @@ import pytest
 from nautilus_trader.adapters.betfair.common import BETFAIR_VENUE
 from nautilus_trader.adapters.betfair.data import BetfairMarketStreamClient
 from nautilus_trader.adapters.betfair.data import InstrumentSearch
-from nautilus_trader.adapters.betfair.data import on_market_update
+from nautilus_trader.adapters.betfair.parsing import on_market_update
 from nautilus_trader.core.type import DataType
 from nautilus_trader.model.data.tick import TradeTick
 from nautilus_trader.model.data.venue import InstrumentClosePrice
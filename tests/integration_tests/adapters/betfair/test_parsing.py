@@ -13,11 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.adapters.betfair.parsing import BetfairMarketStreamParser
 from nautilus_trader.adapters.betfair.parsing import betfair_account_to_account_state
 from nautilus_trader.adapters.betfair.parsing import build_market_update_messages
 from nautilus_trader.adapters.betfair.parsing import order_cancel_to_betfair
 from nautilus_trader.adapters.betfair.parsing import order_submit_to_betfair
 from nautilus_trader.adapters.betfair.parsing import order_update_to_betfair
+from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
 from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.data.tick import TradeTick
 from nautilus_trader.model.enums import AccountType
@@ -28,6 +30,7 @@ from nautilus_trader.model.identifiers import VenueOrderId
 from nautilus_trader.model.objects import AccountBalance
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.orderbook.data import OrderBookDeltas
+from tests.integration_tests.adapters.betfair.test_kit import BetfairDataProvider
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 
 
@@ -138,3 +141,72 @@ def test__merge_order_book_deltas(provider):
     assert isinstance(updates[0], TradeTick)
     assert isinstance(updates[1], OrderBookDeltas)
     assert len(updates[1].deltas) == 2
+
+
+def test_stream_parser_skips_runners_without_changes(provider):
+    provider.load_all()
+    parser = BetfairMarketStreamParser(provider)
+    raw = {
+        "op": "mcm",
+        "clk": "792361654",
+        "pt": 1577575379148,
+        "mc": [
+            {
+                "id": "1.179082386",
+                "rc": [
+                    {"ltp": 3.15, "id": 50214},
+                    {"atl": [[3.15, 3.68]], "id": 50214},
+                    {"id": 50214},
+                ],
+                "con": True,
+                "img": False,
+            }
+        ],
+    }
+    updates = parser.parse(raw)
+    assert len(updates) == 1
+    assert isinstance(updates[0], OrderBookDeltas)
+    assert len(updates[0].deltas) == 1
+
+
+def test_stream_parser_merges_deltas_per_instrument_across_messages(provider):
+    provider.load_all()
+    parser = BetfairMarketStreamParser(provider)
+    raw = {
+        "op": "mcm",
+        "clk": "792361654",
+        "pt": 1577575379148,
+        "mc": [
+            {
+                "id": "1.179082386",
+                "rc": [
+                    {"atl": [[3.15, 3.68], [3.2, 1.0]], "id": 50214},
+                    {"atb": [[3.1, 0]], "id": 50214},
+                ],
+                "con": True,
+                "img": False,
+            }
+        ],
+    }
+
+    first = parser.parse(raw)
+    second = parser.parse(raw)
+
+    assert len(first) == 1 and len(second) == 1
+    assert len(first[0].deltas) == 3
+    assert first[0].deltas is not second[0].deltas  # Batch reused, deltas not shared
+    assert [d.order.price for d in first[0].deltas] == [d.order.price for d in second[0].deltas]
+
+
+def test_stream_parser_replay_matches_instrument_lookup():
+    instruments = BetfairDataProvider.raw_market_updates_instruments()
+    provider = BetfairInstrumentProvider.from_instruments(instruments)
+    parser = BetfairMarketStreamParser(provider)
+
+    updates = [msg for raw in BetfairDataProvider.raw_market_updates() for msg in parser.parse(raw)]
+
+    instrument_ids = {instrument.id for instrument in instruments}
+    deltas = [u for u in updates if isinstance(u, OrderBookDeltas)]
+    assert deltas
+    assert all(u.instrument_id in instrument_ids for u in deltas)
+    assert len({u.instrument_id for u in deltas}) == len(instruments)
@@ -32,6 +32,7 @@ from nautilus_trader.model.data.bar import BarSpecification
 from nautilus_trader.model.data.bar import BarType
 from nautilus_trader.model.data.tick import TradeTick
 from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import BookLevel
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import InstrumentId
@@ -263,6 +264,89 @@ class TestCCXTDataClient:
         self.data_engine.stop()
         await self.data_engine.get_run_queue_task()
 
+    @pytest.mark.asyncio
+    async def test_subscribe_order_book_and_quote_ticks_share_one_stream(self):
+        # Arrange
+        self.data_engine.start()  # Also starts client
+        await asyncio.sleep(0.3)  # Allow engine message queue to start
+
+        # Act
+        self.client.subscribe_order_book(ETHUSDT, level=BookLevel.L2)
+        self.client.subscribe_quote_ticks(ETHUSDT)
+        await asyncio.sleep(0.3)
+
+        # Assert
+        stats = self.client.stream_stats
+        assert list(stats.keys()) == ["OrderBook-ETH/USDT"]
+        assert stats["OrderBook-ETH/USDT"].message_count == 1
+        assert stats["OrderBook-ETH/USDT"].emitted_count == 2  # Snapshot and quote
+        assert self.data_engine.cache.has_quote_ticks(ETHUSDT)
+
+        # Tear Down
+        self.data_engine.stop()
+        await self.data_engine.get_run_queue_task()
+
+    @pytest.mark.asyncio
+    async def test_subscribe_trade_ticks_tracks_stream_stats(self):
+        # Arrange
+        self.data_engine.start()  # Also starts client
+        await asyncio.sleep(0.3)  # Allow engine message queue to start
+
+        # Act
+        self.client.subscribe_trade_ticks(ETHUSDT)
+        await asyncio.sleep(0.3)
+
+        # Assert
+        stats = self.client.stream_stats["TradeTick-ETH/USDT"]
+        assert stats.message_count == 1
+        assert stats.emitted_count == 1
+        assert stats.error_count == 0
+
+        # Tear Down
+        self.data_engine.stop()
+        await self.data_engine.get_run_queue_task()
+
+    @pytest.mark.asyncio
+    async def test_subscribe_quote_ticks_when_exchange_supports_multiple_symbols_multiplexes(self):
+        # Arrange
+        with open(TEST_PATH + "watch_order_book.json") as response:
+            order_book = json.load(response)
+
+        calls = []
+
+        async def watch_order_book_for_symbols(symbols):
+            calls.append(symbols)
+            await asyncio.sleep(0.01)
+            return {**order_book, "symbol": symbols[len(calls) % len(symbols)]}
+
+        self.mock_ccxt.has = {"watchOrderBookForSymbols": True}
+        self.mock_ccxt.watch_order_book_for_symbols = watch_order_book_for_symbols
+
+        client = CCXTDataClient(
+            client=self.mock_ccxt,
+            engine=self.data_engine,
+            clock=self.clock,
+            logger=self.logger,
+        )
+        client.connect()
+        await asyncio.sleep(0.3)  # Allow instruments to load
+
+        # Act
+        client.subscribe_quote_ticks(BTCUSDT)
+        client.subscribe_quote_ticks(ETHUSDT)
+        await asyncio.sleep(0.3)
+
+        # Assert
+        stats = client.stream_stats
+        assert list(stats.keys()) == ["OrderBook-*"]
+        assert stats["OrderBook-*"].message_count > 2
+        assert stats["OrderBook-*"].emitted_count == 2  # Top of book unchanged after first quotes
+        assert all(symbols == ["BTC/USDT", "ETH/USDT"] for symbols in calls)
+
+        # Tear Down
+        client.disconnect()
+        await asyncio.sleep(0.1)
+
     @pytest.mark.asyncio
     async def test_subscribe_bars(self):
         # Arrange
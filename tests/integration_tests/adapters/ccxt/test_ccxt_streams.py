@@ -0,0 +1,103 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.adapters.ccxt.streams import StreamStats
+from nautilus_trader.adapters.ccxt.streams import TopOfBook
+
+
+class TestStreamStats:
+    def test_instantiate_stream_stats(self):
+        # Arrange
+        # Act
+        stats = StreamStats("OrderBook-ETH/USDT")
+
+        # Assert
+        assert stats.name == "OrderBook-ETH/USDT"
+        assert stats.message_count == 0
+        assert stats.emitted_count == 0
+        assert stats.error_count == 0
+        assert stats.avg_latency_ns() == 0.0
+        assert stats.to_dict() == {
+            "name": "OrderBook-ETH/USDT",
+            "message_count": 0,
+            "emitted_count": 0,
+            "error_count": 0,
+            "last_latency_ns": 0,
+            "max_latency_ns": 0,
+            "avg_latency_ns": 0.0,
+        }
+
+
+class TestTopOfBook:
+    def test_update_with_first_levels_returns_true(self):
+        # Arrange
+        top = TopOfBook()
+
+        # Act
+        result = top.update([[100.0, 1.0]], [[101.0, 2.0]])
+
+        # Assert
+        assert result
+        assert top.best_bid == [100.0, 1.0]
+        assert top.best_ask == [101.0, 2.0]
+
+    def test_update_with_empty_side_returns_false(self):
+        # Arrange
+        top = TopOfBook()
+
+        # Act
+        result = top.update([[100.0, 1.0]], [])
+
+        # Assert
+        assert not result
+        assert top.best_bid is None
+
+    def test_update_with_unchanged_top_of_book_returns_false(self):
+        # Arrange
+        top = TopOfBook()
+        top.update([[100.0, 1.0], [99.0, 5.0]], [[101.0, 2.0]])
+
+        # Act
+        result = top.update([[100.0, 1.0], [98.0, 3.0]], [[101.0, 2.0], [102.0, 1.0]])
+
+        # Assert
+        assert not result
+
+    def test_update_with_changed_best_size_returns_true(self):
+        # Arrange
+        top = TopOfBook()
+        top.update([[100.0, 1.0]], [[101.0, 2.0]])
+
+        # Act
+        result = top.update([[100.0, 1.0]], [[101.0, 3.0]])
+
+        # Assert
+        assert result
+        assert top.best_ask == [101.0, 3.0]
+
+    def test_update_when_levels_mutated_in_place_detects_change(self):
+        # Arrange
+        top = TopOfBook()
+        bids = [[100.0, 1.0]]
+        asks = [[101.0, 2.0]]
+        top.update(bids, asks)
+
+        # Act
+        bids[0][1] = 4.0
+        result = top.update(bids, asks)
+
+        # Assert
+        assert result
+        assert top.best_bid == [100.0, 4.0]
@@ -1,7 +1,21 @@
+import json
+
 import pytest
 
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import JsonLinesLogSink
+from nautilus_trader.common.logging import Logger
 from nautilus_trader.common.logging import LoggerAdapter
 from nautilus_trader.data.socket import SocketClient
+from nautilus_trader.data.socket import SocketProtocol
+
+
+def feed(protocol, data, chunk_size):
+    for i in range(0, len(data), chunk_size):
+        chunk = data[i : i + chunk_size]
+        buffer = protocol.get_buffer(-1)
+        buffer[: len(chunk)] = chunk
+        protocol.buffer_updated(len(chunk))
 
 
 @pytest.mark.asyncio
@@ -25,3 +39,77 @@ async def test_socket_base(socket_server, logger, event_loop):
     )
     await client.start()
     assert messages == [b"hello"] * 6
+
+
+def test_socket_protocol_dispatches_all_complete_frames_per_read():
+    # Arrange
+    messages = []
+    batches = []
+    protocol = SocketProtocol(message_handler=messages.append, on_frames=batches.append)
+
+    # Act
+    feed(protocol, b"one\r\ntwo\r\nthree\r\nfou", chunk_size=1024)
+
+    # Assert
+    assert messages == [b"one", b"two", b"three"]
+    assert batches == [[b"one", b"two", b"three"]]
+    assert protocol.messages_received == 3
+    assert protocol.bytes_received == 20
+
+
+def test_socket_protocol_reassembles_frames_split_across_reads():
+    # Arrange
+    messages = []
+    protocol = SocketProtocol(message_handler=messages.append, buffer_size=16)
+    frames = [b"frame-%d-" % i + b"x" * (i * 100) for i in range(50)]
+
+    # Act
+    feed(protocol, b"".join(frame + b"\r\n" for frame in frames), chunk_size=37)
+
+    # Assert
+    assert messages == frames
+
+
+def test_socket_protocol_when_stopped_does_not_dispatch_remaining_frames():
+    # Arrange
+    messages = []
+
+    def handler(raw):
+        messages.append(raw)
+        protocol.is_stopped = True
+
+    protocol = SocketProtocol(message_handler=handler)
+
+    # Act
+    feed(protocol, b"one\r\ntwo\r\n", chunk_size=1024)
+
+    # Assert
+    assert messages == [b"one"]
+
+
+def test_socket_protocol_when_handler_raises_logs_and_dispatches_remaining_frames(tmp_path):
+    # Arrange
+    messages = []
+
+    def handler(raw):
+        if raw == b"bad":
+            raise ValueError("cannot handle message")
+        messages.append(raw)
+
+    path = str(tmp_path / "log.jsonl")
+    sink = JsonLinesLogSink(path)
+    logger = Logger(clock=TestClock(), sink=sink)
+    protocol = SocketProtocol(message_handler=handler, logger=LoggerAdapter("Socket", logger))
+
+    # Act
+    feed(protocol, b"one\r\nbad\r\ntwo\r\n", chunk_size=1024)
+    sink.close()
+
+    # Assert
+    with open(path) as f:
+        lines = [json.loads(line) for line in f]
+    assert messages == [b"one", b"two"]
+    assert protocol.messages_received == 3
+    assert len(lines) == 1
+    assert lines[0]["level"] == "ERR"
+    assert "ValueError(cannot handle message)" in lines[0]["msg"]
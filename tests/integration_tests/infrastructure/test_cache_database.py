@@ -33,6 +33,7 @@ from nautilus_trader.model.enums import OMSType
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.enums import VenueType
+from nautilus_trader.model.identifiers import ExecutionId
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
@@ -275,6 +276,182 @@ class TestRedisCacheDatabase:
         # Assert
         assert self.database.load_order(order.client_order_id) == order
 
+    def test_update_order_writes_snapshot_at_interval_and_restores_from_it(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            instrument_serializer=MsgPackInstrumentSerializer(),
+            command_serializer=MsgPackCommandSerializer(),
+            event_serializer=MsgPackEventSerializer(),
+            config={"host": "localhost", "port": 6379, "snapshot_interval": 2},
+        )
+
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        database.add_order(order)
+
+        order.apply(TestStubs.event_order_submitted(order))
+        database.update_order(order)  # Snapshot at 2 events
+
+        order.apply(TestStubs.event_order_accepted(order))
+        database.update_order(order)
+
+        # Act
+        result = database.load_order(order.client_order_id)
+
+        # Assert
+        assert self.test_redis.exists(
+            f"Trader-{self.trader_id.value}:Snapshots:Orders:{order.client_order_id.value}",
+        )
+        assert result == order
+        assert result.state == order.state
+        assert result.event_count == 3
+
+    def test_compact_trims_events_covered_by_snapshots(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        self.database.add_order(order)
+
+        order.apply(TestStubs.event_order_submitted(order))
+        self.database.update_order(order)
+
+        order.apply(TestStubs.event_order_accepted(order))
+        self.database.update_order(order)
+        self.database.snapshot_order(order)
+
+        fill = TestStubs.event_order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            last_px=Price.from_str("1.00001"),
+        )
+        order.apply(fill)
+        self.database.update_order(order)
+
+        # Act
+        trimmed = self.database.compact()
+
+        # Assert
+        key = f"Trader-{self.trader_id.value}:Orders:{order.client_order_id.value}"
+        assert trimmed == 2
+        assert self.test_redis.llen(key) == 2
+        assert self.database.compact() == 0
+        assert self.database.load_order(order.client_order_id).state == order.state
+        assert self.database.load_orders() == {order.client_order_id: order}
+
+    def test_update_position_writes_snapshot_at_interval_and_restores_from_it(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            instrument_serializer=MsgPackInstrumentSerializer(),
+            command_serializer=MsgPackCommandSerializer(),
+            event_serializer=MsgPackEventSerializer(),
+            config={"host": "localhost", "port": 6379, "snapshot_interval": 2},
+        )
+        database.add_instrument(AUDUSD_SIM)
+
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+        )
+
+        position_id = PositionId("P-1")
+        position = Position(
+            instrument=AUDUSD_SIM,
+            fill=TestStubs.event_order_filled(
+                order1,
+                instrument=AUDUSD_SIM,
+                position_id=position_id,
+                last_px=Price.from_str("1.00001"),
+            ),
+        )
+        database.add_position(position)
+
+        position.apply(
+            TestStubs.event_order_filled(
+                order2,
+                instrument=AUDUSD_SIM,
+                position_id=position_id,
+                last_qty=Quantity.from_int(50000),
+                last_px=Price.from_str("1.00011"),
+            )
+        )
+        database.update_position(position)  # Snapshot at 2 events
+
+        position.apply(
+            TestStubs.event_order_filled(
+                order2,
+                instrument=AUDUSD_SIM,
+                execution_id=ExecutionId("E-2"),
+                position_id=position_id,
+                last_qty=Quantity.from_int(20000),
+                last_px=Price.from_str("1.00021"),
+            )
+        )
+        database.update_position(position)
+
+        # Act
+        result = database.load_position(position_id)
+
+        # Assert
+        assert result == position
+        assert result.net_qty == position.net_qty
+        assert result.quantity == position.quantity
+        assert result.avg_px_close == position.avg_px_close
+        assert result.realized_pnl == position.realized_pnl
+        assert result.commissions() == position.commissions()
+        assert result.client_order_ids == position.client_order_ids
+        assert result.execution_ids == position.execution_ids
+        assert result.last_event == position.last_event
+        assert database.load_positions() == {position.id: position}
+
+    def test_update_account_writes_snapshot_at_interval_and_restores_from_it(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            instrument_serializer=MsgPackInstrumentSerializer(),
+            command_serializer=MsgPackCommandSerializer(),
+            event_serializer=MsgPackEventSerializer(),
+            config={"host": "localhost", "port": 6379, "snapshot_interval": 2},
+        )
+
+        account = Account(TestStubs.event_account_state())
+        database.add_account(account)
+
+        account.update_commissions(Money(2, USD))
+        account.apply(TestStubs.event_account_state())
+        database.update_account(account)  # Snapshot at 2 events
+
+        account.apply(TestStubs.event_account_state())
+        database.update_account(account)
+
+        # Act
+        result = database.load_account(account.id)
+
+        # Assert
+        assert result == account
+        assert result.balances_total() == account.balances_total()
+        assert result.commissions() == {USD: Money(2, USD)}
+        assert result.last_event == account.last_event
+        assert result.event_count == 3
+
     def test_update_position_for_closed_position(self):
         # Arrange
         self.database.add_instrument(AUDUSD_SIM)
@@ -549,6 +726,57 @@ class TestRedisCacheDatabase:
         # Assert
         assert result == {order.client_order_id: order}
 
+    def test_load_orders_cache_in_pipelined_batches(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            instrument_serializer=MsgPackInstrumentSerializer(),
+            command_serializer=MsgPackCommandSerializer(),
+            event_serializer=MsgPackEventSerializer(),
+            config={"host": "localhost", "port": 6379, "batch_size": 2, "workers": 2},
+        )
+
+        orders = [
+            self.strategy.order_factory.market(
+                AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100000),
+            )
+            for _ in range(5)
+        ]
+
+        for order in orders:
+            database.add_order(order)
+
+        # Act
+        result = database.load_orders()
+
+        # Assert
+        assert result == {order.client_order_id: order for order in orders}
+
+    def test_load_currencies_and_instruments_in_pipelined_batches(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            instrument_serializer=MsgPackInstrumentSerializer(),
+            command_serializer=MsgPackCommandSerializer(),
+            event_serializer=MsgPackEventSerializer(),
+            config={"host": "localhost", "port": 6379, "batch_size": 1, "workers": 2},
+        )
+
+        database.add_currency(USD)
+        database.add_instrument(AUDUSD_SIM)
+
+        # Act
+        currencies = database.load_currencies()
+        instruments = database.load_instruments()
+
+        # Assert
+        assert currencies == {"USD": USD}
+        assert instruments == {AUDUSD_SIM.id: AUDUSD_SIM}
+
     def test_load_positions_cache_when_no_positions(self):
         # Arrange
         # Act
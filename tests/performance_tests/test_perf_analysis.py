@@ -0,0 +1,47 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import datetime
+from datetime import timedelta
+
+from nautilus_trader.analysis.performance import PerformanceAnalyzer
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.objects import Money
+from tests.test_kit.performance import PerformanceHarness
+
+
+POSITION_IDS = [PositionId(f"P-{i}") for i in range(100_000)]
+PNLS = [Money((i % 7) - 3, USD) for i in range(100_000)]
+TIMESTAMPS = [datetime(2021, 1, 1) + timedelta(hours=i) for i in range(100_000)]
+
+
+def add_trades_and_returns_then_calculate():
+    analyzer = PerformanceAnalyzer()
+    for position_id, pnl, timestamp in zip(POSITION_IDS, PNLS, TIMESTAMPS):
+        analyzer.add_trade(position_id, pnl)
+        analyzer.add_return(timestamp, 0.0001)
+
+    analyzer.get_performance_stats_pnls(USD)
+    analyzer.daily_returns()
+
+
+class TestPerformanceAnalyzerPerformance(PerformanceHarness):
+    def test_add_trades_and_returns_then_calculate(self):
+        self.benchmark.pedantic(
+            target=add_trades_and_returns_then_calculate,
+            iterations=1,
+            rounds=1,
+        )
@@ -0,0 +1,70 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.adapters.betfair.parsing import BetfairMarketStreamParser
+from nautilus_trader.adapters.betfair.parsing import on_market_update
+from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
+from tests.integration_tests.adapters.betfair.test_kit import BetfairDataProvider
+from tests.test_kit.performance import PerformanceHarness
+
+
+UPDATES = BetfairDataProvider.raw_market_updates()
+INSTRUMENTS = BetfairDataProvider.raw_market_updates_instruments()
+
+
+# The parser replaced a per-runner `OrderBookDeltas` implementation which is no
+# longer in the tree, so these benchmarks compare how the parser is used: a new
+# parser per message (as `on_market_update`), and a parser reused across the
+# stream with and without its lookup table preloaded from the provider.
+
+
+def replay_parser_per_message(instrument_provider):
+    for update in UPDATES:
+        on_market_update(instrument_provider=instrument_provider, update=update)
+
+
+def replay_reused_parser(instrument_provider, preload):
+    parser = BetfairMarketStreamParser(instrument_provider, preload=preload)
+    for update in UPDATES:
+        parser.parse(update)
+
+
+class TestBetfairMarketStreamParserPerformance(PerformanceHarness):
+    def test_replay_parser_per_message(self):
+        instrument_provider = BetfairInstrumentProvider.from_instruments(INSTRUMENTS)
+        self.benchmark.pedantic(
+            target=replay_parser_per_message,
+            args=(instrument_provider,),
+            iterations=1,
+            rounds=1,
+        )
+
+    def test_replay_reused_parser_without_preload(self):
+        instrument_provider = BetfairInstrumentProvider.from_instruments(INSTRUMENTS)
+        self.benchmark.pedantic(
+            target=replay_reused_parser,
+            args=(instrument_provider, False),
+            iterations=1,
+            rounds=1,
+        )
+
+    def test_replay_reused_parser_with_preload(self):
+        instrument_provider = BetfairInstrumentProvider.from_instruments(INSTRUMENTS)
+        self.benchmark.pedantic(
+            target=replay_reused_parser,
+            args=(instrument_provider, True),
+            iterations=1,
+            rounds=1,
+        )
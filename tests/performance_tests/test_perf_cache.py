@@ -0,0 +1,115 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from tests.test_kit.performance import PerformanceHarness
+from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.stubs import TestStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
+
+
+class TestCachePerformance(PerformanceHarness):
+    def setup(self):
+        # Fixture Setup
+        clock = TestClock()
+        self.cache = Cache(database=None, logger=Logger(clock))
+        self.strategy_id = StrategyId("S-001")
+
+        order_factory = OrderFactory(
+            trader_id=TraderId("TESTER-000"),
+            strategy_id=self.strategy_id,
+            clock=clock,
+        )
+
+        for i in range(10_000):
+            order = order_factory.stop_market(
+                AUDUSD_SIM.id if i % 2 else GBPUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100000),
+                Price.from_str("1.00000"),
+            )
+            self.cache.add_order(order, PositionId.null())
+            order.apply(TestStubs.event_order_submitted(order))
+            self.cache.update_order(order)
+            order.apply(TestStubs.event_order_accepted(order))
+            self.cache.update_order(order)
+
+    @pytest.fixture(autouse=True)
+    def setup_benchmark(self, benchmark):
+        self.benchmark = benchmark
+
+    def test_orders_working_count_with_composite_filter(self):
+        self.benchmark.pedantic(
+            target=self.cache.orders_working_count,
+            args=(None, AUDUSD_SIM.id, self.strategy_id),
+            iterations=10_000,
+            rounds=1,
+        )
+
+    def test_orders_working_with_composite_filter(self):
+        self.benchmark.pedantic(
+            target=self.cache.orders_working,
+            args=(None, AUDUSD_SIM.id, self.strategy_id),
+            iterations=1_000,
+            rounds=1,
+        )
+
+
+class TestCacheColumnarHistoryPerformance(PerformanceHarness):
+    def setup(self):
+        # Fixture Setup
+        self.cache = Cache(
+            database=None,
+            logger=Logger(TestClock()),
+            config={"columnar_history": True},
+        )
+        self.tick = TestStubs.quote_tick_5decimal(AUDUSD_SIM.id)
+        for _ in range(self.cache.tick_capacity):
+            self.cache.add_quote_tick(self.tick)
+        self.history = self.cache.quote_tick_history(AUDUSD_SIM.id)
+
+    @pytest.fixture(autouse=True)
+    def setup_benchmark(self, benchmark):
+        self.benchmark = benchmark
+
+    def test_add_quote_tick(self):
+        self.benchmark.pedantic(
+            target=self.cache.add_quote_tick,
+            args=(self.tick,),
+            iterations=100_000,
+            rounds=1,
+        )
+
+    def test_quote_tick_history_column(self):
+        self.benchmark.pedantic(
+            target=self.history.column,
+            args=("bid", 100),
+            iterations=100_000,
+            rounds=1,
+        )
@@ -0,0 +1,85 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import time
+
+import pytest
+import redis
+
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.infrastructure.cache import RedisCacheDatabase
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.serialization.msgpack.serializer import MsgPackCommandSerializer
+from nautilus_trader.serialization.msgpack.serializer import MsgPackEventSerializer
+from nautilus_trader.serialization.msgpack.serializer import MsgPackInstrumentSerializer
+from tests.test_kit.stubs import TestStubs
+
+
+# Requirements:
+# - A Redis instance listening on the default port 6379
+
+ORDER_COUNT = 20_000
+
+
+def create_database(batch_size, workers):
+    clock = TestClock()
+    return RedisCacheDatabase(
+        trader_id=TestStubs.trader_id(),
+        logger=Logger(clock, bypass=True),
+        instrument_serializer=MsgPackInstrumentSerializer(),
+        command_serializer=MsgPackCommandSerializer(),
+        event_serializer=MsgPackEventSerializer(),
+        config={"host": "localhost", "port": 6379, "batch_size": batch_size, "workers": workers},
+    )
+
+
+@pytest.fixture(scope="module")
+def populated_redis():
+    database = create_database(batch_size=1000, workers=1)
+    database.flush()
+
+    order_factory = OrderFactory(
+        trader_id=TestStubs.trader_id(),
+        strategy_id=StrategyId("S-001"),
+        clock=TestClock(),
+    )
+    for _ in range(ORDER_COUNT):
+        database.add_order(
+            order_factory.market(
+                TestStubs.audusd_id(),
+                OrderSide.BUY,
+                Quantity.from_int(100000),
+            )
+        )
+
+    yield
+
+    redis.Redis(host="localhost", port=6379, db=0).flushall()
+
+
+@pytest.mark.parametrize("batch_size, workers", [(1, 1), (1000, 1), (1000, 4)])
+def test_load_orders(benchmark, populated_redis, batch_size, workers):
+    database = create_database(batch_size=batch_size, workers=workers)
+
+    start = time.perf_counter()
+    orders = benchmark.pedantic(database.load_orders, rounds=3, iterations=1)
+    elapsed = time.perf_counter() - start
+
+    assert len(orders) == ORDER_COUNT
+    print(f"batch_size={batch_size}, workers={workers}: {3 * ORDER_COUNT / elapsed:,.0f} keys/sec")
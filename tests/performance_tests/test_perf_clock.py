@@ -79,3 +79,25 @@ class TestClockPerformanceTests(PerformanceHarness):
         )
         # ~320.1ms                       minimum of 1 runs @ 1 iteration each run. (100000 advances)
         # ~3.7ms / ~3655.1μs / 3655108ns minimum of 1 runs @ 1 iteration each run.
+
+    def test_advance_time_with_many_time_alerts(self):
+        clock = TestClock()
+        store = []
+        for i in range(10_000):
+            clock.set_time_alert(
+                f"alert-{i}",
+                clock.utc_now() + timedelta(seconds=i + 1),
+                handler=store.append,
+            )
+        for i in range(0, 10_000, 2):
+            clock.cancel_timer(f"alert-{i}")
+
+        def advance():
+            for i in range(10_000):
+                clock.advance_time(to_time_ns=(i + 1) * 1_000_000_000)
+
+        self.benchmark.pedantic(
+            target=advance,
+            iterations=1,
+            rounds=1,
+        )
@@ -0,0 +1,81 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.model.identifiers import ClientOrderId
+from nautilus_trader.model.identifiers import ExecutionId
+from nautilus_trader.model.identifiers import IdentifierCache
+from nautilus_trader.model.identifiers import InstrumentId
+from tests.test_kit.performance import PerformanceHarness
+
+
+class TestIdentifierPerformance(PerformanceHarness):
+    def setup(self):
+        # Fixture Setup
+        self.instrument_ids = {InstrumentId.from_str(f"SYM{i}.SIM"): i for i in range(1_000)}
+        self.client_order_ids = {ClientOrderId(f"O-{i}"): i for i in range(10_000)}
+        self.execution_ids = IdentifierCache(ExecutionId)
+
+    @pytest.fixture(autouse=True)
+    def setup_benchmark(self, benchmark):
+        self.benchmark = benchmark
+
+    def test_dict_lookup_with_interned_instrument_id(self):
+        instrument_id = InstrumentId.from_str("SYM500.SIM")  # Same instance as key
+
+        self.benchmark.pedantic(
+            target=self.instrument_ids.__getitem__,
+            args=(instrument_id,),
+            iterations=100_000,
+            rounds=1,
+        )
+
+    def test_dict_lookup_with_equal_instrument_id(self):
+        instrument_id = InstrumentId(
+            InstrumentId.from_str("SYM500.SIM").symbol,
+            InstrumentId.from_str("SYM500.SIM").venue,
+        )  # Equal but distinct instance
+
+        self.benchmark.pedantic(
+            target=self.instrument_ids.__getitem__,
+            args=(instrument_id,),
+            iterations=100_000,
+            rounds=1,
+        )
+
+    def test_dict_lookup_with_equal_client_order_id(self):
+        self.benchmark.pedantic(
+            target=self.client_order_ids.__getitem__,
+            args=(ClientOrderId("O-5000"),),
+            iterations=100_000,
+            rounds=1,
+        )
+
+    def test_parse_instrument_id_from_str(self):
+        self.benchmark.pedantic(
+            target=InstrumentId.from_str,
+            args=("SYM500.SIM",),
+            iterations=100_000,
+            rounds=1,
+        )
+
+    def test_identifier_cache_get(self):
+        self.benchmark.pedantic(
+            target=self.execution_ids.get,
+            args=("E-123456",),
+            iterations=100_000,
+            rounds=1,
+        )
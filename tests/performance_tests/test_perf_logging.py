@@ -0,0 +1,33 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import LogLevel
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.common.logging import LoggerAdapter
+from tests.test_kit.performance import PerformanceHarness
+
+
+class TestLoggerPerformance(PerformanceHarness):
+    def test_debug_below_stdout_level(self):
+        logger = Logger(clock=TestClock(), level_stdout=LogLevel.INFO)
+        logger_adapter = LoggerAdapter(component="PERF_LOGGER", logger=logger)
+
+        self.benchmark.pedantic(
+            target=logger_adapter.debug,
+            args=("This is a log message.",),
+            iterations=100_000,
+            rounds=1,
+        )
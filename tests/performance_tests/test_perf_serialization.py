@@ -13,17 +13,21 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pyarrow as pa
 import pytest
 
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.factories import OrderFactory
 from nautilus_trader.core.uuid import uuid4
 from nautilus_trader.model.commands.trading import SubmitOrder
+from nautilus_trader.model.data.tick import TradeTick
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.serialization.arrow.decoders import decode_trade_ticks
 from nautilus_trader.serialization.msgpack.serializer import MsgPackCommandSerializer
 from tests.test_kit.performance import PerformanceHarness
 from tests.test_kit.stubs import TestStubs
@@ -74,3 +78,35 @@ class TestSerializationPerformance(PerformanceHarness):
             rounds=1,
         )
         # ~0.0ms / ~4.1μs / 4105ns minimum of 10,000 runs @ 1 iteration each run.
+
+
+class TestArrowDecoderPerformance(PerformanceHarness):
+    def setup(self):
+        # Fixture Setup
+        rows = [
+            TradeTick.to_dict(
+                TestStubs.trade_tick_5decimal(price=Price.from_str(f"1.{i % 100:05d}"))
+            )
+            for i in range(10_000)
+        ]
+        self.table = pa.table({key: [row[key] for row in rows] for key in rows[0]})
+
+    @pytest.fixture(autouse=True)
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def setup_benchmark(self, benchmark):
+        self.benchmark = benchmark
+
+    def test_trade_ticks_from_dict(self):
+        self.benchmark.pedantic(
+            target=lambda: [TradeTick.from_dict(row) for row in self.table.to_pandas().to_dict("records")],
+            iterations=10,
+            rounds=1,
+        )
+
+    def test_decode_trade_ticks(self):
+        self.benchmark.pedantic(
+            target=decode_trade_ticks,
+            args=(self.table,),
+            iterations=10,
+            rounds=1,
+        )
@@ -0,0 +1,89 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pandas as pd
+
+from nautilus_trader.data.wrangling import QuoteTickDataWrangler
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from tests.test_kit.performance import PerformanceHarness
+from tests.test_kit.providers import TestDataProvider
+from tests.test_kit.providers import TestInstrumentProvider
+
+
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+BARS_BID = TestDataProvider.usdjpy_1min_bid()
+BARS_ASK = TestDataProvider.usdjpy_1min_ask()
+
+
+def string_pre_process_and_build(bars_bid, bars_ask, price_precision, size_precision):
+    # Reference implementation formatting every value into a string
+    frames = []
+    for offset, column in zip((-300, -200, -100, 0), ("open", "high", "low", "close")):
+        frame = pd.DataFrame(
+            data={
+                "bid": bars_bid[column],
+                "ask": bars_ask[column],
+                "bid_size": 1_000_000,
+                "ask_size": 1_000_000,
+            },
+        )
+        frame[["bid", "ask"]] = frame[["bid", "ask"]].applymap(lambda x: f"{x:.{price_precision}f}")
+        frame[["bid_size", "ask_size"]] = frame[["bid_size", "ask_size"]].applymap(lambda x: f"{x:.{size_precision}f}")
+        frame.index = frame.index.shift(periods=offset, freq="ms")
+        frames.append(frame)
+
+    ticks = pd.concat(frames)
+    ticks.sort_index(axis=0, kind="mergesort", inplace=True)
+
+    return [
+        (
+            Price(values[0], price_precision),
+            Price(values[1], price_precision),
+            Quantity(values[2], size_precision),
+            Quantity(values[3], size_precision),
+            int(dt.timestamp() * 1e9),
+        )
+        for values, dt in zip(ticks.values, ticks.index)
+    ]
+
+
+def numeric_pre_process_and_build(bars_bid, bars_ask):
+    wrangler = QuoteTickDataWrangler(
+        instrument=USDJPY_SIM,
+        data_bars_bid={BarAggregation.MINUTE: bars_bid},
+        data_bars_ask={BarAggregation.MINUTE: bars_ask},
+    )
+    wrangler.pre_process(0, random_seed=42)
+    return wrangler.build_ticks()
+
+
+class TestQuoteTickDataWranglerPerformance(PerformanceHarness):
+    def test_string_pre_process_and_build_ticks(self):
+        self.benchmark.pedantic(
+            target=string_pre_process_and_build,
+            args=(BARS_BID, BARS_ASK, USDJPY_SIM.price_precision, USDJPY_SIM.size_precision),
+            iterations=1,
+            rounds=1,
+        )
+
+    def test_numeric_pre_process_and_build_ticks(self):
+        self.benchmark.pedantic(
+            target=numeric_pre_process_and_build,
+            args=(BARS_BID, BARS_ASK),
+            iterations=1,
+            rounds=1,
+        )
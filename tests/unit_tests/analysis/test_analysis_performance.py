@@ -13,20 +13,33 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import date
 from datetime import datetime
 
+import pytest
+import pytz
+
 from nautilus_trader.analysis.performance import PerformanceAnalyzer
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.core.uuid import uuid4
 from nautilus_trader.model.currencies import AUD
+from nautilus_trader.model.currencies import BTC
+from nautilus_trader.model.currencies import ETH
 from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.events.account import AccountState
+from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.objects import AccountBalance
+from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.position import Position
+from nautilus_trader.trading.account import Account
 from tests.test_kit.providers import TestInstrumentProvider
 from tests.test_kit.stubs import TestStubs
 
@@ -174,3 +187,121 @@ class TestAnalyzer:
         assert len(result) == 2
         assert result["P-1"] == 6.0
         assert result["P-2"] == 16.0
+
+    def test_pnl_statistics_without_currency_for_multi_currency_portfolio_raises_value_error(self):
+        # Arrange
+        account = Account(
+            AccountState(
+                account_id=AccountId("SIM", "001"),
+                account_type=AccountType.CASH,
+                base_currency=None,  # Multi-currency
+                reported=True,
+                balances=[
+                    AccountBalance(
+                        BTC,
+                        Money(10.00000000, BTC),
+                        Money(0.00000000, BTC),
+                        Money(10.00000000, BTC),
+                    ),
+                    AccountBalance(
+                        ETH,
+                        Money(20.00000000, ETH),
+                        Money(0.00000000, ETH),
+                        Money(20.00000000, ETH),
+                    ),
+                ],
+                info={},
+                event_id=uuid4(),
+                ts_updated_ns=0,
+                timestamp_ns=0,
+            )
+        )
+
+        # Act
+        self.analyzer.calculate_statistics(account, [])
+
+        # Assert
+        with pytest.raises(ValueError):
+            self.analyzer.max_winner()
+        with pytest.raises(ValueError):
+            self.analyzer.realized_pnls()
+        assert self.analyzer.max_winner(BTC) == 0.0
+        assert self.analyzer.realized_pnls(BTC) is None
+
+    def test_add_trade_with_existing_position_id_overwrites_value(self):
+        # Arrange
+        self.analyzer.add_trade(PositionId("P-1"), Money(10.00, USD))
+        self.analyzer.add_trade(PositionId("P-2"), Money(-5.00, USD))
+
+        # Act
+        self.analyzer.add_trade(PositionId("P-1"), Money(20.00, USD))
+        result = self.analyzer.realized_pnls(USD)
+
+        # Assert
+        assert len(result) == 2
+        assert list(result.index) == ["P-1", "P-2"]
+        assert result["P-1"] == 20.0
+
+    def test_pnl_statistics_when_many_trades_returns_expected(self):
+        # Arrange
+        pnls = [10.0, -5.0, 0.0, 25.0, -15.0] * 100
+        for i, pnl in enumerate(pnls):
+            self.analyzer.add_trade(PositionId(f"P-{i}"), Money(pnl, AUD))
+
+        # Act
+        # Assert
+        assert len(self.analyzer.realized_pnls(AUD)) == 500
+        assert self.analyzer.max_winner(AUD) == 25.0
+        assert self.analyzer.min_winner(AUD) == 10.0
+        assert self.analyzer.avg_winner(AUD) == 17.5
+        assert self.analyzer.max_loser(AUD) == -15.0
+        assert self.analyzer.min_loser(AUD) == 0.0
+        assert self.analyzer.avg_loser(AUD) == -20.0 / 3
+        assert self.analyzer.win_rate(AUD) == 0.4
+        assert self.analyzer.expectancy(AUD) == 17.5 * 0.4 + (-20.0 / 3) * 0.6
+
+    def test_pnl_statistics_updated_after_further_trades(self):
+        # Arrange
+        self.analyzer.add_trade(PositionId("P-1"), Money(10.00, AUD))
+        assert self.analyzer.max_winner(AUD) == 10.0
+
+        # Act
+        self.analyzer.add_trade(PositionId("P-2"), Money(30.00, AUD))
+
+        # Assert
+        assert self.analyzer.max_winner(AUD) == 30.0
+        assert self.analyzer.win_rate(AUD) == 1.0
+
+    def test_add_positions_buckets_returns_by_closed_date(self):
+        # Arrange
+        positions = []
+        for i, day in enumerate([3, 1, 3]):
+            ts_closed_ns = int(datetime(2010, 1, day, 12, tzinfo=pytz.utc).timestamp()) * 1_000_000_000
+            order1 = self.order_factory.market(AUDUSD_SIM.id, OrderSide.BUY, Quantity.from_int(100000))
+            order2 = self.order_factory.market(AUDUSD_SIM.id, OrderSide.SELL, Quantity.from_int(100000))
+            fill1 = TestStubs.event_order_filled(
+                order1,
+                instrument=AUDUSD_SIM,
+                position_id=PositionId(f"P-{i}"),
+                last_px=Price.from_str("1.00000"),
+            )
+            fill2 = TestStubs.event_order_filled(
+                order2,
+                instrument=AUDUSD_SIM,
+                position_id=PositionId(f"P-{i}"),
+                last_px=Price.from_str("1.00010"),
+                ts_filled_ns=ts_closed_ns,
+            )
+            position = Position(instrument=AUDUSD_SIM, fill=fill1)
+            position.apply(fill2)
+            positions.append(position)
+
+        # Act
+        self.analyzer.add_positions(positions)
+        result = self.analyzer.daily_returns()
+
+        # Assert
+        assert len(self.analyzer.realized_pnls(USD)) == 3
+        assert list(result.index) == [date(2010, 1, 3), date(2010, 1, 1)]
+        assert result.iloc[0] == float(positions[0].realized_return) + float(positions[2].realized_return)
+        assert result.iloc[1] == float(positions[1].realized_return)
@@ -15,14 +15,16 @@ import pytest
 
 from examples.strategies.orderbook_imbalance import OrderbookImbalance
 from nautilus_trader.adapters.betfair.common import BETFAIR_VENUE
-from nautilus_trader.adapters.betfair.data import on_market_update
+from nautilus_trader.adapters.betfair.parsing import on_market_update
 from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
 from nautilus_trader.adapters.betfair.util import historical_instrument_provider_loader
+from nautilus_trader.backtest.data_loader import CatalogDataStream
 from nautilus_trader.backtest.data_loader import CSVParser
 from nautilus_trader.backtest.data_loader import DataCatalog
 from nautilus_trader.backtest.data_loader import DataLoader
 from nautilus_trader.backtest.data_loader import ParquetParser
 from nautilus_trader.backtest.data_loader import TextParser
+from nautilus_trader.backtest.data_loader import _InflightBudget
 from nautilus_trader.backtest.data_loader import parse_timestamp
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.common.providers import InstrumentProvider
@@ -33,7 +35,9 @@ from nautilus_trader.model import currencies
 from nautilus_trader.model.currencies import GBP
 from nautilus_trader.model.data.base import Data
 from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
 from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.enums import BookLevel
 from nautilus_trader.model.enums import OMSType
 from nautilus_trader.model.enums import VenueType
@@ -45,6 +49,8 @@ from nautilus_trader.model.instruments.currency import CurrencySpot
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.orderbook.data import OrderBookDelta
+from nautilus_trader.serialization.arrow.core import _deserialize
 from nautilus_trader.serialization.arrow.core import register_parquet
 from tests.test_kit import PACKAGE_ROOT
 from tests.test_kit.providers import TestInstrumentProvider
@@ -198,6 +204,72 @@ def test_data_loader_csv(catalog_dir):
     assert len(data) == 1000
 
 
+@pytest.mark.parametrize("max_inflight_bytes", [1, 256 * 1024 * 1024])
+def test_data_catalog_import_parallel_matches_serial(catalog_dir, tmp_path, max_inflight_bytes):
+    # Arrange
+    def make_loader():
+        instrument_provider = BetfairInstrumentProvider.from_instruments([])
+        parser = TextParser(
+            parser=lambda x, state: on_market_update(
+                instrument_provider=instrument_provider, update=orjson.loads(x)
+            ),
+            instrument_provider_update=historical_instrument_provider_loader,
+        )
+        return DataLoader(
+            path=TEST_DATA_DIR,
+            parser=parser,
+            glob_pattern="**.bz2",
+            instrument_provider=instrument_provider,
+        )
+
+    serial_catalog = DataCatalog(path=str(tmp_path))
+    serial_catalog.import_from_data_loader(loader=make_loader())
+    loader = make_loader()
+    catalog = DataCatalog()
+
+    # Act
+    stats = catalog.import_from_data_loader(
+        loader=loader,
+        workers=2,
+        max_inflight_bytes=max_inflight_bytes,
+    )
+
+    # Assert
+    assert sorted(s.name for s in stats) == loader.path
+    assert all(s.rows > 0 and s.bytes_per_second > 0 for s in stats)
+    assert len(catalog.instruments()) == len(serial_catalog.instruments())
+    assert len(catalog.order_book_deltas()) == len(serial_catalog.order_book_deltas())
+    assert sorted(catalog._load_processed_raw_files()) == loader.path
+
+
+def test_inflight_budget_charges_files_by_parsed_size_of_previous_files():
+    # Arrange
+    budget = _InflightBudget(sizes={"a": 100, "b": 100, "c": 1_000}, max_bytes=5_000)
+    budget.charge("a")
+    budget.release("a", parsed_bytes=400)  # Parsed to 4x its raw size
+
+    # Act
+    budget.charge("b")
+
+    # Assert
+    assert budget.inflight_bytes == 400
+    assert budget.fits("c", buffered_bytes=400)
+    assert not budget.fits("c", buffered_bytes=1_000)
+
+
+def test_data_catalog_import_parallel_skips_processed_files(catalog_dir, data_loader):
+    # Arrange
+    catalog = DataCatalog()
+    catalog.import_from_data_loader(loader=data_loader)
+
+    # Act
+    stats = catalog.import_from_data_loader(loader=data_loader, workers=2)
+
+    # Assert
+    assert stats == []
+    assert len(sum(catalog.load_backtest_data().values(), [])) == 2323
+
+
 def test_parse_timestamp():
     assert parse_timestamp(1580453644855000064) == 1580453644855000064
     assert parse_timestamp("2020-01-31T06:54:04.855000064+10:00") == 1580417644855000064
@@ -412,6 +484,260 @@ def test_data_catalog_append(catalog_dir):
     assert len(catalog.instruments()) == 6
 
 
+def _crypto_instruments():
+    instrument_data = orjson.loads(open(TEST_DATA_DIR + "/crypto_instruments.json").read())
+    instruments = []
+    for data in instrument_data:
+        symbol, venue = data["id"].rsplit(".", maxsplit=1)
+        instruments.append(
+            CurrencySpot(
+                instrument_id=InstrumentId(symbol=Symbol(symbol), venue=Venue(venue)),
+                base_currency=getattr(currencies, data["base_currency"]),
+                quote_currency=getattr(currencies, data["quote_currency"]),
+                price_precision=data["price_precision"],
+                size_precision=data["size_precision"],
+                price_increment=Price.from_str(data["price_increment"]),
+                size_increment=Quantity.from_str(data["size_increment"]),
+                lot_size=data["lot_size"],
+                max_quantity=data["max_quantity"],
+                min_quantity=data["min_quantity"],
+                max_notional=data["max_notional"],
+                min_notional=data["min_notional"],
+                max_price=data["max_price"],
+                min_price=data["min_price"],
+                margin_init=Decimal(1.0),
+                margin_maint=Decimal(1.0),
+                maker_fee=Decimal(1.0),
+                taker_fee=Decimal(1.0),
+                ts_event_ns=0,
+                ts_recv_ns=0,
+            )
+        )
+    return instruments
+
+
+def test_data_catalog_write_chunks_appends_fragments_without_rewriting(catalog_dir):
+    # Arrange
+    catalog = DataCatalog()
+    instruments = _crypto_instruments()
+    catalog._write_chunks(chunk=instruments[:3])
+    first = catalog.fragments(CurrencySpot)
+
+    # Act
+    catalog._write_chunks(chunk=instruments[3:])
+
+    # Assert
+    fragments = catalog.fragments(CurrencySpot)
+    assert len(fragments) == 2
+    assert fragments[0] == first[0]
+    assert catalog.fs.exists(str(catalog.root / "currency_spot.parquet" / first[0]["path"]))
+    assert [f["rows"] for f in fragments] == [3, 3]
+    assert all(f["ts_min"] == 0 and f["ts_max"] == 0 for f in fragments)
+
+
+def test_data_catalog_fragments_track_partitions_and_timestamps(catalog):
+    # Arrange
+    # Act
+    fragments = catalog.fragments(OrderBookDelta)
+
+    # Assert
+    assert fragments
+    assert all(f["partition"].startswith("instrument_id=") for f in fragments)
+    assert all(f["ts_min"] <= f["ts_max"] for f in fragments)
+    assert sum(f["rows"] for f in fragments) >= len(catalog.order_book_deltas())
+
+
+def test_data_catalog_compact_merges_and_deduplicates_fragments(catalog_dir):
+    # Arrange
+    catalog = DataCatalog()
+    instruments = _crypto_instruments()
+    catalog._write_chunks(chunk=instruments[:4])
+    catalog._write_chunks(chunk=instruments[2:])  # Overlaps previous chunk
+
+    # Act
+    catalog.compact(cls=CurrencySpot)
+
+    # Assert
+    fragments = catalog.fragments(CurrencySpot)
+    assert len(fragments) == 1
+    assert fragments[0]["rows"] == 6
+    assert len(catalog.instruments()) == 6
+    assert len(catalog.fs.glob(str(catalog.root / "currency_spot.parquet" / "*.parquet"))) == 1
+
+
+def test_data_catalog_compact_splits_by_target_size(catalog_dir):
+    # Arrange
+    catalog = DataCatalog()
+    instruments = _crypto_instruments()
+    for instrument in instruments:
+        catalog._write_chunks(chunk=[instrument])
+    target_bytes = max(f["bytes"] for f in catalog.fragments(CurrencySpot)) * 3
+
+    # Act
+    thread = catalog.compact(target_bytes=target_bytes, background=True)
+    thread.join()
+
+    # Assert
+    fragments = catalog.fragments(CurrencySpot)
+    assert 1 < len(fragments) < len(instruments)
+    assert sum(f["rows"] for f in fragments) == len(instruments)
+    assert len(catalog.instruments()) == len(instruments)
+
+
+def test_data_catalog_import_records_content_hashes(catalog_dir, data_loader):
+    # Arrange
+    catalog = DataCatalog()
+
+    # Act
+    catalog.import_from_data_loader(loader=data_loader)
+
+    # Assert
+    processed = catalog._load_processed_raw_files()
+    assert {fn: record["hash"] for fn, record in processed.items()} == {
+        fn: data_loader.file_hash(fn) for fn in data_loader.path
+    }
+    assert processed[data_loader.path[0]]["size"] == data_loader.fs.size(data_loader.path[0])
+
+
+def test_data_catalog_import_skips_hashing_unmodified_files(catalog_dir, data_loader, mocker):
+    # Arrange
+    catalog = DataCatalog()
+    catalog.import_from_data_loader(loader=data_loader)
+    file_hash = mocker.spy(data_loader, "file_hash")
+
+    # Act
+    files, _ = catalog._unprocessed_files(data_loader)
+
+    # Assert
+    assert files == []
+    assert file_hash.call_count == 0
+
+
+def test_data_catalog_import_reprocesses_changed_files(catalog_dir, data_loader):
+    # Arrange
+    catalog = DataCatalog()
+    catalog.import_from_data_loader(loader=data_loader)
+    fn = data_loader.path[0]
+    catalog._save_processed_raw_files(files={fn: "changed"})
+
+    # Act
+    files, _ = catalog._unprocessed_files(data_loader)
+
+    # Assert
+    assert files == [fn]
+
+
+def test_data_catalog_load_processed_raw_files_filename_only_format(catalog_dir):
+    # Arrange
+    catalog = DataCatalog()
+    with catalog.fs.open(catalog._processed_files_fn, "wb") as f:
+        f.write(orjson.dumps(["a.bz2"]))
+
+    # Act
+    processed = catalog._load_processed_raw_files()
+
+    # Assert
+    assert processed == {"a.bz2": None}
+    assert catalog._is_processed(processed, "a.bz2", "abc123")
+
+
+def test_data_catalog_trade_ticks_as_nautilus_drops_duplicates_across_fragments(catalog_dir):
+    # Arrange
+    catalog = DataCatalog()
+    instrument_id = InstrumentId(symbol=Symbol("AUDUSD"), venue=Venue("SIM"))
+    ticks = [
+        TradeTick(
+            instrument_id=instrument_id,
+            price=Price.from_str(f"1.0000{i}"),
+            size=Quantity.from_int(100_000),
+            aggressor_side=AggressorSide.BUY,
+            match_id=str(i),
+            ts_event_ns=i,
+            ts_recv_ns=i,
+        )
+        for i in range(5)
+    ]
+    catalog._write_chunks(chunk=ticks[2:])
+    catalog._write_chunks(chunk=ticks[:4])  # Overlaps previous chunk
+
+    # Act
+    result = catalog.trade_ticks(as_nautilus=True)
+
+    # Assert
+    assert result == ticks
+    assert len(catalog.trade_ticks()) == 5
+
+
+def test_data_catalog_trade_ticks_by_ts_recv_ns_drops_duplicates_across_fragments(catalog_dir):
+    # Arrange
+    catalog = DataCatalog()
+    instrument_id = InstrumentId(symbol=Symbol("AUDUSD"), venue=Venue("SIM"))
+    ticks = [
+        TradeTick(
+            instrument_id=instrument_id,
+            price=Price.from_str(f"1.0000{i}"),
+            size=Quantity.from_int(100_000),
+            aggressor_side=AggressorSide.BUY,
+            match_id=str(i),
+            ts_event_ns=i,
+            ts_recv_ns=10,  # Received together
+        )
+        for i in range(2)
+    ]
+    catalog._write_chunks(chunk=ticks)
+    catalog._write_chunks(chunk=ticks)  # Overlaps previous chunk
+
+    # Act
+    result = catalog.trade_ticks(as_nautilus=True, ts_column="ts_recv_ns")
+
+    # Assert
+    assert result == ticks
+
+
+def test_data_catalog_backtest_data_chunked_drops_duplicates_across_fragments(catalog_dir):
+    # Arrange
+    catalog = DataCatalog()
+    instrument_id = InstrumentId(symbol=Symbol("AUDUSD"), venue=Venue("SIM"))
+    ticks = [
+        TradeTick(
+            instrument_id=instrument_id,
+            price=Price.from_str(f"1.0000{i}"),
+            size=Quantity.from_int(100_000),
+            aggressor_side=AggressorSide.BUY,
+            match_id=str(i),
+            ts_event_ns=i // 2,  # Distinct ticks sharing a timestamp
+            ts_recv_ns=i // 2,
+        )
+        for i in range(6)
+    ]
+    catalog._write_chunks(chunk=ticks[2:])
+    catalog._write_chunks(chunk=ticks[:5])  # Overlaps previous chunk
+
+    # Act
+    chunks = catalog.load_backtest_data(
+        order_book_deltas=False,
+        instrument_status_events=False,
+        chunk_size=2,
+    )
+    result = sum(chunks, [])
+
+    # Assert
+    assert sorted(result, key=lambda x: x.match_id) == ticks
+
+
+def test_data_catalog_order_book_deltas_as_nautilus_matches_deserialize(catalog):
+    # Arrange
+    df = catalog.order_book_deltas()
+    expected = _deserialize(cls=OrderBookDelta, chunk=df.to_dict("records"))
+
+    # Act
+    result = catalog.order_book_deltas(as_nautilus=True)
+
+    # Assert
+    assert [type(data) for data in result] == [type(data) for data in expected]
+    assert [data.ts_event_ns for data in result] == [data.ts_event_ns for data in expected]
+
+
 def test_catalog_invalid_partition_key(catalog_dir):
     register_parquet(
         NewsEvent,
@@ -445,6 +771,31 @@ def test_data_catalog_backtest_data_no_filter(catalog):
     assert len(sum(data.values(), [])) == 2323
 
 
+@pytest.mark.parametrize("chunk_size", [1, 100, 10_000])
+def test_data_catalog_backtest_data_chunked(catalog, chunk_size):
+    chunks = list(catalog.load_backtest_data(chunk_size=chunk_size))
+    data = sum(chunks, [])
+    timestamps = [x.ts_event_ns for x in data]
+    assert len(data) == 2323
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+    assert timestamps == sorted(timestamps)
+
+
+def test_data_catalog_backtest_data_chunked_filtered(catalog):
+    chunks = catalog.load_backtest_data(
+        start_timestamp=1576869877788000000,
+        trade_ticks=True,
+        order_book_deltas=False,
+        instrument_status_events=False,
+        chunk_size=50,
+    )
+    data = sum(chunks, [])
+    assert len(data) == len(
+        catalog.trade_ticks(as_nautilus=True, start=1576869877788000000),
+    )
+    assert min(x.ts_event_ns for x in data) >= 1576869877788000000
+
+
 def test_data_catalog_backtest_data_filtered(catalog):
     instruments = catalog.instruments(as_nautilus=True)
     engine = BacktestEngine(bypass_logging=True)
@@ -467,6 +818,69 @@ def test_data_catalog_backtest_data_filtered(catalog):
     assert engine.iteration == 600
 
 
+def test_data_catalog_backtest_data_filtered_chunked(catalog):
+    instruments = catalog.instruments(as_nautilus=True)
+    engine = BacktestEngine(bypass_logging=True)
+    engine = catalog.setup_engine(
+        engine=engine,
+        instruments=[instruments[1]],
+        start_timestamp=1576869877788000000,
+        chunk_size=100,
+    )
+    engine.add_venue(
+        venue=BETFAIR_VENUE,
+        venue_type=VenueType.EXCHANGE,
+        account_type=AccountType.CASH,
+        base_currency=GBP,
+        oms_type=OMSType.NETTING,
+        starting_balances=[Money(10000, GBP)],
+        order_book_level=BookLevel.L2,
+    )
+    engine.run()
+    streamed = catalog.load_backtest_data(
+        instrument_ids=[instruments[1].id.value],
+        start_timestamp=1576869877788000000,
+        chunk_size=100,
+        ts_column="ts_recv_ns",
+    )
+    assert engine.iteration == sum(map(len, streamed))
+
+
+def test_catalog_data_stream_ordered_and_bounded_by_ts_recv_ns(catalog_dir):
+    # Arrange
+    catalog = DataCatalog()
+    instrument_id = TestStubs.audusd_id()
+
+    def trade_tick(i, ts_event_ns, ts_recv_ns):
+        return TradeTick(
+            instrument_id,
+            Price.from_str("1.00000"),
+            Quantity.from_int(1),
+            AggressorSide.BUY,
+            str(i),
+            ts_event_ns,
+            ts_recv_ns,
+        )
+
+    # Received out of event order, written to separate fragments
+    catalog._write_chunks(chunk=[trade_tick(0, 10, 50), trade_tick(1, 20, 30)])
+    catalog._write_chunks(chunk=[trade_tick(2, 30, 40), trade_tick(3, 40, 60)])
+
+    # Act
+    stream = CatalogDataStream(
+        catalog=catalog,
+        start_timestamp=pd.Timestamp(35),
+        order_book_deltas=False,
+        instrument_status_events=False,
+        chunk_size=1,
+    )
+    data = list(stream)
+
+    # Assert
+    assert stream.max_timestamp_ns == 60
+    assert [x.ts_recv_ns for x in data] == [40, 50, 60]
+
+
 def test_data_catalog_backtest_run(catalog):
     instruments = catalog.instruments(as_nautilus=True)
     engine = BacktestEngine()
@@ -14,15 +14,20 @@
 # -------------------------------------------------------------------------------------------------
 
 import pandas as pd
+import pytest
 
 from nautilus_trader.backtest.data_producer import BacktestDataProducer
+from nautilus_trader.backtest.data_producer import StreamingProducer
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.core.type import DataType
 from nautilus_trader.model.data.base import GenericData
 from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.enums import BarAggregation
 from nautilus_trader.model.enums import BookLevel
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.orderbook.data import OrderBookSnapshot
 from tests.test_kit.providers import TestDataProvider
 from tests.test_kit.providers import TestInstrumentProvider
@@ -30,6 +35,7 @@ from tests.test_kit.stubs import MyData
 
 
 ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
+BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
@@ -139,6 +145,32 @@ class TestBacktestDataProducer:
         assert str(next_data.bid_size) == "1000000"
         assert str(next_data.ask_size) == "1000000"
 
+    def test_with_trade_tick_data_produces_correct_ticks(self):
+        # Arrange
+        producer = BacktestDataProducer(
+            logger=self.logger,
+            instruments=[BTCUSDT_BINANCE],
+            trade_ticks={BTCUSDT_BINANCE.id: TestDataProvider.tardis_trades()},
+        )
+        producer.setup(producer.min_timestamp_ns, producer.max_timestamp_ns)
+
+        # Act
+        streamed_data = []
+        while producer.has_data:
+            streamed_data.append(producer.next())  # noqa (own method)
+
+        # Assert
+        first = streamed_data[0]
+        assert len(streamed_data) == 9999
+        assert first.instrument_id == BTCUSDT_BINANCE.id
+        assert first.price == Price.from_str("9682.00")
+        assert first.price.precision == BTCUSDT_BINANCE.price_precision
+        assert first.size == Quantity.from_str("0.132000")
+        assert first.size.precision == BTCUSDT_BINANCE.size_precision
+        assert first.aggressor_side == AggressorSide.BUY
+        assert first.match_id == "42377944"
+        assert first.ts_recv_ns == 1582329602418379000
+
     def test_producer_run_start_stop_parsed_correctly(self):
         instrument = AUDUSD_SIM
         example = TestDataProvider.betfair_trade_ticks()[0]
@@ -161,3 +193,151 @@ class TestBacktestDataProducer:
 
         # Check timestamps outside data range
         producer.setup(start_ns=0, stop_ns=1620394867930000128)
+
+
+class TestStreamingProducer:
+    def setup(self):
+        self.logger = Logger(clock=TestClock())
+
+    def test_producer_with_no_sources(self):
+        # Arrange
+        producer = StreamingProducer(logger=self.logger, sources=[])
+
+        # Act
+        producer.setup(producer.min_timestamp_ns, producer.max_timestamp_ns)
+
+        # Assert
+        assert producer.min_timestamp_ns == 9223285636854775000
+        assert producer.max_timestamp_ns == -9223285636854776000
+        assert not producer.has_data
+        assert producer.next() is None  # noqa (own method)
+
+    def test_single_use_iterator_source_raises_value_error(self):
+        # Arrange
+        source = iter([MyData("a", 0, 0)])
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            StreamingProducer(logger=self.logger, sources=[source])
+
+    @pytest.mark.parametrize("buffer_size", [1, 2, 100])
+    def test_merges_sources_in_timestamp_order(self, buffer_size):
+        # Arrange
+        source1 = [MyData("a", 0, 0), MyData("c", 2, 2), MyData("e", 4, 4)]
+        source2 = [MyData("b", 1, 1), MyData("d", 3, 3)]
+
+        def source3():
+            return (MyData(str(i), i, i) for i in [2, 5])
+
+        producer = StreamingProducer(
+            logger=self.logger,
+            sources=[source1, source2, source3],
+            buffer_size=buffer_size,
+        )
+        producer.setup(producer.min_timestamp_ns, producer.max_timestamp_ns)
+
+        # Act
+        streamed_data = []
+        while producer.has_data:
+            streamed_data.append(producer.next())  # noqa (own method)
+
+        # Assert
+        assert [x.value for x in streamed_data] == ["a", "b", "c", "2", "d", "e", "5"]
+        assert producer.min_timestamp_ns == 0
+        assert producer.max_timestamp_ns == 5
+
+    def test_sources_without_bounds_are_not_scanned(self):
+        # Arrange
+        yielded = []
+
+        def source():
+            for i in range(1, 1001):
+                yielded.append(i)
+                yield MyData(str(i), i, i)
+
+        # Act
+        producer = StreamingProducer(logger=self.logger, sources=[source])
+
+        # Assert
+        assert yielded == [1]
+        assert producer.min_timestamp_ns == 1
+        assert producer.max_timestamp_ns == 9223285636854775000  # Open until streamed
+
+    def test_max_timestamp_known_once_stream_exhausted(self):
+        # Arrange
+        source = [MyData(str(i), i, i) for i in range(1, 6)]
+        producer = StreamingProducer(logger=self.logger, sources=[source], buffer_size=2)
+        producer.setup(producer.min_timestamp_ns, producer.max_timestamp_ns)
+
+        # Act
+        while producer.has_data:
+            producer.next()  # noqa (own method)
+
+        # Assert
+        assert producer.max_timestamp_ns == 5
+
+    def test_setup_filters_data_outside_run_range(self):
+        # Arrange
+        source = [MyData(str(i), i, i) for i in range(10)]
+        producer = StreamingProducer(logger=self.logger, sources=[source], buffer_size=3)
+
+        # Act
+        producer.setup(start_ns=3, stop_ns=6)
+        streamed_data = []
+        while producer.has_data:
+            streamed_data.append(producer.next())  # noqa (own method)
+
+        # Assert
+        assert [x.ts_recv_ns for x in streamed_data] == [3, 4, 5, 6]
+
+    def test_setup_after_run_replays_sources(self):
+        # Arrange
+        source = [MyData(str(i), i, i) for i in range(5)]
+        producer = StreamingProducer(logger=self.logger, sources=[source], buffer_size=2)
+        producer.setup(producer.min_timestamp_ns, producer.max_timestamp_ns)
+        while producer.has_data:
+            producer.next()  # noqa (own method)
+
+        # Act
+        producer.reset()
+        producer.setup(producer.min_timestamp_ns, producer.max_timestamp_ns)
+        streamed_data = []
+        while producer.has_data:
+            streamed_data.append(producer.next())  # noqa (own method)
+
+        # Assert
+        assert len(streamed_data) == 5
+
+    def test_merges_backtest_data_producer_source(self):
+        # Arrange
+        snapshot = OrderBookSnapshot(
+            instrument_id=ETHUSDT_BINANCE.id,
+            level=BookLevel.L2,
+            bids=[[1550.15, 0.51], [1580.00, 1.20]],
+            asks=[[1552.15, 1.51], [1582.00, 2.20]],
+            ts_event_ns=1,
+            ts_recv_ns=1,
+        )
+        in_memory = BacktestDataProducer(
+            logger=self.logger,
+            instruments=[ETHUSDT_BINANCE],
+            order_book_data=[snapshot],
+        )
+        source = [MyData("a", 0, 0), MyData("b", 2, 2)]
+
+        producer = StreamingProducer(
+            logger=self.logger,
+            sources=[in_memory, source],
+            instruments=[ETHUSDT_BINANCE],
+        )
+        producer.setup(producer.min_timestamp_ns, producer.max_timestamp_ns)
+
+        # Act
+        streamed_data = []
+        while producer.has_data:
+            streamed_data.append(producer.next())  # noqa (own method)
+
+        # Assert
+        assert streamed_data[1] == snapshot
+        assert [x.ts_recv_ns for x in streamed_data] == [0, 1, 2]
+        assert producer.instruments() == [ETHUSDT_BINANCE]
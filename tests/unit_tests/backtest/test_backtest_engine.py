@@ -21,6 +21,7 @@ from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.core.type import DataType
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.data.base import GenericData
+from nautilus_trader.model.data.tick import QuoteTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import BarAggregation
 from nautilus_trader.model.enums import BookLevel
@@ -38,6 +39,8 @@ from nautilus_trader.model.orderbook.data import Order
 from nautilus_trader.model.orderbook.data import OrderBookDelta
 from nautilus_trader.model.orderbook.data import OrderBookDeltas
 from nautilus_trader.model.orderbook.data import OrderBookSnapshot
+from nautilus_trader.serialization.arrow.streaming import ArrowStreamReader
+from nautilus_trader.serialization.arrow.streaming import ArrowStreamRecorder
 from nautilus_trader.trading.strategy import TradingStrategy
 from tests.test_kit.providers import TestDataProvider
 from tests.test_kit.providers import TestInstrumentProvider
@@ -410,6 +413,46 @@ class TestBacktestEngine:
         # Assert
         assert self.engine.iteration == 7999
 
+    def test_run_with_data_stream_merges_streamed_data(self):
+        # Arrange
+        data_type = DataType(MyData, metadata={"news_wire": "hacks"})
+        stream = [
+            GenericData(data_type, MyData("AAPL hacked", ts, ts))
+            for ts in range(1359676800000000000, 1359676800000000003)
+        ]
+        self.engine.add_data_stream(stream, ClientId("NEWS_CLIENT"))
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        assert self.engine.iteration == 8002
+
+    def test_run_with_recorded_arrow_stream(self, tmp_path):
+        # Arrange
+        recorder = ArrowStreamRecorder(path=str(tmp_path))
+        recorder.write(USDJPY_SIM)
+        for ts in range(1359676800000000000, 1359676800000000003):
+            recorder.write(
+                QuoteTick(
+                    instrument_id=USDJPY_SIM.id,
+                    bid=Price.from_str("90.002"),
+                    ask=Price.from_str("90.005"),
+                    bid_size=Quantity.from_int(1_000_000),
+                    ask_size=Quantity.from_int(1_000_000),
+                    ts_event_ns=ts,
+                    ts_recv_ns=ts,
+                )
+            )
+        recorder.close()
+
+        # Act
+        ArrowStreamReader(path=str(tmp_path)).setup_engine(self.engine)
+        self.engine.run()
+
+        # Assert
+        assert self.engine.iteration == 8002
+
     def test_change_fill_model(self):
         # Arrange
         # Act
@@ -0,0 +1,170 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import timedelta
+
+from nautilus_trader.backtest.triggers import OrderTriggerBook
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import TimeInForce
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.stubs import TestStubs
+from tests.test_kit.stubs import UNIX_EPOCH
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestOrderTriggerBook:
+    def setup(self):
+        # Fixture Setup
+        self.order_factory = OrderFactory(
+            trader_id=TestStubs.trader_id(),
+            strategy_id=TestStubs.strategy_id(),
+            clock=TestClock(),
+        )
+
+        self.book = OrderTriggerBook()
+
+    def limit(self, side, price, **kwargs):
+        return self.order_factory.limit(
+            AUDUSD_SIM.id,
+            side,
+            Quantity.from_int(100000),
+            Price.from_str(price),
+            **kwargs,
+        )
+
+    def test_triggered_when_empty_returns_empty_list(self):
+        # Arrange, Act
+        result = self.book.triggered(True, 1.0, True, 1.0)
+
+        # Assert
+        assert result == []
+        assert len(self.book) == 0
+
+    def test_triggered_returns_only_crossed_limit_orders(self):
+        # Arrange
+        buy1 = self.limit(OrderSide.BUY, "0.99000")
+        buy2 = self.limit(OrderSide.BUY, "1.00000")
+        sell1 = self.limit(OrderSide.SELL, "1.01000")
+        sell2 = self.limit(OrderSide.SELL, "1.00000")
+
+        for order in [buy1, buy2, sell1, sell2]:
+            self.book.add(order)
+
+        # Act
+        result = self.book.triggered(True, 1.00000, True, 1.00000)
+
+        # Assert
+        assert result == [buy2, sell2]
+
+    def test_triggered_returns_crossed_stop_orders(self):
+        # Arrange
+        buy_stop = self.order_factory.stop_market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00010"),
+        )
+        sell_stop = self.order_factory.stop_market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+            Price.from_str("0.99990"),
+        )
+
+        self.book.add(buy_stop)
+        self.book.add(sell_stop)
+
+        # Act
+        result1 = self.book.triggered(True, 1.00000, True, 1.00005)
+        result2 = self.book.triggered(True, 0.99990, True, 1.00010)
+
+        # Assert
+        assert result1 == []
+        assert result2 == [buy_stop, sell_stop]
+
+    def test_triggered_returns_stop_limit_order_once_in_insertion_order(self):
+        # Arrange
+        buy_limit = self.limit(OrderSide.BUY, "1.00020")
+        stop_limit = self.order_factory.stop_limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            price=Price.from_str("1.00020"),
+            trigger=Price.from_str("1.00010"),
+        )
+
+        self.book.add(stop_limit)
+        self.book.add(buy_limit)
+
+        # Act
+        result = self.book.triggered(False, 0.0, True, 1.00010)
+
+        # Assert
+        assert result == [stop_limit, buy_limit]
+
+    def test_remove_order_no_longer_triggered(self):
+        # Arrange
+        buy1 = self.limit(OrderSide.BUY, "1.00000")
+        buy2 = self.limit(OrderSide.BUY, "1.00000")
+        self.book.add(buy1)
+        self.book.add(buy2)
+
+        # Act
+        self.book.remove(buy1)
+        self.book.remove(buy1)  # Removing twice is a no-op
+
+        # Assert
+        assert len(self.book) == 1
+        assert self.book.triggered(False, 0.0, True, 1.00000) == [buy2]
+
+    def test_expired_returns_orders_in_expire_time_order(self):
+        # Arrange
+        order1 = self.limit(
+            OrderSide.BUY,
+            "0.90000",
+            time_in_force=TimeInForce.GTD,
+            expire_time=UNIX_EPOCH + timedelta(minutes=2),
+        )
+        order2 = self.limit(
+            OrderSide.BUY,
+            "0.90000",
+            time_in_force=TimeInForce.GTD,
+            expire_time=UNIX_EPOCH + timedelta(minutes=1),
+        )
+        order3 = self.limit(
+            OrderSide.BUY,
+            "0.90000",
+            time_in_force=TimeInForce.GTD,
+            expire_time=UNIX_EPOCH + timedelta(minutes=1),
+        )
+
+        for order in [order1, order2, order3]:
+            self.book.add(order)
+
+        self.book.remove(order3)
+
+        # Act
+        result1 = self.book.expired(30_000_000_000)
+        result2 = self.book.expired(120_000_000_000)
+
+        # Assert
+        assert result1 == []
+        assert result2 == [order2, order1]
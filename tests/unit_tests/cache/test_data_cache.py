@@ -15,8 +15,10 @@
 
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
+from nautilus_trader.cache.cache import Cache
 from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import JPY
 from nautilus_trader.model.currencies import USD
@@ -707,3 +709,104 @@ class TestCache:
 
         # Assert
         assert result == Decimal("0.80005")
+
+
+class TestCacheWithColumnarHistory:
+    def setup(self):
+        # Fixture Setup
+        self.cache = Cache(
+            database=None,
+            logger=TestStubs.logger(),
+            config={"columnar_history": True, "tick_capacity": 3, "bar_capacity": 3},
+        )
+
+    def _quote_tick(self, bid, ts):
+        return QuoteTick(
+            AUDUSD_SIM.id,
+            Price.from_str(bid),
+            Price.from_str("0.80010"),
+            Quantity.from_int(1),
+            Quantity.from_int(1),
+            ts,
+            ts,
+        )
+
+    def test_history_when_columnar_history_not_enabled_returns_none(self):
+        # Arrange
+        cache = TestStubs.cache()
+        cache.add_quote_tick(self._quote_tick("0.80000", 0))
+
+        # Act
+        # Assert
+        assert cache.quote_tick_history(AUDUSD_SIM.id) is None
+        assert cache.trade_tick_history(AUDUSD_SIM.id) is None
+        assert cache.bar_history(TestStubs.bartype_gbpusd_1sec_mid()) is None
+
+    def test_history_for_unknown_instrument_returns_none(self):
+        # Arrange
+        # Act
+        # Assert
+        assert self.cache.quote_tick_history(AUDUSD_SIM.id) is None
+        assert self.cache.quote_tick(AUDUSD_SIM.id) is None
+        assert self.cache.quote_tick_count(AUDUSD_SIM.id) == 0
+
+    def test_add_quote_ticks_keeps_most_recent_ticks_up_to_capacity(self):
+        # Arrange
+        ticks = [self._quote_tick(f"0.8000{i}", i) for i in range(5)]
+
+        # Act
+        for tick in ticks:
+            self.cache.add_quote_tick(tick)
+
+        # Assert
+        history = self.cache.quote_tick_history(AUDUSD_SIM.id)
+        assert self.cache.quote_tick_count(AUDUSD_SIM.id) == 3
+        assert self.cache.quote_ticks(AUDUSD_SIM.id) == [ticks[4], ticks[3], ticks[2]]
+        assert self.cache.quote_tick(AUDUSD_SIM.id) == ticks[4]
+        assert self.cache.quote_tick(AUDUSD_SIM.id, index=2) == ticks[2]
+        assert self.cache.quote_tick(AUDUSD_SIM.id, index=3) is None
+        assert np.array_equal(history.column("bid"), [80002, 80003, 80004])
+        assert np.array_equal(history.column("ts_event_ns", 2), [3, 4])
+
+    def test_add_trade_ticks_with_columnar_history(self):
+        # Arrange
+        tick = TradeTick(
+            AUDUSD_SIM.id,
+            Price.from_str("1.00001"),
+            Quantity.from_int(100_000),
+            AggressorSide.SELL,
+            "123456",
+            0,
+            0,
+        )
+
+        # Act
+        self.cache.add_trade_ticks([tick])
+
+        # Assert
+        history = self.cache.trade_tick_history(AUDUSD_SIM.id)
+        assert self.cache.trade_ticks(AUDUSD_SIM.id) == [tick]
+        assert self.cache.trade_tick(AUDUSD_SIM.id).match_id == "123456"
+        assert list(history.column("size")) == [100_000]
+
+    def test_add_bar_with_columnar_history(self):
+        # Arrange
+        bar = TestStubs.bar_5decimal()
+
+        # Act
+        self.cache.add_bar(bar)
+
+        # Assert
+        assert self.cache.bar(bar.type) == bar
+        assert self.cache.bar_history(bar.type).column("close")[-1] == bar.close.raw
+
+    def test_get_xrate_with_columnar_history(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_quote_tick(self._quote_tick("0.80000", 0))
+
+        # Act
+        result = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert result == Decimal("0.80005")
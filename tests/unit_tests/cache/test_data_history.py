@@ -0,0 +1,225 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.cache.history import BarHistory
+from nautilus_trader.cache.history import QuoteTickHistory
+from nautilus_trader.cache.history import TradeTickHistory
+from nautilus_trader.model.data.bar import Bar
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from tests.test_kit.stubs import TestStubs
+
+
+AUDUSD_SIM = TestStubs.audusd_id()
+
+
+def _quote_tick(i):
+    return QuoteTick(
+        AUDUSD_SIM,
+        Price.from_str(f"1.0000{i}"),
+        Price.from_str(f"1.0001{i}"),
+        Quantity.from_int(1_000_000 + i),
+        Quantity.from_str("1.5"),
+        i,
+        i + 1,
+    )
+
+
+class TestQuoteTickHistory:
+    def test_instantiate_with_invalid_capacity_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        with pytest.raises(ValueError):
+            QuoteTickHistory(AUDUSD_SIM, 0)
+
+    def test_empty_history(self):
+        # Arrange
+        history = QuoteTickHistory(AUDUSD_SIM, 3)
+
+        # Act
+        # Assert
+        assert len(history) == 0
+        assert history.to_list() == []
+        assert len(history.column("bid")) == 0
+        assert history.columns() == ["bid", "ask", "bid_size", "ask_size", "ts_event_ns", "ts_recv_ns"]
+        with pytest.raises(IndexError):
+            history[0]
+
+    def test_add_ticks_beyond_capacity_keeps_most_recent(self):
+        # Arrange
+        history = QuoteTickHistory(AUDUSD_SIM, 3)
+        ticks = [_quote_tick(i) for i in range(5)]
+
+        # Act
+        for tick in ticks:
+            history.add(tick)
+
+        # Assert
+        assert len(history) == 3
+        assert history.to_list() == [ticks[4], ticks[3], ticks[2]]
+        assert list(history) == [ticks[4], ticks[3], ticks[2]]
+        assert history[0] == ticks[4]
+        assert history[-1] == ticks[2]
+        assert history.to_list(2) == [ticks[4], ticks[3]]
+
+    def test_column_returns_most_recent_values_in_chronological_order(self):
+        # Arrange
+        history = QuoteTickHistory(AUDUSD_SIM, 3)
+        for i in range(5):
+            history.add(_quote_tick(i))
+
+        # Act
+        bids = history.column("bid")
+        ts_recv = history.column("ts_recv_ns", 2)
+
+        # Assert
+        assert bids.dtype == np.int64
+        assert np.array_equal(bids, [100002, 100003, 100004])
+        assert ts_recv.dtype == np.int64
+        assert np.array_equal(ts_recv, [4, 5])
+
+    def test_column_returns_read_only_view(self):
+        # Arrange
+        history = QuoteTickHistory(AUDUSD_SIM, 3)
+        history.add(_quote_tick(1))
+
+        # Act
+        bids = history.column("bid")
+
+        # Assert
+        with pytest.raises(ValueError):
+            bids[0] = 0
+
+    def test_column_view_is_overwritten_by_later_ticks(self):
+        # Arrange
+        history = QuoteTickHistory(AUDUSD_SIM, 3)
+        for i in range(3):
+            history.add(_quote_tick(i))
+        view = history.column("bid")
+        copy = history.column("bid", copy=True)
+
+        # Act
+        history.add(_quote_tick(3))
+
+        # Assert
+        assert np.array_equal(view, [100003, 100001, 100002])
+        assert np.array_equal(copy, [100000, 100001, 100002])
+        assert copy.flags.writeable
+
+    def test_column_with_unknown_name_raises_key_error(self):
+        # Arrange
+        history = QuoteTickHistory(AUDUSD_SIM, 3)
+
+        # Act
+        # Assert
+        with pytest.raises(KeyError):
+            history.column("price")
+
+    def test_add_tick_for_other_instrument_raises_value_error(self):
+        # Arrange
+        history = QuoteTickHistory(TestStubs.usdjpy_id(), 3)
+
+        # Act
+        # Assert
+        with pytest.raises(ValueError):
+            history.add(_quote_tick(1))
+
+    def test_clear(self):
+        # Arrange
+        history = QuoteTickHistory(AUDUSD_SIM, 3)
+        history.add(_quote_tick(1))
+
+        # Act
+        history.clear()
+
+        # Assert
+        assert len(history) == 0
+
+
+class TestTradeTickHistory:
+    def test_add_and_materialize_tick(self):
+        # Arrange
+        history = TradeTickHistory(AUDUSD_SIM, 2)
+        tick = TradeTick(
+            AUDUSD_SIM,
+            Price.from_str("1.00001"),
+            Quantity.from_str("0.12345678"),
+            AggressorSide.SELL,
+            "123456",
+            1,
+            2,
+        )
+
+        # Act
+        history.appendleft(tick)
+
+        # Assert
+        assert history[0] == tick
+        assert history[0].size == tick.size
+        assert history[0].aggressor_side == AggressorSide.SELL
+        assert history[0].match_id == "123456"
+        assert list(history.column("aggressor_side")) == [AggressorSide.SELL]
+
+    def test_materialize_tick_with_raw_values_beyond_float_precision(self):
+        # Arrange
+        history = TradeTickHistory(AUDUSD_SIM, 2)
+        tick = TradeTick(
+            AUDUSD_SIM,
+            Price.from_str("1.00001"),
+            Quantity.from_raw(123456789123456789, 9),
+            AggressorSide.BUY,
+            "123456",
+            1,
+            2,
+        )
+
+        # Act
+        history.add(tick)
+
+        # Assert
+        assert history[0].size == tick.size
+        assert list(history.column("size")) == [123456789123456789]
+
+
+class TestBarHistory:
+    def test_add_and_materialize_bars(self):
+        # Arrange
+        bar1 = TestStubs.bar_5decimal()
+        bar2 = Bar(
+            bar1.type,
+            Price.from_str("1.00002"),
+            Price.from_str("1.00004"),
+            Price.from_str("1.00001"),
+            Price.from_str("1.00003"),
+            Quantity.from_int(100_000),
+            1,
+            1,
+        )
+        history = BarHistory(bar1.type, 2)
+
+        # Act
+        history.add(bar1)
+        history.add(bar2)
+
+        # Assert
+        assert history.to_list() == [bar2, bar1]
+        assert np.array_equal(history.column("close"), [bar1.close.raw, 100003])
@@ -554,6 +554,86 @@ class TestCache:
         assert self.cache.orders_completed_count() == 1
         assert self.cache.orders_total_count() == 1
 
+    def test_order_queries_with_composite_filters_return_expected_orders(self):
+        # Arrange
+        order1 = self.strategy.order_factory.stop_market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        order2 = self.strategy.order_factory.stop_market(
+            GBPUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        self.cache.add_order(order1, PositionId.null())
+        self.cache.add_order(order2, PositionId.null())
+
+        # Act
+        order1.apply(TestStubs.event_order_submitted(order1))
+        self.cache.update_order(order1)
+        order1.apply(TestStubs.event_order_accepted(order1))
+        self.cache.update_order(order1)
+
+        # Assert
+        assert self.cache.orders_working(instrument_id=AUDUSD_SIM.id) == [order1]
+        assert self.cache.orders_working(instrument_id=GBPUSD_SIM.id) == []
+        assert self.cache.orders_working(venue=Venue("SIM"), strategy_id=self.strategy.id) == [order1]
+        assert self.cache.orders_working(venue=Venue("BINANCE"), instrument_id=AUDUSD_SIM.id) == []
+        assert self.cache.orders_working_count(instrument_id=AUDUSD_SIM.id) == 1
+        assert self.cache.orders_working_count(strategy_id=StrategyId("S-999")) == 0
+        assert self.cache.orders_total_count(venue=Venue("SIM")) == 2
+        assert self.cache.orders_total_count(instrument_id=GBPUSD_SIM.id) == 1
+        assert self.cache.client_order_ids(instrument_id=GBPUSD_SIM.id) == {order2.client_order_id}
+
+    def test_order_queries_when_order_state_changes_invalidates_cached_results(self):
+        # Arrange
+        order = self.strategy.order_factory.stop_market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        self.cache.add_order(order, PositionId.null())
+        order.apply(TestStubs.event_order_submitted(order))
+        self.cache.update_order(order)
+
+        inflight = self.cache.orders_inflight(instrument_id=AUDUSD_SIM.id)
+        working = self.cache.orders_working(instrument_id=AUDUSD_SIM.id)
+        inflight.clear()  # Mutating a result does not affect the cache
+
+        # Act
+        order.apply(TestStubs.event_order_accepted(order))
+        self.cache.update_order(order)
+
+        # Assert
+        assert working == []
+        assert self.cache.orders_inflight(instrument_id=AUDUSD_SIM.id) == []
+        assert self.cache.orders_working(instrument_id=AUDUSD_SIM.id) == [order]
+        assert self.cache.orders_working() == [order]
+
+    def test_client_order_ids_with_filter_returns_copy_of_index(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        self.cache.add_order(order, PositionId.null())
+
+        # Act
+        self.cache.client_order_ids(instrument_id=AUDUSD_SIM.id).clear()
+
+        # Assert
+        assert self.cache.client_order_ids(instrument_id=AUDUSD_SIM.id) == {order.client_order_id}
+        assert self.cache.orders_total_count(instrument_id=AUDUSD_SIM.id) == 1
+
     def test_update_position_for_open_position(self):
         # Arrange
         order1 = self.strategy.order_factory.market(
@@ -24,6 +24,7 @@ import pytz
 from nautilus_trader.common.clock import Clock
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.clock import TestClockScheduler
 from nautilus_trader.common.timer import TimeEvent
 from nautilus_trader.common.timer import TimeEventHandler
 from nautilus_trader.core.datetime import millis_to_nanos
@@ -602,6 +603,137 @@ class TestTestClock:
         assert clock.timer("TEST_TIMER2").name == "TEST_TIMER2"
         assert clock.timer_count == 2
 
+    def test_advance_time_with_many_time_alerts_fires_in_time_order(self):
+        # Arrange
+        clock = TestClock()
+        handler = []
+
+        for i in reversed(range(1, 101)):
+            clock.set_time_alert(f"ALERT{i}", UNIX_EPOCH + timedelta(seconds=i), handler.append)
+
+        # Act
+        event_handlers = clock.advance_time(50 * 1_000_000_000)
+
+        # Assert
+        assert [e.event.name for e in event_handlers] == [f"ALERT{i}" for i in range(1, 51)]
+        assert clock.timer_count == 50
+        assert clock.next_event_time_ns == 51 * 1_000_000_000
+
+    def test_advance_time_after_cancelling_time_alerts_skips_cancelled_alerts(self):
+        # Arrange
+        clock = TestClock()
+        handler = []
+
+        for i in range(1, 11):
+            clock.set_time_alert(f"ALERT{i}", UNIX_EPOCH + timedelta(seconds=i), handler.append)
+
+        # Act
+        for i in range(1, 11, 2):
+            clock.cancel_timer(f"ALERT{i}")
+
+        event_handlers = clock.advance_time(10 * 1_000_000_000)
+
+        # Assert
+        assert clock.next_event_time_ns == 0
+        assert [e.event.name for e in event_handlers] == [f"ALERT{i}" for i in range(2, 11, 2)]
+        assert clock.timer_count == 0
+
+    def test_set_time_alert_after_cancelling_with_same_name_fires_new_alert_only(self):
+        # Arrange
+        clock = TestClock()
+        handler = []
+
+        clock.set_time_alert("ALERT", UNIX_EPOCH + timedelta(seconds=1), handler.append)
+        clock.cancel_timer("ALERT")
+        clock.set_time_alert("ALERT", UNIX_EPOCH + timedelta(seconds=2), handler.append)
+
+        # Act
+        event_handlers = clock.advance_time(5 * 1_000_000_000)
+
+        # Assert
+        assert len(event_handlers) == 1
+        assert event_handlers[0].event.event_timestamp_ns == 2 * 1_000_000_000
+
+
+class TestTestClockScheduler:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.scheduler = TestClockScheduler(self.clock)
+
+    def test_instantiate_has_no_next_event(self):
+        # Arrange, Act, Assert
+        assert self.scheduler.next_event_time_ns == 2 ** 63 - 1
+
+    def test_advance_time_with_no_timers_sets_all_clocks(self):
+        # Arrange
+        clock1 = TestClock()
+        clock2 = TestClock()
+        self.scheduler.register(clock1)
+        self.scheduler.register(clock2)
+
+        # Act
+        self.scheduler.advance_time(1_000_000_000)
+
+        # Assert
+        assert clock1.timestamp_ns() == 1_000_000_000
+        assert clock2.timestamp_ns() == 1_000_000_000
+        assert self.clock.timestamp_ns() == 1_000_000_000
+
+    def test_set_time_alert_on_registered_clock_updates_next_event_time(self):
+        # Arrange
+        clock = TestClock()
+        self.scheduler.register(clock)
+
+        # Act
+        clock.set_time_alert("ALERT", UNIX_EPOCH + timedelta(seconds=2), lambda e: None)
+
+        # Assert
+        assert self.scheduler.next_event_time_ns == 2_000_000_000
+
+    def test_advance_time_handles_events_in_time_order_across_clocks(self):
+        # Arrange
+        handled = []
+        clock1 = TestClock()
+        clock2 = TestClock()
+        self.scheduler.register(clock1)
+        self.scheduler.register(clock2)
+
+        def handler(event):
+            handled.append((event.name, self.clock.timestamp_ns()))
+
+        clock1.set_timer("TIMER1", timedelta(seconds=2), handler=handler)
+        clock2.set_timer("TIMER2", timedelta(seconds=1), handler=handler)
+
+        # Act
+        self.scheduler.advance_time(4_000_000_000)
+
+        # Assert
+        assert handled == [
+            ("TIMER2", 1_000_000_000),
+            ("TIMER1", 2_000_000_000),
+            ("TIMER2", 2_000_000_000),
+            ("TIMER2", 3_000_000_000),
+            ("TIMER1", 4_000_000_000),
+            ("TIMER2", 4_000_000_000),
+        ]
+        assert self.scheduler.next_event_time_ns == 5_000_000_000
+        assert clock1.timestamp_ns() == 4_000_000_000
+
+    def test_clear_deregisters_clocks(self):
+        # Arrange
+        clock = TestClock()
+        self.scheduler.register(clock)
+        self.scheduler.clear()
+
+        # Act
+        clock.set_time_alert("ALERT", UNIX_EPOCH + timedelta(seconds=2), lambda e: None)
+        self.scheduler.advance_time(1_000_000_000)
+
+        # Assert
+        assert self.scheduler.next_event_time_ns == 2 ** 63 - 1
+        assert clock.timestamp_ns() == 0
+
 
 class TestLiveClockWithThreadTimer:
     def setup(self):
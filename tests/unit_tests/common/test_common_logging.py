@@ -14,17 +14,21 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import json
 
 import pytest
 
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import JsonLinesLogSink
 from nautilus_trader.common.logging import LiveLogger
 from nautilus_trader.common.logging import LogColor
 from nautilus_trader.common.logging import LogLevel
 from nautilus_trader.common.logging import LogLevelParser
+from nautilus_trader.common.logging import LogRecord
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.common.logging import LoggerAdapter
+from nautilus_trader.model.identifiers import TraderId
 
 
 class TestLogLevelParser:
@@ -65,6 +69,81 @@ class TestLogLevelParser:
         assert result == expected
 
 
+class TestLogRecord:
+    def test_to_dict_with_annotations_returns_expected_dict(self):
+        # Arrange
+        record = LogRecord(
+            timestamp_ns=1_000_000_000,
+            level=LogLevel.WARNING,
+            color=LogColor.YELLOW,
+            component="TEST_LOGGER",
+            msg="This is a log message.",
+            annotations={"my_tag": "something"},
+        )
+
+        # Act
+        result = record.to_dict()
+
+        # Assert
+        assert result == {
+            "timestamp": 1_000_000_000,
+            "level": "WRN",
+            "color": LogColor.YELLOW,
+            "trader_id": "",
+            "system_id": "",
+            "component": "TEST_LOGGER",
+            "msg": "This is a log message.",
+            "my_tag": "something",
+        }
+
+
+class TestJsonLinesLogSink:
+    def test_write_then_close_writes_json_lines(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "log.jsonl")
+        sink = JsonLinesLogSink(path)
+        records = [
+            LogRecord(i, LogLevel.INFO, LogColor.NORMAL, "TEST_LOGGER", f"message {i}")
+            for i in range(3)
+        ]
+
+        # Act
+        sink.write(records)
+        sink.close()
+
+        # Assert
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        assert sink.is_closed
+        assert [line["msg"] for line in lines] == ["message 0", "message 1", "message 2"]
+        assert lines[0]["level"] == "INF"
+
+    def test_flush_writes_buffered_records(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "log.jsonl")
+        sink = JsonLinesLogSink(path)
+        sink.write([LogRecord(0, LogLevel.DEBUG, LogColor.NORMAL, "TEST_LOGGER", "message")])
+
+        # Act
+        sink.flush()
+
+        # Assert
+        with open(path) as f:
+            assert len(f.readlines()) == 1
+        sink.close()
+
+    def test_flush_after_close_returns(self, tmp_path):
+        # Arrange
+        sink = JsonLinesLogSink(str(tmp_path / "log.jsonl"), timeout_secs=0.1)
+        sink.close()
+
+        # Act
+        sink.flush()
+
+        # Assert
+        assert sink.is_closed
+
+
 class TestLoggerTests:
     def test_log_debug_messages_to_console(self):
         # Arrange
@@ -156,6 +235,60 @@ class TestLoggerTests:
         # Assert
         assert True  # No exceptions raised
 
+    def test_is_enabled_without_sink_filters_below_stdout_level(self):
+        # Arrange
+        logger = Logger(clock=TestClock(), level_stdout=LogLevel.INFO)
+
+        # Act, Assert
+        assert not logger.is_enabled(LogLevel.DEBUG)
+        assert logger.is_enabled(LogLevel.INFO)
+        assert logger.is_enabled(LogLevel.ERROR)
+
+    def test_is_enabled_always_includes_errors(self):
+        # Arrange
+        logger = Logger(clock=TestClock(), level_stdout=LogLevel.CRITICAL)
+
+        # Act, Assert
+        assert not logger.is_enabled(LogLevel.WARNING)
+        assert logger.is_enabled(LogLevel.ERROR)
+
+    def test_is_enabled_when_bypassed_returns_false(self):
+        # Arrange
+        logger = Logger(clock=TestClock(), bypass=True)
+
+        # Act, Assert
+        assert not logger.is_enabled(LogLevel.CRITICAL)
+
+    def test_log_with_sink_writes_records_at_or_above_raw_level(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "log.jsonl")
+        sink = JsonLinesLogSink(path)
+        logger = Logger(
+            clock=TestClock(),
+            trader_id=TraderId("TESTER-000"),
+            level_stdout=LogLevel.ERROR,
+            level_raw=LogLevel.INFO,
+            sink=sink,
+        )
+        logger_adapter = LoggerAdapter(component="TEST_LOGGER", logger=logger)
+
+        # Act
+        logger_adapter.debug("A debug message.")
+        logger_adapter.info("An info message.", annotations={"my_tag": "something"})
+        sink.close()
+
+        # Assert
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        assert logger.is_enabled(LogLevel.INFO)
+        assert not logger.is_enabled(LogLevel.DEBUG)
+        assert len(lines) == 1
+        assert lines[0]["msg"] == "An info message."
+        assert lines[0]["component"] == "TEST_LOGGER"
+        assert lines[0]["my_tag"] == "something"
+        assert lines[0]["trader_id"] == "TESTER-000"
+        assert lines[0]["system_id"] == logger.system_id.value
+
 
 class TestLiveLogger:
     def setup(self):
@@ -229,3 +362,32 @@ class TestLiveLogger:
 
         # Assert
         assert not self.logger.is_running
+
+    @pytest.mark.asyncio
+    async def test_log_with_sink_when_running_writes_batched_records(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "log.jsonl")
+        sink = JsonLinesLogSink(path)
+        logger = LiveLogger(
+            loop=self.loop,
+            clock=LiveClock(),
+            level_stdout=LogLevel.ERROR,
+            sink=sink,
+        )
+
+        logger_adapter = LoggerAdapter(component="LIVE_LOGGER", logger=logger)
+        logger.start()
+
+        # Act
+        for i in range(10):
+            logger_adapter.debug(f"message {i}")
+
+        await asyncio.sleep(0.1)  # <-- processes all log messages
+        logger.stop()
+        await asyncio.sleep(0.1)
+        sink.close()
+
+        # Assert
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        assert [line["msg"] for line in lines] == [f"message {i}" for i in range(10)]
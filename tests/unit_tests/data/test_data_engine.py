@@ -165,6 +165,56 @@ class TestDataEngine:
         # Assert
         assert BINANCE.value not in self.data_engine.registered_clients
 
+    def test_register_data_handler_receives_all_processed_data(self):
+        # Arrange
+        handler = []
+        self.data_engine.register_data_handler(handler.append)
+        tick = TestStubs.trade_tick_5decimal()
+
+        # Act
+        self.data_engine.process(tick)
+
+        # Assert
+        assert handler == [tick]
+
+    def test_register_data_handler_when_handler_raises_still_handles_data(self):
+        # Arrange
+        def raising_handler(data):
+            raise RuntimeError("cannot handle data")
+
+        handler = []
+        self.data_engine.register_data_handler(raising_handler)
+        self.data_engine.register_data_handler(handler.append)
+        tick = TestStubs.trade_tick_5decimal()
+
+        # Act
+        self.data_engine.process(tick)
+
+        # Assert
+        assert handler == [tick]
+
+    def test_register_data_handler_when_already_registered_raises_key_error(self):
+        # Arrange
+        handler = []
+        self.data_engine.register_data_handler(handler.append)
+
+        # Act
+        # Assert
+        with pytest.raises(KeyError):
+            self.data_engine.register_data_handler(handler.append)
+
+    def test_deregister_data_handler_stops_receiving_data(self):
+        # Arrange
+        handler = []
+        self.data_engine.register_data_handler(handler.append)
+
+        # Act
+        self.data_engine.deregister_data_handler(handler.append)
+        self.data_engine.process(TestStubs.trade_tick_5decimal())
+
+        # Assert
+        assert handler == []
+
     def test_reset(self):
         # Arrange
         # Act
@@ -86,14 +86,14 @@ class TestQuoteTickDataWrangler:
         assert tick_data.iloc[2].name == Timestamp("2013-01-31 23:59:59.900000+0000", tz="UTC")
         assert tick_data.iloc[3].name == Timestamp("2013-02-01 00:00:00+0000", tz="UTC")
         assert tick_data.iloc[0]["instrument_id"] == 0
-        assert tick_data.iloc[0]["bid_size"] == "1000000"
-        assert tick_data.iloc[0]["ask_size"] == "1000000"
-        assert tick_data.iloc[1]["bid_size"] == "1000000"
-        assert tick_data.iloc[1]["ask_size"] == "1000000"
-        assert tick_data.iloc[2]["bid_size"] == "1000000"
-        assert tick_data.iloc[2]["ask_size"] == "1000000"
-        assert tick_data.iloc[3]["bid_size"] == "1000000"
-        assert tick_data.iloc[3]["ask_size"] == "1000000"
+        assert tick_data.iloc[0]["bid_size"] == 1000000
+        assert tick_data.iloc[0]["ask_size"] == 1000000
+        assert tick_data.iloc[1]["bid_size"] == 1000000
+        assert tick_data.iloc[1]["ask_size"] == 1000000
+        assert tick_data.iloc[2]["bid_size"] == 1000000
+        assert tick_data.iloc[2]["ask_size"] == 1000000
+        assert tick_data.iloc[3]["bid_size"] == 1000000
+        assert tick_data.iloc[3]["ask_size"] == 1000000
 
     def test_build_ticks_with_tick_data(self):
         # Arrange
@@ -116,7 +116,7 @@ class TestQuoteTickDataWrangler:
         assert ticks[0].bid_size == Quantity.from_str("1000000")
         assert ticks[0].ask_size == Quantity.from_str("1000000")
         assert ticks[0].ts_recv_ns == 1580398089820000000
-        assert ticks[99999].ts_recv_ns == 1580504394500999936
+        assert ticks[99999].ts_recv_ns == 1580504394501000000
 
     def test_build_ticks_with_bar_data(self):
         # Arrange
@@ -141,6 +141,51 @@ class TestQuoteTickDataWrangler:
         assert ticks[0].ask_size == Quantity.from_str("1000000")
         assert ticks[0].ts_recv_ns == 1359676799700000000
 
+    def test_pre_process_with_bar_data_interleaves_ohlc_prices(self):
+        # Arrange
+        bid_data = TestDataProvider.usdjpy_1min_bid()[:10]
+        ask_data = TestDataProvider.usdjpy_1min_ask()[:10]
+        self.tick_builder = QuoteTickDataWrangler(
+            instrument=TestInstrumentProvider.default_fx_ccy("USD/JPY"),
+            data_quotes=None,
+            data_bars_bid={BarAggregation.MINUTE: bid_data},
+            data_bars_ask={BarAggregation.MINUTE: ask_data},
+        )
+
+        # Act
+        self.tick_builder.pre_process(0)
+        tick_data = self.tick_builder.processed_data
+
+        # Assert
+        assert len(tick_data) == 40
+        assert list(tick_data["bid"].iloc[:4]) == list(bid_data.iloc[0][["open", "high", "low", "close"]])
+        assert list(tick_data["ask"].iloc[:4]) == list(ask_data.iloc[0][["open", "high", "low", "close"]])
+        assert tick_data.index.is_monotonic_increasing
+
+    def test_pre_process_with_bar_data_and_random_seed_swaps_high_low_per_bar(self):
+        # Arrange
+        bid_data = TestDataProvider.usdjpy_1min_bid()[:100]
+        ask_data = TestDataProvider.usdjpy_1min_ask()[:100]
+        self.tick_builder = QuoteTickDataWrangler(
+            instrument=TestInstrumentProvider.default_fx_ccy("USD/JPY"),
+            data_quotes=None,
+            data_bars_bid={BarAggregation.MINUTE: bid_data},
+            data_bars_ask={BarAggregation.MINUTE: ask_data},
+        )
+
+        # Act
+        self.tick_builder.pre_process(0, random_seed=42)
+        tick_data = self.tick_builder.processed_data
+
+        # Assert
+        bids = tick_data["bid"].to_numpy().reshape(-1, 4)
+        highs_first = bids[:, 1] == bid_data["high"].to_numpy()
+        lows_first = bids[:, 1] == bid_data["low"].to_numpy()
+        assert (highs_first | lows_first).all()
+        assert (bids[:, 0] == bid_data["open"].to_numpy()).all()
+        assert (bids[:, 3] == bid_data["close"].to_numpy()).all()
+        assert not highs_first.all()
+
 
 class TestTradeTickDataWrangler:
     def setup(self):
@@ -244,6 +289,97 @@ class TestBarDataWrangler:
         # Assert
         assert len(bars) == 500
 
+    def test_build_bars_all_builds_expected_bar(self):
+        # Arrange
+        data = TestDataProvider.gbpusd_1min_bid()[:1000]
+
+        # Act
+        bars = self.bar_builder.build_bars_all()
+
+        # Assert
+        assert bars[0].open == Price(data.iloc[0]["open"], 5)
+        assert bars[0].high == Price(data.iloc[0]["high"], 5)
+        assert bars[0].low == Price(data.iloc[0]["low"], 5)
+        assert bars[0].close == Price(data.iloc[0]["close"], 5)
+        assert bars[0].volume == Quantity(data.iloc[0]["volume"], 1)
+        assert bars[0].ts_recv_ns == data.index[0].value
+
+    def test_build_bars_all_with_identical_data_returns_cached_bars(self):
+        # Arrange
+        BarDataWrangler.clear_cache()
+        bar_builder1 = BarDataWrangler(
+            bar_type=TestStubs.bartype_gbpusd_1min_bid(),
+            price_precision=5,
+            size_precision=1,
+            data=TestDataProvider.gbpusd_1min_bid()[:1000],
+            cache_bars=True,
+        )
+        bar_builder2 = BarDataWrangler(
+            bar_type=TestStubs.bartype_gbpusd_1min_bid(),
+            price_precision=5,
+            size_precision=1,
+            data=TestDataProvider.gbpusd_1min_bid()[:1000],
+            cache_bars=True,
+        )
+
+        # Act
+        bars1 = bar_builder1.build_bars_all()
+        bars2 = bar_builder2.build_bars_all()
+
+        # Assert
+        assert bars1 == bars2
+        assert bars1[0] is bars2[0]
+        assert bars1 is not bars2
+
+    def test_build_bars_all_when_not_caching_builds_new_bars(self):
+        # Arrange
+        BarDataWrangler.clear_cache()
+
+        # Act
+        bars1 = self.bar_builder.build_bars_all()
+        bars2 = self.bar_builder.build_bars_all()
+
+        # Assert
+        assert bars1 == bars2
+        assert bars1[0] is not bars2[0]
+
+    def test_build_bars_all_with_different_precision_does_not_use_cache(self):
+        # Arrange
+        BarDataWrangler.clear_cache()
+        bar_builder1 = BarDataWrangler(
+            bar_type=TestStubs.bartype_gbpusd_1min_bid(),
+            price_precision=5,
+            size_precision=1,
+            data=TestDataProvider.gbpusd_1min_bid()[:1000],
+            cache_bars=True,
+        )
+        bar_builder2 = BarDataWrangler(
+            bar_type=TestStubs.bartype_gbpusd_1min_bid(),
+            price_precision=4,
+            size_precision=1,
+            data=TestDataProvider.gbpusd_1min_bid()[:1000],
+            cache_bars=True,
+        )
+
+        # Act
+        bars1 = bar_builder1.build_bars_all()
+        bars2 = bar_builder2.build_bars_all()
+
+        # Assert
+        assert bars1[0].open.precision == 5
+        assert bars2[0].open.precision == 4
+
+    def test_iter_bars_lazily_builds_bars_in_range(self):
+        # Arrange
+        expected = self.bar_builder.build_bars_range(start=10, end=20)
+
+        # Act
+        bars = list(self.bar_builder.iter_bars(start=10, end=20))
+
+        # Assert
+        assert bars == expected
+        assert len(list(self.bar_builder.iter_bars())) == 1000
+
 
 class TestTardisQuoteDataWrangler:
     def setup(self):
@@ -276,10 +412,10 @@ class TestTardisQuoteDataWrangler:
         assert self.tick_builder.resolution == BarAggregation.TICK
         assert len(ticks) == 9999
         assert ticks.iloc[1].name == Timestamp("2020-02-22 00:00:03.522418+0000", tz="UTC")
-        assert ticks.bid_size[0] == "0.670000"
-        assert ticks.ask_size[0] == "0.840000"
-        assert ticks.bid[0] == "9681.92"
-        assert ticks.ask[0] == "9682.00"
+        assert ticks.bid_size[0] == 0.67
+        assert ticks.ask_size[0] == 0.84
+        assert ticks.bid[0] == 9681.92
+        assert ticks.ask[0] == 9682.0
         assert sorted(ticks.columns) == sorted(
             ["ask", "ask_size", "bid", "bid_size", "instrument_id", "symbol"]
         )
@@ -13,11 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pickle
+
 import pytest
 
 from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import ClientOrderId
+from nautilus_trader.model.identifiers import ExecutionId
 from nautilus_trader.model.identifiers import Identifier
+from nautilus_trader.model.identifiers import IdentifierCache
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import StrategyId
@@ -102,6 +106,24 @@ class TestIdentifiers:
         # Assert
         assert isinstance(hash(identifier1), int)
         assert hash(identifier1) == hash(identifier2)
+        assert hash(identifier1) == hash("abc")
+
+    @pytest.mark.parametrize(
+        "identifier",
+        [
+            ClientOrderId("O-123456"),
+            AccountId("SIM", "000"),
+            InstrumentId(Symbol("AUD/USD"), Venue("SIM")),
+        ],
+    )
+    def test_pickling_round_trip_preserves_equality_and_hash(self, identifier):
+        # Arrange
+        # Act
+        result = pickle.loads(pickle.dumps(identifier))
+
+        # Assert
+        assert result == identifier
+        assert hash(result) == hash(identifier)
 
     def test_identifier_equality(self):
         # Arrange
@@ -273,3 +295,80 @@ class TestInstrumentId:
 
         # Assert
         assert instrument_id == result
+
+    def test_parse_instrument_id_from_str_returns_interned_instance(self):
+        # Arrange
+        # Act
+        result1 = InstrumentId.from_str("AUD/USD.SIM")
+        result2 = InstrumentId.from_str("AUD/USD.SIM")
+
+        # Assert
+        assert result1 is result2
+        assert result1 == InstrumentId(Symbol("AUD/USD"), Venue("SIM"))
+
+
+class TestIdentifierCache:
+    def test_get_returns_interned_instance(self):
+        # Arrange
+        cache = IdentifierCache(ClientOrderId)
+
+        # Act
+        result1 = cache.get("O-123456")
+        result2 = cache.get("O-123456")
+
+        # Assert
+        assert result1 is result2
+        assert result1 == ClientOrderId("O-123456")
+        assert len(cache) == 1
+
+    def test_get_with_composite_identifier_factory(self):
+        # Arrange
+        cache = IdentifierCache(AccountId.from_str)
+
+        # Act
+        result = cache.get("SIM-000")
+
+        # Assert
+        assert result == AccountId("SIM", "000")
+        assert cache.get("SIM-000") is result
+
+    def test_get_when_at_capacity_evicts_oldest(self):
+        # Arrange
+        cache = IdentifierCache(ExecutionId, capacity=2)
+        execution_id1 = cache.get("E-1")
+        execution_id2 = cache.get("E-2")
+
+        # Act
+        cache.get("E-3")
+
+        # Assert
+        assert len(cache) == 2
+        assert cache.get("E-2") is execution_id2
+        assert cache.get("E-1") is not execution_id1
+        assert cache.get("E-1") == execution_id1
+
+    def test_get_when_at_capacity_evicts_least_recently_used(self):
+        # Arrange
+        cache = IdentifierCache(ExecutionId, capacity=2)
+        execution_id1 = cache.get("E-1")
+        execution_id2 = cache.get("E-2")
+        cache.get("E-1")  # Hit moves E-1 to most recently used
+
+        # Act
+        cache.get("E-3")
+
+        # Assert
+        assert len(cache) == 2
+        assert cache.get("E-1") is execution_id1
+        assert cache.get("E-2") is not execution_id2
+
+    def test_clear(self):
+        # Arrange
+        cache = IdentifierCache(ExecutionId)
+        cache.get("E-1")
+
+        # Act
+        cache.clear()
+
+        # Assert
+        assert len(cache) == 0
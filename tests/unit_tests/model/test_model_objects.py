@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pickle
 from decimal import Decimal
 
 import pytest
@@ -541,6 +542,59 @@ class TestBaseDecimal:
         assert isinstance(hash(decimal2), int)
         assert hash(decimal1) == hash(decimal2)
 
+    @pytest.mark.parametrize(
+        "value, precision",
+        [
+            [0, 0],
+            [1.1, 1],
+            [-1.1, 1],
+            [1.12345, 5],
+            [Decimal("100.5"), 2],
+        ],
+    )
+    def test_hash_equals_equivalent_decimal_hash(self, value, precision):
+        # Arrange
+        decimal1 = BaseDecimal(value, precision)
+
+        # Act, Assert
+        assert hash(decimal1) == hash(decimal1.as_decimal())
+
+    @pytest.mark.parametrize(
+        "value, precision, expected",
+        [
+            [0, 0, 0],
+            [1, 2, 100],
+            [1.1, 1, 11],
+            [-1.123, 3, -1123],
+            [1.155, 2, 116],
+            [Decimal("1.005"), 2, 100],
+            ["1.23", 1, 12],
+        ],
+    )
+    def test_raw_with_various_values_returns_expected_scaled_integer(
+        self,
+        value,
+        precision,
+        expected,
+    ):
+        # Arrange, Act
+        result = BaseDecimal(value, precision)
+
+        # Assert
+        assert result.raw == expected
+
+    def test_comparisons_with_different_precisions_returns_expected_result(self):
+        # Arrange
+        decimal1 = BaseDecimal(1.1, 1)
+        decimal2 = BaseDecimal(1.10, 2)
+        decimal3 = BaseDecimal(1.11, 2)
+
+        # Act, Assert
+        assert decimal1 == decimal2
+        assert decimal1 < decimal3
+        assert decimal3 > decimal1
+        assert decimal1 + decimal3 == Decimal("2.21")
+
     @pytest.mark.parametrize(
         "value, precision, expected",
         [
@@ -635,6 +689,25 @@ class TestPrice:
         assert str(price) == string
         assert price.precision == precision
 
+    @pytest.mark.parametrize(
+        "raw, precision, string",
+        [
+            [0, 0, "0"],
+            [0, 2, "0.00"],
+            [91715, 3, "91.715"],
+            [-5, 2, "-0.05"],
+            [1000000, 0, "1000000"],
+        ],
+    )
+    def test_from_raw_returns_expected_value(self, raw, precision, string):
+        # Arrange, Act
+        price = Price.from_raw(raw, precision)
+
+        # Assert
+        assert str(price) == string
+        assert price.precision == precision
+        assert price == Price.from_str(string)
+
     def test_str_repr(self):
         # Arrange, Act
         price = Price(1.00000, precision=5)
@@ -643,6 +716,18 @@ class TestPrice:
         assert "1.00000" == str(price)
         assert "Price('1.00000')" == repr(price)
 
+    def test_pickling_round_trip_returns_equal_price(self):
+        # Arrange
+        price = Price.from_str("1.00005")
+
+        # Act
+        result = pickle.loads(pickle.dumps(price))
+
+        # Assert
+        assert result == price
+        assert result.precision == 5
+        assert str(result) == "1.00005"
+
 
 class TestQuantity:
     def test_zero_returns_zero_quantity(self):
@@ -672,6 +757,20 @@ class TestQuantity:
         assert str(qty) == "0.511"
         assert qty.precision == 3
 
+    def test_from_raw_returns_expected_value(self):
+        # Arrange, Act
+        qty = Quantity.from_raw(511, 3)
+
+        # Assert
+        assert qty == Quantity(0.511, precision=3)
+        assert str(qty) == "0.511"
+        assert qty.precision == 3
+
+    def test_from_raw_with_negative_value_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            Quantity.from_raw(-1, 0)
+
     def test_instantiate_with_negative_value_raises_value_error(self):
         # Arrange
         # Act
@@ -710,6 +809,17 @@ class TestQuantity:
         assert "2100.166667" == str(quantity)
         assert "Quantity('2100.166667')" == repr(quantity)
 
+    def test_pickling_round_trip_returns_equal_quantity(self):
+        # Arrange
+        quantity = Quantity.from_str("100.50")
+
+        # Act
+        result = pickle.loads(pickle.dumps(quantity))
+
+        # Assert
+        assert result == quantity
+        assert result.precision == 2
+
 
 class TestMoney:
     def test_instantiate_with_none_currency_raises_type_error(self):
@@ -832,6 +942,25 @@ class TestMoney:
         assert isinstance(hash(money0), int)
         assert hash(money0) == hash(money0)
 
+    def test_from_raw_returns_expected_money(self):
+        # Arrange, Act
+        money = Money.from_raw(150, USD)
+
+        # Assert
+        assert money == Money(1.50, USD)
+        assert money.raw == 150
+
+    def test_pickling_round_trip_returns_equal_money(self):
+        # Arrange
+        money = Money(1_000.25, USD)
+
+        # Act
+        result = pickle.loads(pickle.dumps(money))
+
+        # Assert
+        assert result == money
+        assert result.currency == USD
+
     def test_str(self):
         # Arrange
         money0 = Money(0, USD)
@@ -21,6 +21,7 @@ from nautilus_trader.model.enums import BookLevel
 from nautilus_trader.model.enums import DeltaType
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.orderbook.book import L1OrderBook
 from nautilus_trader.model.orderbook.book import L2OrderBook
 from nautilus_trader.model.orderbook.book import L3OrderBook
@@ -263,6 +264,33 @@ def test_delete_l1():
     book.delete(order)
 
 
+def test_l1_update_top_reprices_levels_for_fills():
+    # Arrange
+    book = OrderBook.create(
+        instrument=AUDUSD_SIM,
+        level=BookLevel.L1,
+    )
+    book.update_top(TestStubs.quote_tick_5decimal())
+
+    # Act
+    book.update_top(
+        TestStubs.quote_tick_5decimal(
+            bid=Price.from_str("0.99998"),
+            ask=Price.from_str("0.99999"),
+        )
+    )
+    fills = book.asks.simulate_order_fills(
+        order=Order(price=0.99999, size=10.0, side=OrderSide.BUY),
+    )
+
+    # Assert
+    assert book.best_ask_price() == 0.99999
+    assert book.asks.contains_price(0.99999)
+    assert not book.asks.contains_price(1.00003)
+    assert book.bids.level_at(0.99998) is book.best_bid_level()
+    assert fills == [(Price.from_str("0.99999"), Quantity.from_str("10"))]
+
+
 def test_top(empty_l2_book):
     empty_l2_book.add(Order(price=10.0, size=5.0, side=OrderSide.BUY))
     empty_l2_book.add(Order(price=20.0, size=5.0, side=OrderSide.BUY))
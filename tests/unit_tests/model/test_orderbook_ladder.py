@@ -96,6 +96,52 @@ def test_update_no_volume(bids):
     assert order.price not in bids.prices()
 
 
+def test_insert_reversed_keeps_levels_sorted_from_top():
+    prices = [100.0, 103.0, 101.0, 105.0, 102.0, 104.0]
+    orders = [
+        Order(price=price, size=1.0, side=OrderSide.BUY, id=str(i)) for i, price in enumerate(prices)
+    ]
+    ladder = TestStubs.ladder(reverse=True, orders=orders)
+
+    assert ladder.prices() == [105.0, 104.0, 103.0, 102.0, 101.0, 100.0]
+    assert ladder.top().price == 105.0
+
+
+def test_delete_middle_level_keeps_levels_sorted():
+    orders = [
+        Order(price=100.0, size=1.0, side=OrderSide.SELL, id="1"),
+        Order(price=101.0, size=1.0, side=OrderSide.SELL, id="2"),
+        Order(price=102.0, size=1.0, side=OrderSide.SELL, id="3"),
+    ]
+    ladder = TestStubs.ladder(reverse=False, orders=orders)
+
+    ladder.delete(orders[1])
+
+    assert ladder.prices() == [100.0, 102.0]
+    assert not ladder.contains_price(101.0)
+    assert ladder.level_at(101.0) is None
+
+
+def test_update_price_moves_order_to_new_level():
+    order = Order(price=100.0, size=10.0, side=OrderSide.BUY, id="1")
+    ladder = TestStubs.ladder(
+        reverse=True,
+        orders=[order, Order(price=99.0, size=5.0, side=OrderSide.BUY, id="2")],
+    )
+
+    ladder.update(Order(price=98.0, size=10.0, side=OrderSide.BUY, id="1"))
+
+    assert ladder.prices() == [99.0, 98.0]
+    assert ladder.top().price == 99.0
+
+
+def test_contains_price_and_level_at(bids):
+    assert bids.contains_price(10.0)
+    assert bids.level_at(10.0) is bids.top()
+    assert not bids.contains_price(10.5)
+    assert bids.level_at(10.5) is None
+
+
 def test_top_level(bids, asks):
     assert bids.top().price == Price.from_str("10")
     assert asks.top().price == Price.from_str("15")
@@ -108,7 +154,7 @@ def test_exposure():
         Order(price=105.0, size=5.0, side=OrderSide.SELL),
     ]
     ladder = TestStubs.ladder(reverse=True, orders=orders)
-    assert tuple(ladder.exposures()) == (525.0, 1000.0, 1010.0)
+    assert tuple(ladder.exposures()) == (525.0, 1010.0, 1000.0)
 
 
 def test_repr(asks):
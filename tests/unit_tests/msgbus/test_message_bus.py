@@ -13,10 +13,36 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pytest
+
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.msgbus.message_bus import MessageBus
 from nautilus_trader.msgbus.message_bus import Subscription
+from nautilus_trader.msgbus.message_bus import is_matching
+
+
+@pytest.mark.parametrize(
+    "topic, pattern, expected",
+    [
+        ["a", "*", True],
+        ["a", "a", True],
+        ["a", "b", False],
+        ["data.quotes.BINANCE", "data.*", True],
+        ["data.quotes.BINANCE", "data.*.BINANCE", True],
+        ["data.quotes.BINANCE", "data.*.SIM", False],
+        ["data.trades.BINANCE", "data.?rades.*", True],
+        ["data.trades.BINANCE", "data.?.*", False],
+        ["events.order.S-001", "events.order*", True],
+        ["events.order.S-001", "*.order.*", True],
+        ["events.position.S-001", "events.order*", False],
+        ["", "*", True],
+        ["", "?", False],
+    ],
+)
+def test_is_matching(topic, pattern, expected):
+    # Arrange, Act, Assert
+    assert is_matching(topic, pattern) == expected
 
 
 class TestSubscription:
@@ -410,3 +436,67 @@ class TestMessageBus:
         # Assert
         assert "OK!" in subscriber1
         assert "OK!" in subscriber2
+
+    def test_publish_with_single_character_wildcard_sends_to_subscriber(self):
+        # Arrange
+        subscriber = []
+
+        self.msgbus.subscribe(topic="data.?rades.*", handler=subscriber.append)
+
+        # Act
+        self.msgbus.publish("data.trades.BINANCE", "OK!")
+        self.msgbus.publish("data.quotes.BINANCE", "NOT OK!")
+
+        # Assert
+        assert subscriber == ["OK!"]
+
+    def test_publish_after_new_pattern_subscription_sends_to_new_subscriber(self):
+        # Arrange
+        subscriber1 = []
+        subscriber2 = []
+
+        self.msgbus.subscribe(topic="events.order.S-001", handler=subscriber1.append)
+        self.msgbus.publish("events.order.S-001", "1")  # Resolves and caches topic
+
+        # Act
+        self.msgbus.subscribe(topic="events.order*", handler=subscriber2.append)
+        self.msgbus.publish("events.order.S-001", "2")
+
+        # Assert
+        assert subscriber1 == ["1", "2"]
+        assert subscriber2 == ["2"]
+
+    def test_publish_after_unsubscribe_does_not_send_to_removed_subscribers(self):
+        # Arrange
+        subscriber1 = []
+        subscriber2 = []
+
+        self.msgbus.subscribe(topic="events.order.S-001", handler=subscriber1.append)
+        self.msgbus.subscribe(topic="events.*", handler=subscriber2.append)
+        self.msgbus.publish("events.order.S-001", "1")
+
+        # Act
+        self.msgbus.unsubscribe(topic="events.order.S-001", handler=subscriber1.append)
+        self.msgbus.unsubscribe(topic="events.*", handler=subscriber2.append)
+        self.msgbus.publish("events.order.S-001", "2")
+
+        # Assert
+        assert subscriber1 == ["1"]
+        assert subscriber2 == ["1"]
+
+    def test_publish_sends_to_channel_and_pattern_subscribers_in_priority_order(self):
+        # Arrange
+        received = []
+
+        self.msgbus.subscribe(topic="system", handler=lambda m: received.append("channel"))
+        self.msgbus.subscribe(
+            topic="sys*",
+            handler=lambda m: received.append("pattern"),
+            priority=10,
+        )
+
+        # Act
+        self.msgbus.publish("system", "OK!")
+
+        # Assert
+        assert received == ["pattern", "channel"]
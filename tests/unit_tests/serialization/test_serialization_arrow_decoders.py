@@ -0,0 +1,219 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pyarrow as pa
+
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.data.venue import InstrumentStatusUpdate
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.enums import BookLevel
+from nautilus_trader.model.enums import DeltaType
+from nautilus_trader.model.enums import InstrumentStatus
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.orderbook.data import Order
+from nautilus_trader.model.orderbook.data import OrderBookDelta
+from nautilus_trader.model.orderbook.data import OrderBookDeltas
+from nautilus_trader.model.orderbook.data import OrderBookSnapshot
+from nautilus_trader.serialization.arrow.core import _decode
+from nautilus_trader.serialization.arrow.decoders import decode_instrument_status_updates
+from nautilus_trader.serialization.arrow.decoders import decode_order_book_data
+from nautilus_trader.serialization.arrow.decoders import decode_quote_ticks
+from nautilus_trader.serialization.arrow.decoders import decode_trade_ticks
+from tests.test_kit.stubs import TestStubs
+
+
+AUDUSD_SIM = TestStubs.audusd_id()
+USDJPY_SIM = TestStubs.usdjpy_id()
+
+
+def _to_table(values):
+    return pa.table({key: [v[key] for v in values] for key in values[0]})
+
+
+def _trade_tick(instrument_id, price, match_id, ts):
+    return TradeTick(
+        instrument_id=instrument_id,
+        price=Price.from_str(price),
+        size=Quantity.from_int(100_000),
+        aggressor_side=AggressorSide.BUY,
+        match_id=match_id,
+        ts_event_ns=ts,
+        ts_recv_ns=ts,
+    )
+
+
+def _delta(delta_type, ts, side=OrderSide.BUY, price=1.0, order_id="1", instrument_id=AUDUSD_SIM):
+    return OrderBookDelta(
+        instrument_id=instrument_id,
+        level=BookLevel.L2,
+        delta_type=delta_type,
+        order=None if delta_type == DeltaType.CLEAR else Order(price, 10.0, side, order_id),
+        ts_event_ns=ts,
+        ts_recv_ns=ts,
+    )
+
+
+class TestArrowDecoders:
+    def test_decode_trade_ticks_matches_from_dict(self):
+        # Arrange
+        ticks = [
+            _trade_tick(AUDUSD_SIM, "1.00001", "1", 1),
+            _trade_tick(USDJPY_SIM, "90.001", "2", 2),
+            _trade_tick(AUDUSD_SIM, "1.00001", "3", 3),
+        ]
+        table = _to_table([TradeTick.to_dict(tick) for tick in ticks])
+
+        # Act
+        result = decode_trade_ticks(table)
+
+        # Assert
+        assert result == ticks
+        assert result[0].instrument_id is result[2].instrument_id
+        assert result[0].price is result[2].price
+
+    def test_decode_trade_ticks_with_dictionary_encoded_instrument_id(self):
+        # Arrange
+        ticks = [
+            _trade_tick(AUDUSD_SIM, "1.00001", "1", 1),
+            _trade_tick(USDJPY_SIM, "90.001", "2", 2),
+        ]
+        table = _to_table([TradeTick.to_dict(tick) for tick in ticks])
+        index = table.schema.get_field_index("instrument_id")
+        table = table.set_column(
+            index,
+            "instrument_id",
+            table.column("instrument_id").dictionary_encode(),
+        )
+
+        # Act
+        result = decode_trade_ticks(table)
+
+        # Assert
+        assert result == ticks
+
+    def test_decode_trade_ticks_drops_duplicates_with_same_timestamp(self):
+        # Arrange
+        tick1 = _trade_tick(AUDUSD_SIM, "1.00001", "1", 1)
+        tick2 = _trade_tick(AUDUSD_SIM, "1.00002", "2", 1)
+        table = _to_table([TradeTick.to_dict(tick) for tick in (tick1, tick2, tick1, tick2)])
+
+        # Act
+        result = decode_trade_ticks(table)
+        result_with_duplicates = decode_trade_ticks(table, drop_duplicates=False)
+
+        # Assert
+        assert result == [tick1, tick2]
+        assert len(result_with_duplicates) == 4
+
+    def test_decode_quote_ticks_drops_duplicates_across_batches(self):
+        # Arrange
+        tick1 = TestStubs.quote_tick_5decimal()
+        tick2 = TestStubs.quote_tick_3decimal()
+        table = _to_table([QuoteTick.to_dict(tick1), QuoteTick.to_dict(tick2)])
+        table = pa.concat_tables([table, table])
+
+        # Act
+        result = decode_quote_ticks(table)
+
+        # Assert
+        assert len(table.to_batches()) == 2
+        assert result == [tick1, tick2]
+
+    def test_decode_instrument_status_updates(self):
+        # Arrange
+        update = InstrumentStatusUpdate(
+            instrument_id=AUDUSD_SIM,
+            status=InstrumentStatus.PAUSE,
+            ts_event_ns=1,
+            ts_recv_ns=2,
+        )
+        table = _to_table([InstrumentStatusUpdate.to_dict(update)])
+
+        # Act
+        result = decode_instrument_status_updates(table)
+
+        # Assert
+        assert result == [update]
+
+    def test_decode_order_book_data_groups_rows_by_timestamp(self):
+        # Arrange
+        deltas = [
+            _delta(DeltaType.CLEAR, ts=1),
+            _delta(DeltaType.ADD, ts=1, side=OrderSide.BUY, price=1.0, order_id="1"),
+            _delta(DeltaType.ADD, ts=1, side=OrderSide.SELL, price=2.0, order_id="2"),
+            _delta(DeltaType.UPDATE, ts=2, order_id="1"),
+            _delta(DeltaType.DELETE, ts=3, order_id="1"),
+            _delta(DeltaType.ADD, ts=3, order_id="3"),
+        ]
+        table = _to_table([OrderBookDelta.to_dict(delta) for delta in deltas])
+
+        # Act
+        result = decode_order_book_data(table)
+
+        # Assert
+        assert [type(data) for data in result] == [
+            OrderBookSnapshot,
+            OrderBookDelta,
+            OrderBookDeltas,
+        ]
+        assert result[0].bids == [(1.0, 10.0)]
+        assert result[0].asks == [(2.0, 10.0)]
+        assert result[1].type == DeltaType.UPDATE
+        assert result[1].order.id == "1"
+        assert [delta.type for delta in result[2].deltas] == [DeltaType.DELETE, DeltaType.ADD]
+        assert result[2].ts_event_ns == 3
+
+    def test_decode_order_book_data_splits_groups_by_instrument(self):
+        # Arrange
+        deltas = [
+            _delta(DeltaType.UPDATE, ts=1, order_id="1"),
+            _delta(DeltaType.UPDATE, ts=1, order_id="2"),
+            _delta(DeltaType.UPDATE, ts=1, order_id="1", instrument_id=USDJPY_SIM),
+        ]
+        table = _to_table([OrderBookDelta.to_dict(delta) for delta in deltas])
+
+        # Act
+        result = decode_order_book_data(table)
+
+        # Assert
+        assert [type(data) for data in result] == [OrderBookDeltas, OrderBookDelta]
+        assert [data.instrument_id for data in result] == [AUDUSD_SIM, USDJPY_SIM]
+
+    def test_decode_order_book_data_groups_rows_by_group_id(self):
+        # Arrange
+        deltas = [_delta(DeltaType.UPDATE, ts=1, order_id=str(i)) for i in range(3)]
+        table = _to_table([OrderBookDelta.to_dict(delta) for delta in deltas])
+        table = table.append_column("group_id", pa.array([0, 0, 1], type=pa.int64()))
+
+        # Act
+        result = decode_order_book_data(table)
+
+        # Assert
+        assert [type(data) for data in result] == [OrderBookDeltas, OrderBookDelta]
+        assert [delta.order.id for delta in result[0].deltas] == ["0", "1"]
+
+    def test_decode_uses_registered_decoder(self):
+        # Arrange
+        tick = _trade_tick(AUDUSD_SIM, "1.00001", "1", 1)
+        table = _to_table([TradeTick.to_dict(tick)])
+
+        # Act
+        result = _decode(TradeTick, table)
+
+        # Assert
+        assert result == [tick]
@@ -0,0 +1,302 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import os
+
+import pytest
+
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.enums import BookLevel
+from nautilus_trader.model.enums import DeltaType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.orderbook.data import Order
+from nautilus_trader.model.orderbook.data import OrderBookDelta
+from nautilus_trader.model.orderbook.data import OrderBookDeltas
+from nautilus_trader.model.orderbook.data import OrderBookSnapshot
+from nautilus_trader.serialization.arrow.core import from_arrow
+from nautilus_trader.serialization.arrow.core import to_arrow
+from nautilus_trader.serialization.arrow.streaming import ArrowStreamReader
+from nautilus_trader.serialization.arrow.streaming import ArrowStreamRecorder
+from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.stubs import TestStubs
+
+
+AUDUSD_SIM = TestStubs.audusd_id()
+
+
+def _trade_tick(ts, match_id="1"):
+    return TradeTick(
+        instrument_id=AUDUSD_SIM,
+        price=Price.from_str("1.00001"),
+        size=Quantity.from_int(100_000),
+        aggressor_side=AggressorSide.BUY,
+        match_id=match_id,
+        ts_event_ns=ts,
+        ts_recv_ns=ts,
+    )
+
+
+def _quote_tick(ts):
+    return QuoteTick(
+        instrument_id=AUDUSD_SIM,
+        bid=Price.from_str("1.00001"),
+        ask=Price.from_str("1.00003"),
+        bid_size=Quantity.from_int(1_000_000),
+        ask_size=Quantity.from_int(1_000_000),
+        ts_event_ns=ts,
+        ts_recv_ns=ts,
+    )
+
+
+class TestArrowStreaming:
+    def test_to_arrow_from_arrow_round_trip(self):
+        # Arrange
+        ticks = [_trade_tick(ts=i, match_id=str(i)) for i in range(3)]
+
+        # Act
+        batch = to_arrow(ticks)
+        result = from_arrow(TradeTick, batch)
+
+        # Assert
+        assert batch.num_rows == 3
+        assert batch.schema.metadata[b"type"] == b"TradeTick"
+        assert result == ticks
+
+    def test_recorder_round_trip(self, tmp_path):
+        # Arrange
+        recorder = ArrowStreamRecorder(path=str(tmp_path), batch_size=2)
+        ticks = [_trade_tick(ts=i, match_id=str(i)) for i in range(5)]
+
+        # Act
+        for tick in ticks:
+            recorder.write(tick)
+        recorder.close()
+
+        # Assert
+        reader = ArrowStreamReader(path=str(tmp_path))
+        assert len(reader.files(TradeTick)) == 1
+        assert len(list(reader.batches(TradeTick))) == 3
+        assert reader.read(TradeTick) == ticks
+
+    def test_recorder_rotates_files_by_size(self, tmp_path):
+        # Arrange
+        recorder = ArrowStreamRecorder(path=str(tmp_path), batch_size=1, rotate_bytes=1)
+        ticks = [_trade_tick(ts=i, match_id=str(i)) for i in range(3)]
+
+        # Act
+        for tick in ticks:
+            recorder.write(tick)
+        recorder.close()
+
+        # Assert
+        reader = ArrowStreamReader(path=str(tmp_path))
+        assert len(reader.files(TradeTick)) == 3
+        assert reader.read(TradeTick) == ticks
+
+    def test_recorder_rotates_files_by_time(self, tmp_path):
+        # Arrange
+        recorder = ArrowStreamRecorder(path=str(tmp_path), batch_size=1, rotate_interval_ns=10)
+        ticks = [_trade_tick(ts=ts, match_id=str(ts)) for ts in (0, 5, 10, 15, 20)]
+
+        # Act
+        for tick in ticks:
+            recorder.write(tick)
+        recorder.close()
+
+        # Assert
+        reader = ArrowStreamReader(path=str(tmp_path))
+        assert len(reader.files(TradeTick)) == 3
+        assert reader.read(TradeTick) == ticks
+
+    def test_recorder_flushes_by_time(self, tmp_path):
+        # Arrange
+        recorder = ArrowStreamRecorder(path=str(tmp_path), flush_interval_ns=10)
+
+        # Act
+        recorder.write(_trade_tick(ts=0))
+        recorder.write(_trade_tick(ts=10))
+        recorder.write(_trade_tick(ts=11))
+        recorder.close()
+
+        # Assert
+        reader = ArrowStreamReader(path=str(tmp_path))
+        assert len(list(reader.batches(TradeTick))) == 2
+        assert len(reader.read(TradeTick)) == 3
+
+    def test_recorder_flush_writes_buffered_data(self, tmp_path):
+        # Arrange
+        recorder = ArrowStreamRecorder(path=str(tmp_path))
+        recorder.write(_trade_tick(ts=0))
+
+        # Act
+        recorder.flush()
+
+        # Assert
+        reader = ArrowStreamReader(path=str(tmp_path))
+        assert len(reader.read(TradeTick)) == 1
+        recorder.close()
+
+    def test_recorder_write_when_file_cannot_be_written_warns(self, tmp_path):
+        # Arrange
+        path = tmp_path / "recording"
+        path.write_text("not a directory")
+        recorder = ArrowStreamRecorder(path=str(path), batch_size=1)
+
+        # Act
+        # Assert
+        with pytest.warns(UserWarning, match="Cannot record"):
+            recorder.write(_trade_tick(ts=0))
+            recorder.close()
+
+    def test_recorder_order_book_round_trip(self, tmp_path):
+        # Arrange
+        recorder = ArrowStreamRecorder(path=str(tmp_path))
+        snapshot = OrderBookSnapshot(
+            instrument_id=AUDUSD_SIM,
+            level=BookLevel.L2,
+            bids=[(1.0, 10.0)],
+            asks=[(2.0, 10.0)],
+            ts_event_ns=1,
+            ts_recv_ns=1,
+        )
+        delta = OrderBookDelta(
+            instrument_id=AUDUSD_SIM,
+            level=BookLevel.L2,
+            delta_type=DeltaType.UPDATE,
+            order=Order(1.0, 5.0, OrderSide.BUY, "1"),
+            ts_event_ns=2,
+            ts_recv_ns=2,
+        )
+        deltas = OrderBookDeltas(
+            instrument_id=AUDUSD_SIM,
+            level=BookLevel.L2,
+            deltas=[delta, delta],
+            ts_event_ns=2,
+            ts_recv_ns=2,
+        )
+
+        # Act
+        recorder.write(snapshot)
+        recorder.write(deltas)
+        recorder.close()
+
+        # Assert
+        result = ArrowStreamReader(path=str(tmp_path)).read(OrderBookDelta)
+        assert [type(data) for data in result] == [OrderBookSnapshot, OrderBookDeltas]
+        assert result[0].bids == [(1.0, 10.0)]
+        assert result[0].asks == [(2.0, 10.0)]
+        assert len(result[1].deltas) == 2
+
+    def test_recorder_order_book_keeps_objects_sharing_a_timestamp(self, tmp_path):
+        # Arrange
+        recorder = ArrowStreamRecorder(path=str(tmp_path))
+        instrument_ids = [AUDUSD_SIM, TestStubs.usdjpy_id()]
+        snapshots = [
+            OrderBookSnapshot(
+                instrument_id=instrument_id,
+                level=BookLevel.L2,
+                bids=[(1.0, 10.0)],
+                asks=[(2.0, 10.0)],
+                ts_event_ns=1,
+                ts_recv_ns=1,
+            )
+            for instrument_id in instrument_ids
+        ]
+        deltas = [
+            OrderBookDeltas(
+                instrument_id=instrument_id,
+                level=BookLevel.L2,
+                deltas=[
+                    OrderBookDelta(
+                        instrument_id=instrument_id,
+                        level=BookLevel.L2,
+                        delta_type=DeltaType.UPDATE,
+                        order=Order(1.0, 5.0, OrderSide.BUY, "1"),
+                        ts_event_ns=2,
+                        ts_recv_ns=2,
+                    ),
+                ]
+                * 2,
+                ts_event_ns=2,
+                ts_recv_ns=2,
+            )
+            for instrument_id in instrument_ids
+        ]
+
+        # Act
+        for data in snapshots + deltas:
+            recorder.write(data)
+        recorder.close()
+
+        # Assert
+        result = ArrowStreamReader(path=str(tmp_path)).read(OrderBookDelta)
+        assert [type(data) for data in result] == [OrderBookSnapshot] * 2 + [OrderBookDeltas] * 2
+        assert [data.instrument_id for data in result] == instrument_ids * 2
+        assert [len(data.deltas) for data in result[2:]] == [2, 2]
+        assert result[1].bids == [(1.0, 10.0)]
+
+    def test_reader_ignores_truncated_final_message(self, tmp_path):
+        # Arrange
+        recorder = ArrowStreamRecorder(path=str(tmp_path), batch_size=2)
+        ticks = [_trade_tick(ts=i, match_id=str(i)) for i in range(4)]
+        for tick in ticks:
+            recorder.write(tick)
+        recorder.close()
+        reader = ArrowStreamReader(path=str(tmp_path))
+        fn = reader.files(TradeTick)[0]
+
+        # Act
+        with open(fn, "r+b") as f:
+            f.truncate(os.path.getsize(fn) - 20)
+
+        # Assert
+        assert reader.read(TradeTick) == ticks[:2]
+
+    def test_reader_iterates_all_types_in_time_order(self, tmp_path):
+        # Arrange
+        recorder = ArrowStreamRecorder(path=str(tmp_path))
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        recorder.write(instrument)
+        for ts in range(0, 6, 2):
+            recorder.write(_trade_tick(ts=ts, match_id=str(ts)))
+            recorder.write(_quote_tick(ts=ts + 1))
+        recorder.close()
+
+        # Act
+        reader = ArrowStreamReader(path=str(tmp_path))
+        result = list(reader)
+
+        # Assert
+        assert [data.ts_recv_ns for data in result] == [0, 1, 2, 3, 4, 5]
+        assert reader.instruments() == [instrument]
+        assert reader.min_timestamp_ns == 0
+        assert reader.max_timestamp_ns == 5
+
+    def test_recorder_filters_types(self, tmp_path):
+        # Arrange
+        recorder = ArrowStreamRecorder(path=str(tmp_path), types=(QuoteTick,))
+
+        # Act
+        recorder.write(_trade_tick(ts=0))
+        recorder.write(_quote_tick(ts=0))
+        recorder.close()
+
+        # Assert
+        reader = ArrowStreamReader(path=str(tmp_path))
+        assert reader.types() == [QuoteTick]